@@ -1,13 +1,4 @@
 import sys
-import time
-from src.detecteur_crypto import DetecteurCryptoOrchestrateur, ResultatAnalyse
-from src.analyzers.blowfish_analyzer import Blowfish_Analyzer
-from src.analyzers.aes_cbc_analyzer import Aes_Cbc_Analyzer
-from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
-
-from src.interface_console import consoleInterface
-import os
-from rich.progress import track
 # print(DetecteurCryptoOrchestrateur().analyser_fichier_specifique('data/mission1.enc'))
 
 # try:
@@ -18,7 +9,18 @@ from rich.progress import track
 # except FileNotFoundError:
 #     print("Erreur: Le fichier 'mission3.enc' est introuvable.")
 
-consoleInterface()
+# Les workers des attaques parallèles (forkserver/spawn) réimportent ce module sous le nom __mp_main__:
+# la ligne de commande et le menu ne doivent se lancer que dans le processus principal
+if __name__ == "__main__":
+    # Avec des arguments: ligne de commande non interactive (python main.py identify|attack|mission ...)
+    if len(sys.argv) > 1:
+        from src.cli import main
+        sys.exit(main(sys.argv[1:]))
+
+    # Interface interactive: rich et ses menus ne sont chargés que dans ce cas
+    from src.interface_console import consoleInterface
+
+    consoleInterface()
 # print(DetecteurCryptoOrchestrateur().mission_complete_automatique('data/', 'keys/wordlist.txt'))
 # try:
 #         resultat_dechiffrement: bytes = ChaCha20_Analyzer().dechiffrer("data/mission2.enc", os.urandom(32))
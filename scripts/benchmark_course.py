@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la course entre algorithmes sur les fichiers ambigus.
+
+Les missions 3 (Blowfish) et 4 (AES-GCM) sont aussi éligibles pour ChaCha20, qui passe en premier
+dans l'ordre des analyzers: c'est le pire cas de l'attaque séquentielle. Le dictionnaire est gonflé de
+mots leurres au format ChaCha20 (2024 + mot) pour que l'espace de clés du mauvais algorithme soit
+significatif, puis chaque fichier est traité avec et sans course.
+
+Les leurres qui déclencheraient un faux positif de la règle de succès sur le fichier sont écartés à la
+préparation: sinon l'attaque séquentielle s'arrêterait sur un texte parasite et le pire cas (espace de
+clés du mauvais algorithme épuisé) ne serait jamais mesuré.
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.append('.')
+
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.utils import evaluer_dechiffrement, est_dechiffrement_reussi
+
+FICHIERS_AMBIGUS = ['data/mission3.enc', 'data/mission4.enc']
+WORDLIST = 'keys/wordlist.txt'
+
+
+def creer_dictionnaire(chemin: str, fichier_chiffre: str, nb_leurres: int) -> None:
+    """Écrit nb_leurres mots au format 2024 + mot (sans faux positif ChaCha20 sur le fichier), suivis du dictionnaire de référence."""
+    generateur = random.Random(2024)
+    analyzer = ChaCha20_Analyzer()
+    with open(fichier_chiffre, 'rb') as f:
+        donnees = f.read()
+    with open(chemin, 'w', encoding='utf-8') as f:
+        for _ in range(nb_leurres):
+            mot = '2024' + ''.join(generateur.choices(string.ascii_lowercase, k=8))
+            if not est_dechiffrement_reussi(*evaluer_dechiffrement(analyzer.dechiffrer_donnees(donnees, hashlib.sha256(mot.encode()).digest()))):
+                f.write(mot + '\n')
+        with open(WORDLIST, 'r', encoding='utf-8') as reference:
+            f.write(reference.read())
+
+
+def mesurer(orchestrateur: DetecteurCryptoOrchestrateur, chemin: str, dictionnaire: str) -> tuple[float, str]:
+    debut = time.perf_counter()
+    resultat = orchestrateur.traiter_fichier(chemin, dictionnaire)
+    return time.perf_counter() - debut, resultat.algo if est_dechiffrement_reussi(resultat.texte_dechiffre, resultat.taux_succes) else 'échec'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--leurres', type=int, default=50000, help='nombre de mots leurres ajoutés au dictionnaire')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='nombre de processus')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as dossier:
+        dictionnaires = {}
+        for i, chemin in enumerate(FICHIERS_AMBIGUS):
+            dictionnaires[chemin] = os.path.join(dossier, f'wordlist{i}.txt')
+            creer_dictionnaire(dictionnaires[chemin], chemin, args.leurres)
+
+        sequentiel = DetecteurCryptoOrchestrateur(nb_workers=args.workers)
+        course = DetecteurCryptoOrchestrateur(nb_workers=args.workers, course_algorithmes=True)
+        # Génération des clés hors chronométrage: seule l'attaque est comparée
+        for orchestrateur in (sequentiel, course):
+            for chemin in FICHIERS_AMBIGUS:
+                for nom_algo, score in orchestrateur.scorer_fichier(chemin).items():
+                    if score >= 0.6:
+                        orchestrateur.cache_candidats.obtenir(orchestrateur.analyzers[nom_algo], dictionnaires[chemin])
+
+        print('=' * 70)
+        print(f"COURSE ENTRE ALGORITHMES ({args.leurres} leurres, {args.workers} workers)")
+        print('=' * 70)
+        pires = [0.0, 0.0]
+        for chemin in FICHIERS_AMBIGUS:
+            temps_sequentiel, algo_sequentiel = mesurer(sequentiel, chemin, dictionnaires[chemin])
+            temps_course, algo_course = mesurer(course, chemin, dictionnaires[chemin])
+            pires = [max(pires[0], temps_sequentiel), max(pires[1], temps_course)]
+            print(f"{chemin}: séquentiel {temps_sequentiel:.2f}s ({algo_sequentiel}) | course {temps_course:.2f}s ({algo_course})")
+
+        print('-' * 70)
+        print(f"Pire cas: séquentiel {pires[0]:.2f}s | course {pires[1]:.2f}s | gain x{pires[0] / max(pires[1], 1e-9):.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test de charge du service local d'analyse (python main.py serve).
+
+Des clients concurrents soumettent des tâches (identification ou attaque des fichiers de mission, à tour
+de rôle) et attendent leur fin ; la latence de chaque tâche (soumission -> résultat, vue du client) est
+mesurée et résumée par ses percentiles, avec le débit obtenu. Sans --url, un service est démarré dans le
+processus (caches préchauffés hors chronométrage).
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append('.')
+
+from src.service import ServiceAnalyse, creer_serveur
+from src.utils import percentiles
+
+
+def requete(url: str, corps: dict = None) -> dict:
+    donnees = None if corps is None else json.dumps(corps).encode('utf-8')
+    with urllib.request.urlopen(urllib.request.Request(url, data=donnees), timeout=300) as reponse:
+        return json.loads(reponse.read())
+
+
+def executer_tache(url: str, corps: dict) -> tuple[float, dict]:
+    """Soumet une tâche et attend sa fin ; renvoie (latence vue du client, tâche terminée)."""
+    debut = time.perf_counter()
+    tache = requete(f"{url}/taches", corps)
+    while tache['etat'] in ('en_attente', 'en_cours'):
+        tache = requete(f"{url}/taches/{tache['id']}?attendre=30")
+    return time.perf_counter() - debut, tache
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default=None, help='service déjà lancé (défaut: service démarré dans le processus)')
+    parser.add_argument('--taches', type=int, default=200, help='nombre total de tâches')
+    parser.add_argument('--clients', type=int, default=8, help='clients concurrents')
+    parser.add_argument('--workers', type=int, default=2, help='workers du service démarré dans le processus')
+    parser.add_argument('--type', choices=['identify', 'attack'], default='identify', help='type des tâches soumises')
+    args = parser.parse_args()
+
+    serveur = service = None
+    url = args.url
+    if url is None:
+        service = ServiceAnalyse(nb_workers=args.workers)
+        service.demarrer()
+        serveur = creer_serveur(service, port=0)
+        threading.Thread(target=serveur.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{serveur.server_address[1]}"
+
+    fichiers = sorted(os.path.abspath(chemin) for chemin in glob.glob('data/*.enc'))
+    corps = [{'type': args.type, 'chemin': fichiers[i % len(fichiers)]} for i in range(args.taches)]
+    try:
+        debut = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as clients:
+            mesures = list(clients.map(lambda requete_tache: executer_tache(url, requete_tache), corps))
+        duree = time.perf_counter() - debut
+        metriques_service = requete(f"{url}/metriques")
+    finally:
+        if serveur is not None:
+            serveur.shutdown()
+            serveur.server_close()
+            service.arreter()
+
+    latences = [latence * 1000 for latence, _ in mesures]
+    echecs = sum(1 for _, tache in mesures if tache['etat'] != 'terminee')
+    print('=' * 70)
+    print(f"CHARGE DU SERVICE ({args.taches} tâches {args.type}, {args.clients} clients)")
+    print('=' * 70)
+    print(f"Débit: {len(mesures) / duree:.1f} tâches/s en {duree:.2f}s | échecs: {echecs}")
+    print("Latence client (ms): " + " | ".join(f"{rang} {valeur:.1f}" for rang, valeur in percentiles(latences).items())
+          + f" | max {max(latences):.1f}")
+    attente = metriques_service.get('attente', {})
+    print("Attente en file côté service (ms): " + " | ".join(f"{rang} {valeur * 1000:.1f}" for rang, valeur in attente.items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,10 @@
-from src.crypto_analyzer import CryptoAnalyzer
+from typing import BinaryIO
+
+from src.apercu_fichier import ApercuFichier
+from src.crypto_analyzer import CryptoAnalyzer, TAILLE_BLOC_FLUX, lire_par_blocs
 from src.utils import calculer_entropie
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
+from src.key_store import KeyStore
+from src.registre_analyzers import classes_alphabet_integre
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.padding import PKCS7
 
@@ -23,8 +26,9 @@ class Aes_Cbc_Analyzer(CryptoAnalyzer):
   _PBKDF2_SALT = b"AES_CBC_SALT_2024" #Fourni
   _PBKDF2_ITERATIONS = 10000  #Fourni
   _PBKDF2_LONGUEUR_CLE = 32 #Longueur de la clé
+  _CLASSES_ALPHABET = classes_alphabet_integre("AES-256-CBC")  # signature du registre
   
-  def identifier_algo(self, chemin_fichier_chiffre: str) -> float:
+  def identifier_apercu(self, apercu: ApercuFichier) -> float:
     '''
       Estime la probabilité que le fichier soit chiffré en AES-CBC.
       
@@ -35,57 +39,50 @@ class Aes_Cbc_Analyzer(CryptoAnalyzer):
       - On pénalise un motif typique AES-GCM (nonce 12B + tag 16B + corps non multiple de 16).
       
       Args:
-        chemin_fichier_chiffre(str): Le chemin du fichier chiffré à traiter (mission1.enc).
+        apercu(ApercuFichier): la vue du fichier chiffré à traiter (mission1.enc).
       
       Returns:
         float: probabilité calculée.
     '''
     
-    try:
-      with open(chemin_fichier_chiffre, "rb") as f:
-        contenu_fichier = f.read()
-
-        # Garde simple: impossible d'avoir IV (16B) si le fichier est trop court
-        if len(contenu_fichier) < 16:
-          return 0.0
+    taille_fichier = apercu.taille
 
-        iv = contenu_fichier[:16]
-        corps = contenu_fichier[16:]
+    # Garde simple: impossible d'avoir IV (16B) si le fichier est trop court
+    if taille_fichier < 16:
+      return 0.0
 
-        score: float = 0.0
+    taille_corps = taille_fichier - 16
 
-        # CBC: le corps doit être multiple de 16 (car padding par blocs de 16)
-        if len(corps) % 16 == 0 and len(corps) > 0:
-          score += 0.55
-        else:
-          score -= 0.25
+    score: float = 0.0
 
-        # Entropie globale des données (indicateur secondaire, on ajoute un bonus léger)
-        ent = calculer_entropie(corps)
-        if ent > 7.3:
-          score += 0.35
+    # CBC: le corps doit être multiple de 16 (car padding par blocs de 16)
+    if taille_corps % 16 == 0 and taille_corps > 0:
+      score += 0.55
+    else:
+      score -= 0.25
 
-        # Négatif contre GCM: motif nonce 12B au début + tag 16B à la fin + corps non multiple de 16
-        # Si ce motif est détecté, cela contredit CBC → forte pénalité
-        if len(contenu_fichier) >= 28:
-          from src.utils import calculer_entropie as entf
-          nonce12 = contenu_fichier[:12]
-          tag16 = contenu_fichier[-16:]
-          corps_gcm = contenu_fichier[12:-16]
-          if len(corps_gcm) > 0 and (
-            entf(nonce12) > 7.0 and entf(tag16) > 7.0 and len(corps_gcm) % 16 != 0
-          ):
-            score -= 0.60
+    # Entropie globale des données (indicateur secondaire, on ajoute un bonus léger)
+    ent = apercu.entropie(16)
+    if ent > 7.3:
+      score += 0.35
 
-        # Normalisation: on borne toujours le score dans [0, 1]
-        if score < 0.0:
-          score = 0.0
-        if score > 1.0:
-          score = 1.0
-        return score
+    # Négatif contre GCM: motif nonce 12B au début + tag 16B à la fin + corps non multiple de 16
+    # Si ce motif est détecté, cela contredit CBC → forte pénalité
+    if taille_fichier >= 28:
+      nonce12 = apercu.tete(12)
+      tag16 = apercu.queue(16)
+      taille_corps_gcm = taille_fichier - 28
+      if taille_corps_gcm > 0 and (
+        calculer_entropie(nonce12) > 7.0 and calculer_entropie(tag16) > 7.0 and taille_corps_gcm % 16 != 0
+      ):
+        score -= 0.60
 
-    except FileNotFoundError:
-      return 0.0
+    # Normalisation: on borne toujours le score dans [0, 1]
+    if score < 0.0:
+      score = 0.0
+    if score > 1.0:
+      score = 1.0
+    return score
   
   def __filtrer_dictionnaire_par_indices(self, chemin_dictionnaire: str) -> list[str]:
     '''
@@ -99,45 +96,63 @@ class Aes_Cbc_Analyzer(CryptoAnalyzer):
     '''
     
     mots_de_passe_cible: list[str] = []
-    annees_olympiques: list[str] = ["1900", "1924", "2024"] #Annees où Paris a acceuili les JO
     
     try:
       with open(chemin_dictionnaire, "r") as f:
         for ligne in f:
           mot_propre:str = ligne.strip()
-          if mot_propre.startswith("paris") and mot_propre.endswith(tuple(annees_olympiques)): #"paris" car Paris = Ville Lumière = Capitale francaise comme l'indiquent les indices
+          if self.mot_retenu(mot_propre):
             mots_de_passe_cible.append(mot_propre)
       return mots_de_passe_cible        
     except FileNotFoundError:
       return []
     
+  def mot_retenu(self, mot: str) -> bool:
+    annees_olympiques: tuple[str, ...] = ("1900", "1924", "2024") #Annees où Paris a acceuili les JO
+    return mot.startswith("paris") and mot.endswith(annees_olympiques) #"paris" car Paris = Ville Lumière = Capitale francaise comme l'indiquent les indices
+  
   
-  def generer_cles_candidates(self, chemin_dictionnaire: str) -> list[bytes]:
+  def parametres_derivation(self) -> tuple:
+    return (self._PBKDF2_SALT, self._PBKDF2_ITERATIONS, self._PBKDF2_LONGUEUR_CLE)
+
+  def mots_candidats(self, chemin_dictionnaire: str) -> list[str]:
+    return self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
+
+  def generer_cles_candidates(self, chemin_dictionnaire: str, compact: bool = False) -> list[bytes] | KeyStore:
     '''
       Génère les clées candidates pour déchiffrer le fichier à partir de la liste retournée par filtrer_dictionnaire_par_indices.
       
       Args:
         chemin_dictionnaire(str): le chemin du dictionnaire de mots de passes pour l'attaque par dictionnaire.
+        compact(bool): si True, les clés sont rangées dans un KeyStore à pas fixe (32 octets) plutôt qu'une liste.
         
       Returns:
-        list[bytes]: liste des clés candidates. 
+        list[bytes] | KeyStore: liste des clés candidates. 
     '''
     
     mots_de_passe_cible = self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
     
-    clees_candidates: list[bytes] = []
+    clees_candidates: list[bytes] | KeyStore = KeyStore(self._PBKDF2_LONGUEUR_CLE) if compact else []
+    for mot_de_passe in mots_de_passe_cible:
+      clees_candidates.extend(self.deriver_cles(mot_de_passe))
+
+    return clees_candidates
+  
+  def deriver_cles(self, mot: str) -> list[bytes]:
+    '''
+      Dérive la clé PBKDF2 d'un mot de passe (un objet PBKDF2HMAC ne sert qu'une fois).
+    '''
+    # PBKDF2 n'est chargé que pour dériver des clés (jamais pour une simple identification)
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    
     kdf = PBKDF2HMAC(
       algorithm=hashes.SHA256(),
       length=self._PBKDF2_LONGUEUR_CLE,
       iterations=self._PBKDF2_ITERATIONS,
       salt=self._PBKDF2_SALT
     )
-    for mot_de_passe in mots_de_passe_cible:
-      mot_de_passe_en_octets: bytes = mot_de_passe.encode('utf-8')
-      cle_derivee: bytes = kdf.derive(mot_de_passe_en_octets)
-      clees_candidates.append(cle_derivee)
-
-    return clees_candidates
+    return [kdf.derive(mot.encode('utf-8'))]
   
   def dechiffrer(self, chemin_fichier_chiffre: str, cle_donnee: bytes) -> bytes:
     '''
@@ -152,39 +167,98 @@ class Aes_Cbc_Analyzer(CryptoAnalyzer):
     '''
     try:
       with open(chemin_fichier_chiffre, "rb") as f:
-        initialization_vector = f.read(16)
-        donnees_chiffrees = f.read()
-        
-        # Validation de la taille de clé (AES-256 nécessite 32 bytes)
-        if len(cle_donnee) != 32:
-            raise ValueError("Erreur : La clé AES-256 doit faire 32 bytes")
-        
-        try:
-          #Création de l'objet Cipher pour le déchiffrage
-          algorithm_aes = algorithms.AES256(cle_donnee)
-          mode_cbc = modes.CBC(initialization_vector)
-          cipher = Cipher(algorithm_aes, mode_cbc)
-          
-          #Inistanciation du dechiffreur à partir du cipher
-          decrypteur = cipher.decryptor()
-          
-          #Instanciation du supresseur de padding
-          supresseur_padding = PKCS7(algorithm_aes.block_size).unpadder()
-          
-          donnees_chiffrees_avec_padding = decrypteur.update(donnees_chiffrees) + decrypteur.finalize()
-          donnees_originales = supresseur_padding.update(donnees_chiffrees_avec_padding) + supresseur_padding.finalize()
-          
-          return donnees_originales
-        
-        except ValueError as e:
-          # Erreur de déchiffrement (clé incorrecte, padding invalide)
-          # Ne pas retourner b"" si c'est une erreur de validation de taille
-          if "doit faire 32 bytes" in str(e):
-              raise
-          return b""
-        except Exception as e:
-          # Erreur critique inattendue
-          raise RuntimeError(f"Erreur critique lors du déchiffrement AES-CBC: {e}")
-          
+        donnees = f.read()
     except FileNotFoundError:
-      raise
\ No newline at end of file
+      raise
+    
+    return self.dechiffrer_donnees(donnees, cle_donnee)
+  
+  def dechiffrer_flux(self, entree: BinaryIO, taille: int, cle_donnee: bytes, sortie: BinaryIO, taille_bloc: int = TAILLE_BLOC_FLUX) -> bool:
+    '''
+      Déchiffre en flux (IV de 16 octets suivi des données chiffrées) ; le padding est vérifié sur le dernier bloc.
+      
+      Args:
+        entree(BinaryIO): le fichier chiffré, positionné au début
+        taille(int): sa taille en octets
+        cle_donnee(bytes): clé candidate pour le déchiffrement
+        sortie(BinaryIO): destination du texte clair
+        taille_bloc(int): taille des blocs lus
+      
+      Returns:
+        bool: False si la taille ou le padding est invalide
+    '''
+    if len(cle_donnee) != 32:
+      raise ValueError("Erreur : La clé AES-256 doit faire 32 bytes")
+    if taille < 32 or (taille - 16) % 16 != 0:
+      return False
+    
+    decrypteur = Cipher(algorithms.AES256(cle_donnee), modes.CBC(entree.read(16))).decryptor()
+    supresseur_padding = PKCS7(128).unpadder()
+    try:
+      # Le suppresseur de padding retient toujours le dernier bloc: le padding n'est vérifié qu'à la fin
+      for bloc in lire_par_blocs(entree, taille - 16, taille_bloc):
+        sortie.write(supresseur_padding.update(decrypteur.update(bloc)))
+      sortie.write(supresseur_padding.update(decrypteur.finalize()) + supresseur_padding.finalize())
+    except ValueError:
+      return False
+    return True
+  
+  def sonder(self, donnees: bytes, cle_donnee: bytes) -> bool:
+    '''
+      Test rapide d'une clé: seul le dernier bloc est déchiffré (le bloc précédent sert d'IV) et son padding PKCS7 vérifié.
+      
+      Args:
+        donnees(bytes): contenu du fichier chiffré (IV de 16 octets suivi des données chiffrées)
+        cle_donnee(bytes): clé candidate
+      
+      Returns:
+        bool: False si le padding est invalide (clé fausse), True si la clé mérite un déchiffrement complet
+    '''
+    if len(cle_donnee) != 32 or len(donnees) < 32 or len(donnees) % 16 != 0:
+      return False
+    decrypteur = Cipher(algorithms.AES256(cle_donnee), modes.CBC(bytes(donnees[-32:-16]))).decryptor()
+    dernier_bloc = decrypteur.update(bytes(donnees[-16:])) + decrypteur.finalize()
+    taille_padding = dernier_bloc[-1]
+    return 1 <= taille_padding <= 16 and dernier_bloc[-taille_padding:] == bytes([taille_padding]) * taille_padding
+  
+  def dechiffrer_donnees(self, donnees: bytes, cle_donnee: bytes) -> bytes:
+    '''
+      Déchiffre un contenu déjà chargé en mémoire (IV de 16 octets suivi des données chiffrées).
+      
+      Args:
+        donnees(bytes): contenu du fichier chiffré (tout objet bytes-like, ex: memoryview)
+        cle_donnee(bytes): clé candidate pour le déchiffrement
+      
+      Returns:
+        bytes: données déchiffrées, b"" si la clé est incorrecte
+    '''
+    initialization_vector = donnees[:16]
+    donnees_chiffrees = donnees[16:]
+    
+    # Validation de la taille de clé (AES-256 nécessite 32 bytes)
+    if len(cle_donnee) != 32:
+        raise ValueError("Erreur : La clé AES-256 doit faire 32 bytes")
+    
+    try:
+      #Création de l'objet Cipher pour le déchiffrage
+      algorithm_aes = algorithms.AES256(cle_donnee)
+      mode_cbc = modes.CBC(initialization_vector)
+      cipher = Cipher(algorithm_aes, mode_cbc)
+      
+      #Inistanciation du dechiffreur à partir du cipher
+      decrypteur = cipher.decryptor()
+      
+      #Instanciation du supresseur de padding
+      supresseur_padding = PKCS7(algorithm_aes.block_size).unpadder()
+      
+      donnees_chiffrees_avec_padding = decrypteur.update(donnees_chiffrees) + decrypteur.finalize()
+      donnees_originales = supresseur_padding.update(donnees_chiffrees_avec_padding) + supresseur_padding.finalize()
+      
+      return donnees_originales
+    
+    except ValueError:
+      # Erreur de déchiffrement (clé incorrecte, padding invalide)
+      return b""
+    except Exception as e:
+      # Erreur critique inattendue
+      raise RuntimeError(f"Erreur critique lors du déchiffrement AES-CBC: {e}")
@@ -1,9 +1,12 @@
-from src.crypto_analyzer import CryptoAnalyzer
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
+from src.apercu_fichier import ApercuFichier
+from src.crypto_analyzer import CryptoAnalyzer, TAILLE_BLOC_FLUX, lire_par_blocs
+from src.key_store import KeyStore
+from src.registre_analyzers import classes_alphabet_integre
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from typing import List
+from typing import BinaryIO, List, Union
 import re
+import sys
 
 class Aes_Gcm_Analyzer(CryptoAnalyzer):
     '''Détermine si l'algo aes_gcm est utilisé, génère des clés et tente de de déchffrer un fichier chiffré en utilisant les clés générées.
@@ -22,6 +25,8 @@ class Aes_Gcm_Analyzer(CryptoAnalyzer):
     _PBKDF2_SALT: bytes = b"AES_GCM_SALT_2024"  #Fourni
     _PBKDF2_ITERATIONS: int = 10000             #Fourni
     _PBKDF2_LONGUEUR_CLE: int = 32              #Longueur de la clé
+    _CLASSES_ALPHABET = classes_alphabet_integre("AES-GCM")  # signature du registre
+    _MOTIF_ACRONYME = re.compile(r"^[A-Z]{4}$")
     
     def __filtrer_dictionnaire_par_indices(self, chemin_dictionnaire: str) -> List[str]:
         """
@@ -29,52 +34,67 @@ class Aes_Gcm_Analyzer(CryptoAnalyzer):
         L'indice pointe vers le format de clé "Acronyme en majuscules + 4 chiffres".
         """
         mots_filtres: List[str] = []
-        annee_courante: str = "2024"  # Normalement 2025 mais on considère 2024 pour se conformer à la wordlist
-        motif_acronyme = re.compile(r"^[A-Z]{4}$")
 
         try:
             with open(chemin_dictionnaire, "r", encoding="utf-8") as f:
                 for ligne in f:
                     mot: str = ligne.strip()
-                    if mot.endswith(annee_courante):
-                        acronyme: str = mot[:-4]
-                        if motif_acronyme.match(acronyme):
-                            mots_filtres.append(mot)
+                    if self.mot_retenu(mot):
+                        mots_filtres.append(mot)
         except FileNotFoundError:
-            print(f"Erreur : Le fichier de dictionnaire '{chemin_dictionnaire}' est introuvable.")
+            print(f"Erreur : Le fichier de dictionnaire '{chemin_dictionnaire}' est introuvable.", file=sys.stderr)
             return []
 
         return mots_filtres
 
-    def generer_cles_candidates(self, chemin_dictionnaire: str) -> List[bytes]:
+    def mot_retenu(self, mot: str) -> bool:
+        annee_courante: str = "2024"  # Normalement 2025 mais on considère 2024 pour se conformer à la wordlist
+        return mot.endswith(annee_courante) and self._MOTIF_ACRONYME.match(mot[:-4]) is not None
+
+    def parametres_derivation(self) -> tuple:
+        return (self._PBKDF2_SALT, self._PBKDF2_ITERATIONS, self._PBKDF2_LONGUEUR_CLE)
+
+    def mots_candidats(self, chemin_dictionnaire: str) -> List[str]:
+        return self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
+
+    def generer_cles_candidates(self, chemin_dictionnaire: str, compact: bool = False) -> Union[List[bytes], KeyStore]:
         '''
         Génère les clées candidates pour déchiffrer le fichier à partir de la liste retournée par filtrer_dictionnaire_par_indices.
         
         Args:
             chemin_dictionnaire(str): le chemin du dictionnaire de mots de passes pour l'attaque par dictionnaire.
+            compact(bool): si True, les clés sont rangées dans un KeyStore à pas fixe (32 octets) plutôt qu'une liste.
             
         Returns:
-            list[bytes]: liste des clés candidates. 
+            list[bytes] | KeyStore: liste des clés candidates. 
         '''
         
         mots_de_passe_cible: List[str] = self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
         
-        clees_candidates: List[bytes] = []
+        clees_candidates: Union[List[bytes], KeyStore] = KeyStore(self._PBKDF2_LONGUEUR_CLE) if compact else []
         
         for mot_de_passe in mots_de_passe_cible:
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=self._PBKDF2_LONGUEUR_CLE,
-                iterations=self._PBKDF2_ITERATIONS,
-                salt=self._PBKDF2_SALT
-            )
-            mot_de_passe_en_octets: bytes = mot_de_passe.encode('utf-8')
-            cle_derivee: bytes = kdf.derive(mot_de_passe_en_octets)
-            clees_candidates.append(cle_derivee)
+            clees_candidates.extend(self.deriver_cles(mot_de_passe))
 
         return clees_candidates
 
-    def identifier_algo(self, chemin_fichier_chiffre: str) -> float:
+    def deriver_cles(self, mot: str) -> List[bytes]:
+        '''
+        Dérive la clé PBKDF2 d'un mot de passe.
+        '''
+        # PBKDF2 n'est chargé que pour dériver des clés (jamais pour une simple identification)
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=self._PBKDF2_LONGUEUR_CLE,
+            iterations=self._PBKDF2_ITERATIONS,
+            salt=self._PBKDF2_SALT
+        )
+        return [kdf.derive(mot.encode('utf-8'))]
+
+    def identifier_apercu(self, apercu: ApercuFichier) -> float:
         """
         Estime la probabilité que le fichier soit chiffré en AES-GCM.
         
@@ -84,61 +104,59 @@ class Aes_Gcm_Analyzer(CryptoAnalyzer):
         - Les vérifications structurelles ont un poids fort. L'entropie apporte seulement des signaux faibles.
         
         Args:
-            chemin_fichier_chiffre(str): Le chemin vers le fichier chiffré.
+            apercu(ApercuFichier): La vue du fichier chiffré.
             
         Returns:
             float: Probabilité que le fichier utilise AES GCM (0.0 à 1.0).
         """
         try:
-            with open(chemin_fichier_chiffre, "rb") as f:
-                contenu_fichier: bytes = f.read()
+            taille_fichier = apercu.taille
 
             # Garde 1: taille minimale (nonce 12 + tag 16 + au moins 1 octet de corps)
-            if len(contenu_fichier) < 12 + 1 + 16:
+            if taille_fichier < 12 + 1 + 16:
                 return 0.0
 
             # Placement attendu: [0:12] = nonce, [-16:] = tag, [12:-16] = corps
-            nonce: bytes = contenu_fichier[:12]
-            tag: bytes = contenu_fichier[-16:]
-            corps: bytes = contenu_fichier[12:-16]
+            nonce: bytes = apercu.tete(12)
+            tag: bytes = apercu.queue(16)
+            taille_corps = taille_fichier - 12 - 16
 
             # Garde 2: tailles strictes
-            if len(nonce) != 12 or len(tag) != 16 or len(corps) <= 0:
+            if len(nonce) != 12 or len(tag) != 16 or taille_corps <= 0:
                 return 0.0
 
             from src.utils import calculer_entropie
             score: float = 0.0
 
             # Signal positif fort (structure GCM): corps non multiple de 16 → pas de padding bloc
-            if len(corps) % 16 != 0:
+            if taille_corps % 16 != 0:
                 score += 0.50
             else:
                 # Signal négatif (mode bloc typique) : pénalité renforcée
                 score -= 0.50
 
             # Taille totale multiple de 16 : peu probable pour GCM (plus proche AES/Blowfish)
-            if len(contenu_fichier) % 16 == 0:
+            if taille_fichier % 16 == 0:
                 score -= 0.40
 
             # Autres signaux négatifs "mode bloc":
             # - IV 16B plausible en tête + corps multiple de 16 (plutôt AES-CBC)
-            if len(contenu_fichier) >= 16:
-                iv16 = contenu_fichier[:16]
-                corps16 = contenu_fichier[16:]
+            if taille_fichier >= 16:
+                iv16 = apercu.tete(16)
+                taille_corps16 = taille_fichier - 16
                 try:
-                    if len(corps16) > 0 and (len(corps16) % 16) == 0 and calculer_entropie(iv16) > 7.0:
+                    if taille_corps16 > 0 and (taille_corps16 % 16) == 0 and calculer_entropie(iv16) > 7.0:
                         score -= 0.30
                 except Exception:
                     pass
             # - IV 8B plausible en tête + corps multiple de 8 (plutôt Blowfish)
-            if len(contenu_fichier) >= 8:
-                iv8 = contenu_fichier[:8]
-                corps8 = contenu_fichier[8:]
-                if len(corps8) > 0 and (len(corps8) % 8) == 0:
+            if taille_fichier >= 8:
+                taille_corps8 = taille_fichier - 8
+                if taille_corps8 > 0 and (taille_corps8 % 8) == 0:
                     score -= 0.25
 
             # Si les 16 derniers octets ne ressemblent PAS à un tag AEAD (faible entropie), on pénalise.
-            queue16 = contenu_fichier[-16:] if len(contenu_fichier) >= 16 else b""
+            queue16 = tag
             try:
                 if queue16 and calculer_entropie(queue16) <= 7.0:
                     score -= 0.30
@@ -149,7 +167,7 @@ class Aes_Gcm_Analyzer(CryptoAnalyzer):
             ent_tag = calculer_entropie(tag)
             if ent_tag > 7.2:
                 score += 0.10
-            if len(corps) > 0 and calculer_entropie(corps) > 7.0:
+            if taille_corps > 0 and apercu.entropie(12, -16) > 7.0:
                 score += 0.10
             # Nonce aléatoire plausible (faible poids)
             try:
@@ -164,7 +182,7 @@ class Aes_Gcm_Analyzer(CryptoAnalyzer):
 
             # Cas ambigu : nonce/tag semblent aléatoires mais le corps est aligné sur 16 octets → pénalité supplémentaire
             try:
-                if (ent_nonce if 'ent_nonce' in locals() else 0) > 7.0 and ent_tag > 7.2 and (len(corps) % 16) == 0:
+                if (ent_nonce if 'ent_nonce' in locals() else 0) > 7.0 and ent_tag > 7.2 and (taille_corps % 16) == 0:
                     score -= 0.10
             except Exception:
                 pass
@@ -176,11 +194,8 @@ class Aes_Gcm_Analyzer(CryptoAnalyzer):
                 score = 1.0
             return score
             
-        except FileNotFoundError:
-            print(f"Erreur : Le fichier '{chemin_fichier_chiffre}' est introuvable.")
-            return 0.0
         except Exception as e:
-            print(f"Erreur lors de l'identification de l'algorithme AES GCM: {e}")
+            print(f"Erreur lors de l'identification de l'algorithme AES GCM: {e}", file=sys.stderr)
             return 0.0  
 
     def dechiffrer(self, chemin_fichier_chiffre: str, cle_donnee: bytes) -> bytes:
@@ -194,42 +209,78 @@ class Aes_Gcm_Analyzer(CryptoAnalyzer):
         Returns:
             bytes: Le contenu déchiffré ou une chaîne vide en cas d'échec.
         """
+        # Validation taille de clé: AES-256 => 32 octets
+        if len(cle_donnee) != self._PBKDF2_LONGUEUR_CLE:
+            raise ValueError("Erreur : La clé AES-256 doit faire 32 bytes")
+
+        # Lecture du fichier: nonce (12B) + données + tag (16B)
+        with open(chemin_fichier_chiffre, "rb") as f:
+            donnees = f.read()
+
+        return self.dechiffrer_donnees(donnees, cle_donnee)
+
+    def dechiffrer_flux(self, entree: BinaryIO, taille: int, cle_donnee: bytes, sortie: BinaryIO, taille_bloc: int = TAILLE_BLOC_FLUX) -> bool:
+        """
+        Déchiffre en flux un contenu AES-GCM: nonce (12B) + données + tag (16B).
+        Le tag est lu en premier (fin du fichier) et vérifié après le dernier bloc.
+        
+        Args:
+            entree(BinaryIO): Le fichier chiffré, positionné au début.
+            taille(int): Sa taille en octets.
+            cle_donnee(bytes): La clé de déchiffrement.
+            sortie(BinaryIO): Destination du texte clair.
+            taille_bloc(int): Taille des blocs lus.
+            
+        Returns:
+            bool: False si le tag est invalide (clé incorrecte ou contenu altéré).
+        """
+        if len(cle_donnee) != self._PBKDF2_LONGUEUR_CLE:
+            raise ValueError("Erreur : La clé AES-256 doit faire 32 bytes")
+        if taille < 12 + 16:
+            return False
+
+        nonce = entree.read(12)
+        entree.seek(taille - 16)
+        tag = entree.read(16)
+        entree.seek(12)
+        decryptor = Cipher(algorithms.AES(cle_donnee), modes.GCM(nonce, tag)).decryptor()
+        for bloc in lire_par_blocs(entree, taille - 12 - 16, taille_bloc):
+            sortie.write(decryptor.update(bloc))
         try:
-            # Validation taille de clé: AES-256 => 32 octets
-            if len(cle_donnee) != self._PBKDF2_LONGUEUR_CLE:
-                raise ValueError("Erreur : La clé AES-256 doit faire 32 bytes")
+            sortie.write(decryptor.finalize())
+        except InvalidTag:
+            return False
+        return True
 
-            # Lecture du fichier: nonce (12B) + données + tag (16B)
-            with open(chemin_fichier_chiffre, "rb") as f:
-                donnees = f.read()
+    def dechiffrer_donnees(self, donnees: bytes, cle_donnee: bytes) -> bytes:
+        """
+        Déchiffre un contenu AES-GCM déjà chargé en mémoire: nonce (12B) + données + tag (16B).
+        
+        Args:
+            donnees(bytes): Le contenu du fichier chiffré (tout objet bytes-like, ex: memoryview).
+            cle_donnee(bytes): La clé de déchiffrement.
+            
+        Returns:
+            bytes: Le contenu déchiffré ou une chaîne vide en cas d'échec.
+        """
+        # Validation taille de clé: AES-256 => 32 octets
+        if len(cle_donnee) != self._PBKDF2_LONGUEUR_CLE:
+            raise ValueError("Erreur : La clé AES-256 doit faire 32 bytes")
 
-            if len(donnees) < 12 + 16:
-                return b""
+        if len(donnees) < 12 + 16:
+            return b""
 
-            nonce = donnees[:12]
-            ciphertext_tag = donnees[12:]
-            if len(ciphertext_tag) < 16:
-                return b""
-            ciphertext = ciphertext_tag[:-16]
-            tag = ciphertext_tag[-16:]
+        nonce = donnees[:12]
+        ciphertext = donnees[12:-16]
+        # Le tag doit être de type bytes pour modes.GCM
+        tag = bytes(donnees[-16:])
 
+        try:
             # Déchiffrement AES-GCM
             cipher = Cipher(algorithms.AES(cle_donnee), modes.GCM(nonce, tag))
             decryptor = cipher.decryptor()
-            try:
-                plaintext = decryptor.update(ciphertext) + decryptor.finalize()
-                return plaintext
-            except Exception:
-                # Tag invalide / clé incorrecte
-                return b""
-
-        except FileNotFoundError:
-            raise
-        except ValueError as e:
-            # Erreur de validation de clé
-            if "doit faire 32 bytes" in str(e):
-                raise
+            plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+            return plaintext
+        except Exception:
+            # Tag invalide / clé incorrecte
             return b""
-        except Exception as e:
-            # Erreur générique
-            return b""
\ No newline at end of file
@@ -6,6 +6,11 @@ from src.crypto_analyzer import CryptoAnalyzer
 from cryptography.hazmat.primitives.ciphers import algorithms, Cipher, modes
 from src.crypto_analyzer import CryptoAnalyzer
 from src.utils import calculer_entropie
+from src.key_store import KeyStore
+from src.registre_analyzers import classes_alphabet_integre
+from src.crypto_analyzer import TAILLE_BLOC_FLUX, lire_par_blocs
+from src.apercu_fichier import ApercuFichier
+from typing import BinaryIO
 import hashlib
 import base64
 import re
@@ -28,8 +33,11 @@ class Blowfish_Analyzer(CryptoAnalyzer):
   
   __BLOWFISH_TAILLE_BLOC = 64
   __BLOWFISH_TAILLE_IV = 8
+  # Chaque mot donne trois clés: le mot lui-même, son MD5 et son SHA1
+  _CLES_PAR_MOT = 3
+  _CLASSES_ALPHABET = classes_alphabet_integre("BLOWFISH")  # signature du registre
   
-  def identifier_algo(self, chemin_fichier_chiffre: str) -> float:
+  def identifier_apercu(self, apercu: ApercuFichier) -> float:
     '''
       Estime la probabilité que le fichier soit chiffré avec Blowfish (mode par blocs de 8 octets).
       
@@ -39,56 +47,49 @@ class Blowfish_Analyzer(CryptoAnalyzer):
       - L'entropie est prise en compte avec un poids faible.
       
       Args:
-        chemin_fichier_chiffre(str): Le chemin du fichier chiffré à traiter (mission1.enc).
+        apercu(ApercuFichier): la vue du fichier chiffré à traiter (mission1.enc).
       
       Returns:
         float: probabilité calculée.
     '''
     
     score = 0.0
-    try: 
-      with open(chemin_fichier_chiffre, "rb") as f:
-        contenu_fichier: bytes = f.read()
-        taille_totale = len(contenu_fichier)
-        TAILLE_IV = 8
-        
-        # Gardes Blowfish: fichier assez long pour contenir l'IV et corps multiple de 8
-        if taille_totale <= TAILLE_IV:
-          return 0.0
-        donnees_chiffrees = contenu_fichier[TAILLE_IV:]
-        if len(donnees_chiffrees) == 0 or (len(donnees_chiffrees) % 8) != 0:
-          return 0.0
-
-        # Base: structure Blowfish plausible (IV 8B + corps %8)
-        score += 0.35
-
-        # Bonus si la taille totale n'est pas multiple de 16 (moins "AES-like")
-        if taille_totale % 16 != 0:
-          score += 0.25
-        else:
-          score -= 0.35
-
-        # Pénalité si le corps (hors IV) est multiple de 16 (motif plus proche d'AES)
-        if len(donnees_chiffrees) % 16 == 0:
-          score -= 0.25
-
-        # Entropie: signal faible, bonus léger si globalement élevée
-        try:
-          entropie_globale = calculer_entropie(donnees_chiffrees)
-          if entropie_globale > 7.3:
-            score += 0.15
-            # Vérification sur deux moitiés (léger bonus si les deux sont élevées)
-            taille_donnees = len(donnees_chiffrees)
-            moitie = taille_donnees // 2
-            entropie_moitie1 = calculer_entropie(donnees_chiffrees[:moitie])
-            entropie_moitie2 = calculer_entropie(donnees_chiffrees[moitie:])
-            if entropie_moitie1 > 7.3 and entropie_moitie2 > 7.3:
-              score += 0.10
-        except Exception:
-          pass
-              
-    except FileNotFoundError:
-      return 0.0    
+    taille_totale = apercu.taille
+    TAILLE_IV = 8
+    
+    # Gardes Blowfish: fichier assez long pour contenir l'IV et corps multiple de 8
+    if taille_totale <= TAILLE_IV:
+      return 0.0
+    taille_donnees = taille_totale - TAILLE_IV
+    if taille_donnees == 0 or (taille_donnees % 8) != 0:
+      return 0.0
+
+    # Base: structure Blowfish plausible (IV 8B + corps %8)
+    score += 0.35
+
+    # Bonus si la taille totale n'est pas multiple de 16 (moins "AES-like")
+    if taille_totale % 16 != 0:
+      score += 0.25
+    else:
+      score -= 0.35
+
+    # Pénalité si le corps (hors IV) est multiple de 16 (motif plus proche d'AES)
+    if taille_donnees % 16 == 0:
+      score -= 0.25
+
+    # Entropie: signal faible, bonus léger si globalement élevée
+    try:
+      entropie_globale = apercu.entropie(TAILLE_IV)
+      if entropie_globale > 7.3:
+        score += 0.15
+        # Vérification sur deux moitiés (léger bonus si les deux sont élevées)
+        moitie = taille_donnees // 2
+        entropie_moitie1 = apercu.entropie(TAILLE_IV, TAILLE_IV + moitie)
+        entropie_moitie2 = apercu.entropie(TAILLE_IV + moitie)
+        if entropie_moitie1 > 7.3 and entropie_moitie2 > 7.3:
+          score += 0.10
+    except Exception:
+      pass
     
     # Normalisation: on borne toujours le score dans [0, 1]
     if score < 0.0:
@@ -110,51 +111,55 @@ class Blowfish_Analyzer(CryptoAnalyzer):
       list[str]: La liste de tous les mots en chaine de caractères, susceptibles d'être des mots clés parmi ceux du dictionnaire fourni. 
     """
     mots_filtres: list[str] = []
-    prefixes = ("sha256", "sha384", "sha512", "sha1")
-    suffixes = ("123", "456", "789")
 
     try:
       with open(chemin_dictionnaire, "r", encoding="utf-8") as f:
         for ligne in f:
           mot = ligne.strip()
-          if mot.startswith(prefixes) and mot.endswith(suffixes):
+          if self.mot_retenu(mot):
             mots_filtres.append(mot)
     except FileNotFoundError:
-      print(f"Erreur : Le fichier de dictionnaire '{chemin_dictionnaire}' est introuvable.")
+      print(f"Erreur : Le fichier de dictionnaire '{chemin_dictionnaire}' est introuvable.", file=sys.stderr)
       return []
 
     return mots_filtres
 
-  def generer_cles_candidates(self, chemin_dictionnaire: str) -> list[bytes]:
+  def mot_retenu(self, mot: str) -> bool:
+    prefixes = ("sha256", "sha384", "sha512", "sha1")
+    suffixes = ("123", "456", "789")
+    return mot.startswith(prefixes) and mot.endswith(suffixes)
+
+  def mots_candidats(self, chemin_dictionnaire: str) -> list[str]:
+    return self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
+
+  def generer_cles_candidates(self, chemin_dictionnaire: str, compact: bool = False) -> list[bytes] | KeyStore:
     """
     Génère une liste de clés candidates pour le déchiffrement.
     Les candidats incluent les mots de passe directs, leur hash MD5 et leur hash SHA1.
     
     Args:
         chemin_dictionnaire(str): Le chemin vers le fichier de dictionnaire.
+        compact(bool): si True, les clés (de longueurs différentes) sont rangées dans un KeyStore à pas variable.
     
     Returns:
-        list[bytes]: Une liste des clés candidates sous forme d'octets.
+        list[bytes] | KeyStore: Une liste des clés candidates sous forme d'octets.
     """
-    cles_candidates: list[bytes] = []
+    cles_candidates: list[bytes] | KeyStore = KeyStore() if compact else []
     # Utilisation de la méthode privée pour filtrer les mots
     mots_de_passe_cible = self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
     
     for mot in mots_de_passe_cible:
-        mot_en_bytes = mot.encode("utf-8")
-        
-        # 1. Ajouter le mot de passe direct comme clé candidate
-        cles_candidates.append(mot_en_bytes)
-        
-        # 2. Hachage MD5 et ajout à la liste (en bytes)
-        hash_md5 = hashlib.md5(mot_en_bytes).digest()
-        cles_candidates.append(hash_md5)
-        
-        # 3. Hachage SHA1 et ajout à la liste (en bytes)
-        hash_sha1 = hashlib.sha1(mot_en_bytes).digest()
-        cles_candidates.append(hash_sha1)
+        cles_candidates.extend(self.deriver_cles(mot))
     
     return cles_candidates
+
+  def deriver_cles(self, mot: str) -> list[bytes]:
+    """
+    Clés candidates d'un mot de passe: le mot lui-même, son hash MD5 et son hash SHA1.
+    """
+    mot_en_bytes = mot.encode("utf-8")
+    # Mot de passe direct, puis ses hachages MD5 et SHA1 (en bytes)
+    return [mot_en_bytes, hashlib.md5(mot_en_bytes).digest(), hashlib.sha1(mot_en_bytes).digest()]
     
   def decode_base64(self, encoded_bytes, altchars=b'+/'):
     encoded_bytes = re.sub(
@@ -181,6 +186,58 @@ class Blowfish_Analyzer(CryptoAnalyzer):
       bytes: les données originales 
     """
     
+    #La taille de clé est dans l'intervalle 4-56 bytes (32-448 bits)
+    if len(cle_donnee) < 4 or len(cle_donnee) > 56:
+      raise ValueError('Taille de clé invalide.')
+    
+    #Récupération de l'IV et du texte chiffré dans le fichier
+    with open(chemin_fichier_chiffre, 'rb') as f:
+      donnees = f.read()
+    
+    return self.dechiffrer_donnees(donnees, cle_donnee)
+  
+  def dechiffrer_flux(self, entree: BinaryIO, taille: int, cle_donnee: bytes, sortie: BinaryIO, taille_bloc: int = TAILLE_BLOC_FLUX) -> bool:
+    """
+    Déchiffre en flux (IV de 8 octets suivi des données chiffrées) ; le padding est vérifié sur le dernier bloc.
+    
+    Args:
+      entree (BinaryIO): le fichier chiffré, positionné au début
+      taille (int): sa taille en octets
+      cle_donnee (bytes): La clé à utiliser pour le déchiffrement
+      sortie (BinaryIO): destination du texte clair
+      taille_bloc (int): taille des blocs lus
+    Returns:
+      bool: False si la taille ou le padding est invalide
+    """
+    
+    #La taille de clé est dans l'intervalle 4-56 bytes (32-448 bits)
+    if len(cle_donnee) < 4 or len(cle_donnee) > 56:
+      raise ValueError('Taille de clé invalide.')
+    taille_iv = self.__BLOWFISH_TAILLE_IV
+    if taille < 2 * taille_iv or (taille - taille_iv) % 8 != 0:
+      return False
+    
+    decrypteur = Cipher(algorithms.Blowfish(cle_donnee), modes.CBC(entree.read(taille_iv))).decryptor()
+    supresseur_padding = PKCS7(self.__BLOWFISH_TAILLE_BLOC).unpadder()
+    try:
+      for bloc in lire_par_blocs(entree, taille - taille_iv, taille_bloc):
+        sortie.write(supresseur_padding.update(decrypteur.update(bloc)))
+      sortie.write(supresseur_padding.update(decrypteur.finalize()) + supresseur_padding.finalize())
+    except ValueError:
+      return False
+    return True
+  
+  def dechiffrer_donnees(self, donnees: bytes, cle_donnee: bytes) -> bytes:
+    """
+    Déchiffre un contenu Blowfish déjà chargé en mémoire (IV de 8 octets suivi des données chiffrées).
+    
+    Args:
+      donnees (bytes): contenu du fichier chiffré (tout objet bytes-like, ex: memoryview)
+      cle_donnee (bytes): La clé à utiliser pour le déchiffrement
+    Returns:
+      bytes: les données originales, b"" si la clé est incorrecte
+    """
+    
     #La taille de clé est dans l'intervalle 4-56 bytes (32-448 bits)
     if len(cle_donnee) < 4 or len(cle_donnee) > 56:
       raise ValueError('Taille de clé invalide.')
@@ -188,10 +245,6 @@ class Blowfish_Analyzer(CryptoAnalyzer):
     try:
       # Use the key directly, not base64 decoded
       algorithm_blowfish = algorithms.Blowfish(cle_donnee)
-
-      #Récupération de l'IV et du texte chiffré dans le fichier
-      with open(chemin_fichier_chiffre, 'rb') as f:
-        donnees = f.read()
       
       initialization_vector = donnees[:self.__BLOWFISH_TAILLE_IV]
       texte_chiffre = donnees[self.__BLOWFISH_TAILLE_IV:]
@@ -210,8 +263,6 @@ class Blowfish_Analyzer(CryptoAnalyzer):
       donnees_originales = supresseur_padding.update(donnees_chiffrees_avec_padding) + supresseur_padding.finalize() 
       return donnees_originales
       
-    except FileNotFoundError:
-      raise
     except ValueError as e:
       # Erreur de déchiffrement (clé incorrecte, padding invalide)
       return b""
@@ -4,10 +4,13 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
 from rich import print
 import os
 import sys
-from typing import List
+from typing import BinaryIO, List, Union
 
-from src.crypto_analyzer import CryptoAnalyzer
+from src.apercu_fichier import ApercuFichier
+from src.crypto_analyzer import CryptoAnalyzer, TAILLE_BLOC_FLUX, lire_par_blocs
 from src.utils import calculer_entropie
+from src.key_store import KeyStore
+from src.registre_analyzers import classes_alphabet_integre
 
 # Définition de la classe ChaCha20_Analyzer
 class ChaCha20_Analyzer(CryptoAnalyzer):
@@ -30,8 +33,9 @@ class ChaCha20_Analyzer(CryptoAnalyzer):
     _CHACHA20_LONGUEUR_NONCE: int = 12
     _CHACHA20_LONGUEUR_TAG: int = 16
     _CHACHA20_LONGUEUR_BLOC: int = 64
+    _CLASSES_ALPHABET = classes_alphabet_integre("CHACHA20")  # signature du registre
 
-    def identifier_algo(self, chemin_fichier_chiffre: str) -> float:
+    def identifier_apercu(self, apercu: ApercuFichier) -> float:
         """
         Estime la probabilité que le fichier soit chiffré avec ChaCha20.
         
@@ -44,21 +48,18 @@ class ChaCha20_Analyzer(CryptoAnalyzer):
         Retourne un score entre 0.0 et 1.0.
         
         Args:
-            chemin_fichier_chiffre (str): Chemin du fichier chiffré à analyser.
+            apercu (ApercuFichier): Vue du fichier chiffré à analyser.
         Returns:
             float: Probabilité estimée que l'algorithme soit ChaCha20.
         """
         try:
-            with open(chemin_fichier_chiffre, 'rb') as f:
-                donnees: bytes = f.read()
-
-            if len(donnees) < self._CHACHA20_LONGUEUR_NONCE + 1:
+            if apercu.taille < self._CHACHA20_LONGUEUR_NONCE + 1:
                 return 0.0
 
-            nonce: bytes = donnees[:self._CHACHA20_LONGUEUR_NONCE]
-            corps: bytes = donnees[self._CHACHA20_LONGUEUR_NONCE:]
+            nonce: bytes = apercu.tete(self._CHACHA20_LONGUEUR_NONCE)
+            taille_donnees: int = apercu.taille - self._CHACHA20_LONGUEUR_NONCE
 
-            if len(corps) == 0:
+            if taille_donnees == 0:
                 return 0.0
 
             # Composantes de score
@@ -66,7 +67,6 @@ class ChaCha20_Analyzer(CryptoAnalyzer):
 
             # Pondération: structure de flux > entropie
             # 1) Tailles de blocs: fortes pénalités contre les modes par blocs
-            taille_donnees: int = len(corps)
             if taille_donnees % 16 == 0:
                 score -= 0.40
             elif taille_donnees % 8 == 0:
@@ -78,12 +78,12 @@ class ChaCha20_Analyzer(CryptoAnalyzer):
 
             # 2) Queue de 16 octets très aléatoire (tag AEAD probable):
             #    pénalité forte seulement si combinée avec nonce très aléatoire et corps suffisant.
-            queue16: bytes = corps[-16:] if len(corps) >= 16 else b""
+            queue16: bytes = apercu.queue(16) if taille_donnees >= 16 else b""
             if queue16:
                 try:
                     ent_queue = calculer_entropie(queue16)
                     # Pénalité forte uniquement si le pattern (nonce 12B + queue 16B) est très net et corps significatif
-                    if ent_queue > 7.2 and 'ent_nonce' in locals() and ent_nonce > 7.0 and len(corps) >= 32:
+                    if ent_queue > 7.2 and 'ent_nonce' in locals() and ent_nonce > 7.0 and taille_donnees >= 32:
                         score -= 0.45
                     elif ent_queue <= 7.0:
                         # Queue ressemblant moins à un tag AEAD → léger bonus
@@ -95,12 +95,12 @@ class ChaCha20_Analyzer(CryptoAnalyzer):
                     pass
 
             # 3) Taille totale non multiple de 16 (bonus léger pour un flux)
-            if len(donnees) % 16 != 0:
+            if apercu.taille % 16 != 0:
                 score += 0.15
 
             # 4) Entropie: signaux faibles, ne doivent pas dominer le score
             try:
-                ent_corp: float = calculer_entropie(corps)
+                ent_corp: float = apercu.entropie(self._CHACHA20_LONGUEUR_NONCE)
                 if ent_corp > 7.0:
                     score += 0.15
                 ent_nonce: float = calculer_entropie(nonce)
@@ -111,7 +111,7 @@ class ChaCha20_Analyzer(CryptoAnalyzer):
 
             # Pénalité additionnelle si la queue ressemble à un tag AEAD ET le nonce paraît aléatoire (pattern GCM)
             try:
-                ent_queue2 = calculer_entropie(corps[-16:]) if len(corps) >= 16 else 0.0
+                ent_queue2 = calculer_entropie(apercu.queue(16)) if taille_donnees >= 16 else 0.0
                 if ent_queue2 > 7.2 and 'ent_nonce' in locals() and ent_nonce > 7.0:
                     score -= 0.10
             except Exception:
@@ -125,7 +125,7 @@ class ChaCha20_Analyzer(CryptoAnalyzer):
             return score
             
         except Exception as e:
-            print(f"Erreur lors de l'identification de l'algorithme: {e}")
+            print(f"Erreur lors de l'identification de l'algorithme: {e}", file=sys.stderr)
             return 0.0
 
     def __filtrer_dictionnaire_par_indices(self, chemin_dictionnaire: str) -> List[str]:
@@ -152,44 +152,57 @@ class ChaCha20_Analyzer(CryptoAnalyzer):
                     if not mot:
                         continue
 
-                    # Pattern principal des indices: 2024 + mot anglais simple
-                    if len(mot) >= 6 and mot.startswith('2024') and mot[4:].isalpha() and mot[4:].islower():
-                        candidats_prioritaires.append(mot)
+                    if not self.mot_retenu(mot):
                         continue
-
-                    # Pattern secondaire: 4 chiffres + mot anglais simple (fallback si aucune clé prioritaire)
-                    if len(mot) >= 6 and mot[:4].isdigit() and mot[4:].isalpha() and mot[4:].islower():
+                    # Pattern principal des indices: 2024 + mot anglais simple, sinon pattern secondaire
+                    # (fallback si aucune clé prioritaire)
+                    if mot.startswith('2024'):
+                        candidats_prioritaires.append(mot)
+                    else:
                         candidats_secondaires.append(mot)
 
         except FileNotFoundError:
-            print(f"Erreur : Le fichier de dictionnaire '{chemin_dictionnaire}' est introuvable.")
+            print(f"Erreur : Le fichier de dictionnaire '{chemin_dictionnaire}' est introuvable.", file=sys.stderr)
             return []
 
         # Retourner d'abord les candidats prioritaires, sinon les secondaires
         return candidats_prioritaires if candidats_prioritaires else candidats_secondaires
 
-    def generer_cles_candidates(self, chemin_dictionnaire: str) -> List[bytes]:
+    def mot_retenu(self, mot: str) -> bool:
+        """
+            4 chiffres + mot anglais simple (le pattern prioritaire, "2024" + mot, en est un cas particulier).
+            Un mot isolé est toujours retenu s'il suit l'un des deux patterns.
+        """
+        return len(mot) >= 6 and mot[:4].isdigit() and mot[4:].isalpha() and mot[4:].islower()
+
+    def mots_candidats(self, chemin_dictionnaire: str) -> List[str]:
+        return self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
+
+    def generer_cles_candidates(self, chemin_dictionnaire: str, compact: bool = False) -> Union[List[bytes], KeyStore]:
         """
         Cette fonction se charge de générer les clés candidates pour le déchifremment du fichier chiffré en utilisant
         la dérivation sha256 pour renforcer les clées de chiffrement.               
                             
         Args: 
             chemin_dictionnaire(str) : Le chemin vers le dictionnaire.
+            compact(bool) : si True, les clés sont rangées dans un KeyStore à pas fixe (32 octets) plutôt qu'une liste.
         
         Returns:
-            cles_candidates (List[bytes]) : Un tableau de clés, chaque clé étant une séquence d'octets.
+            cles_candidates (List[bytes] | KeyStore) : Un tableau de clés, chaque clé étant une séquence d'octets.
         """
-        cles_candidates: List[bytes] = []
+        cles_candidates: Union[List[bytes], KeyStore] = KeyStore(self._CHACHA20_LONGUEUR_CLE) if compact else []
 
         # Utiliser la méthode de filtrage harmonisée
         candidats: List[str] = self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
 
         for cand in candidats:
-            # Dérivation clé: SHA256 du mot de passe (indices)
-            cle = hashlib.sha256(cand.encode('utf-8')).digest()
-            cles_candidates.append(cle)
+            cles_candidates.extend(self.deriver_cles(cand))
 
         return cles_candidates
+
+    def deriver_cles(self, mot: str) -> List[bytes]:
+        # Dérivation clé: SHA256 du mot de passe (indices)
+        return [hashlib.sha256(mot.encode('utf-8')).digest()]
     
     def dechiffrer(self, chemin_fichier_chiffre: str, cle_donnee: bytes) -> bytes:
         """
@@ -206,27 +219,67 @@ class ChaCha20_Analyzer(CryptoAnalyzer):
         if len(cle_donnee) != self._CHACHA20_LONGUEUR_CLE:
             raise ValueError("Erreur : La clé n'a pas la taille correcte")
 
-        try:
-            with open(chemin_fichier_chiffre, 'rb') as f:
-                nonce_12: bytes = f.read(self._CHACHA20_LONGUEUR_NONCE)
-                payload: bytes = f.read()
+        with open(chemin_fichier_chiffre, 'rb') as f:
+            donnees: bytes = f.read()
 
-            if len(nonce_12) != self._CHACHA20_LONGUEUR_NONCE or len(payload) == 0:
-                return b""
+        return self.dechiffrer_donnees(donnees, cle_donnee)
 
-            # ChaCha20 stream (cryptography attend un nonce 16B)
-            # Construire un nonce 16B en préfixant 4 octets nuls au nonce 12B
-            nonce_16 = b"\x00\x00\x00\x00" + nonce_12
-            try:
-                cipher = Cipher(algorithms.ChaCha20(cle_donnee, nonce_16), mode=None)
-                decryptor = cipher.decryptor()
-                resultat: bytes = decryptor.update(payload) + decryptor.finalize()
-                return resultat
-            except Exception:
-                return b""
+    def dechiffrer_flux(self, entree: BinaryIO, taille: int, cle_donnee: bytes, sortie: BinaryIO, taille_bloc: int = TAILLE_BLOC_FLUX) -> bool:
+        """
+            Déchiffre en flux (nonce de 12 octets suivi du flux chiffré). ChaCha20 n'authentifie pas le contenu:
+            seule la validation du texte clair permet de rejeter une clé.
 
-        except FileNotFoundError:
-            raise
+            Args:
+                entree(BinaryIO): le fichier chiffré, positionné au début
+                taille(int): sa taille en octets
+                cle_donnee(bytes): La clé sur 256 bits utilisée pour le déchiffrement.
+                sortie(BinaryIO): destination du texte clair
+                taille_bloc(int): taille des blocs lus
+
+            Returns:
+                bool: False si le fichier est trop court
+        """
+        if len(cle_donnee) != self._CHACHA20_LONGUEUR_CLE:
+            raise ValueError("Erreur : La clé n'a pas la taille correcte")
+        if taille <= self._CHACHA20_LONGUEUR_NONCE:
+            return False
+
+        nonce_16 = b"\x00\x00\x00\x00" + entree.read(self._CHACHA20_LONGUEUR_NONCE)
+        decryptor = Cipher(algorithms.ChaCha20(cle_donnee, nonce_16), mode=None).decryptor()
+        for bloc in lire_par_blocs(entree, taille - self._CHACHA20_LONGUEUR_NONCE, taille_bloc):
+            sortie.write(decryptor.update(bloc))
+        sortie.write(decryptor.finalize())
+        return True
+
+    def dechiffrer_donnees(self, donnees: bytes, cle_donnee: bytes) -> bytes:
+        """
+            Déchiffre un contenu ChaCha20 déjà chargé en mémoire (nonce de 12 octets suivi du flux chiffré).
+
+            Args:
+                donnees(bytes): Le contenu du fichier chiffré (tout objet bytes-like, ex: memoryview)
+                cle_donnee(bytes): La clé sur 256 bits utilisée pour tenter le déchiffrement.
+
+            Returns:
+                bytes: Le flux déchiffré, b"" si le contenu est invalide.
+        """
+        # Validation de la taille de clé (ChaCha20 nécessite 32 bytes)
+        if len(cle_donnee) != self._CHACHA20_LONGUEUR_CLE:
+            raise ValueError("Erreur : La clé n'a pas la taille correcte")
+
+        nonce_12 = donnees[:self._CHACHA20_LONGUEUR_NONCE]
+        payload = donnees[self._CHACHA20_LONGUEUR_NONCE:]
+
+        if len(nonce_12) != self._CHACHA20_LONGUEUR_NONCE or len(payload) == 0:
+            return b""
+
+        # ChaCha20 stream (cryptography attend un nonce 16B)
+        # Construire un nonce 16B en préfixant 4 octets nuls au nonce 12B
+        nonce_16 = b"\x00\x00\x00\x00" + nonce_12
+        try:
+            cipher = Cipher(algorithms.ChaCha20(cle_donnee, nonce_16), mode=None)
+            decryptor = cipher.decryptor()
+            resultat: bytes = decryptor.update(payload) + decryptor.finalize()
+            return resultat
         except Exception:
             # Erreur de déchiffrement (clé incorrecte, format invalide)
             return b""
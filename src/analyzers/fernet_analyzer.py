@@ -1,11 +1,18 @@
 import base64
 import binascii
 import hashlib
+import hmac
+import re
+import sys
 import time
-from cryptography.fernet import Fernet
-from typing import List
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.padding import PKCS7
+from typing import BinaryIO, Iterator, List, Union
 
-from src.crypto_analyzer import CryptoAnalyzer
+from src.apercu_fichier import ApercuFichier
+from src.crypto_analyzer import CryptoAnalyzer, TAILLE_BLOC_FLUX, lire_par_blocs
+from src.key_store import KeyStore
+from src.registre_analyzers import classes_alphabet_integre
 
 class FernetAnalyzer(CryptoAnalyzer):
     """
@@ -26,8 +33,41 @@ class FernetAnalyzer(CryptoAnalyzer):
     
     _FERNET_VERSION: bytes = b'\x80'  # Le byte de version du format Fernet
     _FERNET_MIN_TAILLE: int = 1 + 8 + 16 + 32  # version + timestamp + iv + hmac
+    _FERNET_TAILLE_CLE_B64: int = 44  # 32 octets encodés en Base64 URL-safe
+    _DONNEES_BYTES_REQUISES: bool = True  # Fernet.decrypt n'accepte que des bytes
+    _CLASSES_ALPHABET = classes_alphabet_integre("FERNET")  # signature du registre
+    _FERNET_HORODATAGE_MIN: int = 1577836800  # 1er janvier 2020
     
-    def identifier_algo(self, chemin_fichier_chiffre: str) -> float:
+    @staticmethod
+    def __decoder_entete(apercu: ApercuFichier) -> bytes:
+        """
+        Décode les 12 premiers caractères Base64 du fichier: byte de version (1B) + horodatage (8B).
+        """
+        caracteres = re.sub(rb"[^A-Za-z0-9+/_-]", b"", apercu.tete(apercu.TAILLE_FENETRE))[:12]
+        return base64.urlsafe_b64decode(caracteres)
+    
+    def compatible(self, apercu: ApercuFichier) -> bool:
+        """
+        Préfiltre Fernet: texte Base64 dont l'en-tête décodé porte le byte de version (0x80) et un
+        horodatage réaliste. Seuls 12 caractères sont décodés, le reste du fichier n'est pas lu.
+        
+        Args:
+            apercu (ApercuFichier): La vue du fichier à filtrer.
+            
+        Returns:
+            bool: False si le fichier ne peut pas être un jeton Fernet.
+        """
+        if not super().compatible(apercu):
+            return False
+        try:
+            entete = self.__decoder_entete(apercu)
+        except (binascii.Error, ValueError):
+            return False
+        horodatage_entier = int.from_bytes(entete[1:9], 'big')
+        return (len(entete) == 9 and entete[:1] == self._FERNET_VERSION
+                and self._FERNET_HORODATAGE_MIN < horodatage_entier <= time.time())
+    
+    def identifier_apercu(self, apercu: ApercuFichier) -> float:
         """
         Estime la probabilité que le fichier soit un jeton Fernet valide.
         
@@ -37,8 +77,11 @@ class FernetAnalyzer(CryptoAnalyzer):
         - Byte de version (0x80) (0.30): premier octet attendu.
         - Horodatage réaliste (0.20): timestamp > 2020 et ≤ maintenant.
         
+        En mode rapide, seuls les premiers caractères Base64 sont décodés (version et horodatage) et la
+        taille décodée est déduite de la taille du fichier: une erreur de padding en fin de jeton n'est pas vue.
+        
         Args:
-            chemin_fichier_chiffre (str): Le chemin du fichier chifré à traiter.
+            apercu (ApercuFichier): La vue du fichier chifré à traiter.
             
         Returns:
             float: Score de probabilité entre 0.0 et 1.0.
@@ -46,15 +89,17 @@ class FernetAnalyzer(CryptoAnalyzer):
         score: float = 0.0
         
         try:
-            with open(chemin_fichier_chiffre, "rb") as f:
-                contenu_fichier = f.read()
-            
             # 1) Le contenu doit être décodable en Base64 URL-safe (sinon ce n'est pas Fernet).
-            contenu_decode_bytes = base64.urlsafe_b64decode(contenu_fichier)
+            if apercu.complet:
+                contenu_decode_bytes = base64.urlsafe_b64decode(apercu.contenu)
+                taille_decodee = len(contenu_decode_bytes)
+            else:
+                contenu_decode_bytes = self.__decoder_entete(apercu)
+                taille_decodee = apercu.taille * 3 // 4
             score += 0.3
                 
             # 2) Taille minimale d'un token Fernet plausible.
-            if len(contenu_decode_bytes) >= self._FERNET_MIN_TAILLE:
+            if taille_decodee >= self._FERNET_MIN_TAILLE:
                 score += 0.2
             else:
                 return 0.0
@@ -71,14 +116,11 @@ class FernetAnalyzer(CryptoAnalyzer):
             horodatage_entier = int.from_bytes(horodatage_bytes, 'big')
             
             # Vérifie que le timestamp est réaliste (après 2020 et avant l'heure actuelle).
-            # 1577836800 = 1er janvier 2020.
-            if horodatage_entier > 1577836800 and horodatage_entier <= time.time(): 
+            if horodatage_entier > self._FERNET_HORODATAGE_MIN and horodatage_entier <= time.time(): 
                 score += 0.2
             else:
                 return 0.0
                 
-        except FileNotFoundError:
-            return 0.0
         except (binascii.Error, ValueError):
             return 0.0
         
@@ -105,37 +147,46 @@ class FernetAnalyzer(CryptoAnalyzer):
             with open(chemin_dictionnaire, "r", encoding="utf-8") as f:
                 for ligne in f:
                     mot = ligne.strip()
-                    if mot.islower() and ' ' in mot and len(mot) > 5:
+                    if self.mot_retenu(mot):
                         mots_filtres.append(mot)
         except FileNotFoundError:
-            print(f"Erreur : Le fichier de dictionnaire '{chemin_dictionnaire}' est introuvable.")
+            print(f"Erreur : Le fichier de dictionnaire '{chemin_dictionnaire}' est introuvable.", file=sys.stderr)
             return []
         
         return mots_filtres
     
-    def generer_cles_candidates(self, chemin_dictionnaire: str) -> List[bytes]:
+    def mot_retenu(self, mot: str) -> bool:
+        return mot.islower() and ' ' in mot and len(mot) > 5
+
+    def mots_candidats(self, chemin_dictionnaire: str) -> List[str]:
+        return self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
+
+    def generer_cles_candidates(self, chemin_dictionnaire: str, compact: bool = False) -> Union[List[bytes], KeyStore]:
         """
         Génère une liste de clés candidates Fernet (32 octets) en dérivant
         une clé SHA256 à partir des mots de passe filtrés et en l'encodant en Base64.
 
         Args:
             chemin_dictionnaire (str): Le chemin vers le fichier de dictionnaire.
+            compact (bool): si True, les clés sont rangées dans un KeyStore à pas fixe (44 octets) plutôt qu'une liste.
         
         Returns:
-            List[bytes]: Une liste des clés candidates.
+            List[bytes] | KeyStore: Une liste des clés candidates.
         """
         mots_de_passe_cible = self.__filtrer_dictionnaire_par_indices(chemin_dictionnaire)
-        cles_candidates: List[bytes] = []
+        cles_candidates: Union[List[bytes], KeyStore] = KeyStore(self._FERNET_TAILLE_CLE_B64) if compact else []
         
         for mot_de_passe in mots_de_passe_cible:
-            # Dérivation de la clé avec SHA256
-            cle_derivee = hashlib.sha256(mot_de_passe.encode('utf-8')).digest()
-            # Encodage en Base64 pour Fernet
-            cle_base64 = base64.urlsafe_b64encode(cle_derivee)
-            cles_candidates.append(cle_base64)
+            cles_candidates.extend(self.deriver_cles(mot_de_passe))
 
         return cles_candidates
 
+    def deriver_cles(self, mot: str) -> List[bytes]:
+        # Dérivation de la clé avec SHA256
+        cle_derivee = hashlib.sha256(mot.encode('utf-8')).digest()
+        # Encodage en Base64 pour Fernet
+        return [base64.urlsafe_b64encode(cle_derivee)]
+
     def dechiffrer(self, chemin_fichier_chiffre: str, cle_donnee: bytes) -> bytes:
         """
         Tente de déchiffrer un fichier chiffré à partir d'une clé prise en paramètre.
@@ -148,32 +199,111 @@ class FernetAnalyzer(CryptoAnalyzer):
         Returns:
             bytes: données déchiffrées ou chaîne vide en cas d'échec
         """
+        # Validation de la taille de clé (Fernet nécessite 44 bytes en Base64)
+        if len(cle_donnee) != self._FERNET_TAILLE_CLE_B64:
+            raise ValueError("Erreur : La clé Fernet doit faire 44 bytes en Base64")
+        
         try:
-            # Validation de la taille de clé (Fernet nécessite 44 bytes en Base64)
-            if len(cle_donnee) != 44:
-                raise ValueError("Erreur : La clé Fernet doit faire 44 bytes en Base64")
+            # Lecture du fichier chiffré
+            with open(chemin_fichier_chiffre, "rb") as f:
+                donnees_chiffrees = f.read()
+        except OSError:
+            # Fichier illisible: traité comme un échec de déchiffrement
+            return b""
+        
+        return self.dechiffrer_donnees(donnees_chiffrees, cle_donnee)
+
+    @staticmethod
+    def __decoder_base64_flux(entree: BinaryIO, taille: int, taille_bloc: int) -> Iterator[bytes]:
+        """
+        Décode un jeton Base64 URL-safe par blocs (groupes de 4 caractères, espaces ignorés).
+        """
+        reste = b""
+        for bloc in lire_par_blocs(entree, taille, taille_bloc):
+            texte = reste + re.sub(rb"\s+", b"", bloc)
+            coupure = len(texte) - len(texte) % 4
+            reste = texte[coupure:]
+            if coupure:
+                yield base64.urlsafe_b64decode(texte[:coupure])
+        if reste:
+            yield base64.urlsafe_b64decode(reste + b"=" * (-len(reste) % 4))
+
+    def dechiffrer_flux(self, entree: BinaryIO, taille: int, cle_donnee: bytes, sortie: BinaryIO, taille_bloc: int = TAILLE_BLOC_FLUX) -> bool:
+        """
+        Déchiffre en flux un jeton Fernet: version (1B) + horodatage (8B) + IV (16B) + AES-128-CBC + HMAC-SHA256 (32B),
+        le tout encodé en Base64. Le HMAC est calculé au fil du déchiffrement et comparé à la fin ; les 32 derniers
+        octets décodés sont retenus pour cela.
+        
+        Args:
+            entree (BinaryIO): le jeton Fernet, positionné au début
+            taille (int): sa taille en octets
+            cle_donnee (bytes): clé candidate (44 octets en Base64)
+            sortie (BinaryIO): destination du texte clair
+            taille_bloc (int): taille des blocs lus
+        
+        Returns:
+            bool: False si le jeton est invalide (format, HMAC ou padding)
+        """
+        if len(cle_donnee) != self._FERNET_TAILLE_CLE_B64:
+            raise ValueError("Erreur : La clé Fernet doit faire 44 bytes en Base64")
+        
+        cle = base64.urlsafe_b64decode(bytes(cle_donnee))
+        signature = hmac.new(cle[:16], digestmod=hashlib.sha256)
+        taille_entete = 1 + 8 + 16
+        tampon = bytearray()
+        decrypteur = None
+        supresseur_padding = PKCS7(128).unpadder()
+        try:
+            for morceau in self.__decoder_base64_flux(entree, taille, taille_bloc):
+                tampon += morceau
+                if decrypteur is None:
+                    if len(tampon) < taille_entete:
+                        continue
+                    entete = bytes(tampon[:taille_entete])
+                    del tampon[:taille_entete]
+                    if entete[:1] != self._FERNET_VERSION:
+                        return False
+                    signature.update(entete)
+                    decrypteur = Cipher(algorithms.AES(cle[16:]), modes.CBC(entete[9:])).decryptor()
+                # Les 32 derniers octets décodés peuvent être le HMAC: ils ne sont pas encore déchiffrés
+                if len(tampon) > 32:
+                    corps = bytes(tampon[:-32])
+                    del tampon[:-32]
+                    signature.update(corps)
+                    sortie.write(supresseur_padding.update(decrypteur.update(corps)))
+            if decrypteur is None or len(tampon) != 32 or not hmac.compare_digest(signature.digest(), bytes(tampon)):
+                return False
+            sortie.write(supresseur_padding.update(decrypteur.finalize()) + supresseur_padding.finalize())
+        except ValueError:
+            # Base64 invalide, corps non multiple du bloc ou padding invalide
+            return False
+        return True
+
+    def dechiffrer_donnees(self, donnees: bytes, cle_donnee: bytes) -> bytes:
+        """
+        Déchiffre un jeton Fernet déjà chargé en mémoire.
+        
+        Args:
+            donnees (bytes): le jeton Fernet (bytes ; une memoryview est copiée car Fernet exige des bytes)
+            cle_donnee (bytes): clé candidate pour le déchiffrement
+        
+        Returns:
+            bytes: données déchiffrées ou chaîne vide en cas d'échec
+        """
+        # Validation de la taille de clé (Fernet nécessite 44 bytes en Base64)
+        if len(cle_donnee) != self._FERNET_TAILLE_CLE_B64:
+            raise ValueError("Erreur : La clé Fernet doit faire 44 bytes en Base64")
+        
+        # Importé au premier déchiffrement: l'identification n'en a pas besoin
+        from cryptography.fernet import Fernet
+        
+        try:
+            # Création de l'objet Fernet pour le déchiffrage
+            fernet = Fernet(bytes(cle_donnee))
             
-            try:
-                # Création de l'objet Fernet pour le déchiffrage
-                fernet = Fernet(cle_donnee)
-                
-                # Lecture du fichier chiffré
-                with open(chemin_fichier_chiffre, "rb") as f:
-                    donnees_chiffrees = f.read()
-                
-                # Tentative de déchiffrement
-                donnees_originales = fernet.decrypt(donnees_chiffrees)
-                
-                return donnees_originales
-                
-            except Exception as e:
-                # Erreur de déchiffrement (clé incorrecte, format invalide)
-                return b""
-                
-        except FileNotFoundError:
-            raise
-        except ValueError as e:
-            # Erreur de validation de la clé
-            if "doit faire 44 bytes" in str(e):
-                raise
-            return b""
\ No newline at end of file
+            # Tentative de déchiffrement
+            return fernet.decrypt(donnees if isinstance(donnees, bytes) else bytes(donnees))
+            
+        except Exception:
+            # Erreur de déchiffrement (clé incorrecte, format invalide)
+            return b""
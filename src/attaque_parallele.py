@@ -0,0 +1,430 @@
+import os
+import sys
+import threading
+import time
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+from typing import Callable, Optional, Sequence, Union
+
+from src.crypto_analyzer import CryptoAnalyzer
+from src.key_store import KeyStore
+from src.metriques import Instrumentation
+from src.utils import evaluer_dechiffrement, est_dechiffrement_reussi, prechauffer_lexique
+
+CLES = Union[Sequence[bytes], KeyStore]
+
+
+class ResultatRecherche:
+    """
+        Résultat d'une recherche de clé par dictionnaire.
+
+        Attributes:
+            index(int): position de la clé trouvée dans l'ordre du dictionnaire (-1 si aucune)
+            cle(bytes): la clé trouvée
+            texte_dechiffre(str): le texte déchiffré et normalisé
+            taux_succes(float): le taux de succès du texte déchiffré
+            nb_testees(int): nombre de clés effectivement essayées
+            reprise(int): index de la première clé non testée si la recherche a été interrompue par son échéance
+                (toutes les clés antérieures ont été testées) ; égal au nombre de clés si l'espace est épuisé
+    """
+
+    __slots__ = ("index", "cle", "texte_dechiffre", "taux_succes", "nb_testees", "reprise")
+
+    def __init__(self, index: int = -1, cle: bytes = b"", texte_dechiffre: str = "", taux_succes: float = 0.0, nb_testees: int = 0, reprise: int = 0):
+        self.index = index
+        self.cle = cle
+        self.texte_dechiffre = texte_dechiffre
+        self.taux_succes = taux_succes
+        self.nb_testees = nb_testees
+        self.reprise = reprise
+
+    @property
+    def trouve(self) -> bool:
+        return self.index >= 0
+
+
+def contexte_processus() -> multiprocessing.context.BaseContext:
+    """
+        Contexte de création des workers: forkserver si disponible, sinon spawn.
+
+        On évite fork() car l'orchestrateur tourne souvent avec des threads actifs (rafraîchissement rich),
+        ce qui peut bloquer les processus enfants.
+    """
+    methodes = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methodes else "spawn")
+
+
+# État propre à chaque worker, initialisé une seule fois par processus
+_analyzers_worker: list[CryptoAnalyzer] = []
+_donnees_worker: memoryview = memoryview(b"")
+_donnees_bytes_worker: bytes = b""
+_segment_worker: Optional[shared_memory.SharedMemory] = None
+# Meilleur index trouvé par algorithme (Array) et rang du premier algorithme ayant réussi (-1 = aucun)
+_bornes_worker = None
+_gagnant_worker = None
+
+
+def _attacher_segment(nom_segment: str) -> shared_memory.SharedMemory:
+    """
+        Attache un segment de mémoire partagée existant sans le confier au resource tracker
+        (seul le processus qui l'a créé doit le détruire).
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=nom_segment, track=False)
+    # Avant 3.13, l'attachement enregistre le segment auprès du resource tracker, qui le signalerait comme
+    # fuite (ou le détruirait) sans son créateur. Le désenregistrer ensuite ne convient pas: le tracker est
+    # partagé avec le processus principal, dont la destruction du segment échouerait. L'enregistrement est
+    # donc évité pendant l'attachement (le worker n'a qu'un fil à ce stade).
+    enregistrer = resource_tracker.register
+    resource_tracker.register = lambda nom, type_ressource: None if type_ressource == "shared_memory" else enregistrer(nom, type_ressource)
+    try:
+        return shared_memory.SharedMemory(name=nom_segment)
+    finally:
+        resource_tracker.register = enregistrer
+
+
+def _initialiser_worker(analyzers: list[CryptoAnalyzer], nom_segment: str, taille: int, bornes, gagnant) -> None:
+    """
+        Initialise un worker: analyzers, texte chiffré et lexique chargés une fois pour toutes.
+
+        Le texte chiffré n'est pas copié: le worker s'attache au segment de mémoire partagée créé par le
+        processus principal et déchiffre directement depuis une memoryview.
+    """
+    global _analyzers_worker, _donnees_worker, _donnees_bytes_worker, _segment_worker, _bornes_worker, _gagnant_worker
+    _analyzers_worker = analyzers
+    _segment_worker = _attacher_segment(nom_segment)
+    _donnees_worker = _segment_worker.buf[:taille]
+    if any(analyzer._DONNEES_BYTES_REQUISES for analyzer in analyzers):
+        # Une seule copie par worker pour les bibliothèques qui refusent les memoryview
+        _donnees_bytes_worker = bytes(_donnees_worker)
+    _bornes_worker = bornes
+    _gagnant_worker = gagnant
+    prechauffer_lexique()
+
+
+def _tester_lot(rang: int, debut: int, cles: CLES, exclues: Optional[bytes] = None) -> tuple[int, int, Optional[tuple[int, bytes, str, float]]]:
+    """
+        Teste un lot de clés contiguës dans le worker.
+
+        Le lot est abandonné dès qu'une clé d'index inférieur a déjà réussi ailleurs (borne partagée),
+        ce qui annule le travail devenu inutile sans perdre le premier succès dans l'ordre du dictionnaire.
+        En course, il est aussi abandonné dès qu'un autre algorithme a gagné.
+
+        Args:
+            rang(int): rang de l'algorithme attaqué parmi les analyzers du worker
+            debut(int): index global de la première clé du lot
+            cles(list[bytes] | KeyStore): les clés du lot
+            exclues(bytes): masque du lot, une clé est sautée si son octet est non nul (déjà testée sans succès)
+
+        Returns:
+            tuple: (nombre de clés testées, nombre de clés parcourues (testées ou sautées), (index, clé, texte, taux) ou None)
+    """
+    analyzer = _analyzers_worker[rang]
+    donnees = _donnees_bytes_worker if analyzer._DONNEES_BYTES_REQUISES else _donnees_worker
+    nb_testees = 0
+    nb_parcourues = 0
+    for decalage, cle in enumerate(cles):
+        index = debut + decalage
+        if index > _bornes_worker[rang] or _gagnant_worker.value not in (-1, rang):
+            break
+        nb_parcourues += 1
+        if exclues is not None and exclues[decalage]:
+            continue
+        texte, taux = evaluer_dechiffrement(analyzer.dechiffrer_donnees(donnees, cle))
+        nb_testees += 1
+        if est_dechiffrement_reussi(texte, taux):
+            with _bornes_worker.get_lock():
+                if index < _bornes_worker[rang]:
+                    _bornes_worker[rang] = index
+            with _gagnant_worker.get_lock():
+                if _gagnant_worker.value == -1:
+                    _gagnant_worker.value = rang
+            return nb_testees, nb_parcourues, (index, bytes(cle), texte, taux)
+    return nb_testees, nb_parcourues, None
+
+
+class MoteurAttaque:
+    """
+        Moteur d'attaque par dictionnaire, séquentiel ou réparti sur un pool de processus.
+
+        En mode parallèle, les clés sont découpées en lots contigus soumis à un `ProcessPoolExecutor`
+        (fenêtre de soumission bornée). Le texte chiffré est déposé une fois dans un segment
+        `multiprocessing.shared_memory`, détruit à la fin de la recherche même en cas d'erreur.
+        Chaque worker déchiffre et valide localement. Dès qu'un succès est signalé, les lots situés après lui
+        dans le dictionnaire sont annulés ; les lots antérieurs vont à leur terme pour que le résultat soit
+        toujours identique au premier succès de la recherche séquentielle.
+
+        Plusieurs algorithmes peuvent aussi être attaqués en course (`course`) sur le même pool: la fenêtre
+        de soumission est partagée au prorata des scores d'identification et les autres algorithmes sont
+        annulés dès que l'un d'eux réussit.
+
+        Attributes:
+            nb_workers(int): nombre de processus (1 = séquentiel)
+            taille_lot(int): nombre de clés par tâche
+            seuil_parallele(int): nombre minimal de clés pour justifier le démarrage d'un pool
+            arret(threading.Event): demande d'arrêt venue d'un autre fil (None = aucune) ; une fois levée, les
+                recherches s'arrêtent comme à leur échéance (avant la clé suivante en séquentiel, les lots en
+                attente étant annulés en parallèle)
+            metriques(Instrumentation): destination des mesures (clés testées, rejetées, durées de déchiffrement
+                et de validation) ; l'instrumentation de base ne mesure rien
+    """
+
+    # Attente maximale (secondes) entre deux vérifications d'une demande d'arrêt en mode parallèle
+    DELAI_SCRUTATION_ARRET = 0.05
+
+    def __init__(self, nb_workers: int = 1, taille_lot: int = 256, seuil_parallele: int = 512):
+        self.nb_workers = max(1, nb_workers or os.cpu_count() or 1)
+        self.taille_lot = max(1, taille_lot)
+        self.seuil_parallele = seuil_parallele
+        self.arret: Optional[threading.Event] = None
+        self.metriques = Instrumentation()
+
+    def _arrete(self) -> bool:
+        return self.arret is not None and self.arret.is_set()
+
+    def rechercher(self, analyzer: CryptoAnalyzer, donnees: bytes, cles: CLES, debut: int = 0, echeance: Optional[float] = None,
+                   progression: Optional[Callable[[int], None]] = None, exclues: Optional[bytes] = None) -> ResultatRecherche:
+        """
+            Cherche la première clé (dans l'ordre du dictionnaire) qui produit un texte valide.
+
+            Args:
+                analyzer(CryptoAnalyzer): l'analyzer de l'algorithme attaqué
+                donnees(bytes): le contenu du fichier chiffré
+                cles(list[bytes] | KeyStore): les clés candidates
+                debut(int): index de la première clé à tester (reprise d'une recherche interrompue)
+                echeance(float): instant `time.monotonic()` au-delà duquel plus aucune clé n'est soumise
+                progression(Callable[[int], None]): appelé avec l'index jusqu'auquel toutes les clés ont été testées
+                exclues(bytes): masque aligné sur les clés, une clé dont l'octet est non nul est sautée sans être déchiffrée
+
+            Returns:
+                ResultatRecherche: le résultat de la recherche
+        """
+        rappel = None if progression is None else lambda _, frontiere: progression(frontiere)
+        return self.course(donnees, [(analyzer, 1.0, cles)], echeance, [debut], rappel, [exclues])[0]
+
+    def course(self, donnees: bytes, candidats: Sequence[tuple[CryptoAnalyzer, float, CLES]], echeance: Optional[float] = None,
+               debuts: Optional[Sequence[int]] = None, progression: Optional[Callable[[int, int], None]] = None,
+               exclusions: Optional[Sequence[Optional[bytes]]] = None) -> list[ResultatRecherche]:
+        """
+            Attaque plusieurs algorithmes candidats d'un même fichier.
+
+            En parallèle, tous les candidats avancent en même temps, chacun recevant une part des workers
+            proportionnelle à son score ; le premier algorithme qui réussit gagne et les autres sont annulés.
+            En séquentiel, les candidats sont attaqués dans l'ordre fourni jusqu'au premier succès.
+            Au sein de l'algorithme gagnant, la clé retenue est toujours la première dans l'ordre du dictionnaire.
+
+            Args:
+                donnees(bytes): le contenu du fichier chiffré
+                candidats(list[tuple]): (analyzer, score d'identification, clés candidates) pour chaque algorithme
+                echeance(float): instant `time.monotonic()` au-delà duquel plus aucune clé n'est soumise
+                debuts(list[int]): index de reprise de chaque candidat (0 par défaut)
+                progression(Callable[[int, int], None]): appelé avec (rang du candidat, index jusqu'auquel toutes ses
+                    clés ont été testées) au fil de la recherche
+                exclusions(list[bytes]): masque de clés à sauter de chaque candidat (None = aucune)
+
+            Returns:
+                list[ResultatRecherche]: un résultat par candidat, au plus un seul trouvé
+        """
+        debuts = list(debuts) if debuts is not None else [0] * len(candidats)
+        exclusions = list(exclusions) if exclusions is not None else [None] * len(candidats)
+        restantes = sum(len(cles) - debut for (_, _, cles), debut in zip(candidats, debuts))
+        if self.nb_workers > 1 and restantes >= self.seuil_parallele:
+            return self._course_parallele(donnees, candidats, echeance, debuts, progression, exclusions)
+
+        resultats: list[ResultatRecherche] = []
+        for rang, ((analyzer, _, cles), debut, exclues) in enumerate(zip(candidats, debuts, exclusions)):
+            if resultats and resultats[-1].trouve:
+                resultats.append(ResultatRecherche(reprise=debut))
+            else:
+                rappel = None if progression is None else lambda frontiere, rang=rang: progression(rang, frontiere)
+                resultats.append(self._rechercher_sequentiel(analyzer, donnees, cles, debut, echeance, rappel, exclues))
+        return resultats
+
+    def rechercher_groupe(self, analyzer: CryptoAnalyzer, donnees: Sequence[bytes], cles: CLES,
+                          echeance: Optional[float] = None, debuts: Optional[Sequence[int]] = None,
+                          exclusions: Optional[Sequence[Optional[bytes]]] = None,
+                          progression: Optional[Callable[[int, int], None]] = None) -> list[ResultatRecherche]:
+        """
+            Attaque en un seul passage plusieurs fichiers chiffrés avec le même algorithme et la même dérivation.
+
+            Chaque clé candidate est lue une fois et testée sur tous les fichiers encore en attente ; un fichier
+            quitte le groupe dès qu'il est déchiffré et le passage s'arrête quand le groupe est vide. Pour chaque
+            fichier, la clé retenue est la première dans l'ordre du dictionnaire, comme avec `rechercher`.
+            Le passage est séquentiel, dans le processus courant: `nb_workers` est ignoré.
+
+            Args:
+                analyzer(CryptoAnalyzer): l'analyzer de l'algorithme commun
+                donnees(list[bytes]): le contenu de chaque fichier chiffré
+                cles(list[bytes] | KeyStore): les clés candidates, dérivées une seule fois pour tout le groupe
+                echeance(float): instant `time.monotonic()` au-delà duquel plus aucune clé n'est testée
+                debuts(list[int]): index de reprise de chaque fichier (None = 0 pour tous)
+                exclusions(list[bytes]): masque des clés à sauter pour chaque fichier (1 = déjà essayée, None = aucune)
+                progression(Callable[[int, int], None]): appelé avec (rang du fichier, frontière atteinte) tous les
+                    `taille_lot` index pour chaque fichier en attente
+
+            Returns:
+                list[ResultatRecherche]: un résultat par fichier, dans l'ordre des données
+        """
+        debuts = list(debuts) if debuts is not None else [0] * len(donnees)
+        exclusions = exclusions if exclusions is not None else [None] * len(donnees)
+        resultats = [ResultatRecherche(reprise=len(cles)) for _ in donnees]
+        en_attente = [rang for rang in range(len(donnees)) if debuts[rang] < len(cles)]
+        premier = min(debuts, default=0)
+        for index in range(premier, len(cles)):
+            if not en_attente:
+                break
+            if (echeance is not None and time.monotonic() >= echeance) or self._arrete():
+                for rang in en_attente:
+                    resultats[rang].reprise = max(index, debuts[rang])
+                break
+            if progression is not None and index > premier and index % self.taille_lot == 0:
+                for rang in en_attente:
+                    progression(rang, max(index, debuts[rang]))
+            cle = None
+            for rang in list(en_attente):
+                if index < debuts[rang]:
+                    continue
+                if exclusions[rang] is not None and exclusions[rang][index]:
+                    self.metriques.compter("cles_rejetees")
+                    continue
+                if cle is None:
+                    cle = cles[index]
+                resultats[rang].nb_testees += 1
+                texte, taux = self.metriques.essayer(analyzer, donnees[rang], cle)
+                if est_dechiffrement_reussi(texte, taux):
+                    resultats[rang] = ResultatRecherche(index, bytes(cle), texte, taux, resultats[rang].nb_testees, index + 1)
+                    en_attente.remove(rang)
+        return resultats
+
+    def _rechercher_sequentiel(self, analyzer: CryptoAnalyzer, donnees: bytes, cles: CLES, debut: int = 0, echeance: Optional[float] = None,
+                               progression: Optional[Callable[[int], None]] = None, exclues: Optional[bytes] = None) -> ResultatRecherche:
+        nb_testees = 0
+        for index in range(debut, len(cles)):
+            if (echeance is not None and time.monotonic() >= echeance) or self._arrete():
+                return ResultatRecherche(nb_testees=nb_testees, reprise=index)
+            if progression is not None and index > debut and index % self.taille_lot == 0:
+                progression(index)
+            if exclues is not None and exclues[index]:
+                self.metriques.compter("cles_rejetees")
+                continue
+            cle = cles[index]
+            nb_testees += 1
+            texte, taux = self.metriques.essayer(analyzer, donnees, cle)
+            if est_dechiffrement_reussi(texte, taux):
+                return ResultatRecherche(index, bytes(cle), texte, taux, nb_testees, index + 1)
+        return ResultatRecherche(nb_testees=nb_testees, reprise=len(cles))
+
+    def _lot(self, cles: CLES, debut: int) -> CLES:
+        fin = min(debut + self.taille_lot, len(cles))
+        if isinstance(cles, KeyStore):
+            return cles.tranche(debut, fin)
+        return list(cles[debut:fin])
+
+    def _quotas(self, scores: list[float]) -> list[int]:
+        """
+            Répartit la fenêtre de soumission (deux lots par worker) entre les candidats au prorata des scores.
+        """
+        fenetre = 2 * self.nb_workers
+        total = sum(scores)
+        if total <= 0:
+            return [max(1, fenetre // len(scores))] * len(scores)
+        return [max(1, round(fenetre * score / total)) for score in scores]
+
+    def _course_parallele(self, donnees: bytes, candidats: Sequence[tuple[CryptoAnalyzer, float, CLES]], echeance: Optional[float],
+                          debuts: list[int], progression: Optional[Callable[[int, int], None]],
+                          exclusions: list[Optional[bytes]]) -> list[ResultatRecherche]:
+        nb_cles = [len(cles) for _, _, cles in candidats]
+        quotas = self._quotas([score for _, score, _ in candidats])
+        contexte = contexte_processus()
+        # Index de la meilleure clé trouvée par candidat (nb_cles = aucune) et rang du gagnant (-1 = aucun)
+        bornes = contexte.Array('q', nb_cles)
+        gagnant = contexte.Value('i', -1)
+        meilleurs: list[Optional[tuple[int, bytes, str, float]]] = [None] * len(candidats)
+        nb_testees = [0] * len(candidats)
+        prochains = list(debuts)
+        # Frontière contiguë de chaque candidat: les lots se terminent dans le désordre, seuls ceux qui la
+        # prolongent sans trou la font avancer
+        frontieres = list(debuts)
+        lots_termines: list[set[int]] = [set() for _ in candidats]
+        expire = False
+        en_cours: dict[Future, tuple[int, int]] = {}
+
+        # Le texte chiffré est placé une seule fois en mémoire partagée (aucune copie par tâche ni par worker)
+        segment = shared_memory.SharedMemory(create=True, size=max(1, len(donnees)))
+        executor: Optional[ProcessPoolExecutor] = None
+        try:
+            segment.buf[:len(donnees)] = donnees
+            executor = ProcessPoolExecutor(
+                max_workers=self.nb_workers,
+                mp_context=contexte,
+                initializer=_initialiser_worker,
+                initargs=([analyzer for analyzer, _, _ in candidats], segment.name, len(donnees), bornes, gagnant),
+            )
+            while True:
+                # Échéance atteinte (ou arrêt demandé): plus aucune soumission, les lots en cours vont à leur terme
+                expire = expire or (echeance is not None and time.monotonic() >= echeance) or self._arrete()
+
+                # Fenêtre de soumission par candidat, jamais au-delà de son meilleur succès connu ;
+                # une fois la course gagnée, toute la fenêtre revient au gagnant
+                for rang, (_, _, cles) in enumerate(candidats):
+                    if expire or gagnant.value not in (-1, rang):
+                        continue
+                    quota = 2 * self.nb_workers if gagnant.value == rang else quotas[rang]
+                    actifs = sum(1 for r, _ in en_cours.values() if r == rang)
+                    while not expire and prochains[rang] < nb_cles[rang] and prochains[rang] <= bornes[rang] and actifs < quota:
+                        debut = prochains[rang]
+                        exclues = exclusions[rang]
+                        masque = None if exclues is None else bytes(exclues[debut:debut + self.taille_lot])
+                        futur = executor.submit(_tester_lot, rang, debut, self._lot(cles, debut), masque)
+                        en_cours[futur] = (rang, prochains[rang])
+                        prochains[rang] += self.taille_lot
+                        actifs += 1
+                        # Un lot de clés dérivées à la demande (ClesProgressives) peut être long à préparer
+                        expire = (echeance is not None and time.monotonic() >= echeance) or self._arrete()
+                if not en_cours:
+                    break
+
+                delai = None if echeance is None or expire else max(0.0, echeance - time.monotonic())
+                if self.arret is not None and not expire:
+                    # Attente bornée: une demande d'arrêt est prise en compte sans attendre la fin d'un lot
+                    delai = min(delai, self.DELAI_SCRUTATION_ARRET) if delai is not None else self.DELAI_SCRUTATION_ARRET
+                termines, _ = wait(en_cours, timeout=delai, return_when=FIRST_COMPLETED)
+                for futur in termines:
+                    rang, debut = en_cours.pop(futur)
+                    testees, parcourues, succes = futur.result()
+                    nb_testees[rang] += testees
+                    self.metriques.compter("cles_testees", testees)
+                    self.metriques.compter("cles_rejetees", parcourues - testees)
+                    self.metriques.compter("octets_dechiffres", testees * len(donnees))
+                    if succes is not None and (meilleurs[rang] is None or succes[0] < meilleurs[rang][0]):
+                        meilleurs[rang] = succes
+                    elif parcourues == min(self.taille_lot, nb_cles[rang] - debut):
+                        lots_termines[rang].add(debut)
+                        avancee = False
+                        while frontieres[rang] in lots_termines[rang]:
+                            lots_termines[rang].remove(frontieres[rang])
+                            frontieres[rang] = min(frontieres[rang] + self.taille_lot, nb_cles[rang])
+                            avancee = True
+                        if avancee and progression is not None:
+                            progression(rang, frontieres[rang])
+
+                # Annulation des lots en attente devenus inutiles (après un succès, d'un algorithme perdant ou
+                # après l'échéance) ; la reprise recule au premier lot annulé pour rester contiguë
+                expire = expire or (echeance is not None and time.monotonic() >= echeance) or self._arrete()
+                for futur, (rang, debut) in list(en_cours.items()):
+                    if (expire or debut > bornes[rang] or gagnant.value not in (-1, rang)) and futur.cancel():
+                        del en_cours[futur]
+                        prochains[rang] = min(prochains[rang], debut)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            segment.close()
+            segment.unlink()
+
+        # Reprise = frontière contiguë: un lot abandonné en cours de route n'y est jamais compté comme testé
+        resultats = [ResultatRecherche(nb_testees=testees, reprise=frontiere) for testees, frontiere in zip(nb_testees, frontieres)]
+        if gagnant.value >= 0 and meilleurs[gagnant.value] is not None:
+            index, cle, texte, taux = meilleurs[gagnant.value]
+            resultats[gagnant.value] = ResultatRecherche(index, cle, texte, taux, nb_testees[gagnant.value], index + 1)
+        return resultats
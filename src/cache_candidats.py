@@ -0,0 +1,151 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Union
+
+from src.crypto_analyzer import CryptoAnalyzer
+from src.key_store import KeyStore
+from src.metriques import Instrumentation
+
+
+class CacheCandidats:
+    """
+        Cache LRU en mémoire des clés candidates, détenu par l'orchestrateur.
+
+        Une entrée est identifiée par l'analyzer (classe et paramètres de dérivation), l'identité du
+        dictionnaire (chemin absolu, taille, date de modification) et le format demandé. Tant que le
+        dictionnaire n'est pas modifié, les dérivations coûteuses (PBKDF2) ne sont faites qu'une fois par
+        session, quel que soit le nombre de fichiers, de missions ou d'actions du menu.
+
+        Le cache peut être partagé par plusieurs orchestrateurs de fils différents (workers du service):
+        une entrée demandée par plusieurs fils à la fois n'est dérivée qu'une fois, les autres attendent
+        ses clés.
+
+        Attributes:
+            budget_octets(int): mémoire maximale occupée par les clés en cache
+            octets_utilises(int): mémoire actuellement occupée
+            succes(int): nombre de requêtes servies depuis le cache
+            echecs(int): nombre de requêtes ayant nécessité une génération
+    """
+
+    BUDGET_PAR_DEFAUT: int = 256 * 1024 * 1024
+
+    def __init__(self, budget_octets: int = BUDGET_PAR_DEFAUT):
+        self.budget_octets = budget_octets
+        self.octets_utilises = 0
+        self.succes = 0
+        self.echecs = 0
+        self._entrees: OrderedDict[Hashable, tuple[Union[list[bytes], KeyStore], int]] = OrderedDict()
+        self._verrou = threading.Lock()
+        # Verrou de chaque entrée en cours de dérivation
+        self._derivations: Dict[Hashable, threading.Lock] = {}
+
+    @staticmethod
+    def identifier(analyzer: CryptoAnalyzer, chemin_dictionnaire: str, compact: bool = True) -> Hashable:
+        """
+            Calcule la clé de cache d'une génération de candidats.
+
+            Args:
+                analyzer(CryptoAnalyzer): l'analyzer qui génère les clés
+                chemin_dictionnaire(str): le dictionnaire utilisé
+                compact(bool): format demandé (KeyStore ou liste)
+
+            Returns:
+                Hashable: l'identifiant de l'entrée
+        """
+        chemin_absolu = os.path.abspath(chemin_dictionnaire)
+        infos = os.stat(chemin_absolu)
+        classe = type(analyzer)
+        return (
+            f"{classe.__module__}.{classe.__qualname__}",
+            analyzer.parametres_derivation(),
+            chemin_absolu,
+            infos.st_size,
+            infos.st_mtime_ns,
+            compact,
+        )
+
+    @staticmethod
+    def _taille(cles: Union[list[bytes], KeyStore]) -> int:
+        if isinstance(cles, KeyStore):
+            return cles.nbytes
+        return sys.getsizeof(cles) + sum(sys.getsizeof(cle) for cle in cles)
+
+    def obtenir(self, analyzer: CryptoAnalyzer, chemin_dictionnaire: str, compact: bool = True,
+                metriques: Optional[Instrumentation] = None) -> Union[list[bytes], KeyStore]:
+        """
+            Retourne les clés candidates de l'analyzer pour ce dictionnaire, en les générant au besoin.
+
+            Args:
+                analyzer(CryptoAnalyzer): l'analyzer qui génère les clés
+                chemin_dictionnaire(str): le dictionnaire utilisé
+                compact(bool): si True, les clés sont rangées dans un KeyStore
+                metriques(Instrumentation): reçoit la durée de l'étape « derivation », mesurée seulement quand
+                    les clés sont réellement générées (None = aucune mesure)
+
+            Returns:
+                list[bytes] | KeyStore: les clés candidates (à ne pas modifier: elles sont partagées)
+        """
+        metriques = metriques if metriques is not None else Instrumentation()
+        try:
+            cle_cache = self.identifier(analyzer, chemin_dictionnaire, compact)
+        except OSError:
+            # Dictionnaire introuvable: l'analyzer gère lui-même le cas (liste vide)
+            with metriques.etape("derivation"):
+                return analyzer.generer_cles_candidates(chemin_dictionnaire, compact=compact)
+
+        with self._verrou:
+            cles = self._consulter(cle_cache)
+            if cles is not None:
+                return cles
+            verrou_derivation = self._derivations.setdefault(cle_cache, threading.Lock())
+
+        with verrou_derivation:
+            with self._verrou:
+                # Entrée dérivée par un autre fil pendant l'attente
+                cles = self._consulter(cle_cache)
+                if cles is not None:
+                    return cles
+                self.echecs += 1
+            with metriques.etape("derivation"):
+                cles = analyzer.generer_cles_candidates(chemin_dictionnaire, compact=compact)
+            taille = self._taille(cles)
+            with self._verrou:
+                self._derivations.pop(cle_cache, None)
+                if taille <= self.budget_octets:
+                    self._entrees[cle_cache] = (cles, taille)
+                    self.octets_utilises += taille
+                    self._evincer()
+        return cles
+
+    def _consulter(self, cle_cache: Hashable) -> Union[list[bytes], KeyStore, None]:
+        entree = self._entrees.get(cle_cache)
+        if entree is None:
+            return None
+        self._entrees.move_to_end(cle_cache)
+        self.succes += 1
+        return entree[0]
+
+    def contient(self, analyzer: CryptoAnalyzer, chemin_dictionnaire: str, compact: bool = True) -> bool:
+        """
+            Indique si les clés candidates de l'analyzer pour ce dictionnaire sont en cache (sans les générer).
+        """
+        try:
+            return self.identifier(analyzer, chemin_dictionnaire, compact) in self._entrees
+        except OSError:
+            return False
+
+    def _evincer(self) -> None:
+        """Retire les entrées les moins récemment utilisées jusqu'à respecter le budget."""
+        while self.octets_utilises > self.budget_octets and self._entrees:
+            _, (_, taille) = self._entrees.popitem(last=False)
+            self.octets_utilises -= taille
+
+    def vider(self) -> None:
+        with self._verrou:
+            self._entrees.clear()
+            self.octets_utilises = 0
+
+    def __len__(self) -> int:
+        return len(self._entrees)
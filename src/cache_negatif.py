@@ -0,0 +1,156 @@
+import hashlib
+import heapq
+import os
+import re
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Tuple, Union
+
+from src.key_store import KeyStore
+
+
+class CacheNegatif:
+    """
+        Cache persistant des candidats déjà essayés sans succès, par (empreinte SHA-256 du texte chiffré, algorithme).
+
+        Un candidat est une suite d'octets: l'orchestrateur y range l'identité d'un mot de passe (le mot et les
+        paramètres de dérivation de l'analyzer, voir `element_mot`), si bien qu'un mot déjà essayé est écarté
+        avant que ses clés ne soient dérivées. Chaque candidat est réduit à une empreinte de 8 octets (BLAKE2b).
+        Les empreintes d'un couple sont rangées sur disque en « runs »: fichiers d'entiers non signés de 64 bits
+        triés et sans doublon, un run par attaque. Une recherche par dichotomie dans chaque run indique si un
+        candidat a déjà échoué. Au-delà de `max_runs` runs, ils sont fusionnés en un seul (compaction).
+
+        Une collision d'empreintes ferait sauter un candidat jamais essayé: avec 64 bits, la probabilité reste
+        négligeable même pour des dizaines de millions de candidats.
+
+        Attributes:
+            dossier(str): dossier racine du cache
+            max_runs(int): nombre de runs au-delà duquel un couple est compacté
+    """
+
+    MAX_RUNS_PAR_DEFAUT = 8
+    EXTENSION = ".run"
+
+    def __init__(self, dossier: str, max_runs: int = MAX_RUNS_PAR_DEFAUT):
+        self.dossier = dossier
+        self.max_runs = max(1, max_runs)
+        self._runs: Dict[Tuple[str, str], List[array]] = {}
+
+    @staticmethod
+    def empreinte_cle(cle: bytes) -> int:
+        """
+            Empreinte de 64 bits d'un candidat.
+        """
+        return int.from_bytes(hashlib.blake2b(cle, digest_size=8).digest(), "little")
+
+    @staticmethod
+    def element_mot(mot: str, parametres_derivation: tuple) -> bytes:
+        """
+            Identité d'un mot de passe candidat: le mot et la recette de dérivation de ses clés.
+        """
+        return repr((mot, parametres_derivation)).encode("utf-8")
+
+    def _dossier_couple(self, empreinte: str, algo: str) -> str:
+        return os.path.join(self.dossier, empreinte, re.sub(r"[^A-Za-z0-9_.-]", "_", algo))
+
+    def _charger(self, empreinte: str, algo: str) -> List[array]:
+        couple = (empreinte, algo)
+        if couple not in self._runs:
+            runs = []
+            dossier = self._dossier_couple(empreinte, algo)
+            if os.path.isdir(dossier):
+                for nom in sorted(os.listdir(dossier)):
+                    if not nom.endswith(self.EXTENSION):
+                        continue
+                    run = array("Q")
+                    with open(os.path.join(dossier, nom), "rb") as f:
+                        run.frombytes(f.read())
+                    runs.append(run)
+            self._runs[couple] = runs
+        return self._runs[couple]
+
+    def contient(self, empreinte: str, algo: str, cle: bytes) -> bool:
+        """
+            Indique si un candidat a déjà été essayé sans succès sur ce texte chiffré.
+        """
+        return self._present(empreinte, algo, self.empreinte_cle(cle))
+
+    def masque(self, empreinte: str, algo: str, cles: Union[List[bytes], KeyStore]) -> bytearray:
+        """
+            Masque des candidats déjà essayés, aligné sur les candidats (1 = à sauter).
+
+            Args:
+                empreinte(str): empreinte SHA-256 du texte chiffré
+                algo(str): algorithme attaqué
+                cles(list[bytes] | KeyStore): les candidats
+
+            Returns:
+                bytearray: un octet par candidat, vide si aucun candidat n'a encore été essayé
+        """
+        if not self._charger(empreinte, algo):
+            return bytearray()
+        return bytearray(self.contient(empreinte, algo, cle) for cle in cles)
+
+    def enregistrer(self, empreinte: str, algo: str, cles: Union[List[bytes], KeyStore], debut: int, fin: int) -> int:
+        """
+            Enregistre comme échoués les candidats d'index [debut, fin) dans un nouveau run, puis compacte si nécessaire.
+
+            Returns:
+                int: nombre d'empreintes nouvelles enregistrées
+        """
+        valeurs = sorted({self.empreinte_cle(cles[i]) for i in range(debut, fin)})
+        nouvelles = array("Q", (valeur for valeur in valeurs if not self._present(empreinte, algo, valeur)))
+        if not nouvelles:
+            return 0
+
+        dossier = self._dossier_couple(empreinte, algo)
+        os.makedirs(dossier, exist_ok=True)
+        runs = self._charger(empreinte, algo)
+        self._ecrire_run(dossier, nouvelles)
+        runs.append(nouvelles)
+        if len(runs) > self.max_runs:
+            self.compacter(empreinte, algo)
+        return len(nouvelles)
+
+    def _present(self, empreinte: str, algo: str, valeur: int) -> bool:
+        for run in self._charger(empreinte, algo):
+            position = bisect_left(run, valeur)
+            if position < len(run) and run[position] == valeur:
+                return True
+        return False
+
+    def _ecrire_run(self, dossier: str, run: array) -> None:
+        numeros = [int(nom[:-len(self.EXTENSION)]) for nom in os.listdir(dossier) if nom.endswith(self.EXTENSION)]
+        chemin = os.path.join(dossier, f"{max(numeros, default=-1) + 1:08d}{self.EXTENSION}")
+        temporaire = chemin + ".tmp"
+        with open(temporaire, "wb") as f:
+            run.tofile(f)
+        os.replace(temporaire, chemin)
+
+    def compacter(self, empreinte: str, algo: str) -> None:
+        """
+            Fusionne tous les runs d'un couple en un seul run trié et sans doublon.
+        """
+        runs = self._charger(empreinte, algo)
+        if len(runs) <= 1:
+            return
+        fusion = array("Q")
+        precedente = None
+        for valeur in heapq.merge(*runs):
+            if valeur != precedente:
+                fusion.append(valeur)
+                precedente = valeur
+
+        dossier = self._dossier_couple(empreinte, algo)
+        anciens = [nom for nom in os.listdir(dossier) if nom.endswith(self.EXTENSION)]
+        # Le run fusionné est écrit avant la suppression des anciens: une interruption ne perd aucune empreinte
+        self._ecrire_run(dossier, fusion)
+        for nom in anciens:
+            os.remove(os.path.join(dossier, nom))
+        self._runs[(empreinte, algo)] = [fusion]
+
+    def taille(self, empreinte: str, algo: str) -> int:
+        """
+            Nombre d'empreintes enregistrées pour un couple (doublons entre runs compris).
+        """
+        return sum(len(run) for run in self._charger(empreinte, algo))
@@ -0,0 +1,85 @@
+import json
+import os
+from typing import Any, Dict, Optional
+
+
+class CacheResultats:
+    """
+        Cache persistant des résultats de mission, adressé par le contenu des fichiers chiffrés.
+
+        Chaque entrée est identifiée par l'empreinte SHA-256 du fichier et conserve l'algorithme, la clé retrouvée
+        et les scores d'identification des algorithmes éligibles: un fichier identique (même sous un autre nom) n'est
+        ni ré-identifié ni ré-attaqué. Seuls les déchiffrements réussis sont conservés ; l'appelant revérifie la clé
+        avant de réutiliser une entrée. Le fichier JSON est réécrit (fichier temporaire puis renommage atomique)
+        à chaque modification, les résultats étant rares au regard du coût d'une attaque.
+
+        Attributes:
+            chemin(str): chemin du fichier JSON du cache
+    """
+
+    VERSION = 1
+
+    def __init__(self, chemin: str):
+        self.chemin = chemin
+        self._resultats: Dict[str, Dict[str, Any]] = self._lire()
+
+    def _lire(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.chemin, "r", encoding="utf-8") as f:
+                etat = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(etat, dict) or etat.get("version") != self.VERSION:
+            return {}
+        return etat.get("resultats", {})
+
+    def obtenir(self, empreinte: str) -> Optional[Dict[str, Any]]:
+        """
+            Entrée d'un fichier chiffré, ou None s'il n'a jamais été déchiffré.
+
+            Args:
+                empreinte(str): empreinte SHA-256 du fichier chiffré
+
+            Returns:
+                dict | None: {"algo", "cle" (bytes), "scores", "fichier"}
+        """
+        entree = self._resultats.get(empreinte)
+        if entree is None:
+            return None
+        try:
+            return {**entree, "cle": bytes.fromhex(entree["cle"])}
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def enregistrer(self, empreinte: str, fichier: str, algo: str, cle: bytes, scores: Dict[str, float]) -> None:
+        """
+            Enregistre le déchiffrement réussi d'un fichier.
+
+            Args:
+                empreinte(str): empreinte SHA-256 du fichier chiffré
+                fichier(str): nom du fichier lors du déchiffrement (informatif)
+                algo(str): algorithme retrouvé
+                cle(bytes): clé retrouvée
+                scores(dict[str, float]): scores d'identification des algorithmes éligibles
+        """
+        self._resultats[empreinte] = {"fichier": fichier, "algo": algo, "cle": cle.hex(), "scores": scores}
+        self.sauvegarder()
+
+    def oublier(self, empreinte: str) -> None:
+        """
+            Supprime l'entrée d'un fichier (clé qui ne déchiffre plus).
+        """
+        if self._resultats.pop(empreinte, None) is not None:
+            self.sauvegarder()
+
+    def sauvegarder(self) -> None:
+        """
+            Écrit le cache (fichier temporaire puis renommage atomique).
+        """
+        temporaire = f"{self.chemin}.tmp"
+        with open(temporaire, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "resultats": self._resultats}, f)
+        os.replace(temporaire, self.chemin)
+
+    def __len__(self) -> int:
+        return len(self._resultats)
@@ -0,0 +1,71 @@
+from typing import Iterator, List, Optional, Sequence, Union
+
+from src.crypto_analyzer import CryptoAnalyzer
+from src.metriques import Instrumentation
+
+
+class ClesProgressives:
+    """
+        Clés candidates dérivées à la demande, mot par mot, dans l'ordre de `generer_cles_candidates`.
+
+        La séquence a la longueur de l'espace de clés complet, mais un mot n'est dérivé (`deriver_cles`)
+        qu'à la première lecture d'une de ses clés. Passée au moteur d'attaque, elle place la dérivation
+        dans la boucle de recherche: l'échéance et la demande d'arrêt du moteur la bornent comme le
+        déchiffrement, et une reprise à l'index n ne dérive pas les mots antérieurs. Les mots déjà dérivés
+        restent acquis pour les recherches suivantes de la session.
+
+        Attributes:
+            analyzer(CryptoAnalyzer): l'analyzer qui dérive les clés
+            mots(list[str]): les mots candidats du dictionnaire (filtre de l'analyzer appliqué)
+            metriques(Instrumentation): reçoit la durée des dérivations effectives (étape « derivation »)
+    """
+
+    def __init__(self, analyzer: CryptoAnalyzer, mots: List[str], metriques: Optional[Instrumentation] = None,
+                 exclus: Optional[Sequence[bool]] = None, _derivees: Optional[List[Optional[List[bytes]]]] = None):
+        self.analyzer = analyzer
+        self.mots = mots
+        self.metriques = metriques if metriques is not None else Instrumentation()
+        self._par_mot = analyzer._CLES_PAR_MOT
+        # Mots à ne pas dériver (cache négatif): leurs clés sont vides, le moteur les saute
+        self._exclus = exclus
+        self._derivees = _derivees if _derivees is not None else [None] * len(mots)
+
+    @staticmethod
+    def possible(analyzer: CryptoAnalyzer) -> bool:
+        """
+            Indique si l'analyzer dérive ses clés mot par mot (capacité optionnelle `deriver_cles`).
+        """
+        return type(analyzer).deriver_cles is not CryptoAnalyzer.deriver_cles
+
+    def masquer(self, exclus: Sequence[bool]) -> 'ClesProgressives':
+        """
+            Vue sur les mêmes dérivations où les mots exclus ne sont jamais dérivés.
+        """
+        return ClesProgressives(self.analyzer, self.mots, self.metriques, exclus, self._derivees)
+
+    def _cles_mot(self, rang: int) -> List[bytes]:
+        cles = self._derivees[rang]
+        if cles is not None:
+            return cles
+        if self._exclus is not None and self._exclus[rang]:
+            return [b""] * self._par_mot
+        with self.metriques.etape("derivation"):
+            cles = self.analyzer.deriver_cles(self.mots[rang])
+        self._derivees[rang] = cles
+        return cles
+
+    def __len__(self) -> int:
+        return len(self.mots) * self._par_mot
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[bytes, List[bytes]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index de clé hors limites")
+        return self._cles_mot(index // self._par_mot)[index % self._par_mot]
+
+    def __iter__(self) -> Iterator[bytes]:
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,317 @@
+"""
+Interface en ligne de commande non interactive (traitements par lots).
+
+    python main.py identify data/*.enc
+    python main.py attack --wordlist keys/wordlist.txt --budget 30 data/mission1.enc
+    python main.py attack --sortie clair.txt data/mission2.enc
+    python main.py mission --workers 4 data
+    python main.py serve --port 8765 --workers 2 --processus 4
+    cat mission5.enc | python main.py identify -
+
+Chaque résultat est écrit sur la sortie standard dès qu'il est prêt, un objet JSON par ligne (ou un
+tableau JSON unique avec --format json). Les messages de l'orchestrateur sont écrits sur la sortie
+d'erreur, en texte brut, ou en JSON avec les événements de progression (--progression). Avec attack --sortie, le texte
+clair complet de chaque fichier déchiffré est écrit sur disque en flux (mémoire constante), une fois le
+contenu authentifié. Avec --metriques, les durées
+par étape (lecture, identification, filtrage, dérivation, déchiffrement, validation) et les compteurs de
+clés sont écrits en fin de traitement.
+
+Codes de sortie: 0 si tous les fichiers sont identifiés (identify) ou déchiffrés (attack, mission),
+1 si au moins un ne l'est pas, 2 en cas d'usage incorrect ou d'absence de fichier, 3 si un fichier
+est illisible, 130 si le traitement est interrompu.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, TextIO, Tuple
+
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur, ResultatAnalyse
+from src.metriques import Metriques
+from src.progression import SortieJsonLignes, SortieTexte
+from src.serialisation import identification_en_json, resultat_en_json
+
+if TYPE_CHECKING:
+    from src.ordonnanceur import OrdonnanceurAttaques
+
+CODE_SUCCES = 0
+CODE_ECHEC = 1
+CODE_USAGE = 2
+CODE_ERREUR_LECTURE = 3
+CODE_INTERRUPTION = 130
+
+ENTREE_STANDARD = "-"
+
+
+class _SortieResultats:
+    """
+        Écrit les résultats au fil de l'eau (JSON Lines) ou en un seul tableau JSON à la fin.
+    """
+
+    def __init__(self, flux: TextIO, format_sortie: str):
+        self.flux = flux
+        self.format_sortie = format_sortie
+        self._resultats: List[Dict[str, Any]] = []
+
+    def ecrire(self, objet: Dict[str, Any]) -> None:
+        if self.format_sortie == "jsonl":
+            self.flux.write(json.dumps(objet, ensure_ascii=False) + "\n")
+            self.flux.flush()
+        else:
+            self._resultats.append(objet)
+
+    def terminer(self) -> None:
+        if self.format_sortie == "json":
+            json.dump(self._resultats, self.flux, ensure_ascii=False, indent=2)
+            self.flux.write("\n")
+            self.flux.flush()
+
+
+def _construire_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cryptoforensic", description="Identification et attaque de fichiers chiffrés, sans interaction.")
+    commun = argparse.ArgumentParser(add_help=False)
+    commun.add_argument("--format", choices=["jsonl", "json"], default="jsonl",
+                        help="un objet JSON par ligne (défaut) ou un tableau JSON unique")
+    commun.add_argument("--rapide", action="store_true", help="identification sur l'en-tête, la fin et des pages échantillonnées")
+    commun.add_argument("--progression", action="store_true", help="événements de progression en JSON Lines sur la sortie d'erreur")
+    commun.add_argument("--metriques", default=None, metavar="FICHIER",
+                        help="durées par étape et compteurs écrits en fin de traitement (JSON si .json, format texte Prometheus sinon)")
+
+    attaque = argparse.ArgumentParser(add_help=False)
+    attaque.add_argument("-w", "--wordlist", default="keys/wordlist.txt", help="dictionnaire des mots de passe candidats")
+    attaque.add_argument("-j", "--workers", type=int, default=1,
+                         help="nombre de processus (0 = tous les cœurs): fichiers traités en parallèle par une mission simple, "
+                              "attaques parallélisées sinon (attack, mission avec --budget) ; "
+                              "incompatible avec --groupee, dont le passage est séquentiel")
+    attaque.add_argument("--budget", type=float, default=None, help="secondes d'attaque au plus (par fichier pour attack, pour toute la mission sinon)")
+
+    sous_commandes = parser.add_subparsers(dest="commande", required=True)
+    identify = sous_commandes.add_parser("identify", parents=[commun], help="scores d'identification de chaque algorithme")
+    identify.add_argument("chemins", nargs="+", help="fichiers, dossiers (fichiers .enc), motifs glob ou - pour l'entrée standard")
+
+    attack = sous_commandes.add_parser("attack", parents=[commun, attaque], help="identification puis attaque par dictionnaire")
+    attack.add_argument("chemins", nargs="+", help="fichiers, dossiers (fichiers .enc), motifs glob ou - pour l'entrée standard")
+    attack.add_argument("--algo", default=None, help="algorithme imposé (pas d'identification)")
+    attack.add_argument("--sortie", default=None, metavar="CHEMIN",
+                        help="fichier du texte clair ; dossier (fichiers <nom>.dec) si plusieurs fichiers sont attaqués")
+
+    mission = sous_commandes.add_parser("mission", parents=[commun, attaque], help="mission complète sur un dossier de fichiers .enc")
+    mission.add_argument("dossier", help="dossier des fichiers chiffrés")
+    mission.add_argument("--groupee", action="store_true", help="clés dérivées une fois et testées sur tous les fichiers d'un algorithme")
+
+    serve = sous_commandes.add_parser("serve", help="service HTTP local (API JSON) gardant analyzers et clés en mémoire")
+    serve.add_argument("--hote", default="127.0.0.1", help="adresse d'écoute")
+    serve.add_argument("--port", type=int, default=8765, help="port d'écoute")
+    serve.add_argument("-j", "--workers", type=int, default=2, help="tâches exécutées en même temps")
+    serve.add_argument("-p", "--processus", type=int, default=1,
+                       help="processus de recherche de clés de chaque attaque (0 = tous les cœurs) ; les workers sont des fils")
+    serve.add_argument("-w", "--wordlist", default="keys/wordlist.txt", help="dictionnaire par défaut des attaques")
+    serve.add_argument("--file", type=int, default=1000, help="nombre maximal de tâches en attente")
+    serve.add_argument("--racine", action="append", default=None, metavar="DOSSIER",
+                       help="dossier lisible par les requêtes (répétable ; défaut: data et le dossier du dictionnaire)")
+    return parser
+
+
+def _resoudre_chemins(motifs: List[str]) -> Tuple[List[str], List[str]]:
+    """
+        Développe les arguments en chemins de fichiers, dans l'ordre donné.
+
+        Returns:
+            tuple[list[str], list[str]]: les chemins trouvés et les arguments qui ne désignent aucun fichier
+    """
+    chemins: List[str] = []
+    introuvables: List[str] = []
+    for motif in motifs:
+        if motif == ENTREE_STANDARD:
+            chemins.append(motif)
+        elif os.path.isdir(motif):
+            chemins.extend(sorted(os.path.join(motif, nom) for nom in os.listdir(motif) if nom.endswith(".enc")))
+        elif os.path.exists(motif):
+            chemins.append(motif)
+        else:
+            trouves = sorted(chemin for chemin in glob.glob(motif, recursive=True) if os.path.isfile(chemin))
+            if trouves:
+                chemins.extend(trouves)
+            else:
+                introuvables.append(motif)
+    return chemins, introuvables
+
+
+def _identifier(orchestrateur: DetecteurCryptoOrchestrateur, fichier: str, chemin: str) -> Dict[str, Any]:
+    with open(chemin, "rb") as f:
+        empreinte = hashlib.file_digest(f, "sha256").hexdigest()
+    return identification_en_json(fichier, empreinte, orchestrateur.scorer_fichier(chemin))
+
+
+def _chemin_sortie(args: argparse.Namespace, fichier: str, nb_fichiers: int) -> Optional[str]:
+    """
+        Fichier du texte clair d'un fichier attaqué (None sans --sortie): --sortie lui-même, ou <nom>.dec dans
+        le dossier --sortie quand plusieurs fichiers sont attaqués.
+    """
+    if args.commande != "attack" or args.sortie is None:
+        return None
+    if nb_fichiers == 1 and not os.path.isdir(args.sortie):
+        return args.sortie
+    os.makedirs(args.sortie, exist_ok=True)
+    nom = "entree_standard" if fichier == ENTREE_STANDARD else os.path.splitext(os.path.basename(fichier))[0]
+    return os.path.join(args.sortie, f"{nom}.dec")
+
+
+def _attaquer(orchestrateur: DetecteurCryptoOrchestrateur, fichier: str, chemin: str, args: argparse.Namespace,
+              ordonnanceur: Optional['OrdonnanceurAttaques'], chemin_sortie: Optional[str] = None) -> Dict[str, Any]:
+    if args.algo:
+        resultat = orchestrateur.attaque_dictionnaire_manuelle(chemin, args.algo, args.wordlist)
+    elif ordonnanceur is not None:
+        # Budget par fichier: l'ordonnanceur arrête chaque attaque à son échéance
+        resultats = ordonnanceur.executer(ordonnanceur.planifier([chemin]))
+        resultat = resultats.get(chemin) or ResultatAnalyse("", b"", 0.0, b"", 0.0, 0, fichier, 0)
+    else:
+        resultat = orchestrateur.traiter_fichier(chemin, args.wordlist)
+    objet = resultat_en_json(fichier, resultat)
+    if chemin_sortie is not None:
+        # Texte clair complet écrit en flux, le fichier n'apparaît que si le contenu est authentifié et validé
+        reussi = objet["succes"] and orchestrateur.dechiffrer_vers_fichier(chemin, resultat.algo, resultat.cle, chemin_sortie)
+        objet["sortie"] = chemin_sortie if reussi else None
+    return objet
+
+
+def _traiter_fichiers(orchestrateur: DetecteurCryptoOrchestrateur, args: argparse.Namespace, sortie: _SortieResultats,
+                      entree: BinaryIO) -> int:
+    chemins, introuvables = _resoudre_chemins(args.chemins)
+    for motif in introuvables:
+        sortie.ecrire({"fichier": motif, "erreur": "fichier introuvable"})
+    if not chemins:
+        return CODE_USAGE
+
+    code = CODE_ERREUR_LECTURE if introuvables else CODE_SUCCES
+    ordonnanceur = None
+    if args.commande == "attack" and not args.algo and args.budget is not None:
+        from src.ordonnanceur import OrdonnanceurAttaques
+
+        # Coûts de dérivation mesurés une seule fois pour tous les fichiers
+        ordonnanceur = OrdonnanceurAttaques(orchestrateur, args.wordlist, budget_fichier=args.budget)
+    for fichier in chemins:
+        temporaire = None
+        chemin = fichier
+        try:
+            if fichier == ENTREE_STANDARD:
+                # Les analyzers lisent des chemins: le texte chiffré reçu est posé dans un fichier temporaire
+                with tempfile.NamedTemporaryFile(prefix="cryptoforensic-", suffix=".enc", delete=False) as f:
+                    f.write(entree.read())
+                    temporaire = chemin = f.name
+            if args.commande == "identify":
+                objet = _identifier(orchestrateur, fichier, chemin)
+                reussi = objet["algo"] is not None
+            else:
+                objet = _attaquer(orchestrateur, fichier, chemin, args, ordonnanceur, _chemin_sortie(args, fichier, len(chemins)))
+                reussi = objet["succes"]
+        except OSError as e:
+            sortie.ecrire({"fichier": fichier, "erreur": str(e)})
+            code = CODE_ERREUR_LECTURE
+            continue
+        finally:
+            if temporaire is not None:
+                os.remove(temporaire)
+        sortie.ecrire(objet)
+        if not reussi and code == CODE_SUCCES:
+            code = CODE_ECHEC
+    return code
+
+
+def _mission(orchestrateur: DetecteurCryptoOrchestrateur, args: argparse.Namespace, sortie: _SortieResultats) -> int:
+    if not os.path.isdir(args.dossier):
+        sortie.ecrire({"fichier": args.dossier, "erreur": "dossier introuvable"})
+        return CODE_USAGE
+    fichiers = sorted(nom for nom in os.listdir(args.dossier) if nom.endswith(".enc"))
+    if not fichiers:
+        return CODE_USAGE
+
+    if args.budget is not None and args.groupee:
+        sortie.ecrire({"fichier": args.dossier, "erreur": "--budget et --groupee sont incompatibles"})
+        return CODE_USAGE
+    if args.groupee and args.workers != 1:
+        # Le passage groupé teste chaque clé sur tous les fichiers dans un seul processus
+        sortie.ecrire({"fichier": args.dossier, "erreur": "--groupee s'exécute dans un seul processus (--workers 1)"})
+        return CODE_USAGE
+
+    if args.budget is None and not args.groupee:
+        # Mission simple: chaque résultat est écrit dès que son fichier est traité (dans l'ordre d'achèvement
+        # quand plusieurs workers traitent les fichiers en parallèle)
+        code = CODE_SUCCES
+        try:
+            for resultat in orchestrateur.mission_flux(args.dossier, args.wordlist, statistiques_seules=True,
+                                                       concurrente=args.workers != 1, nb_workers=args.workers):
+                objet = resultat_en_json(os.path.join(args.dossier, resultat.fichier), resultat)
+                sortie.ecrire(objet)
+                if not objet["succes"]:
+                    code = CODE_ECHEC
+        except OSError as e:
+            sortie.ecrire({"fichier": args.dossier, "erreur": str(e)})
+            return CODE_ERREUR_LECTURE
+        return code
+
+    # Budget: les workers parallélisent les attaques (moteur de l'orchestrateur) ; mode groupé: un seul processus
+    resultats = orchestrateur.mission_complete_automatique(args.dossier, args.wordlist, budget_mission=args.budget,
+                                                            groupee=args.groupee)
+    if len(resultats) != len(fichiers):
+        # Mission interrompue par une erreur (déjà signalée sur la sortie d'erreur)
+        return CODE_ERREUR_LECTURE
+    code = CODE_SUCCES
+    # Les résultats d'une mission suivent l'ordre des fichiers .enc du dossier
+    for nom, resultat in zip(fichiers, resultats):
+        objet = resultat_en_json(os.path.join(args.dossier, nom), resultat)
+        sortie.ecrire(objet)
+        if not objet["succes"]:
+            code = CODE_ECHEC
+    return code
+
+
+def main(argv: Optional[List[str]] = None, sortie: Optional[TextIO] = None, entree: Optional[BinaryIO] = None) -> int:
+    """
+        Point d'entrée de la ligne de commande.
+
+        Args:
+            argv(list[str]): arguments (ceux de la ligne de commande par défaut)
+            sortie(TextIO): destination des résultats JSON (sortie standard par défaut)
+            entree(BinaryIO): texte chiffré lu pour le chemin « - » (entrée standard par défaut)
+
+        Returns:
+            int: le code de sortie
+    """
+    try:
+        args = _construire_parser().parse_args(argv)
+    except SystemExit as e:
+        return CODE_SUCCES if e.code == 0 else CODE_USAGE
+    if args.commande == "serve":
+        from src.service import servir
+        return servir(args.hote, args.port, args.workers, args.wordlist, args.file, args.processus, args.racine)
+    sortie_resultats = _SortieResultats(sortie if sortie is not None else sys.stdout, args.format)
+    entree = entree if entree is not None else sys.stdin.buffer
+
+    # La sortie standard est réservée aux résultats: messages et progression vont sur la sortie d'erreur
+    progression = SortieJsonLignes(sys.stderr) if args.progression else SortieTexte(sys.stderr)
+    metriques = Metriques() if args.metriques else None
+    orchestrateur = DetecteurCryptoOrchestrateur(nb_workers=getattr(args, "workers", 1), identification_rapide=args.rapide,
+                                                 sortie_progression=progression, metriques=metriques)
+    try:
+        if args.commande == "mission":
+            code = _mission(orchestrateur, args, sortie_resultats)
+        else:
+            code = _traiter_fichiers(orchestrateur, args, sortie_resultats, entree)
+    except KeyboardInterrupt:
+        code = CODE_INTERRUPTION
+    sortie_resultats.terminer()
+    if metriques is not None:
+        try:
+            metriques.exporter(args.metriques)
+        except OSError as e:
+            print(f"Export des métriques impossible: {e}", file=sys.stderr)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
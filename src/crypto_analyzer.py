@@ -1,8 +1,100 @@
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+from src.apercu_fichier import ApercuFichier
+from src.key_store import KeyStore
+from src.utils import evaluer_dechiffrement, est_dechiffrement_reussi
+
+# Taille des blocs lus lors d'un déchiffrement en flux: la mémoire utilisée ne dépend pas de la taille du fichier
+TAILLE_BLOC_FLUX: int = 1024 * 1024
+# Préfixe du texte clair sur lequel porte la validation d'un déchiffrement en flux
+TAILLE_ECHANTILLON_VALIDATION: int = 4096
+
+
+def lire_par_blocs(entree: BinaryIO, nb_octets: int, taille_bloc: int = TAILLE_BLOC_FLUX) -> Iterator[bytes]:
+    """
+        Lit au plus nb_octets depuis la position courante, par blocs d'au plus taille_bloc octets.
+    """
+    while nb_octets > 0:
+        bloc = entree.read(min(taille_bloc, nb_octets))
+        if not bloc:
+            return
+        nb_octets -= len(bloc)
+        yield bloc
+
+
+class _EchantillonInvalide(Exception):
+    """
+        Levée dès que le préfixe du texte clair échoue à la validation: le déchiffrement en flux est abandonné.
+    """
+
+
+class _SortieEchantillonnee:
+    """
+        Sortie d'un déchiffrement en flux qui valide le préfixe du texte clair dès qu'il est complet.
+    """
+
+    def __init__(self, sortie: BinaryIO, taille_echantillon: int):
+        self.sortie = sortie
+        self.taille_echantillon = taille_echantillon
+        self.echantillon = bytearray()
+        self.texte = ""
+        self.taux = 0.0
+        self.valide = False
+
+    def write(self, donnees: bytes) -> int:
+        if not self.valide and len(self.echantillon) < self.taille_echantillon:
+            self.echantillon += donnees[:self.taille_echantillon - len(self.echantillon)]
+            if len(self.echantillon) == self.taille_echantillon:
+                self.valider()
+        return self.sortie.write(donnees)
+
+    def valider(self) -> None:
+        if self.valide:
+            return
+        self.texte, self.taux = evaluer_dechiffrement(bytes(self.echantillon))
+        if not est_dechiffrement_reussi(self.texte, self.taux):
+            raise _EchantillonInvalide()
+        self.valide = True
+
 
 class CryptoAnalyzer(ABC):
+    # True si dechiffrer_donnees exige des bytes (les memoryview devraient alors être copiées à chaque appel)
+    _DONNEES_BYTES_REQUISES: bool = False
+    # Nombre de clés candidates dérivées de chaque mot retenu du dictionnaire
+    _CLES_PAR_MOT: int = 1
+    # Classes d'alphabet (ApercuFichier.classe_alphabet) des fichiers que l'analyzer peut reconnaître (None = toutes)
+    _CLASSES_ALPHABET: Optional[Tuple[str, ...]] = None
+    
+    def identifier_algo(self, chemin_fichier_chiffre: str, rapide: bool = False) -> float:
+        '''
+            Estime la probabilité que le fichier ait été chiffré avec l'algorithme de l'analyzer.
+
+            Args:
+                chemin_fichier_chiffre(str): le chemin du fichier chiffré
+                rapide(bool): si True, seuls l'en-tête, la fin et quelques pages échantillonnées sont lus (voir ApercuFichier)
+
+            Returns:
+                float: score entre 0.0 et 1.0 (0.0 si le fichier est illisible)
+        '''
+        try:
+            apercu = ApercuFichier(chemin_fichier_chiffre, rapide)
+        except OSError:
+            return 0.0
+        return self.identifier_apercu(apercu) if self.compatible(apercu) else 0.0
+
+    def compatible(self, apercu: ApercuFichier) -> bool:
+        '''
+            Préfiltre peu coûteux, appliqué avant identifier_apercu: False si le fichier ne peut pas avoir été
+            chiffré avec cet algorithme (alphabet ou invariant de structure incompatible), son score est alors 0.
+            Aucun calcul d'entropie n'est fait ici.
+        '''
+        return self._CLASSES_ALPHABET is None or apercu.classe_alphabet() in self._CLASSES_ALPHABET
+
     @abstractmethod
-    def identifier_algo(self, chemin_fichier_chiffre: str) -> float:
+    def identifier_apercu(self, apercu: ApercuFichier) -> float:
         pass
     
     @abstractmethod
@@ -10,5 +102,107 @@ class CryptoAnalyzer(ABC):
         pass
     
     @abstractmethod
-    def generer_cles_candidates(self, chemin_dictionnaire: str) -> 'list[bytes]': 
-        pass
\ No newline at end of file
+    def dechiffrer_donnees(self, donnees: bytes, cle_donnee: bytes) -> bytes:
+        pass
+    
+    @abstractmethod
+    def generer_cles_candidates(self, chemin_dictionnaire: str, compact: bool = False) -> Union['list[bytes]', KeyStore]:
+        pass
+
+    def parametres_derivation(self) -> tuple:
+        '''
+            Paramètres de la recette de dérivation des clés (sel, itérations...), utilisés pour
+            identifier les clés candidates en cache. Vide si la dérivation n'a pas de paramètre.
+        '''
+        return ()
+
+    def sonder(self, donnees: bytes, cle_donnee: bytes) -> bool:
+        '''
+            Test rapide d'une clé, sans déchiffrement complet: False si la clé est certainement fausse.
+            Par défaut aucun rejet rapide n'est possible et toute clé doit être déchiffrée pour être validée.
+        '''
+        return True
+
+    @abstractmethod
+    def dechiffrer_flux(self, entree: BinaryIO, taille: int, cle_donnee: bytes, sortie: BinaryIO, taille_bloc: int = TAILLE_BLOC_FLUX) -> bool:
+        '''
+            Déchiffre un fichier ouvert par blocs, en écrivant le texte clair dans `sortie` au fil de la lecture.
+
+            Args:
+                entree(BinaryIO): le fichier chiffré, positionné au début
+                taille(int): sa taille en octets
+                cle_donnee(bytes): la clé de déchiffrement
+                sortie(BinaryIO): destination du texte clair
+                taille_bloc(int): taille des blocs lus
+
+            Returns:
+                bool: False si le contenu est rejeté (tag, HMAC ou padding invalide) ; le texte déjà écrit doit alors être jeté
+        '''
+        pass
+
+    def dechiffrer_vers_fichier(self, chemin_fichier_chiffre: str, cle_donnee: bytes, chemin_sortie: str,
+                                taille_echantillon: int = TAILLE_ECHANTILLON_VALIDATION) -> Tuple[str, float]:
+        '''
+            Déchiffre un fichier vers un autre fichier, en mémoire constante quelle que soit sa taille.
+
+            Le texte clair est écrit dans un fichier temporaire du dossier de destination ; seul son préfixe
+            (`taille_echantillon` octets) est validé, et le déchiffrement est abandonné dès que ce préfixe échoue.
+            Le fichier de sortie n'apparaît (renommage atomique) qu'une fois le contenu authentifié (tag GCM,
+            HMAC Fernet, padding) et le préfixe validé.
+
+            Args:
+                chemin_fichier_chiffre(str): le fichier chiffré
+                cle_donnee(bytes): la clé de déchiffrement
+                chemin_sortie(str): le fichier de texte clair à produire
+                taille_echantillon(int): taille du préfixe validé
+
+            Returns:
+                Tuple[str, float]: le texte du préfixe et son taux de succès (("", 0.0) si le contenu est rejeté)
+        '''
+        descripteur, temporaire = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(chemin_sortie)), prefix=".dechiffrement-", suffix=".tmp")
+        try:
+            with open(chemin_fichier_chiffre, "rb") as entree, os.fdopen(descripteur, "wb") as fichier_sortie:
+                sortie = _SortieEchantillonnee(fichier_sortie, taille_echantillon)
+                try:
+                    if not self.dechiffrer_flux(entree, os.fstat(entree.fileno()).st_size, cle_donnee, sortie):
+                        return "", 0.0
+                    # Texte clair plus court que l'échantillon: validé en entier
+                    sortie.valider()
+                except _EchantillonInvalide:
+                    return sortie.texte, sortie.taux
+            os.replace(temporaire, chemin_sortie)
+            return sortie.texte, sortie.taux
+        finally:
+            if os.path.exists(temporaire):
+                os.remove(temporaire)
+
+    def mots_candidats(self, chemin_dictionnaire: str) -> Optional['list[str]']:
+        '''
+            Mots du dictionnaire retenus par le filtre de l'analyzer, avant toute dérivation de clé.
+            None si l'analyzer n'expose pas ses mots candidats (capacité optionnelle).
+        '''
+        return None
+
+    def mot_retenu(self, mot: str) -> bool:
+        '''
+            Filtre des indices appliqué à un mot de passe isolé (par défaut tout mot est retenu).
+        '''
+        return True
+
+    def deriver_cles(self, mot: str) -> Optional['list[bytes]']:
+        '''
+            Clés candidates dérivées d'un seul mot de passe (`_CLES_PAR_MOT` clés, dans l'ordre de
+            generer_cles_candidates), sans appliquer le filtre des indices.
+            None si l'analyzer ne dérive pas ses clés mot par mot (capacité optionnelle).
+        '''
+        return None
+
+    def compter_cles_candidates(self, chemin_dictionnaire: str) -> int:
+        '''
+            Nombre de clés candidates que produirait le dictionnaire, compté sans dériver les clés
+            (repli sur la génération complète si l'analyzer n'expose pas ses mots candidats).
+        '''
+        mots = self.mots_candidats(chemin_dictionnaire)
+        if mots is None:
+            return len(self.generer_cles_candidates(chemin_dictionnaire, compact=True))
+        return len(mots) * self._CLES_PAR_MOT
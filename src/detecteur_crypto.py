@@ -1,26 +1,48 @@
 # Import des modules
+import hashlib
+from contextlib import nullcontext
 import os
 import time
-from typing import List, Union
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
-from rich.progress import Progress
 # Import des modules d'analyse
-from src.analyzers.aes_cbc_analyzer import Aes_Cbc_Analyzer
 from src.crypto_analyzer import CryptoAnalyzer
-from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
-from src.analyzers.blowfish_analyzer import Blowfish_Analyzer
-from src.analyzers.aes_gcm_analyzer import Aes_Gcm_Analyzer
-from src.analyzers.fernet_analyzer import FernetAnalyzer
+from src.apercu_fichier import ApercuFichier
+from src.registre_analyzers import RegistreAnalyzers
 from src.rapport_mission import rapport_mission
-# Import des modules utilitaries
-from src.utils import verifier_texte_dechiffre
-from rich.progress import Progress, TaskID
-from rich.markdown import Markdown
-from rich.console import Console
+from src.key_store import KeyStore
+from src.cache_candidats import CacheCandidats
+from src.cles_progressives import ClesProgressives
+from src.points_reprise import PointsReprise
+from src.cache_negatif import CacheNegatif
+from src.cache_resultats import CacheResultats
+from src.trousseau import TrousseauCles
+from src.progression import SortieProgression, SortieRich
+from src.metriques import Instrumentation
+from src.utils import est_dechiffrement_reussi, evaluer_dechiffrement
+
+if TYPE_CHECKING:
+    from src.attaque_parallele import MoteurAttaque, ResultatRecherche
+
+
+def _afficher(message: str) -> None:
+    # rich.console n'est chargé qu'au premier message affiché
+    from rich.console import Console
+    Console().print(message)
+
 class ResultatAnalyse:
     """
         Classe représentant un résultat d'analyse.
+        
+        Les attributs sont déclarés dans __slots__ (pas de __dict__ par instance): un run sur de nombreux
+        fichiers en crée beaucoup. Pour agréger de nombreux résultats, voir TableResultats.
+        
+        nb_tentatives a le même sens dans tous les modes de mission (séquentiel, concurrent, groupé, planifié):
+        en cas de succès, le rang de la clé gagnante (index + 1 parmi les candidates de son algorithme, ou parmi
+        les clés du trousseau essayées) ; en cas d'échec, toutes les clés testées, tous algorithmes confondus.
     """
+    __slots__ = ("algo", "cle", "score_probabilite", "texte_dechiffre", "temps_execution", "nb_tentatives", "fichier", "taux_succes")
+    
     def __init__(self, algo: str, cle: bytes, score_probabilite: float, texte_dechiffre: bytes, temps_execution: float = 0.0, nb_tentatives: int = 0, fichier: str ='', taux_succes: float = 0.0):
         self.algo = algo
         self.cle = cle
@@ -28,8 +50,10 @@ class ResultatAnalyse:
         self.texte_dechiffre = texte_dechiffre
         self.temps_execution = temps_execution
         self.nb_tentatives = nb_tentatives
-        self.fichier = fichier,
+        self.fichier = fichier
         self.taux_succes = taux_succes
+
+
 class DetecteurCryptoOrchestrateur:
     """
             Classe principale qui centralise tout:
@@ -38,34 +62,148 @@ class DetecteurCryptoOrchestrateur:
                 -Lance et coordonnes le processus de dechiffrement 
     """
     
-    _NBR_OPERATION_MISSION = 4 
     _NBR_OPERATION_ANALYSE = 3
     
-    def __init__(self):
+    def __init__(self, budget_cache_candidats: int = CacheCandidats.BUDGET_PAR_DEFAUT, nb_workers: int = 1, course_algorithmes: bool = False,
+                 fichier_reprise: Optional[str] = None, dossier_cache_negatif: Optional[str] = None,
+                 fichier_resultats: Optional[str] = None, identification_rapide: bool = False,
+                 sortie_progression: Optional[SortieProgression] = None, registre: Optional[RegistreAnalyzers] = None,
+                 metriques: Optional[Instrumentation] = None, cache_candidats: Optional[CacheCandidats] = None):
         """
         Initialisation de tous les modules d'analyse disponibles 
+        
+        Args:
+            budget_cache_candidats(int): mémoire maximale (octets) du cache de clés candidates partagé par la session
+            nb_workers(int): nombre de processus pour les attaques par dictionnaire (1 = séquentiel, 0 = tous les cœurs)
+            course_algorithmes(bool): si True, les algorithmes éligibles d'un fichier sont attaqués en même temps
+            fichier_reprise(str): fichier d'état des points de reprise des attaques (None = pas de reprise)
+            dossier_cache_negatif(str): dossier du cache persistant des mots de passe déjà essayés sans succès (None = désactivé)
+            fichier_resultats(str): cache persistant des résultats, adressé par l'empreinte SHA-256 des fichiers (None = désactivé)
+            identification_rapide(bool): si True, les grands fichiers sont identifiés sur leur en-tête, leur fin et des pages échantillonnées
+            sortie_progression(SortieProgression): destination des événements de progression (None = barres rich ;
+                SortieMuette ou SortieJsonLignes pour une exécution sans terminal)
+            registre(RegistreAnalyzers): analyzers disponibles (None = analyzers fournis et entry points)
+            metriques(Instrumentation): chronomètres par étape et compteurs du chemin critique (None = aucune mesure ;
+                Metriques pour les collecter)
+            cache_candidats(CacheCandidats): cache de clés candidates partagé avec d'autres orchestrateurs (None = cache
+                propre, de budget budget_cache_candidats)
         """
-        self.analyzers: dict[str, CryptoAnalyzer] = {
-            "AES-256-CBC": Aes_Cbc_Analyzer(),
-            "CHACHA20": ChaCha20_Analyzer(),
-            "BLOWFISH": Blowfish_Analyzer(),
-            "AES-GCM": Aes_Gcm_Analyzer(),
-            "FERNET": FernetAnalyzer(),
-        }
-        self.missions_completees: list[dict[str, Union[str, list[ResultatAnalyse], float]]]  = []
+        # Analyzers importés à leur première utilisation (voir RegistreAnalyzers)
+        self.analyzers: RegistreAnalyzers = registre if registre is not None else RegistreAnalyzers()
+        self.missions_completees: list[dict[str, Union[str, list[ResultatAnalyse], int, float]]]  = []
         self.statistiques_globales: dict[str, Union[int, float]] = {
             "total_fichiers": 0,
             "fichiers_dechiffres": 0,
             "temps_total": 0.0,
             "tentatives_total": 0
         }
+        # Clés candidates réutilisées entre fichiers, missions et actions du menu
+        self.cache_candidats = cache_candidats if cache_candidats is not None else CacheCandidats(budget_cache_candidats)
+        # Clés dérivées à la demande par les recherches bornées (échéance, arrêt, reprise), par analyzer et dictionnaire
+        self._cles_progressives: Dict[Hashable, ClesProgressives] = {}
+        # Moteur d'attaque (multiprocessing) créé à la première attaque: une identification seule ne le charge pas
+        self.nb_workers = nb_workers
+        self._moteur_attaque: Optional['MoteurAttaque'] = None
+        self.course_algorithmes = course_algorithmes
+        # Points de reprise: une attaque interrompue repart de la dernière frontière enregistrée
+        self.points_reprise = PointsReprise(fichier_reprise) if fichier_reprise else None
+        # Clés déjà testées sans succès sur un même texte chiffré, sautées d'un run à l'autre
+        self.cache_negatif = CacheNegatif(dossier_cache_negatif) if dossier_cache_negatif else None
+        # Résultats des fichiers déjà déchiffrés, réutilisés pour tout fichier au contenu identique
+        self.cache_resultats = CacheResultats(fichier_resultats) if fichier_resultats else None
+        # Clés retrouvées pendant la session, essayées sur chaque fichier avant l'attaque par dictionnaire
+        self.trousseau = TrousseauCles(metriques)
+        # Identification sur un aperçu du fichier plutôt que sur son contenu complet (voir ApercuFichier)
+        self.identification_rapide = identification_rapide
+        # Le calcul émet des événements de progression, leur présentation dépend de la sortie
+        self.sortie_progression = sortie_progression
+        # Ordonnanceur des missions planifiées, conservé pour reprendre les espaces de clés non parcourus
+        self.ordonnanceur = None
+        # Mesures du chemin critique, partagées avec le moteur d'attaque
+        self.metriques = metriques if metriques is not None else Instrumentation()
     
-    def maj_progress_bar(self, sleep_avant: float, progress: Progress, task: TaskID, message: str, avance: float, sleep_apres: float):
-        time.sleep(sleep_avant)
-        progress.update(task_id=task, description=message, advance=avance)
-        time.sleep(sleep_apres)
+    @property
+    def moteur_attaque(self) -> 'MoteurAttaque':
+        """
+            Moteur des attaques par dictionnaire, importé et créé au premier accès.
+        """
+        if self._moteur_attaque is None:
+            from src.attaque_parallele import MoteurAttaque
+            self._moteur_attaque = MoteurAttaque(self.nb_workers)
+            self._moteur_attaque.metriques = self.metriques
+        return self._moteur_attaque
+    
+    def cles_candidates(self, analyzer: CryptoAnalyzer, chemin_dictionnaire: str) -> Union[list[bytes], KeyStore]:
+        """
+            Clés candidates d'un analyzer pour un dictionnaire, servies par le cache de la session (dérivées au premier appel).
+            Seule une dérivation effective compte dans l'étape « derivation » des métriques, pas un accès au cache.
+        """
+        return self.cache_candidats.obtenir(analyzer, chemin_dictionnaire, metriques=self.metriques)
+    
+    def __cles_progressives(self, analyzer: CryptoAnalyzer, chemin_dictionnaire: str) -> Optional[ClesProgressives]:
+        """
+            Clés candidates dérivées à la demande pendant la recherche (voir ClesProgressives), conservées pour la
+            session. None si les clés sont déjà dans le cache de la session ou si l'analyzer ne dérive pas mot par mot.
+        """
+        if not ClesProgressives.possible(analyzer) or self.cache_candidats.contient(analyzer, chemin_dictionnaire):
+            return None
+        try:
+            identite = self.cache_candidats.identifier(analyzer, chemin_dictionnaire)
+        except OSError:
+            return None
+        cles = self._cles_progressives.get(identite)
+        if cles is None:
+            mots = analyzer.mots_candidats(chemin_dictionnaire)
+            if mots is None:
+                return None
+            cles = self._cles_progressives[identite] = ClesProgressives(analyzer, mots, self.metriques)
+        return cles
+    
+    def __cles_recherche(self, analyzer: CryptoAnalyzer, chemin_dictionnaire: str, bornee: bool) -> Union[list[bytes], KeyStore, ClesProgressives]:
+        """
+            Clés candidates d'une recherche: dérivées à la demande si la recherche est bornée (échéance, demande
+            d'arrêt ou reprise), afin que la dérivation respecte ces bornes ; le dictionnaire complet sinon.
+        """
+        progressives = self.__cles_progressives(analyzer, chemin_dictionnaire) if bornee else None
+        return progressives if progressives is not None else self.cles_candidates(analyzer, chemin_dictionnaire)
+    
+    def source_candidates(self, analyzer: CryptoAnalyzer, chemin_dictionnaire: str) -> str:
+        """
+            Identité de la source des clés candidates pour les points de reprise: dictionnaire (chemin, taille, date)
+            et recette de dérivation de l'analyzer. Lève OSError si le dictionnaire est illisible.
+        """
+        return hashlib.sha256(repr(self.cache_candidats.identifier(analyzer, chemin_dictionnaire)).encode()).hexdigest()
+    
+    def maj_progress_bar(self, progress: Optional[SortieProgression], task, message: str, avance: float) -> None:
+        """
+            Émet un événement de progression vers la sortie (sans effet si aucune sortie n'est fournie).
+        """
+        if progress is not None:
+            progress.update(task_id=task, description=message, advance=avance)
+
+    def __message(self, texte: str, style: bool = False) -> None:
+        """
+            Message destiné à l'utilisateur: confié à la sortie de progression de l'orchestrateur si elle est
+            fournie (SortieMuette le tait, SortieJsonLignes l'écrit en JSON), affiché sur la console sinon.
+            
+            Args:
+                texte(str): le message
+                style(bool): si True, le message contient des balises de style rich
+        """
+        if self.sortie_progression is not None:
+            self.sortie_progression.message(texte, style)
+        elif style:
+            _afficher(texte)
+        else:
+            print(texte)
+    
+    def __sortie_progression(self) -> SortieProgression:
+        """
+            Sortie de progression d'une opération: celle de l'orchestrateur, ou des barres rich par défaut.
+        """
+        return self.sortie_progression if self.sortie_progression is not None else SortieRich()
         
-    def analyser_fichier_specifique(self, chemin_fichier_chiffre: str, progress : Progress, task, error:bool, nbr_opr_mission: int) -> List[ResultatAnalyse] :
+    def analyser_fichier_specifique(self, chemin_fichier_chiffre: str, progress : Optional[SortieProgression], task, error:bool, nbr_opr_mission: int) -> List[ResultatAnalyse] :
         """
         ANALYSE D'UN FICHIER SPÉCIFIQUE
         - Sélection du fichier à analyser
@@ -74,7 +212,7 @@ class DetecteurCryptoOrchestrateur:
         
         Args:
             chemin_fichier_chiffre(str): chemin du fichier chiffré à analyser
-            progress (Progress) : la progress bar à mettre à jour
+            progress (SortieProgression) : la sortie de progression à mettre à jour (rich.Progress acceptée, None = aucune)
             error(bool): nécessaire pour déterminer les erreurs et définir le message de final de la progress bar 
         Returns:
             ResultatAnalyse: résultat de l'analyse
@@ -85,19 +223,19 @@ class DetecteurCryptoOrchestrateur:
             # Vérification de l'existence du fichier
             avance = (100/(self._NBR_OPERATION_ANALYSE * nbr_opr_mission))
             # Done : Intégrer la progress bar -> step : Verification du chemin de fichier fourni
-            self.maj_progress_bar(0.3, progress, task, "Verification du chemin de fichier fourni", avance * 0.3, 1) 
+            self.maj_progress_bar(progress, task, "Verification du chemin de fichier fourni", avance * 0.3)
             
             if not os.path.isfile(Path('data')/f"{chemin_fichier_chiffre}"):
                 
                 # TODO : Intégrer la progress bar -> step : Verification du chemin de fichier fourni (Done)
-                self.maj_progress_bar(0.3, progress, task, "Fichier non trouvé ❌ (Aborting...)", ((avance * self._NBR_OPERATION_ANALYSE) - avance * 0.3), 1) 
+                self.maj_progress_bar(progress, task, "Fichier non trouvé ❌ (Aborting...)", ((avance * self._NBR_OPERATION_ANALYSE) - avance * 0.3))
                 
                 error = True
                 return [ResultatAnalyse("", b"", 0.0, b"", 0.0, 0)]
             
             # Initialisation des variables
             # TODO : Mise à jour de la progress bar -> step : Initialisation des utilitaires pour l'identification (Done)
-            self.maj_progress_bar(0.5, progress, task, "Initialisation des utilitaires pour l'identification", avance*0.2, 1)
+            self.maj_progress_bar(progress, task, "Initialisation des utilitaires pour l'identification", avance*0.2)
 
             cle = b""
             texte_dechiffre = b""
@@ -113,13 +251,13 @@ class DetecteurCryptoOrchestrateur:
                 avance_algo = avance/(len(self.analyzers)*3 * 0.5)
                 
                 # TODO : Mise à jour de la progress bar -> step : Utilisation de {algrorithme} pour déterminer le chiffrement (Done)
-                self.maj_progress_bar(0.5, progress, task, f"Utilisation de {nom_algo} pour déterminer le chiffrement", avance_algo, 1)
+                self.maj_progress_bar(progress, task, f"Utilisation de {nom_algo} pour déterminer le chiffrement", avance_algo)
 
-                score = analyzer.identifier_algo(f"data/{chemin_fichier_chiffre}")
+                score = analyzer.identifier_algo(f"data/{chemin_fichier_chiffre}", self.identification_rapide)
                 scores_algorithmes[nom_algo] = score
                 
                 # TODO : Mise à jour de la progress bar -> step : Analyse des résultats d'identification (Done)
-                self.maj_progress_bar(0.5, progress, task, "Analyse des résultats d'identification", avance_algo, 1)
+                self.maj_progress_bar(progress, task, "Analyse des résultats d'identification", avance_algo)
 
                 cumul_progress_avance += 2 * avance_algo
                 
@@ -131,16 +269,16 @@ class DetecteurCryptoOrchestrateur:
                     })
                     
                     # TODO : Mise à jour de la progress bar -> step : Détection réussie pour {algorithme} et préparation du rapport d'analyse (Done)
-                    self.maj_progress_bar(1, progress, task, f"Elligibilité détectée pour {nom_algo}", avance_algo, 1)
+                    self.maj_progress_bar(progress, task, f"Elligibilité détectée pour {nom_algo}", avance_algo)
                     
                 else :
                     # TODO : Intégrer la progress bar -> step : Echec d'identification pour {algorithme} (Done)
-                    self.maj_progress_bar(1, progress, task, f"Echec d'identification pour {nom_algo}", avance_algo, 1)
+                    self.maj_progress_bar(progress, task, f"Echec d'identification pour {nom_algo}", avance_algo)
 
                     cumul_progress_avance += avance_algo
  
             if not algorithme_potenciel:
-                print("Aucun algorithme correctement détecté ")
+                self.__message("Aucun algorithme correctement détecté ")
                 temps_execution = time.time() - debut_analyse
                 return [ResultatAnalyse("", b"", 0.0, b"", temps_execution, nb_tentatives, chemin_fichier_chiffre, 0)]
             
@@ -153,174 +291,983 @@ class DetecteurCryptoOrchestrateur:
             return resultat
         
         except Exception as e:
-            print(f"Erreur lors de l'analyse: {str(e)}")
+            self.__message(f"Erreur lors de l'analyse: {str(e)}")
             temps_execution = time.time() - debut_analyse
             error = True
             return [ResultatAnalyse("", b"", 0.0, b"", temps_execution, 0, chemin_fichier_chiffre)]
     
-    def __tenter_dechiffrement_avec_dictionnaire(self, chemin_fichier: str, cles_candidates: list[bytes], analyzer: CryptoAnalyzer, resultat: ResultatAnalyse):
+    def scorer_fichier(self, chemin_fichier: str) -> dict[str, float]:
+        """
+            Calcule le score d'identification de chaque algorithme pour un fichier, sans affichage.
+            
+            Args:
+                chemin_fichier(str): chemin du fichier chiffré
+            
+            Returns:
+                dict[str, float]: score de chaque algorithme, dans l'ordre des analyzers
+        """
+        # Un seul aperçu (une seule lecture) partagé par tous les analyzers
+        try:
+            with self.metriques.etape("lecture"):
+                apercu = ApercuFichier(chemin_fichier, self.identification_rapide)
+        except OSError:
+            return {nom_algo: 0.0 for nom_algo in self.analyzers}
+        with self.metriques.etape("identification"):
+            # Les analyzers écartés par le préfiltre valent 0 sans autre calcul: ceux dont la signature exclut
+            # l'alphabet du fichier ne sont pas même importés
+            compatibles = set(self.analyzers.compatibles(apercu))
+            scores = {}
+            for nom_algo in self.analyzers:
+                analyzer = self.analyzers[nom_algo] if nom_algo in compatibles else None
+                scores[nom_algo] = analyzer.identifier_apercu(apercu) if analyzer is not None and analyzer.compatible(apercu) else 0.0
+        return scores
+    
+    def traiter_fichier(self, chemin_fichier: str, chemin_dictionnaire: str) -> ResultatAnalyse:
+        """
+            Identifie puis attaque un fichier sans aucun affichage (utilisé par les missions concurrentes).
+            Les algorithmes éligibles (score >= 0.6) sont attaqués dans l'ordre des analyzers jusqu'au premier succès,
+            ou tous en même temps si la course entre algorithmes est activée.
+            
+            Args:
+                chemin_fichier(str): chemin du fichier chiffré
+                chemin_dictionnaire(str): dictionnaire utilisé pour générer les clés candidates
+            
+            Returns:
+                ResultatAnalyse: le résultat final du fichier (algorithme vide si aucun n'est détecté)
+        """
+        with self.metriques.etape("lecture"), open(chemin_fichier, 'rb') as f:
+            donnees = f.read()
+        return self.__traiter_contenu(chemin_fichier, donnees, PointsReprise.empreinte(donnees), chemin_dictionnaire)
+    
+    def __traiter_contenu(self, chemin_fichier: str, donnees: bytes, empreinte: str, chemin_dictionnaire: str) -> ResultatAnalyse:
+        """
+            Corps de traiter_fichier, sur le contenu déjà lu et son empreinte SHA-256.
+        """
+        debut = time.perf_counter()
+        nom_fichier = os.path.basename(chemin_fichier)
+        resultat = self.__resultat_connu(donnees, empreinte, nom_fichier)
+        if resultat is not None:
+            return resultat
+        resultat = ResultatAnalyse("", b"", 0.0, b"", 0.0, 0, nom_fichier, 0)
+        
+        scores = self.scorer_fichier(chemin_fichier)
+        eligibles = [
+            ResultatAnalyse(nom_algo, b"", score, b"", 0.0, 0, nom_fichier, 0)
+            for nom_algo, score in scores.items() if score >= 0.6
+        ]
+        if eligibles:
+            resultat = self.__attaquer_eligibles(donnees, eligibles, chemin_dictionnaire)
+        
+        resultat.temps_execution = time.perf_counter() - debut
+        self.__memoriser_resultat(chemin_fichier, empreinte, resultat, scores)
+        return resultat
+    
+    def __resultat_connu(self, donnees: bytes, empreinte: str, nom_fichier: str) -> Optional[ResultatAnalyse]:
+        """
+            Résultat du cache pour un fichier au contenu déjà déchiffré, après vérification que la clé
+            enregistrée le déchiffre toujours (une entrée invalide est supprimée).
+            
+            Args:
+                donnees(bytes): le contenu du fichier chiffré
+                empreinte(str): son empreinte SHA-256
+                nom_fichier(str): nom du fichier, repris dans le résultat
+            
+            Returns:
+                ResultatAnalyse | None: le résultat vérifié, ou None s'il faut analyser le fichier
+        """
+        if self.cache_resultats is None:
+            return None
+        entree = self.cache_resultats.obtenir(empreinte)
+        if entree is None or entree["algo"] not in self.analyzers:
+            return None
+        texte, taux = evaluer_dechiffrement(self.analyzers[entree["algo"]].dechiffrer_donnees(donnees, entree["cle"]))
+        if not est_dechiffrement_reussi(texte, taux):
+            self.cache_resultats.oublier(empreinte)
+            return None
+        return ResultatAnalyse(entree["algo"], entree["cle"], entree["scores"].get(entree["algo"], 0.0), texte, 0.0, 0, nom_fichier, taux)
+    
+    def __memoriser_resultat(self, chemin_fichier: str, empreinte: str, resultat: ResultatAnalyse, scores: Optional[dict[str, float]] = None) -> None:
+        """
+            Enregistre un déchiffrement réussi dans le cache de résultats (scores recalculés s'ils ne sont pas fournis).
+        """
+        if self.cache_resultats is None or not est_dechiffrement_reussi(resultat.texte_dechiffre, resultat.taux_succes):
+            return
+        if scores is None:
+            scores = self.scorer_fichier(chemin_fichier)
+        self.cache_resultats.enregistrer(empreinte, os.path.basename(chemin_fichier), resultat.algo, resultat.cle, scores)
+    
+    @staticmethod
+    def __copier_resultat(resultat: ResultatAnalyse, nom_fichier: str) -> ResultatAnalyse:
+        """
+            Résultat d'un fichier identique à un fichier déjà traité dans le même run (aucune tentative supplémentaire).
+        """
+        return ResultatAnalyse(resultat.algo, resultat.cle, resultat.score_probabilite, resultat.texte_dechiffre, 0.0, 0, nom_fichier, resultat.taux_succes)
+    
+    def __resoudre_par_empreinte(self, chemins: List[str], traiter: Callable[[List[str]], List[ResultatAnalyse]]) -> List[ResultatAnalyse]:
+        """
+            Traite une liste de fichiers en n'analysant qu'une fois chaque contenu: les fichiers identiques
+            reprennent le résultat du premier, les contenus déjà déchiffrés lors d'un run précédent sont servis
+            par le cache de résultats, et seuls les autres sont confiés à `traiter`.
+            
+            Args:
+                chemins(List[str]): les fichiers chiffrés
+                traiter(Callable): traite une sous-liste de fichiers et renvoie leurs résultats dans le même ordre
+            
+            Returns:
+                List[ResultatAnalyse]: un résultat par fichier, dans l'ordre des chemins
+        """
+        empreintes = []
+        premiers: dict[str, int] = {}
+        resultats: List[Optional[ResultatAnalyse]] = [None] * len(chemins)
+        a_traiter: List[int] = []
+        for i, chemin in enumerate(chemins):
+            with open(chemin, 'rb') as f:
+                donnees = f.read()
+            empreintes.append(PointsReprise.empreinte(donnees))
+            if empreintes[i] in premiers:
+                self.__message(f"{os.path.basename(chemin)}: contenu identique à {os.path.basename(chemins[premiers[empreintes[i]]])}")
+                continue
+            premiers[empreintes[i]] = i
+            resultats[i] = self.__resultat_connu(donnees, empreintes[i], os.path.basename(chemin))
+            if resultats[i] is not None:
+                self.__message(f"{os.path.basename(chemin)}: {resultats[i].algo} (résultat en cache)")
+            else:
+                a_traiter.append(i)
+        
+        for i, resultat in zip(a_traiter, traiter([chemins[i] for i in a_traiter])):
+            resultats[i] = resultat
+            self.__memoriser_resultat(chemins[i], empreintes[i], resultat)
+        for i, chemin in enumerate(chemins):
+            if resultats[i] is None:
+                resultats[i] = self.__copier_resultat(resultats[premiers[empreintes[i]]], os.path.basename(chemin))
+        return resultats
+    
+    def __attaquer_eligibles(self, donnees: bytes, eligibles: List[ResultatAnalyse], chemin_dictionnaire: str) -> ResultatAnalyse:
+        """
+            Attaque les algorithmes éligibles d'un fichier: en course si l'option est active (workers partagés
+            au prorata des scores, perdants annulés au premier succès), sinon l'un après l'autre.
+            
+            Args:
+                donnees(bytes): le contenu du fichier chiffré
+                eligibles(list[ResultatAnalyse]): un résultat par algorithme éligible, complété par l'attaque
+                chemin_dictionnaire(str): dictionnaire utilisé pour générer les clés candidates
+            
+            Returns:
+                ResultatAnalyse: le résultat de l'algorithme gagnant, ou du dernier algorithme tenté
+        """
+        resultat = self.__essayer_trousseau(donnees, eligibles)
+        if resultat is not None:
+            return resultat
+        
+        candidats = [(self.analyzers[resultat.algo], resultat.score_probabilite) for resultat in eligibles]
+        
+        noms_algos = [resultat.algo for resultat in eligibles]
+        if self.course_algorithmes:
+            recherches = self.__lancer_recherche(donnees, noms_algos, candidats, chemin_dictionnaire)
+        else:
+            recherches = []
+            for nom_algo, candidat in zip(noms_algos, candidats):
+                recherches += self.__lancer_recherche(donnees, [nom_algo], [candidat], chemin_dictionnaire)
+                # Arrêt demandé (annulation): les algorithmes suivants ne sont ni dérivés ni attaqués
+                if recherches[-1].trouve or self.moteur_attaque._arrete():
+                    break
+        
+        for resultat, recherche in zip(eligibles, recherches):
+            if recherche.trouve:
+                resultat.cle = recherche.cle
+                resultat.texte_dechiffre = recherche.texte_dechiffre
+                resultat.taux_succes = recherche.taux_succes
+                resultat.nb_tentatives = recherche.index + 1
+                return resultat
+            resultat.nb_tentatives += recherche.nb_testees
+        # Échec: toutes les clés testées sur le fichier, tous algorithmes confondus
+        dernier = eligibles[len(recherches) - 1]
+        dernier.nb_tentatives = sum(eligible.nb_tentatives for eligible in eligibles)
+        return dernier
+    
+    def __essayer_trousseau(self, donnees: bytes, eligibles: List[ResultatAnalyse]) -> Optional[ResultatAnalyse]:
+        """
+            Essaie les clés du trousseau de session sur chaque algorithme éligible, en écartant d'abord
+            les clés rejetées par le test rapide de l'analyzer.
+            
+            Args:
+                donnees(bytes): le contenu du fichier chiffré
+                eligibles(list[ResultatAnalyse]): un résultat par algorithme éligible, complété en cas de succès
+            
+            Returns:
+                ResultatAnalyse | None: le résultat de l'algorithme déchiffré par une clé du trousseau, ou None
+        """
+        for resultat in eligibles:
+            analyzer = self.analyzers[resultat.algo]
+            for cle in self.trousseau.cles(resultat.algo, analyzer):
+                if not analyzer.sonder(donnees, cle):
+                    self.metriques.compter("cles_rejetees")
+                    continue
+                resultat.nb_tentatives += 1
+                texte, taux = self.metriques.essayer(analyzer, donnees, cle)
+                if est_dechiffrement_reussi(texte, taux):
+                    resultat.cle = cle
+                    resultat.texte_dechiffre = texte
+                    resultat.taux_succes = taux
+                    return resultat
+        return None
+    
+    def __memoriser_cle(self, nom_algo: str, analyzer: CryptoAnalyzer, chemin_dictionnaire: str, recherche: 'ResultatRecherche') -> None:
+        """
+            Ajoute une clé retrouvée au trousseau, avec son mot de passe quand l'analyzer expose ses mots candidats.
+        """
+        mot = None
+        mots = analyzer.mots_candidats(chemin_dictionnaire)
+        if mots is not None and recherche.index // analyzer._CLES_PAR_MOT < len(mots):
+            mot = mots[recherche.index // analyzer._CLES_PAR_MOT]
+        self.trousseau.ajouter(nom_algo, recherche.cle, mot)
+    
+    def __lancer_recherche(self, donnees: bytes, noms_algos: List[str], candidats: list, chemin_dictionnaire: str,
+                           suivi: Optional[Callable[[int, int], None]] = None, echeance: Optional[float] = None,
+                           debuts: Optional[List[int]] = None) -> List['ResultatRecherche']:
+        """
+            Lance une recherche (un ou plusieurs algorithmes en course), puis ajoute les clés retrouvées
+            au trousseau de session.
+            
+            Args:
+                donnees(bytes): le contenu du fichier chiffré
+                noms_algos(list[str]): le nom de l'algorithme de chaque candidat
+                candidats(list[tuple]): (analyzer, score) de chaque algorithme ; les clés candidates sont
+                    dérivées ici, après consultation du cache négatif
+                chemin_dictionnaire(str): dictionnaire d'où proviennent les clés candidates
+                suivi(Callable[[int, int], None]): appelé avec (rang du candidat, frontière atteinte) au fil de la recherche
+                echeance(float): instant (time.monotonic) auquel la recherche s'arrête (None = aucune échéance)
+                debuts(list[int]): index de départ de chaque candidat (None = ceux des points de reprise)
+            
+            Returns:
+                list[ResultatRecherche]: un résultat par candidat
+        """
+        recherches = self.__course_memorisee(donnees, noms_algos, candidats, chemin_dictionnaire, suivi, echeance, debuts)
+        for nom_algo, (analyzer, _), recherche in zip(noms_algos, candidats, recherches):
+            if recherche.trouve:
+                self.__memoriser_cle(nom_algo, analyzer, chemin_dictionnaire, recherche)
+        return recherches
+    
+    def __nb_cles_candidates(self, analyzer: CryptoAnalyzer, chemin_dictionnaire: str) -> int:
+        """
+            Nombre de clés candidates d'un analyzer, compté sans dérivation quand il expose ses mots candidats.
+        """
+        if analyzer.mots_candidats(chemin_dictionnaire) is None:
+            return len(self.cles_candidates(analyzer, chemin_dictionnaire))
+        return analyzer.compter_cles_candidates(chemin_dictionnaire)
+    
+    def __mots_exclus(self, empreinte: str, nom_algo: str, analyzer: CryptoAnalyzer,
+                      chemin_dictionnaire: str) -> Tuple[Optional[list], Optional[List[bool]], Optional[List[bytes]]]:
+        """
+            Mots de passe candidats d'un algorithme et, pour chacun, s'il a déjà été essayé sans succès sur ce
+            texte chiffré (cache négatif).
+            
+            Returns:
+                tuple: les mots, leur masque d'exclusion et l'identité de chaque mot ; (None, None, None) sans cache
+                    négatif ou si l'analyzer n'expose pas ses mots candidats
+        """
+        mots = analyzer.mots_candidats(chemin_dictionnaire) if self.cache_negatif is not None else None
+        if mots is None:
+            return None, None, None
+        
+        parametres = analyzer.parametres_derivation()
+        elements = [CacheNegatif.element_mot(mot, parametres) for mot in mots]
+        with self.metriques.etape("filtrage"):
+            masque_mots = self.cache_negatif.masque(empreinte, nom_algo, elements)
+        if any(masque_mots):
+            self.__message(f"Cache négatif {nom_algo}: {sum(masque_mots)} mot(s) déjà essayé(s) sauté(s)")
+        return mots, masque_mots, elements
+    
+    def __memoriser_mots_essayes(self, empreinte: str, nom_algo: str, analyzer: CryptoAnalyzer, elements: List[bytes],
+                                 debut: int, recherche: 'ResultatRecherche') -> None:
+        """
+            Ajoute au cache négatif les mots dont toutes les clés ont été testées sans succès: avant la clé
+            trouvée, ou jusqu'à la frontière atteinte.
+        """
+        fin = recherche.index if recherche.trouve else recherche.reprise
+        premier, dernier = -(-debut // analyzer._CLES_PAR_MOT), fin // analyzer._CLES_PAR_MOT
+        if dernier > premier:
+            self.cache_negatif.enregistrer(empreinte, nom_algo, elements, premier, dernier)
+    
+    def __cles_filtrees(self, empreinte: str, nom_algo: str, analyzer: CryptoAnalyzer, chemin_dictionnaire: str,
+                        bornee: bool = False) -> Tuple[Union[list[bytes], KeyStore, ClesProgressives], Optional[bytearray], Optional[List[bytes]]]:
+        """
+            Clés candidates d'un algorithme, filtrées par le cache négatif avant toute dérivation.
+            
+            Le cache négatif est consulté sur l'identité des mots de passe (mot et paramètres de dérivation):
+            un mot déjà essayé sans succès sur ce texte chiffré n'est pas dérivé, sa place étant tenue par des
+            clés vides afin que les index restent ceux du dictionnaire complet. Si les clés du dictionnaire sont
+            déjà dans le cache de la session, elles sont reprises telles quelles. Un analyzer qui n'expose pas
+            ses mots candidats n'a pas de cache négatif. Pour une recherche bornée, les clés sont dérivées à la
+            demande pendant la recherche (voir __cles_recherche).
+            
+            Returns:
+                tuple: les clés candidates, le masque des clés à sauter (None si aucune) et l'identité de
+                    chaque mot (None sans cache négatif)
+        """
+        mots, masque_mots, elements = self.__mots_exclus(empreinte, nom_algo, analyzer, chemin_dictionnaire)
+        if mots is None:
+            return self.__cles_recherche(analyzer, chemin_dictionnaire, bornee), None, None
+        if not any(masque_mots):
+            return self.__cles_recherche(analyzer, chemin_dictionnaire, bornee), None, elements
+        
+        masque = bytearray(exclu for exclu in masque_mots for _ in range(analyzer._CLES_PAR_MOT))
+        progressives = self.__cles_progressives(analyzer, chemin_dictionnaire) if bornee else None
+        if progressives is not None:
+            return progressives.masquer(masque_mots), masque, elements
+        if self.cache_candidats.contient(analyzer, chemin_dictionnaire):
+            return self.cles_candidates(analyzer, chemin_dictionnaire), masque, elements
+        
+        cles: Optional[List[bytes]] = []
+        vides = [b""] * analyzer._CLES_PAR_MOT
+        with self.metriques.etape("derivation"):
+            for mot, exclu in zip(mots, masque_mots):
+                derivees = vides if exclu else analyzer.deriver_cles(mot)
+                if derivees is None:
+                    cles = None
+                    break
+                cles.extend(derivees)
+        if cles is None:
+            # Analyzer sans dérivation mot par mot: dictionnaire complet
+            return self.cles_candidates(analyzer, chemin_dictionnaire), masque, elements
+        return cles, masque, elements
+    
+    def __course_memorisee(self, donnees: bytes, noms_algos: List[str], candidats: list, chemin_dictionnaire: str,
+                           suivi: Optional[Callable[[int, int], None]] = None, echeance: Optional[float] = None,
+                           debuts: Optional[List[int]] = None) -> List['ResultatRecherche']:
+        """
+            Course du moteur d'attaque en repartant des points de reprise enregistrés, avec enregistrement de la
+            progression si les points de reprise sont actifs. Les mots de passe déjà essayés sans succès lors de
+            runs précédents ne sont ni dérivés ni testés si le cache négatif est actif, et les mots dont toutes les
+            clés ont été testées y sont ajoutés.
+            
+            Une recherche bornée (échéance, demande d'arrêt possible ou reprise en cours d'espace) dérive ses clés à
+            la demande, dans la boucle du moteur: la dérivation est soumise à l'échéance et à l'arrêt, et les clés
+            antérieures au point de reprise ne sont pas dérivées. La reprise d'une recherche interrompue est alors la
+            frontière atteinte par la dérivation et le test des clés.
+        """
+        moteur = self.moteur_attaque
+        if self.points_reprise is None and self.cache_negatif is None:
+            bornee = echeance is not None or moteur.arret is not None or any(debuts or ())
+            courses = [(analyzer, score, self.__cles_recherche(analyzer, chemin_dictionnaire, bornee)) for analyzer, score in candidats]
+            return moteur.course(donnees, courses, echeance, debuts, suivi)
+        
+        empreinte = PointsReprise.empreinte(donnees)
+        points = self.points_reprise
+        progression = suivi
+        if points is not None:
+            try:
+                sources = [self.source_candidates(analyzer, chemin_dictionnaire) for analyzer, _ in candidats]
+            except OSError:
+                points = None
+        if debuts is None:
+            debuts = [0] * len(candidats)
+            if points is not None:
+                debuts = [points.position(empreinte, nom_algo, source) for nom_algo, source in zip(noms_algos, sources)]
+        
+        bornee = echeance is not None or moteur.arret is not None or any(debuts)
+        filtrees = [self.__cles_filtrees(empreinte, nom_algo, analyzer, chemin_dictionnaire, bornee)
+                    for nom_algo, (analyzer, _) in zip(noms_algos, candidats)]
+        courses = [(analyzer, score, cles) for (analyzer, score), (cles, _, _) in zip(candidats, filtrees)]
+        exclusions = [masque for _, masque, _ in filtrees]
+        if points is not None:
+            for nom_algo, debut, (_, _, cles) in zip(noms_algos, debuts, courses):
+                if debut:
+                    self.__message(f"Reprise de l'attaque {nom_algo} à la clé {debut}/{len(cles)}")
+            def progression(rang: int, frontiere: int) -> None:
+                points.avancer(empreinte, noms_algos[rang], sources[rang], frontiere)
+                if suivi is not None:
+                    suivi(rang, frontiere)
+        
+        try:
+            recherches = moteur.course(donnees, courses, echeance, debuts, progression, exclusions)
+        finally:
+            # Interruption: la dernière frontière connue est écrite sans attendre l'intervalle
+            if points is not None:
+                points.sauvegarder()
+        
+        for nom_algo, debut, recherche, (analyzer, _), (_, _, elements) in zip(noms_algos, debuts, recherches, candidats, filtrees):
+            if elements is not None:
+                self.__memoriser_mots_essayes(empreinte, nom_algo, analyzer, elements, debut, recherche)
+        
+        if points is None:
+            return recherches
+        if any(recherche.trouve for recherche in recherches):
+            for nom_algo, source in zip(noms_algos, sources):
+                points.terminer(empreinte, nom_algo, source)
+        else:
+            for nom_algo, source, recherche, (_, _, cles) in zip(noms_algos, sources, recherches, courses):
+                if recherche.reprise >= len(cles):
+                    points.terminer(empreinte, nom_algo, source)
+                else:
+                    # Échéance ou interruption entre deux lots: la frontière finale est enregistrée
+                    points.avancer(empreinte, nom_algo, source, recherche.reprise)
+            points.sauvegarder()
+        return recherches
+    
+    def attaque_memorisee(self, donnees: bytes, nom_algo: str, chemin_dictionnaire: str, debut: int = 0,
+                          echeance: Optional[float] = None) -> 'ResultatRecherche':
         """
-            Tente de déchiffrer un fichier avec les clés candidates et l'analyzer correspondant
+            Attaque par dictionnaire d'un contenu par un algorithme, avec les mémoires de la session: progression
+            enregistrée dans les points de reprise au fil de la recherche, mots déjà essayés sautés puis ajoutés au
+            cache négatif, clé retrouvée ajoutée au trousseau (utilisée par l'ordonnanceur des missions planifiées).
+            
+            Args:
+                donnees(bytes): le contenu du fichier chiffré
+                nom_algo(str): l'algorithme attaqué
+                chemin_dictionnaire(str): dictionnaire d'où proviennent les clés candidates
+                debut(int): index de la première clé à tester
+                echeance(float): instant (time.monotonic) auquel la recherche s'arrête (None = aucune échéance)
+            
+            Returns:
+                ResultatRecherche: le résultat de la recherche
+        """
+        candidat = (self.analyzers[nom_algo], 1.0)
+        return self.__lancer_recherche(donnees, [nom_algo], [candidat], chemin_dictionnaire, None, echeance, [debut])[0]
+    
+    def __tenter_dechiffrement_avec_dictionnaire(self, chemin_fichier: str, analyzer: CryptoAnalyzer, resultat: ResultatAnalyse, chemin_dictionnaire: str):
+        """
+            Tente de déchiffrer un fichier avec les clés candidates du dictionnaire et l'analyzer correspondant
+            (dérivées après lecture du fichier, le cache négatif écartant d'abord les mots déjà essayés)
             
             Args: 
                 chemin_fichier(str) : chemin vers le fichier
-                cles_candidates(list[bytes]) : les clés candidates retenus par le dossier de clés sur la base des indices
                 analyzer(CryptoAnalyzer) : l'Analyzer correspondant à ce fichier
                 resultat(ResultatAnalyse) : les résultats de l'analyse de fichier 
+                chemin_dictionnaire(str) : dictionnaire d'où proviennent les clés (identité des points de reprise)
             
             Returns :
                 bool : si une erreur est survenue ou non
         """
-        for j, cle in enumerate(cles_candidates):
-            resultat.nb_tentatives += 1
-                                            
-            # Déchiffrement et normalisation de l'affichage (évite les \x.. et caractères non imprimables)
-            donnees = analyzer.dechiffrer(chemin_fichier, cle)
-            texte_dechiffre = donnees.decode('utf-8', errors='ignore').replace('\x00', ' ')
-            succes =  verifier_texte_dechiffre(texte_dechiffre)['taux_succes']
-            
-            if texte_dechiffre and succes > 60 and len(texte_dechiffre) > 0:
-                resultat.cle = cle
-                resultat.texte_dechiffre = texte_dechiffre
-                resultat.taux_succes = succes
-                print(f"Clé trouvée après {j+1} tentatives!")
-                return False
-        
-        print("Aucune clé valide trouvée")
+        # Lecture unique du fichier: les clés sont testées sur le contenu en mémoire
+        with self.metriques.etape("lecture"), open(chemin_fichier, 'rb') as f:
+            donnees = f.read()
+        
+        if self.__essayer_trousseau(donnees, [resultat]) is not None:
+            self.__message(f"Clé du trousseau réutilisée après {resultat.nb_tentatives} tentative(s)!")
+            return False
+        
+        # Déchiffrement et normalisation de l'affichage (évite les \x.. et caractères non imprimables)
+        recherche = self.__lancer_recherche(donnees, [resultat.algo], [(analyzer, 1.0)], chemin_dictionnaire)[0]
+        
+        if recherche.trouve:
+            resultat.nb_tentatives = recherche.index + 1
+            resultat.cle = recherche.cle
+            resultat.texte_dechiffre = recherche.texte_dechiffre
+            resultat.taux_succes = recherche.taux_succes
+            self.__message(f"Clé trouvée après {recherche.index + 1} tentatives!")
+            return False
+        
+        resultat.nb_tentatives += recherche.nb_testees
+        self.__message("Aucune clé valide trouvée")
         return True
 
-    def mission_complete_automatique(self, dossier_chiffres: str, chemin_dictionnaire: str) -> List[ResultatAnalyse]:
+    def mission_complete_automatique(self, dossier_chiffres: str, chemin_dictionnaire: str, concurrente: bool = False, nb_workers: int = 0,
+                                     planifiee: bool = False, budget_fichier: Optional[float] = None, budget_mission: Optional[float] = None,
+                                     groupee: bool = False) -> List[ResultatAnalyse]:
         """
         MISSION COMPLÈTE AUTOMATIQUE
-        - Analyse des 5 fichiers séquentiellement
+        - Analyse des 5 fichiers séquentiellement (ou en parallèle en mode concurrent)
         - Tentatives de déchiffrement avec retour visuel
         - Rapport de synthèse final
         
         Args:
             dossier_chiffres(str): dossier contenant les fichiers chiffrés
+            chemin_dictionnaire(str): dictionnaire utilisé pour générer les clés candidates
+            concurrente(bool): si True, les fichiers sont identifiés et attaqués en parallèle (incompatible avec
+                les modes planifié et groupé, dont les attaques utilisent les workers du moteur d'attaque)
+            nb_workers(int): budget global de processus du mode concurrent (0 = tous les cœurs)
+            planifiee(bool): si True, les attaques sont ordonnées par gain attendu (score / coût mesuré) avec une ETA
+            budget_fichier(float): secondes d'attaque au plus par fichier, implique le mode planifié
+            budget_mission(float): secondes d'attaque au plus pour la mission, implique le mode planifié
+            groupee(bool): si True, les fichiers sont regroupés par algorithme détecté et chaque clé candidate,
+                dérivée une seule fois, est testée sur tous les fichiers du groupe ; ce passage est séquentiel et
+                n'utilise pas les workers de l'orchestrateur (nb_workers)
         
         Returns:
             list[ResultatAnalyse]: liste des résultats d'analyse
+        
+        Raises:
+            ValueError: si le mode concurrent est demandé avec le mode planifié (ou un budget) ou le mode groupé
         """
+        
+        planifiee = planifiee or budget_fichier is not None or budget_mission is not None
+        if concurrente and (planifiee or groupee):
+            raise ValueError("Le mode concurrent ne se combine ni avec le mode planifié (budgets) ni avec le mode groupé")
+        if concurrente:
+            return self.__mission_concurrente(dossier_chiffres, chemin_dictionnaire, nb_workers)
+        if planifiee:
+            return self.__mission_planifiee(dossier_chiffres, chemin_dictionnaire, budget_fichier, budget_mission)
+        if groupee:
+            return self.__mission_groupee(dossier_chiffres, chemin_dictionnaire)
+
+        # Mission séquentielle: le flux fichier par fichier, conservé en liste
+        try:
+            return list(self.mission_flux(dossier_chiffres, chemin_dictionnaire))
+        except Exception as e:
+            self.__message(f"Erreur lors de la mission complète: {str(e)}")
+            return []
+        
 
+    def mission_flux(self, dossier_chiffres: str, chemin_dictionnaire: str, statistiques_seules: bool = False,
+                     concurrente: bool = False, nb_workers: int = 0) -> Iterator[ResultatAnalyse]:
+        """
+            Mission complète au fil de l'eau: le résultat de chaque fichier .enc est produit dès qu'il est
+            définitif, après l'ajout de son rapport de synthèse au fichier des rapports et la mise à jour de
+            statistiques_globales.
+            
+            Les fichiers au contenu identique ne sont attaqués qu'une fois. Arrêter l'itération arrête la mission ;
+            la mission est enregistrée dans missions_completees avec les fichiers traités jusque-là.
+            
+            En mode concurrent, les résultats arrivent dans l'ordre d'achèvement mais le fichier des rapports garde
+            l'ordre des noms de fichiers: le rapport d'un fichier n'est écrit qu'une fois ceux des fichiers qui le
+            précèdent écrits, et ceux encore en attente à l'arrêt de l'itération sont écrits dans cet ordre.
+            Le processus principal sert le cache de résultats et les contenus identiques avant de confier les
+            autres fichiers au pool ; les workers reprennent aux points de reprise, utilisent le cache négatif et
+            partent des clés du trousseau connues au lancement. Limite: une clé retrouvée par un worker rejoint le
+            trousseau de la session avec son résultat, mais n'est pas essayée par les autres workers de la mission.
+            
+            Args:
+                dossier_chiffres(str): dossier contenant les fichiers chiffrés
+                chemin_dictionnaire(str): dictionnaire utilisé pour générer les clés candidates
+                statistiques_seules(bool): si True, les résultats ne sont pas conservés par l'orchestrateur
+                    (missions_completees ne reçoit que le nombre de fichiers et la durée)
+                concurrente(bool): si True, les fichiers sont identifiés et attaqués en parallèle
+                nb_workers(int): budget global de processus du mode concurrent (0 = tous les cœurs)
+            
+            Yields:
+                ResultatAnalyse: le résultat de chaque fichier (`fichier` donne son nom), dans l'ordre des noms
+                    de fichiers, ou dans l'ordre d'achèvement en mode concurrent
+        """
         debut_mission = time.time()
-        resultats: list[ResultatAnalyse] = []
+        fichiers_enc = sorted(f for f in os.listdir(dossier_chiffres) if f.endswith(".enc"))
+        if not fichiers_enc:
+            self.__message("Aucun fichier .enc trouvé dans le dossier")
+            return
+        self.__message(f"{len(fichiers_enc)} fichiers .enc détectés")
+        
+        chemins = [os.path.join(dossier_chiffres, fichier) for fichier in fichiers_enc]
+        if concurrente:
+            self.__message("\nANALYSE CONCURRENTE DES FICHIERS")
+            resultats_fichiers = self.__flux_concurrent(chemins, chemin_dictionnaire, nb_workers)
+        else:
+            self.__message("\nANALYSE SÉQUENTIELLE DES FICHIERS")
+            resultats_fichiers = self.__flux_sequentiel(chemins, chemin_dictionnaire)
+        resultats: List[ResultatAnalyse] = []
+        nb_fichiers = 0
+        # Rapports en attente des fichiers qui les précèdent (mode concurrent), par rang de fichier
+        rangs = {fichier: rang for rang, fichier in enumerate(fichiers_enc)}
+        rapports_en_attente: dict[int, ResultatAnalyse] = {}
+        prochain_rapport = 0
         try:
-            with Progress() as progress :
-                # Récupération des fichiers .enc
-                fichiers_enc = [f for f in os.listdir(dossier_chiffres) if f.endswith(".enc")]
-                
-                if not fichiers_enc:
-                    print("Aucun fichier .enc trouvé dans le dossier")
-                    return []
-                
-                print(f"{len(fichiers_enc)} fichiers .enc détectés")
-                print("\nANALYSE SÉQUENTIELLE DES FICHIERS")
-                time.sleep(0.5) 
-                for i, fichier in enumerate(fichiers_enc, 0):
-                    print(f"\nFICHIER {i+1}/{len(fichiers_enc)}: {fichier}")
-                    
-                    # TODO: New progress bar -> step: Analyse du fichier mission{i+1}.enc (Done)
-                    task = progress.add_task(f"Analyse du fichier mission{i+1}.enc...", total=100)
-                    time.sleep(0.5)
-                    
-                    chemin_fichier = os.path.join(dossier_chiffres, fichier)
-                    
-                    # Analyse du fichier
-                    error = False
-                    resultats_analyse = self.analyser_fichier_specifique(fichier, progress, task, error, self._NBR_OPERATION_MISSION)
-                    cumul_avance : float = 0
+            with self.__sortie_progression() as progress:
+                task = progress.add_task("Mission complète", total=len(chemins))
+                for resultat in resultats_fichiers:
+                    self.__afficher_resultat(resultat.fichier, resultat)
+                    rapports_en_attente[rangs[resultat.fichier]] = resultat
+                    while prochain_rapport in rapports_en_attente:
+                        self.__ecrire_rapport(rapports_en_attente.pop(prochain_rapport))
+                        prochain_rapport += 1
+                    self.__comptabiliser(resultat)
+                    nb_fichiers += 1
+                    if not statistiques_seules:
+                        resultats.append(resultat)
+                    progress.update(task, description=f"Mission complète: {resultat.fichier}", advance=1)
+                    yield resultat
+                progress.remove_task(task)
+        finally:
+            resultats_fichiers.close()
+            for rang in sorted(rapports_en_attente):
+                self.__ecrire_rapport(rapports_en_attente[rang])
+            mission: dict = {"dossier": dossier_chiffres, "nb_fichiers": nb_fichiers, "temps_total": time.time() - debut_mission}
+            if not statistiques_seules:
+                mission["resultats"] = resultats
+            self.missions_completees.append(mission)
+    
+    def __flux_sequentiel(self, chemins: List[str], chemin_dictionnaire: str) -> Iterator[ResultatAnalyse]:
+        """
+            Résultats des fichiers traités un à un. Un fichier au contenu déjà vu reprend l'algorithme et la clé
+            du premier (son texte est déchiffré à nouveau plutôt que gardé en mémoire).
+            
+            La table des contenus déjà vus croît d'une entrée par contenu distinct de la mission: empreinte,
+            nom d'algorithme, clé et score, soit quelques centaines d'octets au plus, quelle que soit la taille
+            des fichiers. Elle vit le temps de la mission (environ 30 Mo pour 100 000 fichiers distincts).
+        """
+        # Empreinte SHA-256 -> (algorithme, clé, score) du premier fichier de ce contenu
+        premiers: dict[str, tuple[str, bytes, float]] = {}
+        for chemin_fichier in chemins:
+            fichier = os.path.basename(chemin_fichier)
+            with self.metriques.etape("lecture"), open(chemin_fichier, 'rb') as f:
+                donnees = f.read()
+            empreinte = PointsReprise.empreinte(donnees)
+            if empreinte in premiers:
+                algo, cle, score = premiers[empreinte]
+                resultat = ResultatAnalyse(algo, cle, score, b"", 0.0, 0, fichier, 0.0)
+                if cle:
+                    resultat.texte_dechiffre, resultat.taux_succes = evaluer_dechiffrement(self.analyzers[algo].dechiffrer_donnees(donnees, cle))
+            else:
+                resultat = self.__traiter_contenu(chemin_fichier, donnees, empreinte, chemin_dictionnaire)
+                premiers[empreinte] = (resultat.algo, resultat.cle, resultat.score_probabilite)
+            # Le contenu n'est pas retenu pendant que l'appelant traite le résultat
+            del donnees
+            yield resultat
+    
+    def __flux_concurrent(self, chemins: List[str], chemin_dictionnaire: str, nb_workers: int) -> Iterator[ResultatAnalyse]:
+        """
+            Résultats des fichiers identifiés et attaqués dans les processus du pool, dans l'ordre d'achèvement.
+            Chaque contenu n'est confié qu'une fois au pool: les fichiers identiques reçoivent une copie du résultat
+            du premier, et les contenus déjà déchiffrés lors d'un run précédent sont servis par le cache de résultats.
+            Les workers reprennent leurs attaques aux points de reprise de la session, qui enregistre leurs avancées,
+            partagent le cache négatif et partent du trousseau de la session, qui reçoit les clés qu'ils retrouvent.
+        """
+        # Import local: mission_concurrente dépend elle-même de ce module
+        from src.mission_concurrente import iterer_mission_concurrente
+        
+        # Empreinte SHA-256 -> chemins des fichiers de ce contenu (le premier est traité)
+        identiques: dict[str, List[str]] = {}
+        connus: List[Tuple[str, ResultatAnalyse]] = []
+        a_traiter: List[str] = []
+        for chemin in chemins:
+            with self.metriques.etape("lecture"), open(chemin, 'rb') as f:
+                donnees = f.read()
+            empreinte = PointsReprise.empreinte(donnees)
+            if empreinte in identiques:
+                identiques[empreinte].append(chemin)
+                continue
+            identiques[empreinte] = [chemin]
+            resultat = self.__resultat_connu(donnees, empreinte, os.path.basename(chemin))
+            if resultat is not None:
+                connus.append((empreinte, resultat))
+            else:
+                a_traiter.append(empreinte)
+        
+        def avec_identiques(empreinte: str, resultat: ResultatAnalyse) -> Iterator[ResultatAnalyse]:
+            yield resultat
+            for chemin in identiques[empreinte][1:]:
+                yield self.__copier_resultat(resultat, os.path.basename(chemin))
+        
+        for empreinte, resultat in connus:
+            yield from avec_identiques(empreinte, resultat)
+        premiers = [identiques[empreinte][0] for empreinte in a_traiter]
+        dossier_cache_negatif = self.cache_negatif.dossier if self.cache_negatif is not None else None
+        resultats = iterer_mission_concurrente(premiers, chemin_dictionnaire, nb_workers, self.points_reprise,
+                                               self.trousseau, dossier_cache_negatif)
+        for index, resultat in resultats:
+            self.__memoriser_resultat(premiers[index], a_traiter[index], resultat)
+            yield from avec_identiques(a_traiter[index], resultat)
+    
+    def __afficher_resultat(self, nom_fichier: str, resultat: ResultatAnalyse) -> None:
+        """
+            Retour visuel d'une ligne sur le résultat final d'un fichier.
+        """
+        if resultat.algo and resultat.taux_succes > 60:
+            self.__message(f"[bold green]{nom_fichier}: {resultat.algo} (score: {resultat.score_probabilite:.2f}) ✅[/bold green]", style=True)
+        elif resultat.algo:
+            self.__message(f"[bold red]{nom_fichier}: {resultat.algo} - Déchiffrement non concluant ❌[/bold red]", style=True)
+        else:
+            self.__message(f"[bold yellow]{nom_fichier}: Aucun algorithme détecté ⚠️[/bold yellow]", style=True)
 
-                    print('analyzed')
-                    # Tentative de déchiffrement si algorithme détecté
-                    for resultat in resultats_analyse :
-                        if resultat.algo:
-                            avancement = (100/(self._NBR_OPERATION_MISSION * len(resultats_analyse)))
-                            # TODO: MAJ de la progress bar -> step: Amorçage de la phase de déchiffrement (Done)
-                            self.maj_progress_bar(0, progress, task, f"Amorçage de la phase de déchiffrement avec {resultat.algo}...", avancement * 0.5, 1)
-                                                    
-                            analyzer = self.analyzers[resultat.algo]
-                            
-                            # TODO: MAJ de la progress bar -> step: Récupération des clés candidates (Done)
-                            self.maj_progress_bar(0, progress, task, f"Récupération des clés candidates pour {resultat.algo}...", avancement*0.5, 1)
+    def __ecrire_rapport(self, resultat_fichier: ResultatAnalyse) -> None:
+        """
+            Ajoute le rapport de synthèse d'un fichier au fichier des rapports.
+        """
+        resultat = {
+            'algorithme': resultat_fichier.algo,
+            'fichier': resultat_fichier.fichier,
+            'cle': resultat_fichier.cle,
+            'tentatives': resultat_fichier.nb_tentatives,
+            'temps_execution': resultat_fichier.temps_execution,
+            'taux_succes': resultat_fichier.taux_succes,
+            'statut_succes' : 'Succès' if resultat_fichier.taux_succes > 60 else 'Echec',
+            'texte_dechiffre' : resultat_fichier.texte_dechiffre
+        }
+        rapport_mission(self.analyzers, self.__message).generer_rapport_synthese(resultat)
 
-                            cles_candidates = analyzer.generer_cles_candidates(chemin_dictionnaire)
-                            cumul_avance += avancement
-                            
-                            if cles_candidates:
-                                print(f"Test de {len(cles_candidates)} clés candidates pour {resultat.algo}...")
-                                
-                                # TODO: MAJ de la progress bar -> step: Test de déchiffrement (Done)
-                                self.maj_progress_bar(0, progress, task, f"Test de déchiffrement pour {resultat.algo}...", avancement * 0.5, 3)
-                            
-                                error = self.__tenter_dechiffrement_avec_dictionnaire(chemin_fichier, cles_candidates, analyzer, resultat) 
-                                
-                                #Cas de déchiffrement réussi
-                                if not error : 
-                                    # TODO: MAJ de la progress bar -> step: Déchiffrement réussi pour {algorithme}
-                                    self.maj_progress_bar(0.5, progress, task, f"Déchiffrement réussi pour {resultat.algo}", (100/self._NBR_OPERATION_MISSION) - cumul_avance , 2)
-                                    
-                                    resultat_final : ResultatAnalyse = resultat
-                                    break
-                                else : 
-                                    self.maj_progress_bar(0.5, progress, task, f"Echec de déchiffrement pour {resultat.algo} ❌", avancement * 0.5, 2)
-                            else :
-                                # TODO: MAJ de la progress bar -> step: Abort et récupération des résultats d'analyse (Done)
-                                self.maj_progress_bar(0, progress, task, "Aucune clé candidate générée pour {resultat.algo}❌ (Aborting ...)", avancement, 3)
-                                error = True
-                    
-                    resultats.append(resultat_final)
-                    
-                    # retour visuel
-                    if resultat_final.algo:
-                        # TODO: MAJ de la progress bar -> step: Finalsation et retour de résultats (Done)
-                        self.maj_progress_bar(0, progress, task, "Finalisation et retour des résultats", 100, 3)
-                        
-                        print(f"{fichier}: {resultat_final.algo} (score: {resultat_final.score_probabilite:.2f})")
-                        
-                        message = "[bold green] Mission terminée. ✅[/bold green]\n\n" if not error else "[bold red] Mission terminée: Déchiffrement non concluant. ❌ [/bold red]\n\n"
-                        Console().print(message)
-                    else:
-                        # TODO: MAJ de la progress bar -> step: Abort et récupération des résultats d'analyse (Done)
-                        self.maj_progress_bar(0, progress, task, "Aborting et récupération des résultats d'analyse...", 100, 0.5)
-                        Console().print(f"[bold yellow] Mission terminée: Aucun algorithme détecté. ⚠️[/bold yellow]\n\n")
-                    
-                    progress.remove_task(task)
+    def __comptabiliser(self, resultat: ResultatAnalyse) -> None:
+        """
+            Ajoute le résultat d'un fichier aux statistiques globales de la session.
+        """
+        self.statistiques_globales["total_fichiers"] += 1
+        if est_dechiffrement_reussi(resultat.texte_dechiffre, resultat.taux_succes):
+            self.statistiques_globales["fichiers_dechiffres"] += 1
+        self.statistiques_globales["temps_total"] += resultat.temps_execution
+        self.statistiques_globales["tentatives_total"] += resultat.nb_tentatives
+
+    def __generer_rapports(self, resultats: List[ResultatAnalyse]) -> None:
+        """
+            Génère le rapport de synthèse de chaque fichier, dans l'ordre des résultats.
+        """
+        with self.__sortie_progression() as progress :
+            task = progress.add_task("Préparation des rapports", total=max(1, len(resultats)))
+            
+            for resultat_fichier in resultats :
+                self.__ecrire_rapport(resultat_fichier)
+                self.__comptabiliser(resultat_fichier)
+                progress.update(task, description="Préparation des rapports", advance=1)
+            progress.update(task, description="Mission complète effectuée.")
+
+    def __mission_concurrente(self, dossier_chiffres: str, chemin_dictionnaire: str, nb_workers: int) -> List[ResultatAnalyse]:
+        """
+            Mission complète en mode concurrent: chaque fichier est identifié et attaqué dans un processus
+            du pool et son résultat est affiché dès qu'il est prêt (voir mission_flux) ; la liste retournée
+            suit l'ordre des fichiers.
+        """
+        try:
+            resultats = list(self.mission_flux(dossier_chiffres, chemin_dictionnaire, concurrente=True, nb_workers=nb_workers))
+        except Exception as e:
+            self.__message(f"Erreur lors de la mission complète: {str(e)}")
+            return []
+        # Noms de fichiers d'un même dossier: l'ordre des noms est celui des fichiers
+        return sorted(resultats, key=lambda resultat: resultat.fichier)
+
+    def __mission_planifiee(self, dossier_chiffres: str, chemin_dictionnaire: str, budget_fichier: Optional[float], budget_mission: Optional[float]) -> List[ResultatAnalyse]:
+        """
+            Mission complète ordonnancée: les couples (fichier, algorithme) sont attaqués par gain attendu décroissant,
+            avec une ETA après chaque attaque. Les espaces de clés interrompus par un budget sont repris au run suivant.
+            Comme en mission séquentielle, les clés du trousseau sont essayées d'abord, et chaque attaque passe par
+            les points de reprise et le cache négatif (voir attaque_memorisee).
+        """
+        # Import local: l'ordonnanceur dépend lui-même de ce module
+        from src.ordonnanceur import OrdonnanceurAttaques
+        
+        debut_mission = time.time()
+        try:
+            fichiers_enc = sorted(f for f in os.listdir(dossier_chiffres) if f.endswith(".enc"))
+            if not fichiers_enc:
+                self.__message("Aucun fichier .enc trouvé dans le dossier")
+                return []
+            
+            if self.ordonnanceur is None or self.ordonnanceur.chemin_dictionnaire != chemin_dictionnaire:
+                self.ordonnanceur = OrdonnanceurAttaques(self, chemin_dictionnaire)
+            self.ordonnanceur.budget_fichier = budget_fichier
+            self.ordonnanceur.budget_mission = budget_mission
+            
+            self.__message(f"{len(fichiers_enc)} fichiers .enc détectés")
+            
+            def afficher(tache, recherche, eta: float) -> None:
+                statut = "[bold green]✅" if recherche.trouve else "[bold yellow]⏸" if recherche.reprise < tache.nb_cles else "[bold red]❌"
+                self.__message(f"{statut} {os.path.basename(tache.fichier)} - {tache.algo}: {recherche.nb_testees} clés testées | ETA {eta:.1f}s", style=True)
+            
+            def traiter(sous_chemins: List[str]) -> List[ResultatAnalyse]:
+                # Clés retrouvées plus tôt dans la session: essayées avant toute attaque planifiée
+                par_fichier: dict[str, ResultatAnalyse] = {}
+                essais_trousseau: dict[str, int] = {}
+                if len(self.trousseau):
+                    for chemin in sous_chemins:
+                        debut = time.perf_counter()
+                        with self.metriques.etape("lecture"), open(chemin, 'rb') as f:
+                            donnees = f.read()
+                        eligibles = [
+                            ResultatAnalyse(nom_algo, b"", score, b"", 0.0, 0, os.path.basename(chemin), 0)
+                            for nom_algo, score in self.scorer_fichier(chemin).items() if score >= 0.6
+                        ]
+                        resultat = self.__essayer_trousseau(donnees, eligibles) if eligibles else None
+                        if resultat is not None:
+                            resultat.temps_execution = time.perf_counter() - debut
+                            par_fichier[chemin] = resultat
+                            self.__message(f"[bold green]{os.path.basename(chemin)}: {resultat.algo} (clé du trousseau) ✅[/bold green]", style=True)
+                        else:
+                            essais_trousseau[chemin] = sum(eligible.nb_tentatives for eligible in eligibles)
+                a_planifier = [chemin for chemin in sous_chemins if chemin not in par_fichier]
                 
-                # Rapport de synthèse final
-                with Progress() as progress :
-                    task = progress.add_task("Préparation des rapports", total=100) # TODO: New progress bar -> step: Préparation des rapports (1 to 100%) (Done)
-                    
-                    while not progress.finished :
-                        progress.update(task, description="Préparation des rapports", advance=2)
-                        time.sleep(0.2)
-                    for i in range(len(fichiers_enc)) :
-                        resultat = {
-                            'algorithme': resultats[i].algo,
-                            'fichier': resultats[i].fichier,
-                            'cle': resultats[i].cle,
-                            'tentatives': resultats[i].nb_tentatives,
-                            'temps_execution': resultats[i].temps_execution,
-                            'taux_succes': resultats[i].taux_succes,
-                            'statut_succes' : 'Succès' if resultats[i].taux_succes > 60 else 'Echec',
-                            'texte_dechiffre' : resultats[i].texte_dechiffre
-                        }
-                        rapport_mission().generer_rapport_synthese(resultat)
-                        progress.update(task, description="Mission complète effectuée.") # TODO: MAJ de la progress bar -> step: Mission complète effectuée (Done)
+                # Reprise: si des espaces de clés de ces fichiers sont en attente, seuls ceux-là sont planifiés
+                reprendre = any(self.ordonnanceur.en_attente(chemin) for chemin in a_planifier)
+                taches = self.ordonnanceur.planifier(a_planifier, reprendre)
+                self.__message(f"\nATTAQUES PLANIFIÉES: {len(taches)} (durée estimée: {self.ordonnanceur.eta(taches, set()):.1f}s)")
+                for chemin, resultat in self.ordonnanceur.executer(taches, afficher).items():
+                    # Échec: les clés du trousseau essayées comptent parmi les tentatives (voir ResultatAnalyse)
+                    if not est_dechiffrement_reussi(resultat.texte_dechiffre, resultat.taux_succes):
+                        resultat.nb_tentatives += essais_trousseau.get(chemin, 0)
+                    par_fichier[chemin] = resultat
+                # Fichiers sans algorithme éligible: résultat vide, comme en mission séquentielle
+                return [par_fichier.get(chemin) or ResultatAnalyse("", b"", 0.0, b"", 0.0, 0, os.path.basename(chemin), 0) for chemin in sous_chemins]
+            
+            chemins = [os.path.join(dossier_chiffres, fichier) for fichier in fichiers_enc]
+            resultats = self.__resoudre_par_empreinte(chemins, traiter)
+            if self.ordonnanceur.restes:
+                self.__message(f"{len(self.ordonnanceur.restes)} espace(s) de clés laissé(s) pour un prochain run")
+            
+            self.__generer_rapports(resultats)
+            self.missions_completees.append({
+                "dossier": dossier_chiffres,
+                "resultats": resultats,
+                "temps_total": time.time() - debut_mission
+            })
+            return resultats
+        
+        except Exception as e:
+            self.__message(f"Erreur lors de la mission complète: {str(e)}")
+            return []
 
-                # Mise à jour des statistiques globales
-                self.missions_completees.append({
-                    "dossier": dossier_chiffres,
-                    "resultats": resultats,
-                    "temps_total": time.time() - debut_mission
-                })
+    def __mission_groupee(self, dossier_chiffres: str, chemin_dictionnaire: str) -> List[ResultatAnalyse]:
+        """
+            Mission complète par groupes: les fichiers sont regroupés par algorithme éligible (même recette de
+            dérivation), les clés candidates de chaque groupe sont dérivées une fois puis testées en un seul passage
+            sur tous les fichiers encore non résolus du groupe. Un fichier résolu quitte ses autres groupes.
+            Comme en mission séquentielle, les clés du trousseau sont essayées d'abord, et chaque fichier du groupe
+            garde son point de reprise et son cache négatif (voir __attaquer_groupe). Le passage se fait dans le
+            processus courant, quel que soit le nombre de workers de l'orchestrateur.
+        """
+        debut_mission = time.time()
+        try:
+            fichiers_enc = sorted(f for f in os.listdir(dossier_chiffres) if f.endswith(".enc"))
+            if not fichiers_enc:
+                self.__message("Aucun fichier .enc trouvé dans le dossier")
+                return []
+            
+            self.__message(f"{len(fichiers_enc)} fichiers .enc détectés")
+            self.__message("\nATTAQUE GROUPÉE PAR ALGORITHME")
+            
+            def traiter(sous_chemins: List[str]) -> List[ResultatAnalyse]:
+                resultats = {chemin: ResultatAnalyse("", b"", 0.0, b"", 0.0, 0, os.path.basename(chemin), 0) for chemin in sous_chemins}
+                contenus: dict[str, bytes] = {}
+                # Groupes dans l'ordre des analyzers: algorithme -> [(chemin, score)]
+                groupes: dict[str, list[tuple[str, float]]] = {nom_algo: [] for nom_algo in self.analyzers}
+                for chemin in sous_chemins:
+                    debut = time.perf_counter()
+                    with self.metriques.etape("lecture"), open(chemin, 'rb') as f:
+                        contenus[chemin] = f.read()
+                    eligibles = [
+                        ResultatAnalyse(nom_algo, b"", score, b"", 0.0, 0, os.path.basename(chemin), 0)
+                        for nom_algo, score in self.scorer_fichier(chemin).items() if score >= 0.6
+                    ]
+                    # Clés retrouvées plus tôt dans la session: essayées avant toute attaque de groupe
+                    resultat = self.__essayer_trousseau(contenus[chemin], eligibles) if eligibles else None
+                    if resultat is not None:
+                        resultats[chemin] = resultat
+                        self.__message(f"[bold green]{os.path.basename(chemin)}: {resultat.algo} (clé du trousseau) ✅[/bold green]", style=True)
+                    else:
+                        resultats[chemin].nb_tentatives += sum(eligible.nb_tentatives for eligible in eligibles)
+                        for eligible in eligibles:
+                            groupes[eligible.algo].append((chemin, eligible.score_probabilite))
+                    resultats[chemin].temps_execution += time.perf_counter() - debut
                 
-                return resultats
+                for nom_algo, membres in groupes.items():
+                    en_attente = [(chemin, score) for chemin, score in membres if not est_dechiffrement_reussi(resultats[chemin].texte_dechiffre, resultats[chemin].taux_succes)]
+                    if not en_attente:
+                        continue
+                    debut = time.perf_counter()
+                    analyzer = self.analyzers[nom_algo]
+                    recherches = self.__attaquer_groupe(nom_algo, analyzer, [contenus[chemin] for chemin, _ in en_attente], chemin_dictionnaire)
+                    # Le passage est commun: sa durée est répartie entre les fichiers du groupe
+                    duree = (time.perf_counter() - debut) / len(en_attente)
+                    
+                    for (chemin, score), recherche in zip(en_attente, recherches):
+                        resultat = resultats[chemin]
+                        if not resultat.algo or recherche.trouve:
+                            resultat.algo = nom_algo
+                            resultat.score_probabilite = score
+                        resultat.temps_execution += duree
+                        if recherche.trouve:
+                            resultat.nb_tentatives = recherche.index + 1
+                            resultat.cle = recherche.cle
+                            resultat.texte_dechiffre = recherche.texte_dechiffre
+                            resultat.taux_succes = recherche.taux_succes
+                            self.__memoriser_cle(nom_algo, analyzer, chemin_dictionnaire, recherche)
+                            self.__message(f"[bold green]{os.path.basename(chemin)}: {nom_algo} (score: {score:.2f}) ✅[/bold green]", style=True)
+                        else:
+                            resultat.nb_tentatives += recherche.nb_testees
+                return [resultats[chemin] for chemin in sous_chemins]
             
+            chemins = [os.path.join(dossier_chiffres, fichier) for fichier in fichiers_enc]
+            resultats = self.__resoudre_par_empreinte(chemins, traiter)
+            
+            self.__generer_rapports(resultats)
+            self.missions_completees.append({
+                "dossier": dossier_chiffres,
+                "resultats": resultats,
+                "temps_total": time.time() - debut_mission
+            })
+            return resultats
+        
         except Exception as e:
-            print(f"Erreur lors de la mission complète: {str(e)}")
+            self.__message(f"Erreur lors de la mission complète: {str(e)}")
             return []
+
+    def __attaquer_groupe(self, nom_algo: str, analyzer: CryptoAnalyzer, donnees: List[bytes],
+                          chemin_dictionnaire: str) -> List['ResultatRecherche']:
+        """
+            Passage unique des clés candidates d'un algorithme sur les fichiers d'un groupe, avec les mêmes
+            mémoires qu'une attaque fichier par fichier: chaque fichier repart de son point de reprise, saute les
+            mots déjà essayés sans succès (cache négatif) et enregistre sa progression.
+            
+            Args:
+                nom_algo(str): l'algorithme commun au groupe
+                analyzer(CryptoAnalyzer): son analyzer
+                donnees(list[bytes]): le contenu de chaque fichier du groupe
+                chemin_dictionnaire(str): dictionnaire d'où proviennent les clés candidates
+            
+            Returns:
+                list[ResultatRecherche]: un résultat par fichier, dans l'ordre des données
+        """
+        cles = self.cles_candidates(analyzer, chemin_dictionnaire)
+        self.__message(f"Groupe {nom_algo}: {len(donnees)} fichier(s), {len(cles)} clés candidates dérivées une fois")
+        if self.points_reprise is None and self.cache_negatif is None:
+            return self.moteur_attaque.rechercher_groupe(analyzer, donnees, cles)
         
+        empreintes = [PointsReprise.empreinte(contenu) for contenu in donnees]
+        exclusions: List[Optional[bytearray]] = []
+        elements_fichiers: List[Optional[List[bytes]]] = []
+        for empreinte in empreintes:
+            _, masque_mots, elements = self.__mots_exclus(empreinte, nom_algo, analyzer, chemin_dictionnaire)
+            elements_fichiers.append(elements)
+            exclusions.append(bytearray(exclu for exclu in masque_mots for _ in range(analyzer._CLES_PAR_MOT))
+                              if masque_mots is not None and any(masque_mots) else None)
+        
+        points = self.points_reprise
+        debuts = [0] * len(donnees)
+        progression = None
+        if points is not None:
+            try:
+                source = self.source_candidates(analyzer, chemin_dictionnaire)
+            except OSError:
+                points = None
+        if points is not None:
+            debuts = [points.position(empreinte, nom_algo, source) for empreinte in empreintes]
+            if any(debuts):
+                self.__message(f"Reprise du groupe {nom_algo} à partir de la clé {min(debuts)}/{len(cles)}")
+            def progression(rang: int, frontiere: int) -> None:
+                points.avancer(empreintes[rang], nom_algo, source, frontiere)
+        
+        try:
+            recherches = self.moteur_attaque.rechercher_groupe(analyzer, donnees, cles, None, debuts, exclusions, progression)
+        finally:
+            # Interruption: la dernière frontière connue est écrite sans attendre l'intervalle
+            if points is not None:
+                points.sauvegarder()
+        
+        for empreinte, debut, recherche, elements in zip(empreintes, debuts, recherches, elements_fichiers):
+            if elements is not None:
+                self.__memoriser_mots_essayes(empreinte, nom_algo, analyzer, elements, debut, recherche)
+            if points is None:
+                continue
+            if recherche.trouve or recherche.reprise >= len(cles):
+                points.terminer(empreinte, nom_algo, source)
+            else:
+                points.avancer(empreinte, nom_algo, source, recherche.reprise)
+        if points is not None:
+            points.sauvegarder()
+        return recherches
+
+    def dechiffrer_vers_fichier(self, chemin_fichier: str, algo: str, cle: bytes, chemin_sortie: str) -> bool:
+        """
+            Déchiffre un fichier vers un fichier de texte clair, en flux et en mémoire constante.
+            
+            Args:
+                chemin_fichier(str): le fichier chiffré
+                algo(str): l'algorithme retrouvé
+                cle(bytes): la clé retrouvée
+                chemin_sortie(str): le fichier de texte clair à produire (créé seulement si le déchiffrement est validé)
+            
+            Returns:
+                bool: True si le contenu est authentifié et son préfixe validé
+        """
+        texte, taux = self.analyzers[algo].dechiffrer_vers_fichier(chemin_fichier, cle, chemin_sortie)
+        if not est_dechiffrement_reussi(texte, taux):
+            self.__message(f"Déchiffrement de {os.path.basename(chemin_fichier)} rejeté: aucun fichier écrit")
+            return False
+        self.__message(f"{os.path.basename(chemin_fichier)} déchiffré vers {chemin_sortie} (taux de succès du préfixe: {taux:.2f}%)")
+        return True
 
     def attaque_dictionnaire_manuelle(self, chemin_fichier: str, algorithme_choisi: str, chemin_dictionnaire: str) -> ResultatAnalyse:
         """
@@ -343,78 +1290,73 @@ class DetecteurCryptoOrchestrateur:
         
         try:
             if algorithme_choisi not in self.analyzers:
-                print(f"Algorithme {algorithme_choisi} non disponible")
+                self.__message(f"Algorithme {algorithme_choisi} non disponible")
                 return resultat
             
             analyzer = self.analyzers[algorithme_choisi]
             
             # Vérification de l'algorithme
-            score = analyzer.identifier_algo(chemin_fichier)
+            score = analyzer.identifier_algo(chemin_fichier, self.identification_rapide)
             resultat.score_probabilite = score
             resultat.algo = algorithme_choisi
-            print(f"Score de confirmation: {score:.2f}")
+            self.__message(f"Score de confirmation: {score:.2f}")
             
             if score < 0.3:
-                print("Score de confiance faible pour cet algorithme")
+                self.__message("Score de confiance faible pour cet algorithme")
             
-            # Génération des clés candidates
-            print(f"Génération des clés candidates")
-            cles_candidates = analyzer.generer_cles_candidates(chemin_dictionnaire)
-            print(f"{len(cles_candidates)} clés candidates générées")
+            # Clés candidates, dérivées au moment de l'attaque
+            self.__message(f"{self.__nb_cles_candidates(analyzer, chemin_dictionnaire)} clés candidates")
             
             # Attaque par dictionnaire
             
-            self.__tenter_dechiffrement_avec_dictionnaire(chemin_fichier, cles_candidates, analyzer, resultat)
+            self.__tenter_dechiffrement_avec_dictionnaire(chemin_fichier, analyzer, resultat, chemin_dictionnaire)
             
             
             temps_execution = time.time() - debut_attaque
             resultat.temps_execution = temps_execution
-            print(f"Temps d'exécution: {temps_execution:.2f} secondes")
+            self.__message(f"Temps d'exécution: {temps_execution:.2f} secondes")
             
             return resultat
             
         except Exception as e:
-            print(f"Erreur lors de l'attaque: {str(e)}")
+            self.__message(f"Erreur lors de l'attaque: {str(e)}")
             temps_execution = time.time() - debut_attaque
             return ResultatAnalyse("", b"", 0.0, b"", temps_execution, 0)
         
-    def attaque_dictionnaire(self,chemin_fichier_chiffrer: str, algo : str, chemin_dico : str = "keys/wordlist.txt"):
-        
-        with Progress() as progress:
-            analyzer = self.analyzers[algo]
+    def attaque_dictionnaire(self, chemin_fichier_chiffrer: str, algo: str, chemin_dico: str = "keys/wordlist.txt") -> str:
+        """
+            Attaque par dictionnaire interactive d'un fichier de data/ avec l'algorithme choisi.
             
-            cle_candidates = analyzer.generer_cles_candidates(chemin_dico)
-
-            with open(chemin_dico,'r') as d:
-                dico = d.readlines()
-
-            with open(f"data/{chemin_fichier_chiffrer}",'rb') as f :
-                texte_chiffrer = f.read()
-
-            task_id = progress.add_task("Testing...",total=len(cle_candidates))
-
-            current_task = 0
-
-            advance = 1
-
-
-            while current_task < len(cle_candidates) :
-                time.sleep(0.5)
-
-                essai_dechiffrage = analyzer.dechiffrer(f"data/{chemin_fichier_chiffrer}", cle_candidates[current_task])
-                
-                if essai_dechiffrage != b"" :
-
-                    progress.update(task_id,advance=len(cle_candidates) - current_task)
-
-                    # Retourner un texte décodé/nettoyé pour affichage propre
-                    return essai_dechiffrage.decode('utf-8', errors='ignore').replace('\x00', ' ')
-                     
-                current_task+=1
-
-                progress.update(task_id,advance=advance)
-
+            Les clés candidates sont testées par le moteur d'attaque (points de reprise et cache négatif compris)
+            et validées par la règle de succès de la mission automatique. Avec les barres rich par défaut, le
+            débit, les clés restantes et l'ETA sont affichés par rich.live, rafraîchi à fréquence fixe hors de
+            la boucle de test.
+            
+            Args:
+                chemin_fichier_chiffrer(str): nom du fichier dans data/
+                algo(str): algorithme attaqué
+                chemin_dico(str): dictionnaire des clés candidates
+            
+            Returns:
+                str: le texte déchiffré, ou un message d'échec
+        """
+        analyzer = self.analyzers[algo]
+        with open(f"data/{chemin_fichier_chiffrer}", 'rb') as f:
+            donnees = f.read()
+        
+        from rich.live import Live
+        from src.suivi_attaque import SuiviAttaque
+        
+        suivi = SuiviAttaque(algo, self.__nb_cles_candidates(analyzer, chemin_dico))
+        # Exécution sans terminal (sortie de progression fournie): pas d'affichage en direct
+        affichage = Live(suivi, refresh_per_second=SuiviAttaque.FREQUENCE_RAFRAICHISSEMENT) if self.sortie_progression is None else nullcontext()
+        with affichage:
+            recherche = self.__lancer_recherche(donnees, [algo], [(analyzer, 1.0)], chemin_dico, suivi.avancer)[0]
+            suivi.terminer(recherche)
         
+        if recherche.trouve:
+            # Texte nettoyé pour un affichage propre
+            return recherche.texte_dechiffre.replace('\x00', ' ')
         return "Aucune clé trouvé"
 
 
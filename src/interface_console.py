@@ -1,7 +1,6 @@
 import re
 import math
 from rich.console import Console
-from rich.traceback import install
 from rich.markdown import Markdown
 from rich import print
 from rich.text import Text
@@ -14,15 +13,20 @@ from pathlib import Path
 # from detecteur_crypto import Analyser_fichier_sequentiels
 from .detecteur_crypto import DetecteurCryptoOrchestrateur
 from .rapport_mission import rapport_mission
-import time, os
-
-install()
+import os
 
 class consoleInterface:
     def __init__(self):
+        # Tracebacks rich pour la session interactive seulement (importer le module ne modifie pas sys.excepthook)
+        from rich.traceback import install
+        install()
         # Dummy text for now
         self.console = Console()
         self.prompt = Prompt()
+        # Un seul orchestrateur par session: ses caches servent à toutes les actions du menu.
+        # Les attaques interrompues reprennent au lancement suivant grâce au fichier de points de reprise.
+        self.orchestrateur = DetecteurCryptoOrchestrateur(fichier_reprise=".reprise_attaques.json", dossier_cache_negatif=".cache_negatif",
+                                                         fichier_resultats=".resultats_missions.json")
         self.default_menu()
         
 
@@ -39,9 +43,7 @@ class consoleInterface:
             self.console.print(" ",end='')
             gap=gap+1
 
-        for char in text:
-            self.console.print(f"[{color}]{char}[/{color}]",end='')
-            time.sleep(0.02)
+        self.console.print(f"[{color}]{text}[/{color}]")
         self.console.print('\n')
 
         
@@ -50,7 +52,6 @@ class consoleInterface:
         self.console.clear()
         self.dynamiqueText("😈​ Bienvenue sur Forensic je suis Crypto votre assitant IA minimaliste 🤖​ ","green")
         self.dynamiqueText("En quoi puis-je vous aider ? :","white")
-        time.sleep(0.02)
         menuTag = Markdown("# Menu",style="blue")
         menuOption = Markdown("1. #### Analyse d'un fichier spécifique \n" \
                               "2. #### Mission complète automatique \n" \
@@ -59,7 +60,6 @@ class consoleInterface:
                               "5. #### Système d'aide intégré \n" \
                               "6. #### Quitter")
         self.console.print(menuTag,menuOption)
-        time.sleep(0.02)
 
         choix = self.prompt.ask("Veuillez choisir une option ", choices=["1","2","3","4","5","6"])
         try:    
@@ -85,13 +85,12 @@ class consoleInterface:
         self.dynamiqueText("Analyse d'un fichier spécifique","green")
         self.dynamiqueText("Veuillez entrer le chemin du fichier","yellow")
         fichier = self.prompt.ask("")
-        time.sleep(0.02)
         self.dynamiqueText("Analyse en cours...","green")
         with Progress() as progress :
             
             task=progress.add_task(f"Analyse du {fichier}", total=100)
             error = False 
-            data = DetecteurCryptoOrchestrateur().analyser_fichier_specifique(fichier, progress, task, error, 1)
+            data = self.orchestrateur.analyser_fichier_specifique(fichier, progress, task, error, 1)
             for item in data :
                 if item.algo :
                     print(f"\n[bold]Algorithme potencielle détecté[/bold] : [yellow]{item.algo}[/yellow]")
@@ -100,7 +99,6 @@ class consoleInterface:
                     continue
                 
             progress.update(task, description="Analyse terminé et affichage des résultats✅", advance=100)
-            time.sleep(2)   
             
         print(f"[bold]Temps d'éxécution[/bold] : [green]{round(data[0].temps_execution,4)}[/green] s\n")
             
@@ -113,23 +111,20 @@ class consoleInterface:
         self.console.clear()
         self.dynamiqueText("Mission complète automatique","green")
         self.dynamiqueText("Veuillez entrer le chemin du dossier :","white")
-        time.sleep(0.02)
         pad = 0
         while pad < self.calc_center("data"):
             print(" ",end='')
             pad+=1
             
         chemin_dossier = self.prompt.ask("")
-        resultat = DetecteurCryptoOrchestrateur().mission_complete_automatique(chemin_dossier, "keys/wordlist.txt")
+        resultat = self.orchestrateur.mission_complete_automatique(chemin_dossier, "keys/wordlist.txt")
         print(line for line in resultat)
         # self.console.clear()
         self.dynamiqueText("Mission en cours...","green")
-        time.sleep(0.02)
         # self.console.clear()
         self.dynamiqueText("Mission terminée","green")
         
         esc=input("Veuillez appuyer sur la touche entrer pour retourner au menu principal")
-        time.sleep(0.02)
         
         if esc=="":
             self.default_menu()
@@ -148,12 +143,12 @@ class consoleInterface:
             pad+=1
         chemin_fichier = self.prompt.ask("")
 
-        algo = self.prompt.ask("Veuillez saisir l'un des algorithmes suivant pour le déchiffrage",choices=[ "AES-256-CBC","CHACHA20","BLOWFISH","AES-GCM","FERNET"]).upper()
+        algo = self.prompt.ask("Veuillez saisir l'un des algorithmes suivant pour le déchiffrage",choices=list(self.orchestrateur.analyzers)).upper()
 
         self.dynamiqueText("Attaque en cours...","green")
         # time.sleep(0.02)
         # self.console.clear()
-        print(DetecteurCryptoOrchestrateur().attaque_dictionnaire(chemin_fichier,algo))
+        print(self.orchestrateur.attaque_dictionnaire(chemin_fichier,algo))
 
         self.dynamiqueText("Attaque terminée","green")
 
@@ -169,7 +164,6 @@ class consoleInterface:
     def menu_4(self):
         self.console.clear()
         self.dynamiqueText("Affichage des rapports","green")
-        time.sleep(0.02)
         date = input("Quel est la date du rapport que vous souhaitez? Entrez 'all' pour tous les rapports. (format: jj/mm/aa): ")
         
         rapports = []
@@ -186,7 +180,6 @@ class consoleInterface:
         else :
             self.console.print(Markdown('#### Aucun rapport trouvé.'))
         
-        time.sleep(0.03)
         esc = input('Veuillez appuyez sur la touche entrer pour continuer')
         if esc=="": 
             self.default_menu()
@@ -251,7 +244,6 @@ class consoleInterface:
     def menu_6(self):
         self.console.clear()
         self.dynamiqueText("😄​ Merci pour votre visite et à la revoyure 👋​ !","yellow")
-        time.sleep(2)
         self.console.clear()
             
 # consoleInterface()
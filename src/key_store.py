@@ -0,0 +1,244 @@
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, Optional, Union
+
+
+class KeyStore:
+    """
+        Conteneur compact de clés candidates.
+
+        Les clés sont rangées bout à bout dans un unique `bytearray` au lieu d'une `list[bytes]`
+        (environ 65 octets d'en-tête objet par clé). Deux modes de rangement:
+        - pas fixe: toutes les clés ont la même taille (`taille_cle`), la clé i commence à i * taille_cle ;
+        - pas variable: un tableau d'offsets (`array('Q')`) délimite chaque clé (cas de Blowfish,
+          qui produit des clés de longueurs différentes pour un même mot).
+
+        Le conteneur se comporte comme une séquence de `bytes` (len, indexation, itération) afin de
+        rester interchangeable avec les listes retournées par `generer_cles_candidates`.
+
+        Attributes:
+            taille_cle(int | None): taille fixe des clés, None pour un rangement à pas variable
+    """
+
+    _MAGIC = b"CFKS"
+    _VERSION = 1
+    # magic, version, mode (0: pas fixe, 1: pas variable), taille de clé, nombre de clés
+    _ENTETE = struct.Struct("<4sBBxxQQ")
+
+    def __init__(self, taille_cle: Optional[int] = None):
+        if taille_cle is not None and taille_cle <= 0:
+            raise ValueError("La taille de clé doit être strictement positive")
+        self.taille_cle = taille_cle
+        self._donnees = bytearray()
+        self._offsets: Optional[array] = None if taille_cle else array('Q', [0])
+        self._nombre = 0
+
+    @classmethod
+    def depuis_iterable(cls, cles: Iterable[bytes], taille_cle: Optional[int] = None) -> 'KeyStore':
+        """
+            Construit un KeyStore à partir d'un itérable de clés.
+
+            Args:
+                cles(Iterable[bytes]): les clés à ranger
+                taille_cle(int | None): taille fixe attendue, None pour un pas variable
+
+            Returns:
+                KeyStore: le conteneur rempli
+        """
+        store = cls(taille_cle)
+        store.extend(cles)
+        return store
+
+    def append(self, cle: bytes) -> None:
+        """
+            Ajoute une clé à la fin du conteneur.
+
+            Args:
+                cle(bytes): clé à ajouter (tout objet bytes-like)
+        """
+        if self.taille_cle is not None:
+            if len(cle) != self.taille_cle:
+                raise ValueError(f"Taille de clé invalide: {len(cle)} octets au lieu de {self.taille_cle}")
+            self._donnees += cle
+        else:
+            self._donnees += cle
+            self._offsets.append(len(self._donnees))
+        self._nombre += 1
+
+    def extend(self, cles: Iterable[bytes]) -> None:
+        for cle in cles:
+            self.append(cle)
+
+    def _bornes(self, index: int) -> tuple[int, int]:
+        if index < 0:
+            index += self._nombre
+        if not 0 <= index < self._nombre:
+            raise IndexError("Index de clé hors limites")
+        if self.taille_cle is not None:
+            debut = index * self.taille_cle
+            return debut, debut + self.taille_cle
+        return self._offsets[index], self._offsets[index + 1]
+
+    def vue(self, index: int) -> memoryview:
+        """
+            Retourne la clé d'index donné sous forme de memoryview, sans copie.
+
+            Tant qu'une vue est vivante, le conteneur ne peut plus être agrandi (BufferError).
+
+            Args:
+                index(int): position de la clé
+
+            Returns:
+                memoryview: vue en lecture seule sur la clé
+        """
+        debut, fin = self._bornes(index)
+        return memoryview(self._donnees).toreadonly()[debut:fin]
+
+    def iter_vues(self) -> Iterator[memoryview]:
+        """
+            Parcourt les clés sous forme de memoryview (aucune copie).
+        """
+        vue_globale = memoryview(self._donnees).toreadonly()
+        if self.taille_cle is not None:
+            for debut in range(0, self._nombre * self.taille_cle, self.taille_cle):
+                yield vue_globale[debut:debut + self.taille_cle]
+        else:
+            for i in range(self._nombre):
+                yield vue_globale[self._offsets[i]:self._offsets[i + 1]]
+
+    def tranche(self, debut: int, fin: int) -> 'KeyStore':
+        """
+            Extrait les clés [debut, fin[ dans un nouveau KeyStore (une seule copie contiguë).
+
+            Args:
+                debut(int): index de la première clé
+                fin(int): index de fin (exclu)
+
+            Returns:
+                KeyStore: le sous-ensemble de clés
+        """
+        debut, fin, _ = slice(debut, fin).indices(self._nombre)
+        fin = max(debut, fin)
+        morceau = KeyStore(self.taille_cle)
+        if self.taille_cle is not None:
+            morceau._donnees = self._donnees[debut * self.taille_cle:fin * self.taille_cle]
+        else:
+            base = self._offsets[debut]
+            morceau._donnees = self._donnees[base:self._offsets[fin]]
+            morceau._offsets = array('Q', (o - base for o in self._offsets[debut:fin + 1]))
+        morceau._nombre = fin - debut
+        return morceau
+
+    def decouper(self, nb_morceaux: int) -> list['KeyStore']:
+        """
+            Découpe le conteneur en `nb_morceaux` tranches contiguës de tailles voisines,
+            dans l'ordre du dictionnaire (utile pour répartir les clés entre workers).
+
+            Args:
+                nb_morceaux(int): nombre de tranches souhaité
+
+            Returns:
+                list[KeyStore]: les tranches non vides
+        """
+        if nb_morceaux <= 0:
+            raise ValueError("Le nombre de tranches doit être strictement positif")
+        taille, reste = divmod(self._nombre, nb_morceaux)
+        morceaux: list[KeyStore] = []
+        debut = 0
+        for i in range(nb_morceaux):
+            fin = debut + taille + (1 if i < reste else 0)
+            if fin > debut:
+                morceaux.append(self.tranche(debut, fin))
+            debut = fin
+        return morceaux
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les données et les offsets (hors en-tête de l'objet)."""
+        taille = len(self._donnees)
+        if self._offsets is not None:
+            taille += len(self._offsets) * self._offsets.itemsize
+        return taille
+
+    def sauvegarder(self, chemin: str) -> None:
+        """
+            Enregistre le conteneur sur disque (en-tête, offsets éventuels puis données brutes).
+
+            Args:
+                chemin(str): chemin du fichier de destination
+        """
+        mode = 0 if self.taille_cle is not None else 1
+        entete = self._ENTETE.pack(self._MAGIC, self._VERSION, mode, self.taille_cle or 0, self._nombre)
+        chemin_temporaire = f"{chemin}.tmp"
+        with open(chemin_temporaire, "wb") as f:
+            f.write(entete)
+            if self._offsets is not None:
+                offsets = self._offsets
+                if sys.byteorder != "little":
+                    offsets = array('Q', offsets)
+                    offsets.byteswap()
+                f.write(offsets.tobytes())
+            f.write(self._donnees)
+        os.replace(chemin_temporaire, chemin)
+
+    @classmethod
+    def charger(cls, chemin: str) -> 'KeyStore':
+        """
+            Recharge un conteneur enregistré avec `sauvegarder`.
+
+            Args:
+                chemin(str): chemin du fichier à relire
+
+            Returns:
+                KeyStore: le conteneur reconstitué
+        """
+        with open(chemin, "rb") as f:
+            entete = f.read(cls._ENTETE.size)
+            if len(entete) != cls._ENTETE.size:
+                raise ValueError("Fichier KeyStore tronqué")
+            magic, version, mode, taille_cle, nombre = cls._ENTETE.unpack(entete)
+            if magic != cls._MAGIC or version != cls._VERSION:
+                raise ValueError("Fichier KeyStore invalide")
+
+            store = cls(taille_cle if mode == 0 else None)
+            if mode == 1:
+                offsets = array('Q')
+                offsets.frombytes(f.read((nombre + 1) * offsets.itemsize))
+                if sys.byteorder != "little":
+                    offsets.byteswap()
+                store._offsets = offsets
+            store._donnees = bytearray(f.read())
+            store._nombre = nombre
+
+        attendu = nombre * taille_cle if mode == 0 else store._offsets[-1]
+        if len(store._donnees) != attendu:
+            raise ValueError("Fichier KeyStore tronqué")
+        return store
+
+    def __len__(self) -> int:
+        return self._nombre
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[bytes, 'KeyStore']:
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("Seules les tranches contiguës sont supportées")
+            debut, fin, _ = index.indices(self._nombre)
+            return self.tranche(debut, fin)
+        debut, fin = self._bornes(index)
+        with memoryview(self._donnees) as vue:
+            return bytes(vue[debut:fin])
+
+    def __iter__(self) -> Iterator[bytes]:
+        for vue in self.iter_vues():
+            yield bytes(vue)
+
+    def __eq__(self, autre: object) -> bool:
+        if not isinstance(autre, KeyStore):
+            return NotImplemented
+        return len(self) == len(autre) and all(a == b for a, b in zip(self.iter_vues(), autre.iter_vues()))
+
+    def __repr__(self) -> str:
+        pas = f"pas fixe {self.taille_cle}" if self.taille_cle is not None else "pas variable"
+        return f"KeyStore({self._nombre} clés, {pas}, {self.nbytes} octets)"
@@ -0,0 +1,162 @@
+import json
+import os
+import tempfile
+from contextlib import nullcontext
+from time import perf_counter_ns
+from typing import Any, ContextManager, Dict, Tuple
+
+from src.crypto_analyzer import CryptoAnalyzer
+from src.utils import evaluer_dechiffrement
+
+# Étapes chronométrées du chemin critique d'une attaque
+ETAPES = ("lecture", "identification", "filtrage", "derivation", "dechiffrement", "validation")
+# Compteurs: clés déchiffrées, clés écartées sans déchiffrement (test rapide ou cache négatif), octets déchiffrés
+COMPTEURS = ("cles_testees", "cles_rejetees", "octets_dechiffres")
+PREFIXE_PROMETHEUS = "cryptoforensic"
+
+_SANS_MESURE = nullcontext()
+
+
+class Instrumentation:
+    """
+        Destination des mesures du chemin critique émises par l'orchestrateur et le moteur d'attaque.
+
+        Le calcul annonce ses étapes (`etape`), ses compteurs (`compter`) et fait tester chaque clé par
+        `essayer`, qui déchiffre et valide. Cette instrumentation de base ne mesure rien: `etape` rend un
+        contexte partagé sans effet et `essayer` se réduit au déchiffrement et à la validation, si bien que
+        le coût d'une instrumentation désactivée se limite aux appels.
+    """
+
+    actives = False
+
+    def etape(self, nom: str) -> ContextManager:
+        return _SANS_MESURE
+
+    def compter(self, nom: str, valeur: int = 1) -> None:
+        pass
+
+    def essayer(self, analyzer: CryptoAnalyzer, donnees: bytes, cle: bytes) -> Tuple[str, float]:
+        """
+            Déchiffre les données avec une clé et évalue le texte obtenu.
+
+            Returns:
+                Tuple[str, float]: le texte normalisé et son taux de succès (voir evaluer_dechiffrement)
+        """
+        return evaluer_dechiffrement(analyzer.dechiffrer_donnees(donnees, cle))
+
+
+class _Chronometre:
+    """
+        Contexte qui ajoute sa durée (perf_counter_ns) à une étape.
+    """
+
+    __slots__ = ("metriques", "nom", "debut")
+
+    def __init__(self, metriques: "Metriques", nom: str):
+        self.metriques = metriques
+        self.nom = nom
+
+    def __enter__(self) -> None:
+        self.debut = perf_counter_ns()
+
+    def __exit__(self, *exc) -> None:
+        self.metriques.ajouter_duree(self.nom, perf_counter_ns() - self.debut)
+
+
+class Metriques(Instrumentation):
+    """
+        Chronomètres par étape (nanosecondes cumulées et nombre de passages) et compteurs du chemin critique,
+        exportables en JSON ou au format texte de Prometheus.
+
+        En mode parallèle, déchiffrement et validation ont lieu dans les workers: seuls les compteurs
+        y sont remontés, pas les durées de ces deux étapes. Une instance n'est pas prévue pour être
+        partagée entre plusieurs fils.
+
+        Attributes:
+            durees_ns(dict[str, int]): durée cumulée de chaque étape
+            passages(dict[str, int]): nombre de mesures de chaque étape
+            compteurs(dict[str, int]): valeur de chaque compteur
+    """
+
+    actives = True
+
+    def __init__(self):
+        self.durees_ns: Dict[str, int] = dict.fromkeys(ETAPES, 0)
+        self.passages: Dict[str, int] = dict.fromkeys(ETAPES, 0)
+        self.compteurs: Dict[str, int] = dict.fromkeys(COMPTEURS, 0)
+
+    def etape(self, nom: str) -> ContextManager:
+        return _Chronometre(self, nom)
+
+    def ajouter_duree(self, nom: str, duree_ns: int) -> None:
+        self.durees_ns[nom] = self.durees_ns.get(nom, 0) + duree_ns
+        self.passages[nom] = self.passages.get(nom, 0) + 1
+
+    def compter(self, nom: str, valeur: int = 1) -> None:
+        self.compteurs[nom] = self.compteurs.get(nom, 0) + valeur
+
+    def essayer(self, analyzer: CryptoAnalyzer, donnees: bytes, cle: bytes) -> Tuple[str, float]:
+        debut = perf_counter_ns()
+        brut = analyzer.dechiffrer_donnees(donnees, cle)
+        milieu = perf_counter_ns()
+        resultat = evaluer_dechiffrement(brut)
+        self.ajouter_duree("dechiffrement", milieu - debut)
+        self.ajouter_duree("validation", perf_counter_ns() - milieu)
+        self.compteurs["cles_testees"] += 1
+        self.compteurs["octets_dechiffres"] += len(donnees)
+        return resultat
+
+    def instantane(self) -> Dict[str, Any]:
+        """
+            État courant des mesures.
+
+            Returns:
+                dict: {"etapes": {étape: {"secondes": float, "passages": int}}, "compteurs": {compteur: int}}
+        """
+        return {
+            "etapes": {nom: {"secondes": duree / 1e9, "passages": self.passages[nom]} for nom, duree in self.durees_ns.items()},
+            "compteurs": dict(self.compteurs),
+        }
+
+    def en_json(self) -> str:
+        return json.dumps(self.instantane(), indent=2, ensure_ascii=False)
+
+    def en_prometheus(self) -> str:
+        """
+            Mesures au format texte d'exposition de Prometheus (compteurs cumulés).
+        """
+        lignes = [
+            f"# HELP {PREFIXE_PROMETHEUS}_etape_secondes_total Temps cumulé passé dans chaque étape.",
+            f"# TYPE {PREFIXE_PROMETHEUS}_etape_secondes_total counter",
+        ]
+        lignes += [f'{PREFIXE_PROMETHEUS}_etape_secondes_total{{etape="{nom}"}} {duree / 1e9:.9f}' for nom, duree in self.durees_ns.items()]
+        lignes += [
+            f"# HELP {PREFIXE_PROMETHEUS}_etape_passages_total Nombre de mesures de chaque étape.",
+            f"# TYPE {PREFIXE_PROMETHEUS}_etape_passages_total counter",
+        ]
+        lignes += [f'{PREFIXE_PROMETHEUS}_etape_passages_total{{etape="{nom}"}} {passages}' for nom, passages in self.passages.items()]
+        for nom, valeur in self.compteurs.items():
+            lignes.append(f"# TYPE {PREFIXE_PROMETHEUS}_{nom}_total counter")
+            lignes.append(f"{PREFIXE_PROMETHEUS}_{nom}_total {valeur}")
+        return "\n".join(lignes) + "\n"
+
+    def exporter(self, chemin: str) -> None:
+        """
+            Écrit un instantané des mesures: en JSON si le chemin se termine par .json, au format texte de
+            Prometheus sinon (.prom, pour le collecteur textfile de node_exporter). Le fichier est remplacé
+            d'un seul coup, un lecteur ne voit jamais d'export partiel.
+        """
+        contenu = self.en_json() if chemin.endswith(".json") else self.en_prometheus()
+        dossier = os.path.dirname(os.path.abspath(chemin))
+        f = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=dossier, suffix=".tmp", delete=False)
+        try:
+            with f:
+                f.write(contenu)
+            os.replace(f.name, chemin)
+        except BaseException:
+            # Écriture ou remplacement manqué (disque plein, interruption...): le fichier temporaire est retiré
+            try:
+                os.remove(f.name)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,185 @@
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.attaque_parallele import contexte_processus
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur, ResultatAnalyse
+from src.points_reprise import PointsReprise
+from src.progression import SortieTexte
+from src.trousseau import TrousseauCles
+from src.utils import prechauffer_lexique
+
+# Délai maximal (secondes) entre deux relèves des avancées envoyées par les workers
+DELAI_RELEVE_REPRISE = 0.5
+
+# Orchestrateur propre à chaque worker: ses caches (clés candidates, lexique) servent à tous ses fichiers
+_orchestrateur_worker: Optional[DetecteurCryptoOrchestrateur] = None
+
+
+class _RelaisPointsReprise(PointsReprise):
+    """
+        Points de reprise vus d'un worker de mission concurrente.
+
+        Les positions de départ viennent de l'instantané des attaques transmis par le processus principal ;
+        chaque avancée ou fin d'attaque lui est renvoyée par une file. Seul le processus principal écrit le
+        fichier d'état: des workers qui le réécriraient chacun de leur côté effaceraient les frontières des autres.
+    """
+
+    def __init__(self, attaques: Dict[str, Dict[str, Any]], file):
+        self.chemin = None
+        self.intervalle = 0.0
+        self._attaques = attaques
+        self._file = file
+
+    def avancer(self, empreinte: str, algo: str, source: str, frontiere: int) -> None:
+        self._attaques[self._identifiant(empreinte, algo, source)] = {
+            "fichier_sha256": empreinte,
+            "algo": algo,
+            "source": source,
+            "frontiere": frontiere,
+        }
+        self._file.put(("avancer", empreinte, algo, source, frontiere))
+
+    def terminer(self, empreinte: str, algo: str, source: str) -> None:
+        self._attaques.pop(self._identifiant(empreinte, algo, source), None)
+        self._file.put(("terminer", empreinte, algo, source))
+
+    def sauvegarder(self) -> None:
+        pass
+
+
+def _initialiser_worker_mission(cles_trousseau: List[Tuple[str, bytes, Optional[str]]] = (), dossier_cache_negatif: Optional[str] = None,
+                                attaques: Optional[Dict[str, Dict[str, Any]]] = None, file=None) -> None:
+    global _orchestrateur_worker
+    # Attaque séquentielle dans chaque worker: le budget de processus est celui du pool de la mission.
+    # Les messages du worker vont sur la sortie d'erreur, la sortie standard restant au processus principal.
+    # Chaque contenu n'est confié qu'à un worker: le cache négatif, rangé par contenu, est partagé sans conflit.
+    _orchestrateur_worker = DetecteurCryptoOrchestrateur(nb_workers=1, sortie_progression=SortieTexte(sys.stderr),
+                                                         dossier_cache_negatif=dossier_cache_negatif)
+    for algo, cle, mot in cles_trousseau:
+        _orchestrateur_worker.trousseau.ajouter(algo, cle, mot)
+    if file is not None:
+        _orchestrateur_worker.points_reprise = _RelaisPointsReprise(attaques, file)
+    prechauffer_lexique()
+
+
+def _relever_avancees(file, points: PointsReprise) -> None:
+    """
+        Applique aux points de reprise du processus principal les avancées reçues des workers.
+    """
+    while not file.empty():
+        operation, *attaque = file.get()
+        if operation == "avancer":
+            points.avancer(*attaque)
+        else:
+            points.terminer(*attaque)
+
+
+def _traiter_fichier(chemin_fichier: str, chemin_dictionnaire: str) -> Tuple[ResultatAnalyse, List[Tuple[str, bytes, Optional[str]]]]:
+    """
+        Identifie et attaque un fichier dans le worker. Une erreur sur un fichier ne doit pas
+        interrompre le reste du corpus: elle est signalée et le fichier reste sans résultat.
+        Le trousseau du worker accompagne le résultat, pour que le processus principal garde les clés retrouvées.
+    """
+    try:
+        resultat = _orchestrateur_worker.traiter_fichier(chemin_fichier, chemin_dictionnaire)
+    except Exception as e:
+        print(f"Erreur lors du traitement de {chemin_fichier}: {str(e)}", file=sys.stderr)
+        resultat = ResultatAnalyse("", b"", 0.0, b"", 0.0, 0, os.path.basename(chemin_fichier), 0)
+    return resultat, _orchestrateur_worker.trousseau.instantane()
+
+
+def executer_mission_concurrente(chemins_fichiers: List[str], chemin_dictionnaire: str, nb_workers: int = 0,
+                                 rappel: Optional[Callable[[int, ResultatAnalyse], None]] = None) -> List[ResultatAnalyse]:
+    """
+        Identifie et attaque plusieurs fichiers en parallèle sous un budget global de processus.
+
+        Les fichiers sont répartis sur un `ProcessPoolExecutor`: un fichier PBKDF2 lent n'empêche plus
+        les fichiers rapides (ChaCha20, Fernet) d'avancer. Chaque résultat est transmis au rappel dès
+        qu'il est prêt ; la liste retournée suit toujours l'ordre des chemins fournis.
+
+        Args:
+            chemins_fichiers(List[str]): les fichiers chiffrés à traiter
+            chemin_dictionnaire(str): dictionnaire utilisé pour générer les clés candidates
+            nb_workers(int): nombre maximal de processus (0 = tous les cœurs)
+            rappel(Callable[[int, ResultatAnalyse], None]): appelé avec (index du fichier, résultat) dès qu'un fichier est terminé
+
+        Returns:
+            List[ResultatAnalyse]: les résultats, dans l'ordre des fichiers
+    """
+    resultats: List[Optional[ResultatAnalyse]] = [None] * len(chemins_fichiers)
+    for index, resultat in iterer_mission_concurrente(chemins_fichiers, chemin_dictionnaire, nb_workers):
+        resultats[index] = resultat
+        if rappel is not None:
+            rappel(index, resultat)
+    return resultats
+
+
+def iterer_mission_concurrente(chemins_fichiers: List[str], chemin_dictionnaire: str, nb_workers: int = 0,
+                               points_reprise: Optional[PointsReprise] = None, trousseau: Optional[TrousseauCles] = None,
+                               dossier_cache_negatif: Optional[str] = None) -> Iterator[Tuple[int, ResultatAnalyse]]:
+    """
+        Identifie et attaque plusieurs fichiers en parallèle, en produisant chaque résultat dès qu'il est prêt.
+
+        Arrêter l'itération annule les fichiers dont le traitement n'a pas commencé (ceux en cours vont à leur terme).
+
+        Avec des points de reprise, chaque worker repart des frontières enregistrées et renvoie ses avancées
+        au processus principal, seul à écrire le fichier d'état (voir _RelaisPointsReprise) ; la dernière
+        frontière de chaque attaque est écrite à l'arrêt de l'itération, interruption comprise.
+
+        Chaque worker reçoit les clés du trousseau connues au lancement et renvoie les siennes avec chaque
+        résultat: elles rejoignent le trousseau fourni, mais une clé retrouvée par un worker n'est pas transmise
+        aux workers déjà lancés. Le cache négatif est partagé par son dossier.
+
+        Args:
+            chemins_fichiers(List[str]): les fichiers chiffrés à traiter
+            chemin_dictionnaire(str): dictionnaire utilisé pour générer les clés candidates
+            nb_workers(int): nombre maximal de processus (0 = tous les cœurs)
+            points_reprise(PointsReprise): points de reprise des attaques (None = pas de reprise)
+            trousseau(TrousseauCles): clés retrouvées de la session, complétées par celles des workers (None = aucune)
+            dossier_cache_negatif(str): dossier du cache négatif utilisé par les workers (None = désactivé)
+
+        Yields:
+            tuple[int, ResultatAnalyse]: (index du fichier, résultat), dans l'ordre d'achèvement
+    """
+    if not chemins_fichiers:
+        return
+
+    nb_workers = min(nb_workers or os.cpu_count() or 1, len(chemins_fichiers))
+    contexte = contexte_processus()
+    file = None
+    delai = None
+    initargs = (trousseau.instantane() if trousseau is not None else [], dossier_cache_negatif)
+    if points_reprise is not None:
+        # File sans thread d'envoi: une avancée est dans le tube avant que le worker ne rende son résultat
+        file = contexte.SimpleQueue()
+        delai = DELAI_RELEVE_REPRISE
+        initargs += (points_reprise.instantane(), file)
+    executor = ProcessPoolExecutor(max_workers=nb_workers, mp_context=contexte, initializer=_initialiser_worker_mission, initargs=initargs)
+    futurs = {}
+    try:
+        futurs = {executor.submit(_traiter_fichier, chemin, chemin_dictionnaire): i for i, chemin in enumerate(chemins_fichiers)}
+        restants = set(futurs)
+        while restants:
+            termines, restants = wait(restants, timeout=delai, return_when=FIRST_COMPLETED)
+            if file is not None:
+                _relever_avancees(file, points_reprise)
+            for futur in termines:
+                resultat, cles_trousseau = futur.result()
+                if trousseau is not None:
+                    for algo, cle, mot in cles_trousseau:
+                        trousseau.ajouter(algo, cle, mot)
+                yield futurs[futur], resultat
+    finally:
+        executor.shutdown(wait=file is None, cancel_futures=True)
+        if file is not None:
+            # Les fichiers en cours vont à leur terme: leurs avancées sont relevées jusqu'au bout pour
+            # qu'aucun worker ne reste bloqué sur une file pleine
+            restants = {futur for futur in futurs if not futur.done()}
+            while restants:
+                _, restants = wait(restants, timeout=delai)
+                _relever_avancees(file, points_reprise)
+            executor.shutdown()
+            _relever_avancees(file, points_reprise)
+            points_reprise.sauvegarder()
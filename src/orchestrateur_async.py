@@ -0,0 +1,157 @@
+import asyncio
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple, TypeVar, Union
+
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur, ResultatAnalyse
+from src.progression import SortieMuette
+
+T = TypeVar("T")
+SOURCE = Union[str, bytes]
+
+
+class OrchestrateurAsync:
+    """
+        Façade asyncio de DetecteurCryptoOrchestrateur, pour l'intégrer à un service asynchrone.
+
+        Le travail (identification, dérivation des clés, recherche) s'exécute dans un pool de fils partagé
+        dont la taille plafonne le nombre d'opérations simultanées ; la boucle d'événements n'est jamais
+        bloquée. Chaque fil possède son propre orchestrateur, sans affichage, dont les caches servent à
+        toutes les opérations qu'il exécute.
+
+        L'annulation d'une opération (asyncio.CancelledError) lève la demande d'arrêt du moteur d'attaque:
+        les clés étant dérivées au fil de la recherche, celle-ci s'arrête au plus un lot de clés plus tard,
+        dérivation comprise, les lots en attente des workers sont annulés et les algorithmes suivants ne sont
+        pas attaqués, puis CancelledError est propagée une fois le fil libéré.
+
+        Attributes:
+            concurrence(int): nombre maximal d'opérations exécutées en même temps
+            chemin_dictionnaire(str): dictionnaire des mots de passe candidats par défaut
+    """
+
+    def __init__(self, concurrence: int = 2, chemin_dictionnaire: str = "keys/wordlist.txt", nb_workers: int = 1,
+                 identification_rapide: bool = False):
+        """
+            Args:
+                concurrence(int): taille du pool de fils (opérations simultanées)
+                chemin_dictionnaire(str): dictionnaire utilisé quand aucun n'est précisé
+                nb_workers(int): processus de recherche de chaque orchestrateur (1 = séquentiel, 0 = tous les cœurs)
+                identification_rapide(bool): identification sur un aperçu des grands fichiers (voir ApercuFichier)
+        """
+        self.concurrence = max(1, concurrence)
+        self.chemin_dictionnaire = chemin_dictionnaire
+        self._nb_workers = nb_workers
+        self._identification_rapide = identification_rapide
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrence, thread_name_prefix="cryptoforensic")
+        self._local = threading.local()
+
+    async def __aenter__(self) -> "OrchestrateurAsync":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        # L'attente des opérations en cours se fait hors de la boucle d'événements
+        await asyncio.to_thread(self.fermer)
+
+    def fermer(self) -> None:
+        """
+            Libère le pool de fils (les opérations en cours vont à leur terme) ; bloquant, pour les appelants
+            synchrones (`async with` attend la fermeture dans un fil).
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _orchestrateur(self) -> DetecteurCryptoOrchestrateur:
+        if not hasattr(self._local, "orchestrateur"):
+            self._local.orchestrateur = DetecteurCryptoOrchestrateur(nb_workers=self._nb_workers,
+                                                                     identification_rapide=self._identification_rapide,
+                                                                     sortie_progression=SortieMuette())
+        return self._local.orchestrateur
+
+    def _executer(self, operation: Callable[[DetecteurCryptoOrchestrateur, str], T], source: SOURCE, arret: threading.Event) -> T:
+        """
+            Exécute une opération dans un fil du pool, sur le chemin de la source (un texte chiffré en bytes
+            est d'abord posé dans un fichier temporaire, les analyzers lisant des chemins).
+        """
+        orchestrateur = self._orchestrateur()
+        moteur = orchestrateur.moteur_attaque
+        moteur.arret = arret
+        temporaire = None
+        try:
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                with tempfile.NamedTemporaryFile(prefix="cryptoforensic-", suffix=".enc", delete=False) as f:
+                    f.write(source)
+                    temporaire = f.name
+            return operation(orchestrateur, temporaire or source)
+        finally:
+            moteur.arret = None
+            if temporaire is not None:
+                os.remove(temporaire)
+
+    async def _soumettre(self, operation: Callable[[DetecteurCryptoOrchestrateur, str], T], source: SOURCE) -> T:
+        arret = threading.Event()
+        futur: Future = self._executor.submit(self._executer, operation, source, arret)
+        try:
+            return await asyncio.wrap_future(futur)
+        except asyncio.CancelledError:
+            arret.set()
+            # Le fil est attendu avant de propager l'annulation: le pool de processus et la mémoire partagée
+            # de la recherche sont libérés, et la place est rendue au plafond de concurrence
+            if not futur.cancel():
+                await asyncio.wait([asyncio.wrap_future(futur)])
+            raise
+
+    async def identifier(self, source: SOURCE) -> Dict[str, float]:
+        """
+            Scores d'identification de chaque algorithme.
+
+            Args:
+                source(str | bytes): chemin du fichier chiffré, ou texte chiffré
+
+            Returns:
+                dict[str, float]: score de chaque algorithme
+        """
+        return await self._soumettre(lambda orchestrateur, chemin: orchestrateur.scorer_fichier(chemin), source)
+
+    async def attaquer(self, source: SOURCE, algo: Optional[str] = None, chemin_dictionnaire: Optional[str] = None) -> ResultatAnalyse:
+        """
+            Identifie puis attaque un fichier par dictionnaire (ou attaque directement avec l'algorithme imposé).
+
+            Args:
+                source(str | bytes): chemin du fichier chiffré, ou texte chiffré
+                algo(str): algorithme imposé (None = algorithmes identifiés)
+                chemin_dictionnaire(str): dictionnaire des mots de passe candidats (None = celui de la façade)
+
+            Returns:
+                ResultatAnalyse: le résultat de l'attaque
+        """
+        dictionnaire = chemin_dictionnaire or self.chemin_dictionnaire
+        if algo is None:
+            return await self._soumettre(lambda orchestrateur, chemin: orchestrateur.traiter_fichier(chemin, dictionnaire), source)
+        return await self._soumettre(
+            lambda orchestrateur, chemin: orchestrateur.attaque_dictionnaire_manuelle(chemin, algo, dictionnaire), source)
+
+    async def mission(self, dossier_chiffres: str, chemin_dictionnaire: Optional[str] = None) -> AsyncIterator[Tuple[str, ResultatAnalyse]]:
+        """
+            Mission complète sur les fichiers .enc d'un dossier: chaque résultat est produit dès qu'il est prêt.
+
+            Les fichiers sont attaqués en même temps dans la limite du plafond de concurrence. Interrompre
+            l'itération (annulation ou fermeture du générateur) annule les attaques restantes.
+
+            Yields:
+                tuple[str, ResultatAnalyse]: (chemin du fichier, résultat)
+        """
+        chemins = [os.path.join(dossier_chiffres, nom) for nom in sorted(os.listdir(dossier_chiffres)) if nom.endswith(".enc")]
+        taches = {asyncio.ensure_future(self.attaquer(chemin, chemin_dictionnaire=chemin_dictionnaire)): chemin for chemin in chemins}
+        try:
+            en_attente = set(taches)
+            while en_attente:
+                terminees, en_attente = await asyncio.wait(en_attente, return_when=asyncio.FIRST_COMPLETED)
+                for tache in terminees:
+                    yield taches[tache], tache.result()
+        finally:
+            restantes = [tache for tache in taches if not tache.done()]
+            for tache in restantes:
+                tache.cancel()
+            if restantes:
+                await asyncio.gather(*restantes, return_exceptions=True)
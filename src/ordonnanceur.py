@@ -0,0 +1,328 @@
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from src.crypto_analyzer import CryptoAnalyzer
+from src.attaque_parallele import ResultatRecherche
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur, ResultatAnalyse
+from src.key_store import KeyStore
+from src.utils import evaluer_dechiffrement, prechauffer_lexique
+
+
+class CoutAnalyzer:
+    """
+        Coût mesuré d'un analyzer pour un dictionnaire donné.
+
+        Attributes:
+            derivation(float): secondes par clé candidate dérivée
+            echantillon(list[bytes] | KeyStore): quelques clés réelles, réutilisées pour mesurer le coût de déchiffrement
+    """
+
+    def __init__(self, derivation: float, echantillon: Union[List[bytes], KeyStore]):
+        self.derivation = derivation
+        self.echantillon = echantillon
+
+
+class TacheAttaque:
+    """
+        Attaque d'un fichier par un algorithme, telle que planifiée par l'ordonnanceur.
+
+        Attributes:
+            fichier(str): chemin du fichier chiffré
+            algo(str): algorithme attaqué
+            score(float): score d'identification de l'algorithme pour ce fichier
+            nb_cles(int): nombre de clés candidates (compté sans les dériver)
+            debut(int): index de la première clé à tester (reprise d'un espace de clés laissé par un run précédent)
+            cout_derivation(float): secondes par clé pour dériver les candidates
+            cout_dechiffrement(float): secondes par clé pour déchiffrer et valider ce fichier
+    """
+
+    def __init__(self, fichier: str, algo: str, score: float, nb_cles: int, debut: int, cout_derivation: float, cout_dechiffrement: float):
+        self.fichier = fichier
+        self.algo = algo
+        self.score = score
+        self.nb_cles = nb_cles
+        self.debut = debut
+        self.cout_derivation = cout_derivation
+        self.cout_dechiffrement = cout_dechiffrement
+
+    def duree_estimee(self, derivation_faite: bool, nb_workers: int = 1) -> float:
+        """
+            Durée attendue pour parcourir tout l'espace de clés restant (la dérivation n'est comptée qu'une fois par
+            algorithme, et seulement à partir du point de reprise).
+        """
+        derivation = 0.0 if derivation_faite else (self.nb_cles - self.debut) * self.cout_derivation
+        return derivation + (self.nb_cles - self.debut) * self.cout_dechiffrement / max(1, nb_workers)
+
+    def priorite(self, derivation_faite: bool, nb_workers: int = 1) -> float:
+        """
+            Gain attendu par seconde: score d'identification divisé par le coût.
+        """
+        return self.score / max(self.duree_estimee(derivation_faite, nb_workers), 1e-9)
+
+
+class OrdonnanceurAttaques:
+    """
+        Ordonnanceur d'attaques conscient des coûts.
+
+        Le coût de dérivation par clé d'un analyzer est mesuré sur quelques mots réels du dictionnaire la
+        première fois qu'un fichier lui est attribué (les analyzers jamais éligibles ne sont pas chargés) ; le coût de déchiffrement est mesuré sur chaque fichier avec ces mêmes clés. Les clés
+        candidates sont comptées sans être dérivées, ce qui donne la durée attendue de chaque couple
+        (fichier, algorithme). Les attaques sont lancées par gain attendu décroissant (score / coût) et
+        s'arrêtent à l'échéance du budget par fichier ou par mission: l'espace de clés non parcouru est
+        conservé dans `restes` pour un run ultérieur, et dans les points de reprise de l'orchestrateur s'ils sont
+        actifs (mêmes entrées que l'attaque séquentielle), d'où un run suivant repart.
+
+        Attributes:
+            orchestrateur(DetecteurCryptoOrchestrateur): fournit les analyzers, le cache de candidates et le moteur d'attaque
+            chemin_dictionnaire(str): dictionnaire des clés candidates
+            budget_fichier(float): secondes d'attaque au plus par fichier (None = illimité)
+            budget_mission(float): secondes d'attaque au plus pour toute la mission (None = illimité)
+            couts(dict[str, CoutAnalyzer]): coûts déjà mesurés, par algorithme
+            restes(dict[tuple[str, str], int]): (fichier, algorithme) -> index de reprise de l'espace de clés non parcouru
+    """
+
+    TAILLE_ECHANTILLON = 4
+
+    def __init__(self, orchestrateur: DetecteurCryptoOrchestrateur, chemin_dictionnaire: str,
+                 budget_fichier: Optional[float] = None, budget_mission: Optional[float] = None):
+        self.orchestrateur = orchestrateur
+        self.chemin_dictionnaire = chemin_dictionnaire
+        self.budget_fichier = budget_fichier
+        self.budget_mission = budget_mission
+        self.restes: Dict[Tuple[str, str], int] = {}
+        # Empreinte SHA-256 de chaque fichier planifié (identité de ses points de reprise)
+        self._empreintes: Dict[str, str] = {}
+        # Lexique chargé avant les mesures: son premier chargement fausserait le coût de validation
+        prechauffer_lexique()
+        self.couts: Dict[str, CoutAnalyzer] = {}
+
+    def cout(self, nom_algo: str) -> CoutAnalyzer:
+        """
+            Coût d'un algorithme, mesuré à la première demande.
+        """
+        if nom_algo not in self.couts:
+            self.couts[nom_algo] = self.mesurer_cout(self.orchestrateur.analyzers[nom_algo])
+        return self.couts[nom_algo]
+
+    def mesurer_cout(self, analyzer: CryptoAnalyzer) -> CoutAnalyzer:
+        """
+            Microbenchmark de la dérivation: génère les clés de quelques mots retenus du dictionnaire.
+
+            Args:
+                analyzer(CryptoAnalyzer): l'analyzer mesuré
+
+            Returns:
+                CoutAnalyzer: le coût par clé et les clés de l'échantillon
+        """
+        mots = analyzer.mots_candidats(self.chemin_dictionnaire)
+        if mots is not None:
+            cles: List[bytes] = []
+            debut = time.perf_counter()
+            for mot in mots[:self.TAILLE_ECHANTILLON]:
+                derivees = analyzer.deriver_cles(mot)
+                if derivees is None:
+                    break
+                cles.extend(derivees)
+            else:
+                return CoutAnalyzer((time.perf_counter() - debut) / max(1, len(cles)), cles)
+
+        # Analyzer sans mots candidats ou sans dérivation mot par mot: génération complète chronométrée
+        debut = time.perf_counter()
+        cles = analyzer.generer_cles_candidates(self.chemin_dictionnaire, compact=True)
+        return CoutAnalyzer((time.perf_counter() - debut) / max(1, len(cles)), cles[:self.TAILLE_ECHANTILLON])
+
+    def mesurer_cout_dechiffrement(self, nom_algo: str, donnees: bytes) -> float:
+        """
+            Microbenchmark du déchiffrement et de la validation d'un fichier avec les clés de l'échantillon.
+
+            Returns:
+                float: secondes par clé
+        """
+        echantillon = self.cout(nom_algo).echantillon
+        if not len(echantillon):
+            return 0.0
+        analyzer = self.orchestrateur.analyzers[nom_algo]
+        debut = time.perf_counter()
+        for cle in echantillon:
+            evaluer_dechiffrement(analyzer.dechiffrer_donnees(donnees, cle))
+        return (time.perf_counter() - debut) / len(echantillon)
+
+    def en_attente(self, chemin: str) -> bool:
+        """
+            True si un espace de clés du fichier a été laissé par un run précédent (en mémoire ou dans les points de reprise).
+        """
+        chemin_absolu = os.path.abspath(chemin)
+        if any(fichier == chemin_absolu for fichier, _ in self.restes):
+            return True
+        points = self.orchestrateur.points_reprise
+        return points is not None and points.en_cours(self.__empreinte(chemin))
+
+    def reprise(self, chemin: str, nom_algo: str) -> int:
+        """
+            Index de reprise de l'espace de clés d'un couple (fichier, algorithme), 0 s'il n'a pas été entamé.
+        """
+        cle_reste = (os.path.abspath(chemin), nom_algo)
+        if cle_reste in self.restes:
+            return self.restes[cle_reste]
+        points = self.orchestrateur.points_reprise
+        if points is None:
+            return 0
+        try:
+            source = self.orchestrateur.source_candidates(self.orchestrateur.analyzers[nom_algo], self.chemin_dictionnaire)
+        except OSError:
+            return 0
+        return points.position(self.__empreinte(chemin), nom_algo, source)
+
+    def __empreinte(self, chemin: str, donnees: Optional[bytes] = None) -> str:
+        chemin_absolu = os.path.abspath(chemin)
+        if chemin_absolu not in self._empreintes:
+            if donnees is None:
+                with open(chemin, "rb") as f:
+                    donnees = f.read()
+            self._empreintes[chemin_absolu] = self.orchestrateur.points_reprise.empreinte(donnees)
+        return self._empreintes[chemin_absolu]
+
+    def __retenir(self, tache: TacheAttaque, reprise: int) -> None:
+        """
+            Conserve l'index de reprise d'une tâche interrompue, en mémoire et dans les points de reprise.
+        """
+        self.restes[(os.path.abspath(tache.fichier), tache.algo)] = reprise
+        points = self.orchestrateur.points_reprise
+        if points is not None:
+            source = self.orchestrateur.source_candidates(self.orchestrateur.analyzers[tache.algo], self.chemin_dictionnaire)
+            points.avancer(self.__empreinte(tache.fichier), tache.algo, source, reprise)
+
+    def __oublier(self, tache: TacheAttaque) -> None:
+        """
+            Efface l'index de reprise d'une tâche achevée (clé trouvée ou espace épuisé).
+        """
+        self.restes.pop((os.path.abspath(tache.fichier), tache.algo), None)
+        points = self.orchestrateur.points_reprise
+        if points is not None:
+            source = self.orchestrateur.source_candidates(self.orchestrateur.analyzers[tache.algo], self.chemin_dictionnaire)
+            points.terminer(self.__empreinte(tache.fichier), tache.algo, source)
+
+    def planifier(self, chemins_fichiers: List[str], reprendre: bool = False) -> List[TacheAttaque]:
+        """
+            Planifie les attaques des algorithmes éligibles (score >= 0.6) de chaque fichier.
+
+            Args:
+                chemins_fichiers(List[str]): les fichiers chiffrés
+                reprendre(bool): si True, seuls les espaces de clés laissés par un run précédent sont planifiés
+
+            Returns:
+                List[TacheAttaque]: les tâches, par gain attendu décroissant
+        """
+        taches: List[TacheAttaque] = []
+        for chemin in chemins_fichiers:
+            with open(chemin, "rb") as f:
+                donnees = f.read()
+            if self.orchestrateur.points_reprise is not None:
+                self.__empreinte(chemin, donnees)
+            for nom_algo, score in self.orchestrateur.scorer_fichier(chemin).items():
+                if score < 0.6:
+                    continue
+                debut = self.reprise(chemin, nom_algo)
+                if reprendre and not debut:
+                    continue
+                nb_cles = self.orchestrateur.analyzers[nom_algo].compter_cles_candidates(self.chemin_dictionnaire)
+                if nb_cles <= debut:
+                    continue
+                taches.append(TacheAttaque(chemin, nom_algo, score, nb_cles, debut, self.cout(nom_algo).derivation,
+                                           self.mesurer_cout_dechiffrement(nom_algo, donnees)))
+        self.trier(taches, set())
+        return taches
+
+    def trier(self, taches: List[TacheAttaque], algos_derives: set) -> None:
+        nb_workers = self.orchestrateur.moteur_attaque.nb_workers
+        taches.sort(key=lambda tache: tache.priorite(tache.algo in algos_derives, nb_workers), reverse=True)
+
+    def eta(self, taches: List[TacheAttaque], algos_derives: set) -> float:
+        """
+            Durée estimée (secondes) pour terminer les tâches restantes, dérivation comptée une fois par algorithme.
+        """
+        nb_workers = self.orchestrateur.moteur_attaque.nb_workers
+        total = 0.0
+        derives = set(algos_derives)
+        for tache in taches:
+            total += tache.duree_estimee(tache.algo in derives, nb_workers)
+            derives.add(tache.algo)
+        return total
+
+    def executer(self, taches: List[TacheAttaque],
+                 rappel: Optional[Callable[[TacheAttaque, ResultatRecherche, float], None]] = None) -> Dict[str, ResultatAnalyse]:
+        """
+            Exécute les tâches par gain attendu décroissant, dans les budgets de temps.
+
+            Un fichier résolu n'est plus attaqué par ses autres algorithmes. Chaque tâche passe par
+            `attaque_memorisee` de l'orchestrateur: sa progression est enregistrée dans les points de reprise
+            au fil de la recherche et les mots essayés rejoignent le cache négatif. Les clés qui ne sont pas déjà
+            en cache sont dérivées au fil de la recherche, à partir du point de reprise: le budget couvre la
+            dérivation comme le déchiffrement. Quand un budget est épuisé, la tâche s'arrête et la frontière
+            atteinte est conservée dans `restes` (et dans les points de reprise s'ils sont actifs).
+
+            Args:
+                taches(List[TacheAttaque]): les tâches planifiées
+                rappel(Callable): appelé après chaque tâche avec (tâche, résultat de la recherche, ETA en secondes)
+
+            Returns:
+                Dict[str, ResultatAnalyse]: le résultat de chaque fichier planifié
+        """
+        maintenant = time.monotonic()
+        fin_mission = maintenant + self.budget_mission if self.budget_mission is not None else None
+        temps_fichiers: Dict[str, float] = {}
+        resultats: Dict[str, ResultatAnalyse] = {}
+        algos_derives: set = set()
+        restantes = list(taches)
+
+        for tache in restantes:
+            resultats.setdefault(tache.fichier, ResultatAnalyse("", b"", 0.0, b"", 0.0, 0, os.path.basename(tache.fichier), 0))
+
+        while restantes:
+            self.trier(restantes, algos_derives)
+            tache = restantes.pop(0)
+            resultat = resultats[tache.fichier]
+
+            echeances = [fin_mission]
+            if self.budget_fichier is not None:
+                echeances.append(time.monotonic() + self.budget_fichier - temps_fichiers.get(tache.fichier, 0.0))
+            echeance = min((e for e in echeances if e is not None), default=None)
+            if echeance is not None and time.monotonic() >= echeance:
+                self.__retenir(tache, tache.debut)
+                continue
+
+            debut = time.monotonic()
+            algos_derives.add(tache.algo)
+            with open(tache.fichier, "rb") as f:
+                donnees = f.read()
+            # Même chemin que les missions: points de reprise tenus au fil de la recherche, cache négatif, trousseau
+            recherche = self.orchestrateur.attaque_memorisee(donnees, tache.algo, self.chemin_dictionnaire, tache.debut, echeance)
+            temps_fichiers[tache.fichier] = temps_fichiers.get(tache.fichier, 0.0) + time.monotonic() - debut
+
+            if not resultat.algo or recherche.trouve:
+                resultat.algo = tache.algo
+                resultat.score_probabilite = tache.score
+            resultat.temps_execution = temps_fichiers[tache.fichier]
+            if recherche.trouve:
+                # Même décompte que les autres modes: rang de la clé gagnante (voir ResultatAnalyse)
+                resultat.nb_tentatives = recherche.index + 1
+                resultat.cle = recherche.cle
+                resultat.texte_dechiffre = recherche.texte_dechiffre
+                resultat.taux_succes = recherche.taux_succes
+                self.__oublier(tache)
+                # Fichier résolu: ses autres algorithmes ne sont plus attaqués
+                restantes = [autre for autre in restantes if autre.fichier != tache.fichier]
+            else:
+                resultat.nb_tentatives += recherche.nb_testees
+                if recherche.reprise < tache.nb_cles:
+                    self.__retenir(tache, recherche.reprise)
+                else:
+                    self.__oublier(tache)
+
+            if rappel is not None:
+                rappel(tache, recherche, self.eta(restantes, algos_derives))
+
+        if self.orchestrateur.points_reprise is not None:
+            self.orchestrateur.points_reprise.sauvegarder()
+        return resultats
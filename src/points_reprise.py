@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict
+
+
+class PointsReprise:
+    """
+        Points de reprise des attaques par dictionnaire longues.
+
+        Le fichier d'état (JSON) associe à chaque attaque, identifiée par l'empreinte SHA-256 du fichier chiffré,
+        l'algorithme et l'identité de la source des clés candidates, la frontière contiguë des clés déjà testées:
+        toutes les clés d'index inférieur ont été essayées sans succès. Une attaque interrompue reprend à cette
+        frontière. Les écritures passent par un fichier temporaire renommé atomiquement et sont limitées à une
+        toutes les `intervalle` secondes ; la fin d'une attaque (clé trouvée ou espace épuisé) efface son entrée.
+
+        Attributes:
+            chemin(str): chemin du fichier d'état
+            intervalle(float): délai minimal (secondes) entre deux écritures périodiques
+    """
+
+    INTERVALLE_PAR_DEFAUT = 5.0
+    VERSION = 1
+
+    def __init__(self, chemin: str, intervalle: float = INTERVALLE_PAR_DEFAUT):
+        self.chemin = chemin
+        self.intervalle = intervalle
+        self._attaques: Dict[str, Dict[str, Any]] = self._lire()
+        self._derniere_ecriture = time.monotonic()
+        self._modifie = False
+
+    def _lire(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.chemin, "r", encoding="utf-8") as f:
+                etat = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(etat, dict) or etat.get("version") != self.VERSION:
+            return {}
+        return etat.get("attaques", {})
+
+    @staticmethod
+    def empreinte(donnees: bytes) -> str:
+        """
+            Empreinte SHA-256 (hexadécimale) du contenu d'un fichier chiffré.
+        """
+        return hashlib.sha256(donnees).hexdigest()
+
+    @staticmethod
+    def _identifiant(empreinte: str, algo: str, source: str) -> str:
+        return hashlib.sha256(f"{empreinte}|{algo}|{source}".encode("utf-8")).hexdigest()
+
+    def position(self, empreinte: str, algo: str, source: str) -> int:
+        """
+            Index de reprise d'une attaque (0 si aucun point de reprise).
+
+            Args:
+                empreinte(str): empreinte SHA-256 du fichier chiffré
+                algo(str): algorithme attaqué
+                source(str): identité de la source des clés candidates (dictionnaire et recette de dérivation)
+
+            Returns:
+                int: la frontière contiguë des clés déjà testées
+        """
+        attaque = self._attaques.get(self._identifiant(empreinte, algo, source))
+        return int(attaque["frontiere"]) if attaque else 0
+
+    def en_cours(self, empreinte: str) -> bool:
+        """
+            True si au moins une attaque du fichier chiffré a un point de reprise.
+        """
+        return any(attaque["fichier_sha256"] == empreinte for attaque in self._attaques.values())
+
+    def avancer(self, empreinte: str, algo: str, source: str, frontiere: int) -> None:
+        """
+            Enregistre la progression d'une attaque ; le fichier d'état n'est réécrit qu'une fois l'intervalle écoulé.
+        """
+        self._attaques[self._identifiant(empreinte, algo, source)] = {
+            "fichier_sha256": empreinte,
+            "algo": algo,
+            "source": source,
+            "frontiere": frontiere,
+        }
+        self._modifie = True
+        if time.monotonic() - self._derniere_ecriture >= self.intervalle:
+            self.sauvegarder()
+
+    def terminer(self, empreinte: str, algo: str, source: str) -> None:
+        """
+            Efface le point de reprise d'une attaque achevée.
+        """
+        if self._attaques.pop(self._identifiant(empreinte, algo, source), None) is not None:
+            self._modifie = True
+            self.sauvegarder()
+
+    def instantane(self) -> Dict[str, Dict[str, Any]]:
+        """
+            Copie des attaques en cours (transmise aux workers des missions concurrentes).
+        """
+        return {identifiant: dict(attaque) for identifiant, attaque in self._attaques.items()}
+
+    def sauvegarder(self) -> None:
+        """
+            Écrit le fichier d'état s'il a changé (fichier temporaire puis renommage atomique).
+        """
+        if not self._modifie:
+            return
+        temporaire = f"{self.chemin}.tmp"
+        with open(temporaire, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "attaques": self._attaques}, f)
+        os.replace(temporaire, self.chemin)
+        self._derniere_ecriture = time.monotonic()
+        self._modifie = False
+
+    def __len__(self) -> int:
+        return len(self._attaques)
@@ -0,0 +1,164 @@
+import itertools
+import json
+import re
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, TextIO
+
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+
+# Balises de style rich ([bold green], [/bold green]...) retirées des messages écrits en texte brut
+_BALISE_STYLE = re.compile(r"\[/?[a-z ]+\]")
+
+
+def texte_brut(message: str) -> str:
+    """
+        Message sans ses balises de style rich.
+    """
+    return _BALISE_STYLE.sub("", message)
+
+
+class SortieProgression:
+    """
+        Destination des événements de progression émis par l'orchestrateur.
+
+        Le calcul ne fait qu'émettre des événements (création, avancement et fin d'une tâche) et des
+        messages ; leur présentation est l'affaire de la sortie choisie. L'interface reprend le sous-ensemble
+        de `rich.progress.Progress` utilisé par l'orchestrateur pour les tâches, qui peut donc aussi recevoir
+        une Progress. Cette sortie de base ne fait rien (mode sans affichage).
+    """
+
+    def __enter__(self) -> "SortieProgression":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def add_task(self, description: str, total: float = 100) -> Any:
+        return None
+
+    def update(self, task_id: Any = None, description: Optional[str] = None, advance: float = 0.0) -> None:
+        pass
+
+    def remove_task(self, task_id: Any) -> None:
+        pass
+
+    def message(self, texte: str, style: bool = False) -> None:
+        """
+            Message destiné à l'utilisateur (fichier traité, clé trouvée, reprise...).
+
+            Args:
+                texte(str): le message
+                style(bool): si True, le message contient des balises de style rich
+        """
+        pass
+
+
+class SortieMuette(SortieProgression):
+    """
+        Sortie sans effet: aucun affichage, aucun coût en dehors des appels.
+    """
+
+
+class SortieTexte(SortieProgression):
+    """
+        Écrit les messages en texte brut sur un flux et ignore les événements de progression.
+
+        Attributes:
+            flux(TextIO): destination des messages (sortie d'erreur par défaut, la sortie standard restant aux résultats)
+    """
+
+    def __init__(self, flux: Optional[TextIO] = None):
+        self.flux = flux if flux is not None else sys.stderr
+
+    def message(self, texte: str, style: bool = False) -> None:
+        self.flux.write((texte_brut(texte) if style else texte) + "\n")
+        self.flux.flush()
+
+
+class SortieJsonLignes(SortieProgression):
+    """
+        Écrit chaque événement sur une ligne JSON (horodatage monotone en secondes), pour les exécutions
+        sans terminal: {"evenement": "debut" | "avance" | "fin", "tache": int, ...}.
+
+        Attributes:
+            flux(TextIO): destination des lignes (sortie d'erreur par défaut, la sortie standard restant aux résultats)
+    """
+
+    def __init__(self, flux: Optional[TextIO] = None):
+        self.flux = flux if flux is not None else sys.stderr
+        self._compteur = itertools.count(1)
+
+    def _emettre(self, evenement: str, tache: Any, **champs: Any) -> None:
+        self.flux.write(json.dumps({"evenement": evenement, "tache": tache, "horodatage": time.monotonic(), **champs},
+                                   ensure_ascii=False) + "\n")
+        self.flux.flush()
+
+    def add_task(self, description: str, total: float = 100) -> int:
+        tache = next(self._compteur)
+        self._emettre("debut", tache, description=description, total=total)
+        return tache
+
+    def update(self, task_id: Any = None, description: Optional[str] = None, advance: float = 0.0) -> None:
+        self._emettre("avance", task_id, description=description, avance=advance)
+
+    def remove_task(self, task_id: Any) -> None:
+        self._emettre("fin", task_id)
+
+    def message(self, texte: str, style: bool = False) -> None:
+        self._emettre("message", None, texte=texte_brut(texte) if style else texte)
+
+
+class SortieRich(SortieProgression):
+    """
+        Barres de progression rich dont le rafraîchissement est limité: l'état est mis à jour à chaque
+        événement mais l'écran au plus une fois par `intervalle` secondes (et à la fin de chaque tâche).
+
+        Attributes:
+            intervalle(float): délai minimal (secondes) entre deux rafraîchissements de l'affichage
+    """
+
+    INTERVALLE_PAR_DEFAUT = 0.1
+
+    def __init__(self, intervalle: float = INTERVALLE_PAR_DEFAUT, progress: Optional['Progress'] = None):
+        # rich.progress n'est importé que si les barres sont réellement affichées
+        from rich.progress import Progress
+
+        self.intervalle = intervalle
+        self._progress = progress if progress is not None else Progress(auto_refresh=False)
+        self._dernier_rafraichissement = 0.0
+
+    def __enter__(self) -> "SortieRich":
+        self._progress.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._progress.refresh()
+        self._progress.stop()
+
+    def _rafraichir(self, force: bool = False) -> None:
+        maintenant = time.monotonic()
+        if force or maintenant - self._dernier_rafraichissement >= self.intervalle:
+            self._progress.refresh()
+            self._dernier_rafraichissement = maintenant
+
+    def add_task(self, description: str, total: float = 100) -> 'TaskID':
+        tache = self._progress.add_task(description, total=total)
+        self._rafraichir(force=True)
+        return tache
+
+    def update(self, task_id: Any = None, description: Optional[str] = None, advance: float = 0.0) -> None:
+        champs: Dict[str, Any] = {"advance": advance}
+        if description is not None:
+            champs["description"] = description
+        self._progress.update(task_id, **champs)
+        self._rafraichir()
+
+    def remove_task(self, task_id: Any) -> None:
+        self._rafraichir(force=True)
+        self._progress.remove_task(task_id)
+
+    def message(self, texte: str, style: bool = False) -> None:
+        # Affiché au-dessus des barres en cours
+        self._progress.console.print(texte, markup=style, highlight=False)
@@ -1,10 +1,21 @@
 from datetime import date, datetime
 import os
 from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from src.registre_analyzers import ANALYZERS_INTEGRES
 class rapport_mission():
     
-    def __init__(self):
-        pass
+    def __init__(self, algorithmes: Optional[Iterable[str]] = None, afficher: Callable[[str], None] = print):
+        """
+            Args:
+                algorithmes(Iterable[str]): noms des algorithmes dans l'ordre des missions, par exemple le
+                    registre de l'orchestrateur (None = analyzers fournis)
+                afficher(Callable[[str], None]): destination des rapports et messages affichés (la sortie
+                    standard par défaut)
+        """
+        self.algorithmes = [description.nom for description in ANALYZERS_INTEGRES] if algorithmes is None else list(algorithmes)
+        self.afficher = afficher
     
     def generer_rapport_synthese(self, resultats_de_mission:dict)->None:
         """
@@ -15,7 +26,8 @@ class rapport_mission():
                 str: le rapport
         """
         
-        equivalence=['AES-CBC-256', 'CHACHA20', 'BLOWFISH', 'AES-GCM', 'FERNET']
+        # Numéro de mission: rang de l'algorithme dans le registre des analyzers
+        equivalence=self.algorithmes
         
         try :
             rapport= f"RAPPORT DE SYNTHESE DU {date.today().strftime("%d/%m/%y")} à {str(datetime.now().time()).split('.')[0]}\n " f"Mission {equivalence.index(resultats_de_mission['algorithme'].upper()) + 1}: {resultats_de_mission['algorithme'].upper()} \n I - Statistiques relatives à l'analyse du fichier\n" f"-Fichier crypté par cet algorithme: {resultats_de_mission['fichier']}\n" f"-Clé de déchiffrement identifiée: {resultats_de_mission['cle']} \n" f"-Nombre de tentatives: {resultats_de_mission['tentatives']} \n" f"-Temps d'exécution: {resultats_de_mission["temps_execution"]} \n II - Résultats obtenus\n" f"-Taux réussite du déchiffrement: {resultats_de_mission['taux_succes']}({resultats_de_mission['statut_succes']})\n" f"-Texte déchiffré: {resultats_de_mission['texte_dechiffre']} \n\n"
@@ -25,11 +37,11 @@ class rapport_mission():
             with open(chemin, 'a') as f:
                 f.write(rapport.replace('\n', '~'))
             f.close()
-            print(rapport)
+            self.afficher(rapport)
             
             return 
         except (KeyError, ValueError):
-            print("Une erreur s'est produite.") 
+            self.afficher("Une erreur s'est produite.") 
             return
         
     
@@ -0,0 +1,130 @@
+import importlib
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.apercu_fichier import ApercuFichier
+from src.crypto_analyzer import CryptoAnalyzer
+
+# Groupe d'entry points des analyzers tiers: chaque entrée désigne une DescriptionAnalyzer
+GROUPE_ENTRY_POINTS = "cryptoforensic.analyzers"
+
+
+class DescriptionAnalyzer:
+    """
+        Métadonnées d'un analyzer, lisibles sans importer son module.
+
+        Attributes:
+            nom(str): nom de l'algorithme, clé du registre
+            cible(str): « module:Classe » de l'analyzer, importé à sa première utilisation
+            classes_alphabet(tuple[str, ...]): classes d'alphabet (ApercuFichier) des fichiers compatibles, None = toutes
+    """
+
+    def __init__(self, nom: str, cible: str, classes_alphabet: Optional[Tuple[str, ...]] = None):
+        self.nom = nom
+        self.cible = cible
+        self.classes_alphabet = classes_alphabet
+
+    def accepte(self, apercu: ApercuFichier) -> bool:
+        """
+            Préfiltre de la signature: False si l'alphabet du fichier exclut cet algorithme.
+        """
+        return self.classes_alphabet is None or apercu.classe_alphabet() in self.classes_alphabet
+
+    def charger(self) -> CryptoAnalyzer:
+        nom_module, nom_classe = self.cible.split(":")
+        return getattr(importlib.import_module(nom_module), nom_classe)()
+
+
+# Analyzers fournis, dans l'ordre des missions. Leurs signatures sont la seule source du préfiltre:
+# chaque analyzer en tire son _CLASSES_ALPHABET (classes_alphabet_integre).
+ANALYZERS_INTEGRES: List[DescriptionAnalyzer] = [
+    # Textes chiffrés binaires: un fichier Base64 ou texte est écarté par le préfiltre
+    DescriptionAnalyzer("AES-256-CBC", "src.analyzers.aes_cbc_analyzer:Aes_Cbc_Analyzer", (ApercuFichier.BINAIRE,)),
+    DescriptionAnalyzer("CHACHA20", "src.analyzers.chacha20_analyzer:ChaCha20_Analyzer", (ApercuFichier.BINAIRE,)),
+    DescriptionAnalyzer("BLOWFISH", "src.analyzers.blowfish_analyzer:Blowfish_Analyzer", (ApercuFichier.BINAIRE,)),
+    DescriptionAnalyzer("AES-GCM", "src.analyzers.aes_gcm_analyzer:Aes_Gcm_Analyzer", (ApercuFichier.BINAIRE,)),
+    # Un jeton Fernet est un texte Base64
+    DescriptionAnalyzer("FERNET", "src.analyzers.fernet_analyzer:FernetAnalyzer", (ApercuFichier.BASE64,)),
+]
+
+
+def classes_alphabet_integre(nom: str) -> Optional[Tuple[str, ...]]:
+    """
+        Classes d'alphabet de la signature d'un analyzer fourni (None = toutes).
+    """
+    return next(description.classes_alphabet for description in ANALYZERS_INTEGRES if description.nom == nom)
+
+
+class RegistreAnalyzers(Mapping):
+    """
+        Registre des analyzers: nom de l'algorithme -> analyzer, importé et instancié au premier accès.
+
+        Le registre ne contient au départ que des descriptions. Un analyzer n'est chargé que lorsqu'il est
+        demandé (registre[nom]) ; `compatibles` applique le préfiltre des signatures sans rien charger.
+        Les analyzers tiers sont découverts par les entry points du groupe GROUPE_ENTRY_POINTS lors de la
+        première consultation du registre, après les analyzers fournis (qu'ils ne peuvent pas remplacer).
+
+        Attributes:
+            decouverte(bool): si True, les entry points sont consultés
+    """
+
+    def __init__(self, descriptions: Optional[Iterable[DescriptionAnalyzer]] = None, decouverte: bool = True):
+        self._descriptions: Dict[str, DescriptionAnalyzer] = {
+            description.nom: description for description in (ANALYZERS_INTEGRES if descriptions is None else descriptions)
+        }
+        self._analyzers: Dict[str, CryptoAnalyzer] = {}
+        self.decouverte = decouverte
+        self._decouverts = False
+
+    def _toutes(self) -> Dict[str, DescriptionAnalyzer]:
+        if self.decouverte and not self._decouverts:
+            self._decouverts = True
+            from importlib.metadata import entry_points
+            for entree in entry_points(group=GROUPE_ENTRY_POINTS):
+                try:
+                    description = entree.load()
+                except Exception as e:
+                    print(f"Analyzer {entree.name} ignoré: {e}", file=sys.stderr)
+                    continue
+                if isinstance(description, DescriptionAnalyzer) and description.nom not in self._descriptions:
+                    self._descriptions[description.nom] = description
+        return self._descriptions
+
+    def enregistrer(self, description: DescriptionAnalyzer, analyzer: Optional[CryptoAnalyzer] = None) -> None:
+        """
+            Ajoute (ou remplace) un analyzer ; une instance fournie est utilisée telle quelle.
+        """
+        self._descriptions[description.nom] = description
+        self._analyzers.pop(description.nom, None)
+        if analyzer is not None:
+            self._analyzers[description.nom] = analyzer
+
+    def description(self, nom: str) -> DescriptionAnalyzer:
+        return self._toutes()[nom]
+
+    def descriptions(self) -> List[DescriptionAnalyzer]:
+        return list(self._toutes().values())
+
+    def compatibles(self, apercu: ApercuFichier) -> List[str]:
+        """
+            Noms des algorithmes dont la signature accepte le fichier, sans importer leurs analyzers.
+        """
+        return [nom for nom, description in self._toutes().items() if description.accepte(apercu)]
+
+    def est_charge(self, nom: str) -> bool:
+        return nom in self._analyzers
+
+    def __getitem__(self, nom: str) -> CryptoAnalyzer:
+        if nom not in self._analyzers:
+            self._analyzers[nom] = self._toutes()[nom].charger()
+        return self._analyzers[nom]
+
+    def __contains__(self, nom: object) -> bool:
+        return nom in self._toutes()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._toutes()))
+
+    def __len__(self) -> int:
+        return len(self._toutes())
@@ -0,0 +1,47 @@
+"""
+Représentation JSON des résultats, commune à l'interface en ligne de commande et au service local.
+"""
+
+from typing import Any, Dict
+
+from src.detecteur_crypto import ResultatAnalyse
+from src.utils import est_dechiffrement_reussi
+
+SEUIL_IDENTIFICATION = 0.6
+
+
+def _texte(valeur: Any) -> str:
+    if isinstance(valeur, (bytes, bytearray)):
+        return bytes(valeur).decode("utf-8", errors="replace")
+    return valeur or ""
+
+
+def resultat_en_json(fichier: str, resultat: ResultatAnalyse) -> Dict[str, Any]:
+    """
+        Objet JSON d'un résultat d'attaque (clé en hexadécimal, texte déchiffré en UTF-8).
+    """
+    texte = _texte(resultat.texte_dechiffre)
+    return {
+        "fichier": fichier,
+        "algo": resultat.algo or None,
+        "score": resultat.score_probabilite,
+        "succes": bool(resultat.algo) and est_dechiffrement_reussi(texte, resultat.taux_succes),
+        "cle": resultat.cle.hex() if resultat.cle else None,
+        "taux_succes": resultat.taux_succes,
+        "tentatives": resultat.nb_tentatives,
+        "temps_execution": resultat.temps_execution,
+        "texte_dechiffre": texte,
+    }
+
+
+def identification_en_json(fichier: str, empreinte: str, scores: Dict[str, float]) -> Dict[str, Any]:
+    """
+        Objet JSON d'une identification: l'algorithme retenu (meilleur score, s'il atteint le seuil) et tous les scores.
+    """
+    meilleur = max(scores, key=scores.get) if scores else None
+    return {
+        "fichier": fichier,
+        "sha256": empreinte,
+        "algo": meilleur if meilleur is not None and scores[meilleur] >= SEUIL_IDENTIFICATION else None,
+        "scores": scores,
+    }
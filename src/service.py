@@ -0,0 +1,379 @@
+"""
+Service local d'analyse: API JSON sur HTTP (bibliothèque standard), file de tâches et workers à caches chauds.
+
+    python main.py serve --port 8765 --workers 2 --processus 4
+
+    POST /taches           {"type": "identify" | "attack", "chemin": "data/mission1.enc"}
+                           ou {"type": ..., "donnees": "<texte chiffré en Base64>"} ; options d'attaque: "algo", "wordlist"
+                           ("chemin" et "wordlist" doivent se trouver sous les dossiers autorisés)
+                           -> 202 {"id": ..., "etat": "en_attente"}
+    GET  /taches/<id>      état, résultat et métriques de la tâche (?attendre=<secondes> attend sa fin)
+    GET  /metriques        compteurs du service et percentiles de latence des tâches terminées
+    GET  /sante            {"statut": "ok"}
+
+Chaque worker garde son orchestrateur d'une tâche à l'autre (analyzers chargés, trousseau). Les clés
+candidates dérivées sont dans un cache unique partagé par les workers: chaque jeu de clés n'est dérivé
+qu'une fois pour tout le service, au préchauffage ou à la première tâche qui le demande.
+
+Les workers sont des fils: ils se partagent un seul cœur pour l'identification et la dérivation des clés.
+Avec --processus, la recherche de clé de chaque attaque est répartie sur un pool de processus.
+"""
+
+import base64
+import binascii
+import hashlib
+import itertools
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import parse_qs, urlparse
+
+from src.cache_candidats import CacheCandidats
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.progression import SortieMuette
+from src.serialisation import identification_en_json, resultat_en_json
+from src.utils import percentiles, prechauffer_lexique
+
+EN_ATTENTE = "en_attente"
+EN_COURS = "en_cours"
+TERMINEE = "terminee"
+ECHOUEE = "echouee"
+
+TYPES_TACHES = ("identify", "attack")
+
+
+class Tache:
+    """
+        Tâche d'identification ou d'attaque soumise au service.
+
+        Attributes:
+            id(str): identifiant attribué par le service
+            type(str): "identify" ou "attack"
+            parametres(dict): la requête JSON
+            etat(str): EN_ATTENTE, EN_COURS, TERMINEE ou ECHOUEE
+            resultat(dict): résultat JSON (None tant que la tâche n'est pas terminée)
+            erreur(str): message d'erreur d'une tâche échouée
+            worker(str): nom du worker qui l'a exécutée
+    """
+
+    def __init__(self, identifiant: str, type_tache: str, parametres: Dict[str, Any]):
+        self.id = identifiant
+        self.type = type_tache
+        self.parametres = parametres
+        self.etat = EN_ATTENTE
+        self.resultat: Optional[Dict[str, Any]] = None
+        self.erreur: Optional[str] = None
+        self.worker: Optional[str] = None
+        self.soumission = time.monotonic()
+        self.debut: Optional[float] = None
+        self.fin: Optional[float] = None
+        self.terminee = threading.Event()
+
+    def metriques(self) -> Dict[str, Optional[float]]:
+        """
+            Durées de la tâche en secondes: attente dans la file, exécution et total (None si pas encore connues).
+        """
+        return {
+            "attente": self.debut - self.soumission if self.debut is not None else None,
+            "execution": self.fin - self.debut if self.fin is not None and self.debut is not None else None,
+            "total": self.fin - self.soumission if self.fin is not None else None,
+        }
+
+    def en_json(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "etat": self.etat,
+            "worker": self.worker,
+            "resultat": self.resultat,
+            "erreur": self.erreur,
+            "metriques": self.metriques(),
+        }
+
+
+class ServiceAnalyse:
+    """
+        File de tâches servie par un pool de workers (fils), chacun avec son orchestrateur ; le cache des clés
+        candidates est commun à tous.
+
+        Attributes:
+            nb_workers(int): nombre de tâches exécutées en même temps
+            chemin_dictionnaire(str): dictionnaire des attaques sans "wordlist" explicite
+            taille_file(int): nombre maximal de tâches en attente (au-delà, la soumission est refusée)
+            nb_processus(int): processus de recherche de chaque orchestrateur (1 = séquentiel, 0 = tous les cœurs)
+            racines(list[str]): dossiers sous lesquels doivent se trouver les « chemin » et « wordlist » des requêtes
+                (par défaut data/ et le dossier du dictionnaire par défaut)
+            cache_candidats(CacheCandidats): clés candidates partagées par les orchestrateurs des workers
+    """
+
+    MAX_TACHES_CONSERVEES = 10_000
+
+    def __init__(self, nb_workers: int = 2, chemin_dictionnaire: str = "keys/wordlist.txt", taille_file: int = 1000,
+                 nb_processus: int = 1, racines: Optional[Sequence[str]] = None):
+        self.nb_workers = max(1, nb_workers)
+        self.chemin_dictionnaire = chemin_dictionnaire
+        self.taille_file = taille_file
+        self.nb_processus = nb_processus
+        if racines is None:
+            racines = ("data", os.path.dirname(chemin_dictionnaire) or os.curdir)
+        self.racines = [os.path.realpath(racine) for racine in racines]
+        self._file: "queue.Queue[Optional[Tache]]" = queue.Queue(maxsize=taille_file)
+        self._taches: Dict[str, Tache] = {}
+        self._verrou = threading.Lock()
+        self._compteur = itertools.count(1)
+        self._workers: List[threading.Thread] = []
+        self.cache_candidats = CacheCandidats()
+        self._lancement = time.monotonic()
+
+    def demarrer(self, prechauffer: bool = True) -> None:
+        """
+            Démarre les workers ; avec `prechauffer`, charge d'abord le lexique et dérive une fois, dans le cache
+            partagé, les clés candidates du dictionnaire par défaut pour tous les analyzers.
+        """
+        if prechauffer:
+            prechauffer_lexique()
+            orchestrateur = self._creer_orchestrateur()
+            try:
+                for analyzer in orchestrateur.analyzers.values():
+                    orchestrateur.cache_candidats.obtenir(analyzer, self.chemin_dictionnaire)
+            except Exception as e:
+                # Un préchauffage manqué n'empêche pas de servir: les clés seront dérivées à la première tâche
+                print(f"Préchauffage incomplet ({e})")
+        for numero in range(self.nb_workers):
+            worker = threading.Thread(target=self._boucle_worker, args=(f"worker-{numero + 1}",),
+                                      name=f"cryptoforensic-worker-{numero + 1}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def arreter(self) -> None:
+        """
+            Arrête les workers une fois les tâches déjà en file terminées.
+        """
+        for _ in self._workers:
+            self._file.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers.clear()
+
+    def soumettre(self, parametres: Dict[str, Any]) -> Tache:
+        """
+            Valide une requête et la place dans la file.
+
+            Raises:
+                ValueError: requête invalide
+                queue.Full: file pleine
+        """
+        type_tache = parametres.get("type")
+        if type_tache not in TYPES_TACHES:
+            raise ValueError(f"type de tâche inconnu: {type_tache!r} (attendu: {', '.join(TYPES_TACHES)})")
+        if ("chemin" in parametres) == ("donnees" in parametres):
+            raise ValueError("un seul des champs « chemin » ou « donnees » est attendu")
+        if "donnees" in parametres:
+            try:
+                base64.b64decode(parametres["donnees"], validate=True)
+            except (binascii.Error, TypeError) as e:
+                raise ValueError(f"« donnees » n'est pas du Base64 valide: {e}") from e
+        for champ in ("chemin", "wordlist"):
+            if parametres.get(champ) is not None:
+                self._verifier_chemin(champ, parametres[champ])
+
+        tache = Tache(str(next(self._compteur)), type_tache, parametres)
+        with self._verrou:
+            self._file.put_nowait(tache)
+            self._taches[tache.id] = tache
+            self._oublier_anciennes()
+        return tache
+
+    def _verifier_chemin(self, champ: str, chemin: Any) -> None:
+        # Un client ne lit que sous les dossiers autorisés (liens symboliques et « .. » résolus)
+        if not isinstance(chemin, str):
+            raise ValueError(f"« {champ} » doit être un chemin")
+        reel = os.path.realpath(chemin)
+        if not any(os.path.commonpath([reel, racine]) == racine for racine in self.racines):
+            raise ValueError(f"« {champ} » est hors des dossiers autorisés")
+
+    def _oublier_anciennes(self) -> None:
+        # Historique borné: les tâches finies les plus anciennes sont oubliées
+        excedent = len(self._taches) - self.MAX_TACHES_CONSERVEES
+        if excedent <= 0:
+            return
+        for identifiant in [identifiant for identifiant, tache in self._taches.items() if tache.terminee.is_set()][:excedent]:
+            del self._taches[identifiant]
+
+    def tache(self, identifiant: str) -> Optional[Tache]:
+        with self._verrou:
+            return self._taches.get(identifiant)
+
+    def metriques(self) -> Dict[str, Any]:
+        """
+            Compteurs par état, profondeur de la file et percentiles des durées des tâches terminées.
+        """
+        with self._verrou:
+            taches = list(self._taches.values())
+        etats = {etat: 0 for etat in (EN_ATTENTE, EN_COURS, TERMINEE, ECHOUEE)}
+        for tache in taches:
+            etats[tache.etat] += 1
+        finies = [tache.metriques() for tache in taches if tache.fin is not None]
+        return {
+            "taches": etats,
+            "file": self._file.qsize(),
+            "workers": self.nb_workers,
+            "duree_service": time.monotonic() - self._lancement,
+            "latence": percentiles([mesures["total"] for mesures in finies]),
+            "attente": percentiles([mesures["attente"] for mesures in finies]),
+        }
+
+    def _creer_orchestrateur(self) -> DetecteurCryptoOrchestrateur:
+        return DetecteurCryptoOrchestrateur(nb_workers=self.nb_processus, sortie_progression=SortieMuette(),
+                                            cache_candidats=self.cache_candidats)
+
+    def _boucle_worker(self, nom: str) -> None:
+        orchestrateur = self._creer_orchestrateur()
+        while True:
+            tache = self._file.get()
+            if tache is None:
+                return
+            tache.worker = nom
+            tache.debut = time.monotonic()
+            tache.etat = EN_COURS
+            try:
+                tache.resultat = self._executer(orchestrateur, tache)
+                tache.etat = TERMINEE
+            except Exception as e:
+                tache.erreur = str(e)
+                tache.etat = ECHOUEE
+            tache.fin = time.monotonic()
+            tache.terminee.set()
+
+    def _executer(self, orchestrateur: DetecteurCryptoOrchestrateur, tache: Tache) -> Dict[str, Any]:
+        parametres = tache.parametres
+        temporaire = None
+        try:
+            if "donnees" in parametres:
+                # Les analyzers lisent des chemins: le texte chiffré reçu est posé dans un fichier temporaire
+                with tempfile.NamedTemporaryFile(prefix="cryptoforensic-", suffix=".enc", delete=False) as f:
+                    f.write(base64.b64decode(parametres["donnees"]))
+                    temporaire = chemin = f.name
+                fichier = "-"
+            else:
+                fichier = chemin = parametres["chemin"]
+
+            if tache.type == "identify":
+                with open(chemin, "rb") as f:
+                    empreinte = hashlib.file_digest(f, "sha256").hexdigest()
+                return identification_en_json(fichier, empreinte, orchestrateur.scorer_fichier(chemin))
+
+            dictionnaire = parametres.get("wordlist") or self.chemin_dictionnaire
+            if parametres.get("algo"):
+                resultat = orchestrateur.attaque_dictionnaire_manuelle(chemin, parametres["algo"], dictionnaire)
+            else:
+                resultat = orchestrateur.traiter_fichier(chemin, dictionnaire)
+            return resultat_en_json(fichier, resultat)
+        finally:
+            if temporaire is not None:
+                os.remove(temporaire)
+
+
+class _GestionnaireRequetes(BaseHTTPRequestHandler):
+    """
+        Traduction HTTP <-> ServiceAnalyse (le serveur porte le service dans son attribut `service`).
+    """
+
+    server_version = "CryptoForensic"
+    ATTENTE_MAX = 60.0
+
+    def _repondre(self, statut: int, objet: Dict[str, Any]) -> None:
+        corps = json.dumps(objet, ensure_ascii=False).encode("utf-8")
+        self.send_response(statut)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(corps)))
+        self.end_headers()
+        self.wfile.write(corps)
+
+    def do_POST(self) -> None:
+        if urlparse(self.path).path != "/taches":
+            self._repondre(404, {"erreur": "ressource inconnue"})
+            return
+        try:
+            longueur = int(self.headers.get("Content-Length", 0))
+            parametres = json.loads(self.rfile.read(longueur) or b"{}")
+            if not isinstance(parametres, dict):
+                raise ValueError("un objet JSON est attendu")
+            tache = self.server.service.soumettre(parametres)
+        except ValueError as e:
+            self._repondre(400, {"erreur": str(e)})
+            return
+        except queue.Full:
+            self._repondre(503, {"erreur": "file de tâches pleine"})
+            return
+        self._repondre(202, {"id": tache.id, "etat": tache.etat})
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/sante":
+            self._repondre(200, {"statut": "ok"})
+        elif url.path == "/metriques":
+            self._repondre(200, self.server.service.metriques())
+        elif url.path.startswith("/taches/"):
+            tache = self.server.service.tache(url.path[len("/taches/"):])
+            if tache is None:
+                self._repondre(404, {"erreur": "tâche inconnue"})
+                return
+            try:
+                attente = float(parse_qs(url.query).get("attendre", ["0"])[0])
+            except ValueError:
+                self._repondre(400, {"erreur": "« attendre » doit être un nombre de secondes"})
+                return
+            if attente > 0:
+                tache.terminee.wait(min(attente, self.ATTENTE_MAX))
+            self._repondre(200, tache.en_json())
+        else:
+            self._repondre(404, {"erreur": "ressource inconnue"})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Journal d'accès désactivé: un service chargé y passerait plus de temps qu'à répondre
+        pass
+
+
+class _Serveur(ThreadingHTTPServer):
+    daemon_threads = True
+    # File d'écoute élargie: avec la valeur par défaut (5), des clients simultanés voient leurs connexions
+    # refusées puis réémises une seconde plus tard
+    request_queue_size = 128
+
+
+def creer_serveur(service: ServiceAnalyse, hote: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """
+        Serveur HTTP du service (port 0 = port libre choisi par le système, lisible dans `server_address`).
+    """
+    serveur = _Serveur((hote, port), _GestionnaireRequetes)
+    serveur.service = service
+    return serveur
+
+
+def servir(hote: str = "127.0.0.1", port: int = 8765, nb_workers: int = 2, chemin_dictionnaire: str = "keys/wordlist.txt",
+           taille_file: int = 1000, nb_processus: int = 1, racines: Optional[Sequence[str]] = None) -> int:
+    """
+        Démarre le service et répond jusqu'à l'interruption (Ctrl+C).
+
+        Returns:
+            int: le code de sortie
+    """
+    service = ServiceAnalyse(nb_workers, chemin_dictionnaire, taille_file, nb_processus, racines)
+    print(f"Préchauffage de {service.nb_workers} worker(s)...", flush=True)
+    service.demarrer()
+    serveur = creer_serveur(service, hote, port)
+    print(f"Service prêt sur http://{serveur.server_address[0]}:{serveur.server_address[1]}", flush=True)
+    try:
+        serveur.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        serveur.server_close()
+        service.arreter()
+    return 0
@@ -0,0 +1,92 @@
+import time
+from typing import Optional
+
+from rich.table import Table
+
+from src.attaque_parallele import ResultatRecherche
+
+
+class SuiviAttaque:
+    """
+        État d'une attaque par dictionnaire interactive, alimenté par le moteur et lu par un affichage rich.live.
+
+        La boucle de test ne fait qu'enregistrer la frontière atteinte (appel de `avancer` tous les lots de
+        clés) ; le débit, les clés restantes et l'ETA sont calculés au moment du rendu, par le fil de
+        rafraîchissement de Live, à fréquence fixe. L'affichage ne ralentit donc pas l'attaque.
+
+        Attributes:
+            algo(str): algorithme attaqué
+            total(int): nombre de clés candidates
+            frontiere(int): index jusqu'auquel toutes les clés ont été testées
+            recherche(ResultatRecherche): résultat final, None tant que l'attaque est en cours
+    """
+
+    FREQUENCE_RAFRAICHISSEMENT = 4
+
+    def __init__(self, algo: str, total: int):
+        self.algo = algo
+        self.total = total
+        self.frontiere = 0
+        self.recherche: Optional[ResultatRecherche] = None
+        # Première frontière observée: une attaque reprise ne compte pas les clés testées lors d'un run précédent
+        self._origine: Optional[tuple[float, int]] = None
+        self._derniere: Optional[tuple[float, int]] = None
+        self._lancement = time.monotonic()
+        self._debit_final: Optional[float] = None
+
+    def avancer(self, rang: int, frontiere: int) -> None:
+        """
+            Rappel de progression du moteur d'attaque: (rang du candidat, frontière atteinte).
+        """
+        maintenant = time.monotonic()
+        if self._origine is None:
+            self._origine = (maintenant, frontiere)
+        self.frontiere = frontiere
+        self._derniere = (maintenant, frontiere)
+
+    def terminer(self, recherche: ResultatRecherche) -> None:
+        self.recherche = recherche
+        self.frontiere = recherche.index + 1 if recherche.trouve else recherche.reprise
+        # Débit final sur les clés réellement testées (les clés sautées par le cache négatif n'y comptent pas)
+        duree = time.monotonic() - self._lancement
+        self._debit_final = recherche.nb_testees / duree if duree > 0 else 0.0
+
+    def debit(self) -> float:
+        """
+            Clés testées par seconde: depuis le premier lot terminé en cours d'attaque, sur toute l'attaque à la fin.
+        """
+        if self._debit_final is not None:
+            return self._debit_final
+        if self._origine is None or self._derniere is None:
+            return 0.0
+        duree = self._derniere[0] - self._origine[0]
+        return (self._derniere[1] - self._origine[1]) / duree if duree > 0 else 0.0
+
+    def restantes(self) -> int:
+        return max(0, self.total - self.frontiere)
+
+    def eta(self) -> Optional[float]:
+        """
+            Secondes restantes au débit actuel pour parcourir tout l'espace de clés (None si inconnu).
+        """
+        debit = self.debit()
+        return self.restantes() / debit if debit > 0 else None
+
+    def __rich__(self) -> Table:
+        if self.recherche is None:
+            statut = "[yellow]En cours...[/yellow]"
+        elif self.recherche.trouve:
+            statut = f"[bold green]Clé trouvée (tentative {self.recherche.index + 1}) ✅[/bold green]"
+        else:
+            statut = "[bold red]Aucune clé valide ❌[/bold red]"
+        eta = self.eta()
+
+        tableau = Table(title=f"Attaque par dictionnaire {self.algo}", show_header=False)
+        tableau.add_column(style="bold")
+        tableau.add_column(justify="right")
+        tableau.add_row("Clés testées", f"{self.frontiere}/{self.total}")
+        tableau.add_row("Clés restantes", str(self.restantes()))
+        tableau.add_row("Débit", f"{self.debit():.0f} clés/s")
+        tableau.add_row("ETA", f"{eta:.1f} s" if eta is not None and self.recherche is None else "-")
+        tableau.add_row("Statut", statut)
+        return tableau
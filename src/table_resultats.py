@@ -0,0 +1,166 @@
+import os
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from src.detecteur_crypto import ResultatAnalyse
+from src.utils import est_dechiffrement_reussi, percentiles
+
+
+class TableResultats:
+    """
+        Table en colonnes des résultats d'un run: une colonne par attribut plutôt qu'un objet par fichier.
+
+        Les algorithmes sont codés par leur rang dans `algos` ; scores, durées, tentatives et taux de succès
+        sont rangés dans des tableaux `array`, et le succès de chaque fichier dans un octet. Les agrégats
+        (taux de réussite par algorithme, percentiles des durées, totaux) se calculent sur ces colonnes sans
+        reconstruire de ResultatAnalyse.
+
+        Les textes déchiffrés sont gardés par référence, ou écrits à la suite dans `fichier_textes` (seules
+        leur position et leur longueur restent en mémoire) ; ils sont relus à la demande.
+
+        Attributes:
+            algos(list[str]): algorithmes rencontrés, dans l'ordre d'apparition (l'indice est leur code)
+            id_algo(array): code de l'algorithme de chaque résultat
+            scores(array): score d'identification de chaque résultat
+            temps(array): durée d'analyse de chaque résultat (secondes)
+            tentatives(array): nombre de clés testées pour chaque résultat
+            taux_succes(array): taux de succès du texte déchiffré de chaque résultat
+            succes(bytearray): 1 si le déchiffrement est réussi, 0 sinon
+            fichiers(list[str]): nom du fichier de chaque résultat
+            cles(list[bytes]): clé retenue pour chaque résultat
+    """
+
+    def __init__(self, fichier_textes: Optional[str] = None):
+        """
+            Args:
+                fichier_textes(str): fichier où écrire les textes déchiffrés (None = textes gardés par référence)
+        """
+        self.algos: List[str] = []
+        self._codes_algos: Dict[str, int] = {}
+        self.id_algo = array("H")
+        self.scores = array("d")
+        self.temps = array("d")
+        self.tentatives = array("Q")
+        self.taux_succes = array("d")
+        self.succes = bytearray()
+        self.fichiers: List[str] = []
+        self.cles: List[bytes] = []
+        self._textes: List[Union[str, bytes]] = []
+        # Textes déversés sur disque: position, longueur et type (1 = bytes, 0 = str encodé en UTF-8)
+        self._flux = open(fichier_textes, "w+b") if fichier_textes else None
+        self._positions = array("Q")
+        self._longueurs = array("Q")
+        self._textes_bytes = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.fichiers)
+
+    def __enter__(self) -> "TableResultats":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+    def fermer(self) -> None:
+        """
+            Ferme le fichier des textes (ils ne sont plus lisibles ensuite).
+        """
+        if self._flux is not None:
+            self._flux.close()
+
+    def _code_algo(self, algo: str) -> int:
+        code = self._codes_algos.get(algo)
+        if code is None:
+            code = self._codes_algos[algo] = len(self.algos)
+            self.algos.append(algo)
+        return code
+
+    def ajouter(self, resultat: ResultatAnalyse) -> int:
+        """
+            Ajoute un résultat à la table.
+
+            Args:
+                resultat(ResultatAnalyse): le résultat d'un fichier
+
+            Returns:
+                int: l'indice du résultat dans la table
+        """
+        self.id_algo.append(self._code_algo(resultat.algo))
+        self.scores.append(resultat.score_probabilite)
+        self.temps.append(resultat.temps_execution)
+        self.tentatives.append(resultat.nb_tentatives)
+        self.taux_succes.append(resultat.taux_succes)
+        self.succes.append(bool(resultat.algo) and est_dechiffrement_reussi(resultat.texte_dechiffre, resultat.taux_succes))
+        self.fichiers.append(resultat.fichier)
+        self.cles.append(resultat.cle)
+        texte = resultat.texte_dechiffre
+        if self._flux is None:
+            self._textes.append(texte)
+        else:
+            est_bytes = isinstance(texte, (bytes, bytearray))
+            contenu = bytes(texte) if est_bytes else texte.encode("utf-8")
+            self._flux.seek(0, os.SEEK_END)
+            self._positions.append(self._flux.tell())
+            self._longueurs.append(len(contenu))
+            self._textes_bytes.append(est_bytes)
+            self._flux.write(contenu)
+        return len(self.fichiers) - 1
+
+    def etendre(self, resultats: Iterable[ResultatAnalyse]) -> None:
+        """
+            Ajoute des résultats au fil de leur production (par exemple ceux de mission_flux).
+        """
+        for resultat in resultats:
+            self.ajouter(resultat)
+
+    def texte(self, indice: int) -> Union[str, bytes]:
+        """
+            Texte déchiffré d'un résultat (relu sur disque s'il a été déversé).
+        """
+        if self._flux is None:
+            return self._textes[indice]
+        self._flux.seek(self._positions[indice])
+        contenu = self._flux.read(self._longueurs[indice])
+        return contenu if self._textes_bytes[indice] else contenu.decode("utf-8")
+
+    def __getitem__(self, indice: int) -> ResultatAnalyse:
+        return ResultatAnalyse(self.algos[self.id_algo[indice]], self.cles[indice], self.scores[indice], self.texte(indice),
+                               self.temps[indice], self.tentatives[indice], self.fichiers[indice], self.taux_succes[indice])
+
+    def taux_reussite_par_algo(self) -> Dict[str, float]:
+        """
+            Part des fichiers déchiffrés parmi ceux attribués à chaque algorithme (les fichiers sans
+            algorithme détecté ne sont pas comptés).
+
+            Returns:
+                dict[str, float]: algorithme -> taux de réussite entre 0 et 1
+        """
+        totaux = Counter(self.id_algo)
+        reussis = Counter(compress(self.id_algo, self.succes))
+        return {self.algos[code]: reussis[code] / total for code, total in totaux.items() if self.algos[code]}
+
+    def percentiles_temps(self, rangs: Sequence[float] = (50, 90, 99), algo: Optional[str] = None) -> Dict[str, float]:
+        """
+            Percentiles des durées d'analyse, de tous les résultats ou de ceux d'un algorithme.
+
+            Returns:
+                dict[str, float]: {"p50": ..., "p90": ..., "p99": ...}, vide si aucun résultat
+        """
+        if algo is None:
+            return percentiles(self.temps, rangs)
+        if algo not in self._codes_algos:
+            return {}
+        return percentiles(array("d", compress(self.temps, map(self._codes_algos[algo].__eq__, self.id_algo))), rangs)
+
+    def resume(self) -> Dict[str, Union[int, float]]:
+        """
+            Totaux du run, aux clés de DetecteurCryptoOrchestrateur.statistiques_globales.
+        """
+        return {
+            "total_fichiers": len(self),
+            "fichiers_dechiffres": self.succes.count(1),
+            "temps_total": sum(self.temps),
+            "tentatives_total": sum(self.tentatives)
+        }
@@ -0,0 +1,88 @@
+from typing import Dict, List, Optional, Tuple
+
+from src.crypto_analyzer import CryptoAnalyzer
+from src.metriques import Instrumentation
+
+
+class CleRetrouvee:
+    """
+        Clé retrouvée lors d'une attaque.
+
+        Attributes:
+            algo(str): algorithme du fichier déchiffré
+            cle(bytes): clé dérivée
+            mot(str): mot de passe d'origine (None s'il n'est pas connu)
+    """
+
+    def __init__(self, algo: str, cle: bytes, mot: Optional[str] = None):
+        self.algo = algo
+        self.cle = cle
+        self.mot = mot
+
+
+class TrousseauCles:
+    """
+        Trousseau de session des clés retrouvées, essayées sur chaque fichier avant toute attaque par dictionnaire.
+
+        Les mots de passe étant souvent réutilisés d'un fichier à l'autre, un fichier d'un algorithme reçoit
+        d'abord les clés déjà retrouvées pour cet algorithme, puis celles dérivées, avec sa propre recette,
+        des mots de passe retrouvés pour les autres algorithmes (dérivations mémorisées pour la session).
+        Le filtre des indices de l'analyzer ne s'applique pas à ces mots: un mot de passe retrouvé est essayé
+        sur tous les algorithmes. Seul un analyzer qui ne dérive pas ses clés mot par mot (deriver_cles) n'en
+        reçoit aucune.
+
+        Attributes:
+            metriques(Instrumentation): reçoit la durée des dérivations effectives (étape « derivation »)
+    """
+
+    def __init__(self, metriques: Optional[Instrumentation] = None):
+        self._cles: List[CleRetrouvee] = []
+        self._derivees: Dict[Tuple[str, str], List[bytes]] = {}
+        self.metriques = metriques if metriques is not None else Instrumentation()
+
+    def ajouter(self, algo: str, cle: bytes, mot: Optional[str] = None) -> None:
+        """
+            Ajoute une clé retrouvée (ignorée si elle est déjà connue pour cet algorithme).
+        """
+        for connue in self._cles:
+            if connue.algo == algo and connue.cle == cle:
+                if connue.mot is None:
+                    connue.mot = mot
+                return
+        self._cles.append(CleRetrouvee(algo, bytes(cle), mot))
+
+    def cles(self, algo: str, analyzer: CryptoAnalyzer) -> List[bytes]:
+        """
+            Clés à essayer sur un fichier de l'algorithme donné, sans doublon.
+
+            Args:
+                algo(str): algorithme du fichier
+                analyzer(CryptoAnalyzer): son analyzer, qui dérive les clés des mots de passe des autres algorithmes
+
+            Returns:
+                list[bytes]: les clés retrouvées pour cet algorithme, puis celles dérivées des autres mots de passe
+        """
+        resultat = [connue.cle for connue in self._cles if connue.algo == algo]
+        mots = {connue.mot for connue in self._cles if connue.mot is not None and connue.algo != algo}
+        for mot in sorted(mots):
+            for cle in self._deriver(algo, analyzer, mot):
+                if cle not in resultat:
+                    resultat.append(cle)
+        return resultat
+
+    def instantane(self) -> List[Tuple[str, bytes, Optional[str]]]:
+        """
+            Clés retrouvées, sous forme de triplets (algorithme, clé, mot de passe) à redonner à `ajouter`
+            (transmises entre le processus principal et les workers des missions concurrentes).
+        """
+        return [(connue.algo, connue.cle, connue.mot) for connue in self._cles]
+
+    def _deriver(self, algo: str, analyzer: CryptoAnalyzer, mot: str) -> List[bytes]:
+        if (algo, mot) not in self._derivees:
+            with self.metriques.etape("derivation"):
+                cles = analyzer.deriver_cles(mot)
+            self._derivees[(algo, mot)] = [bytes(cle) for cle in cles or []]
+        return self._derivees[(algo, mot)]
+
+    def __len__(self) -> int:
+        return len(self._cles)
@@ -1,38 +1,47 @@
 import math, re, string, time, os
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, TypedDict
-from rich.console import Console
-from threading import Thread
+from typing import Any, Dict, FrozenSet, List, Mapping, Sequence, Tuple, TypedDict
 class StatsDict(TypedDict):
     imprimable: float
     nombre_mots: int
     p_mots_valide: float
     non_mots: List[str]
     ponctuation_valide: int
-  
-                
+
+
+# Seuil (en %) de taux de succès au-delà duquel un déchiffrement est considéré comme réussi
+SEUIL_SUCCES: float = 60
         
 def calculer_entropie(bytes: bytes) -> float:
     '''
         Calcul l'entropie (le désordre dans une suite de données) afin de déterminer le degré d'improbabilité d'une chaine de données.
 
+        Chaque octet contribue 1/i * log2(i), où i vaut 1 + le nombre d'occurrences de sa valeur: la somme ne dépend
+        donc que du nombre d'occurrences de chaque valeur, compté en un seul passage.
+
         Args:
             bytes(bytes): La donnée brute contenue dans le fichier crypté.
 
         Returns:
             float: l'entropie calculée.
     '''
-    entropie = 0
-    proba_byte = 0
-    for specifique_byte in bytes:
-        i = 1
-        for chaque_byte in bytes:
-                if(chaque_byte == specifique_byte):
-                    i += 1
-
-        proba_byte = 1 / i
-        entropie +=  (proba_byte) * math.log(1/proba_byte, 2)
-    return entropie
+    return entropie_depuis_comptes(Counter(bytes))
+
+
+def entropie_depuis_comptes(comptes: Mapping[int, float]) -> float:
+    '''
+        Entropie (au sens de calculer_entropie) à partir du nombre d'occurrences de chaque valeur d'octet.
+        Les comptes peuvent être fractionnaires: c'est le cas d'une estimation extrapolée depuis un échantillon.
+
+        Args:
+            comptes(Mapping[int, float]): valeur d'octet -> nombre d'occurrences
+
+        Returns:
+            float: l'entropie calculée.
+    '''
+    return sum(compte * math.log2(compte + 1) / (compte + 1) for compte in comptes.values())
         
 
 def verifier_texte_dechiffre(texte: str) -> Dict[str, Any]:
@@ -91,20 +100,11 @@ def verifier_texte_dechiffre(texte: str) -> Dict[str, Any]:
             for syl in ['Fr', 'En']:
 
                 chemin = Path(f"dico{syl}")/f"{first_char}.txt" 
-                if not os.path.isfile(chemin) : continue
-                try:
-                    with open(chemin, 'r', encoding='latin-1') as f: 
-                        for ligne in f:
-                            ligne_clean = ligne.strip().removesuffix('\n')
-                            # Utiliser une correspondance exacte au lieu de re.match
-                            if ligne_clean.lower() == mot.lower():
-                                mots_valides += 1
-                                trouve=True
-                                break
-                except FileNotFoundError:
-                    continue
-                
-                if trouve : break
+                # Correspondance exacte (insensible à la casse) dans le lexique de la lettre
+                if mot.lower() in charger_lexique(os.path.abspath(chemin)):
+                    mots_valides += 1
+                    trouve=True
+                    break
                 
             if not trouve : 
                 stats['non_mots'].append(mot)
@@ -137,6 +137,70 @@ def verifier_texte_dechiffre(texte: str) -> Dict[str, Any]:
     return stats
     
 
+@lru_cache(maxsize=None)
+def charger_lexique(chemin_lettre: str) -> FrozenSet[str]:
+    """
+        Charge une seule fois par processus les mots d'un fichier de dictionnaire (dicoFr/x.txt, dicoEn/x.txt)
+        pour que `verifier_texte_dechiffre` n'ait plus à relire les fichiers à chaque mot testé.
+
+        Args:
+            chemin_lettre(str): chemin absolu du fichier de la lettre
+
+        Returns:
+            FrozenSet[str]: les mots en minuscules (ensemble vide si le fichier n'existe pas)
+    """
+    try:
+        with open(chemin_lettre, 'r', encoding='latin-1') as f:
+            return frozenset(ligne.strip().lower() for ligne in f)
+    except (FileNotFoundError, IsADirectoryError):
+        return frozenset()
+
+
+def prechauffer_lexique() -> None:
+    """
+        Charge à l'avance tous les fichiers de dictionnaire (utile à l'initialisation d'un worker).
+    """
+    for syl in ['Fr', 'En']:
+        for lettre in string.ascii_lowercase:
+            charger_lexique(os.path.abspath(Path(f"dico{syl}")/f"{lettre}.txt"))
+
+
+def evaluer_dechiffrement(donnees: bytes) -> Tuple[str, float]:
+    """
+        Normalise des données déchiffrées et calcule leur taux de succès.
+
+        Args:
+            donnees(bytes): le résultat brut d'un déchiffrement
+
+        Returns:
+            Tuple[str, float]: le texte normalisé (sans \\x00) et son taux de succès (0 si vide)
+    """
+    texte = donnees.decode('utf-8', errors='ignore').replace('\x00', ' ')
+    if not texte:
+        return texte, 0.0
+    return texte, verifier_texte_dechiffre(texte)['taux_succes']
+
+
+def est_dechiffrement_reussi(texte: str, taux_succes: float) -> bool:
+    """
+        Règle de succès commune aux attaques: texte non vide et taux de succès au-dessus du seuil.
+    """
+    return bool(texte) and taux_succes > SEUIL_SUCCES
+
+
+def percentiles(valeurs: Sequence[float], rangs: Sequence[float] = (50, 90, 99)) -> Dict[str, float]:
+    """
+        Percentiles (rang le plus proche) d'une série de mesures.
+
+        Returns:
+            dict[str, float]: {"p50": ..., "p90": ..., "p99": ...}, vide si aucune mesure
+    """
+    if not valeurs:
+        return {}
+    triees = sorted(valeurs)
+    return {f"p{rang:g}": triees[max(0, math.ceil(rang * len(triees) / 100) - 1)] for rang in rangs}
+
+
 def rangerDico() -> None:
     """
         Fonction utilitaire de rangement du dictionnaire anglais téléchargé
@@ -0,0 +1,30 @@
+import os
+from typing import Optional
+
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, CipherAlgorithm, algorithms, modes
+
+# Fabriques de textes chiffrés partagées par les tests, au format des fichiers de mission (IV ou nonce en tête)
+
+
+def chiffrer_cbc(algorithme: CipherAlgorithm, texte: bytes) -> bytes:
+    """
+        Chiffrement CBC avec bourrage PKCS7: IV aléatoire de la taille d'un bloc, suivi du texte chiffré.
+    """
+    iv = os.urandom(algorithme.block_size // 8)
+    bourrage = padding.PKCS7(algorithme.block_size).padder()
+    chiffreur = Cipher(algorithme, modes.CBC(iv)).encryptor()
+    return iv + chiffreur.update(bourrage.update(texte) + bourrage.finalize()) + chiffreur.finalize()
+
+
+def chiffrer_aes_cbc(cle: bytes, texte: bytes) -> bytes:
+    return chiffrer_cbc(algorithms.AES256(cle), texte)
+
+
+def chiffrer_chacha(cle: bytes, texte: bytes, nonce: Optional[bytes] = None) -> bytes:
+    """
+        Chiffrement ChaCha20: nonce de 12 octets (aléatoire par défaut), suivi du texte chiffré.
+    """
+    nonce = os.urandom(12) if nonce is None else nonce
+    chiffreur = Cipher(algorithms.ChaCha20(cle, b"\x00" * 4 + nonce), mode=None).encryptor()
+    return nonce + chiffreur.update(texte)
@@ -0,0 +1,117 @@
+import os
+import sys
+import tempfile
+import base64
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from cryptography.fernet import Fernet
+
+from src.analyzers.fernet_analyzer import FernetAnalyzer
+from src.apercu_fichier import ApercuFichier
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.utils import calculer_entropie
+
+
+class ApercuFichierTests(unittest.TestCase):
+    """
+    Vérifie que l'identification rapide (en-tête, fin et pages échantillonnées) donne les mêmes scores
+    qu'une lecture complète sur de grands fichiers, et que l'entropie extrapolée reste proche de l'exacte.
+    """
+
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dossier.cleanup)
+        self.fichiers = {
+            "aleatoire": os.urandom(1024 * 1024 + 12 + 5),
+            "blocs": os.urandom(1024 * 1024 + 8),
+            "texte": (b"lorem ipsum dolor sit amet " * 40000)[:1000003],
+            "fernet": Fernet(Fernet.generate_key()).encrypt(os.urandom(600000)),
+        }
+        for nom, contenu in self.fichiers.items():
+            with open(self.chemin(nom), "wb") as f:
+                f.write(contenu)
+
+    def chemin(self, nom: str) -> str:
+        return os.path.join(self.dossier.name, nom)
+
+    def test_scores_identiques_a_la_lecture_complete(self):
+        complet = DetecteurCryptoOrchestrateur()
+        rapide = DetecteurCryptoOrchestrateur(identification_rapide=True)
+        for nom in self.fichiers:
+            with self.subTest(fichier=nom):
+                self.assertEqual(rapide.scorer_fichier(self.chemin(nom)), complet.scorer_fichier(self.chemin(nom)))
+        self.assertGreaterEqual(rapide.scorer_fichier(self.chemin("fernet"))["FERNET"], 0.8)
+
+    def test_entropie_extrapolee_proche(self):
+        for nom, contenu in self.fichiers.items():
+            apercu = ApercuFichier(self.chemin(nom), rapide=True)
+            self.assertFalse(apercu.complet)
+            exacte = calculer_entropie(contenu[12:-16])
+            self.assertAlmostEqual(apercu.entropie(12, -16), exacte, delta=exacte * 0.01)
+
+    def test_tete_queue_et_petits_fichiers_exacts(self):
+        contenu = self.fichiers["aleatoire"]
+        apercu = ApercuFichier(self.chemin("aleatoire"), rapide=True)
+        self.assertEqual(apercu.taille, len(contenu))
+        self.assertEqual(apercu.tete(16), contenu[:16])
+        self.assertEqual(apercu.queue(16), contenu[-16:])
+        self.assertEqual(apercu.entropie(0, 100), calculer_entropie(contenu[:100]))
+        with self.assertRaises(ValueError):
+            apercu.contenu
+
+        with open(self.chemin("petit"), "wb") as f:
+            f.write(contenu[:5000])
+        petit = ApercuFichier(self.chemin("petit"), rapide=True)
+        self.assertTrue(petit.complet)
+        self.assertEqual(petit.entropie(8), calculer_entropie(contenu[8:5000]))
+
+
+class PrefiltreTests(unittest.TestCase):
+    """
+    Vérifie le préfiltre par alphabet et structure: les analyzers incompatibles valent 0 sans être exécutés.
+    """
+
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dossier.cleanup)
+        self.orchestrateur = DetecteurCryptoOrchestrateur()
+
+    def ecrire(self, nom: str, contenu: bytes) -> str:
+        chemin = os.path.join(self.dossier.name, nom)
+        with open(chemin, "wb") as f:
+            f.write(contenu)
+        return chemin
+
+    def test_classes_alphabet(self):
+        jeton = Fernet(Fernet.generate_key()).encrypt(b"secret")
+        self.assertEqual(ApercuFichier(self.ecrire("jeton", jeton + b"\n")).classe_alphabet(), ApercuFichier.BASE64)
+        self.assertEqual(ApercuFichier(self.ecrire("texte", b"Bonjour, monde !\n")).classe_alphabet(), ApercuFichier.TEXTE)
+        self.assertEqual(ApercuFichier(self.ecrire("binaire", b"\x00\xff" * 40)).classe_alphabet(), ApercuFichier.BINAIRE)
+
+    def test_analyzers_binaires_ecartes_sur_jeton_fernet(self):
+        chemin = self.ecrire("jeton", Fernet(Fernet.generate_key()).encrypt(os.urandom(500)))
+        with mock.patch("src.analyzers.aes_gcm_analyzer.Aes_Gcm_Analyzer.identifier_apercu") as identifier:
+            scores = self.orchestrateur.scorer_fichier(chemin)
+        identifier.assert_not_called()
+        self.assertEqual(scores["FERNET"], 1.0)
+        self.assertEqual([score for algo, score in scores.items() if algo != "FERNET"], [0.0] * 4)
+
+    def test_fernet_ecarte_sans_decodage_complet(self):
+        binaire = self.ecrire("binaire", os.urandom(4096))
+        # Base64 valide mais byte de version incorrect
+        mauvaise_version = self.ecrire("b64", base64.urlsafe_b64encode(b"\x81" + os.urandom(200)))
+        analyzer = FernetAnalyzer()
+        with mock.patch.object(FernetAnalyzer, "identifier_apercu") as identifier:
+            self.assertEqual(analyzer.identifier_algo(binaire), 0.0)
+            self.assertEqual(analyzer.identifier_algo(mauvaise_version), 0.0)
+        identifier.assert_not_called()
+        self.assertFalse(analyzer.compatible(ApercuFichier(mauvaise_version)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.attaque_parallele import MoteurAttaque
+from src.analyzers.aes_cbc_analyzer import Aes_Cbc_Analyzer
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.progression import SortieMuette
+from tests.chiffrement import chiffrer_aes_cbc, chiffrer_chacha
+
+
+class AttaqueGroupeeTests(unittest.TestCase):
+    """
+    Vérifie l'attaque groupée: un seul passage sur les clés pour tous les fichiers d'un algorithme,
+    fichiers retirés du groupe dès leur résolution, dérivation faite une fois par mission.
+    """
+
+    def setUp(self) -> None:
+        self.texte = b"Bonjour, le monde est grand et la nuit est calme. " * 4
+        self.cles = [hashlib.sha256(f"mot{i}".encode()).digest() for i in range(20)]
+
+    def test_un_passage_pour_tout_le_groupe(self):
+        donnees = [chiffrer_chacha(self.cles[3], self.texte), chiffrer_chacha(self.cles[7], self.texte), chiffrer_chacha(os.urandom(32), self.texte)]
+        resultats = MoteurAttaque(1).rechercher_groupe(ChaCha20_Analyzer(), donnees, self.cles)
+
+        self.assertEqual([resultat.index for resultat in resultats], [3, 7, -1])
+        self.assertEqual([resultat.nb_testees for resultat in resultats], [4, 8, 20])
+        self.assertEqual(resultats[1].cle, self.cles[7])
+        self.assertEqual(resultats[2].reprise, len(self.cles))
+
+    def test_echeance_depassee(self):
+        resultats = MoteurAttaque(1).rechercher_groupe(ChaCha20_Analyzer(), [chiffrer_chacha(self.cles[3], self.texte)], self.cles, echeance=0)
+        self.assertFalse(resultats[0].trouve)
+        self.assertEqual(resultats[0].reprise, 0)
+
+    def test_reprise_et_exclusions_par_fichier(self):
+        donnees = [chiffrer_chacha(self.cles[3], self.texte), chiffrer_chacha(self.cles[7], self.texte)]
+        exclues = bytearray(20)
+        exclues[7] = 1
+        resultats = MoteurAttaque(1).rechercher_groupe(ChaCha20_Analyzer(), donnees, self.cles, debuts=[2, 5], exclusions=[None, exclues])
+
+        self.assertEqual(resultats[0].index, 3)
+        self.assertEqual(resultats[0].nb_testees, 2)
+        # Clé 7 écartée par le masque: le second fichier n'est pas résolu
+        self.assertFalse(resultats[1].trouve)
+        self.assertEqual(resultats[1].nb_testees, 14)
+
+    def test_mission_groupee_trousseau_et_cache_negatif(self):
+        if not os.path.exists("keys/wordlist.txt"):
+            self.skipTest("Dictionnaire introuvable.")
+        cles = Aes_Cbc_Analyzer().generer_cles_candidates("keys/wordlist.txt")
+        with tempfile.TemporaryDirectory() as dossier:
+            with open(os.path.join(dossier, "trouve.enc"), "wb") as f:
+                f.write(chiffrer_aes_cbc(cles[-1], self.texte))
+            with open(os.path.join(dossier, "inconnu.enc"), "wb") as f:
+                f.write(chiffrer_aes_cbc(os.urandom(32), self.texte))
+
+            orchestrateur = DetecteurCryptoOrchestrateur(dossier_cache_negatif=os.path.join(dossier, "negatif"))
+            with mock.patch("src.detecteur_crypto.rapport_mission"):
+                premiers = orchestrateur.mission_complete_automatique(dossier, "keys/wordlist.txt", groupee=True)
+                seconds = orchestrateur.mission_complete_automatique(dossier, "keys/wordlist.txt", groupee=True)
+
+        par_fichier = {resultat.fichier: resultat for resultat in seconds}
+        self.assertEqual(premiers[1].cle, cles[-1])
+        # Second run: clé du trousseau, et mots déjà essayés sautés pour le fichier non résolu
+        self.assertEqual(par_fichier["trouve.enc"].cle, cles[-1])
+        self.assertEqual(par_fichier["trouve.enc"].nb_tentatives, 1)
+        self.assertGreater(premiers[0].nb_tentatives, 0)
+        self.assertEqual(par_fichier["inconnu.enc"].nb_tentatives, 0)
+        # La durée du passage commun est répartie entre les fichiers, pas comptée pour chacun
+        self.assertLess(sum(resultat.temps_execution for resultat in premiers), 2 * max(resultat.temps_execution for resultat in premiers))
+
+    def test_mission_groupee_derive_une_fois(self):
+        if not os.path.exists("keys/wordlist.txt"):
+            self.skipTest("Dictionnaire introuvable.")
+        analyzer = Aes_Cbc_Analyzer()
+        mots = analyzer.mots_candidats("keys/wordlist.txt")
+        cles = analyzer.generer_cles_candidates("keys/wordlist.txt")
+        with tempfile.TemporaryDirectory() as dossier:
+            for i, rang in enumerate((0, len(mots) - 1, 0)):
+                with open(os.path.join(dossier, f"fichier{i}.enc"), "wb") as f:
+                    f.write(chiffrer_aes_cbc(cles[rang], self.texte + bytes([65 + i])))
+
+            orchestrateur = DetecteurCryptoOrchestrateur()
+            with mock.patch("src.detecteur_crypto.rapport_mission"), mock.patch("src.detecteur_crypto.time.sleep"):
+                resultats = orchestrateur.mission_complete_automatique(dossier, "keys/wordlist.txt", groupee=True)
+
+        self.assertEqual([resultat.cle for resultat in resultats], [cles[0], cles[-1], cles[0]])
+        self.assertEqual({resultat.algo for resultat in resultats}, {"AES-256-CBC"})
+        # Une seule dérivation par algorithme attaqué, quel que soit le nombre de fichiers
+        self.assertEqual(orchestrateur.cache_candidats.echecs, 1)
+
+    def test_nb_tentatives_identique_entre_modes(self):
+        if not os.path.exists("data/mission4.enc"):
+            self.skipTest("Fichiers de mission introuvables.")
+        modes = {
+            "séquentiel": {},
+            "concurrent": {"concurrente": True, "nb_workers": 2},
+            "groupé": {"groupee": True},
+            "planifié": {"planifiee": True},
+        }
+        tentatives = {}
+        for mode, options in modes.items():
+            orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette())
+            with mock.patch("src.detecteur_crypto.rapport_mission"):
+                resultats = orchestrateur.mission_complete_automatique("data", "keys/wordlist.txt", **options)
+            tentatives[mode] = {resultat.fichier: resultat.nb_tentatives for resultat in resultats}
+
+        # Rang de la clé gagnante dans tous les modes, y compris pour les fichiers à plusieurs algorithmes éligibles
+        self.assertEqual(tentatives["séquentiel"]["mission4.enc"], 1)
+        self.assertEqual(tentatives["séquentiel"]["mission3.enc"], 1)
+        for mode in modes:
+            self.assertEqual(tentatives[mode], tentatives["séquentiel"], mode)
+
+
+if __name__ == "__main__":
+    unittest.main()
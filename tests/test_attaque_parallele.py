@@ -0,0 +1,142 @@
+import hashlib
+import os
+import sys
+import time
+import unittest
+from multiprocessing import shared_memory
+from pathlib import Path
+from unittest import mock
+
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.attaque_parallele import MoteurAttaque, _attacher_segment
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.key_store import KeyStore
+from tests.chiffrement import chiffrer_chacha
+
+TEXTE_CLAIR = b"Bonjour, le monde est grand. " * 8
+
+
+class AnalyzerMarque(ChaCha20_Analyzer):
+    """Analyzer factice: toute clé commençant par 0xAA « déchiffre » le texte clair."""
+
+    def dechiffrer_donnees(self, donnees, cle_donnee):
+        return TEXTE_CLAIR if cle_donnee[0] == 0xAA else b"\x93\x11\x07"
+
+
+class AnalyzerLent(ChaCha20_Analyzer):
+    """Analyzer factice lent qui ne déchiffre jamais rien."""
+
+    def dechiffrer_donnees(self, donnees, cle_donnee):
+        time.sleep(0.001)
+        return b"\x93\x11\x07"
+
+
+class AnalyzerDefaillant(ChaCha20_Analyzer):
+    """Analyzer factice qui échoue dans le worker."""
+
+    def dechiffrer_donnees(self, donnees, cle_donnee):
+        raise RuntimeError("échec du worker")
+
+
+def segments_partages() -> set[str]:
+    return set(os.listdir("/dev/shm"))
+
+
+class MoteurAttaqueTests(unittest.TestCase):
+    """
+    Vérifie que les recherches séquentielle et parallèle donnent le même premier succès.
+    """
+
+    def setUp(self) -> None:
+        self.cle = hashlib.sha256(b"2024secret").digest()
+        # Nonce fixe: les déchiffrements (et les éventuels faux positifs) sont reproductibles
+        self.donnees = chiffrer_chacha(self.cle, TEXTE_CLAIR, nonce=b"\x01" * 12)
+
+        self.cles = KeyStore(32)
+        for i in range(1000):
+            self.cles.append(self.cle if i == 700 else hashlib.sha256(str(i).encode()).digest())
+
+    def test_sequentiel_et_parallele_identiques(self):
+        sequentiel = MoteurAttaque(1).rechercher(ChaCha20_Analyzer(), self.donnees, self.cles)
+        parallele = MoteurAttaque(2, taille_lot=64, seuil_parallele=1).rechercher(ChaCha20_Analyzer(), self.donnees, self.cles)
+        self.assertTrue(sequentiel.trouve)
+        self.assertLessEqual(sequentiel.index, 700)
+        self.assertEqual(parallele.index, sequentiel.index)
+        self.assertEqual(parallele.cle, sequentiel.cle)
+        self.assertEqual(parallele.texte_dechiffre, sequentiel.texte_dechiffre)
+
+    def test_cle_valide_retrouvee(self):
+        cles = [hashlib.sha256(b"autre").digest()] * 3 + [self.cle]
+        resultat = MoteurAttaque(1).rechercher(ChaCha20_Analyzer(), self.donnees, cles)
+        self.assertEqual(resultat.index, 3)
+        self.assertEqual(resultat.texte_dechiffre, TEXTE_CLAIR.decode())
+
+    def test_premier_succes_dans_l_ordre_du_dictionnaire(self):
+        # Deux clés valides dans des lots différents: la première doit toujours l'emporter
+        cles = [bytes([0xAA if i in (130, 900) else 0x01]) + bytes(31) for i in range(1000)]
+        resultat = MoteurAttaque(3, taille_lot=32, seuil_parallele=1).rechercher(AnalyzerMarque(), self.donnees, cles)
+        self.assertEqual(resultat.index, 130)
+
+    def test_aucune_cle_valide(self):
+        cles = [bytes([0x01]) + bytes(31)] * 100
+        resultat = MoteurAttaque(2, taille_lot=16, seuil_parallele=1).rechercher(AnalyzerMarque(), self.donnees, cles)
+        self.assertFalse(resultat.trouve)
+        self.assertEqual(resultat.nb_testees, 100)
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "Mémoire partagée POSIX non visible")
+    def test_segment_partage_libere(self):
+        avant = segments_partages()
+        MoteurAttaque(2, taille_lot=64, seuil_parallele=1).rechercher(ChaCha20_Analyzer(), self.donnees, self.cles)
+        self.assertEqual(segments_partages() - avant, set())
+
+        with self.assertRaises(RuntimeError):
+            MoteurAttaque(2, taille_lot=64, seuil_parallele=1).rechercher(AnalyzerDefaillant(), self.donnees, self.cles)
+        self.assertEqual(segments_partages() - avant, set())
+
+    def test_attachement_sans_resource_tracker(self):
+        segment = shared_memory.SharedMemory(create=True, size=16)
+        self.addCleanup(segment.unlink)
+        self.addCleanup(segment.close)
+        with mock.patch("multiprocessing.resource_tracker.register") as enregistrer:
+            attache = _attacher_segment(segment.name)
+            attache.close()
+        enregistrer.assert_not_called()
+
+    def test_course_annule_les_perdants(self):
+        # L'algorithme lent est en tête et mieux noté: sans course, tout son espace serait parcouru d'abord
+        lentes = [bytes(32)] * 20000
+        marquees = [bytes([0xAA if i == 200 else 0x01]) + bytes(31) for i in range(1000)]
+        perdant, gagnant = MoteurAttaque(2, taille_lot=64, seuil_parallele=1).course(
+            self.donnees, [(AnalyzerLent(), 0.9, lentes), (AnalyzerMarque(), 0.6, marquees)]
+        )
+        self.assertFalse(perdant.trouve)
+        self.assertLess(perdant.nb_testees, len(lentes))
+        self.assertEqual(gagnant.index, 200)
+
+    def test_course_sequentielle_dans_l_ordre(self):
+        cles = [bytes([0xAA]) + bytes(31)]
+        resultats = MoteurAttaque(1).course(self.donnees, [(AnalyzerMarque(), 0.6, cles), (AnalyzerMarque(), 0.9, cles)])
+        self.assertTrue(resultats[0].trouve)
+        self.assertFalse(resultats[1].trouve)
+        self.assertEqual(resultats[1].nb_testees, 0)
+
+    def test_reprise_apres_echeance(self):
+        lentes = [bytes(32)] * 5000
+        moteur = MoteurAttaque(2, taille_lot=64, seuil_parallele=1)
+        interrompue = moteur.rechercher(AnalyzerLent(), self.donnees, lentes, echeance=time.monotonic() + 0.3)
+        self.assertFalse(interrompue.trouve)
+        self.assertLess(interrompue.reprise, len(lentes))
+        # Toutes les clés avant la reprise ont été testées, aucune après
+        self.assertEqual(interrompue.nb_testees, interrompue.reprise)
+
+        cles = [bytes([0xAA if i == 30 else 0x01]) + bytes(31) for i in range(100)]
+        self.assertFalse(MoteurAttaque(1).rechercher(AnalyzerMarque(), self.donnees, cles, debut=31).trouve)
+        reprise = MoteurAttaque(1).rechercher(AnalyzerMarque(), self.donnees, cles, debut=10)
+        self.assertEqual((reprise.index, reprise.nb_testees), (30, 21))
+
+
+if __name__ == "__main__":
+    unittest.main()
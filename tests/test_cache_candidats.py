@@ -0,0 +1,99 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.cache_candidats import CacheCandidats
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.analyzers.fernet_analyzer import FernetAnalyzer
+
+
+class AnalyzerCompteur(ChaCha20_Analyzer):
+    """Analyzer ChaCha20 qui compte ses générations de clés."""
+
+    def __init__(self):
+        self.appels = 0
+
+    def generer_cles_candidates(self, chemin_dictionnaire, compact=False):
+        self.appels += 1
+        return super().generer_cles_candidates(chemin_dictionnaire, compact)
+
+
+class CacheCandidatsTests(unittest.TestCase):
+    """
+    Vérifie la réutilisation, l'invalidation et l'éviction du cache de clés candidates.
+    """
+
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+        self.dictionnaire = os.path.join(self.dossier.name, "wordlist.txt")
+        with open(self.dictionnaire, "w", encoding="utf-8") as f:
+            f.write("2024hello\n2024secret\nune phrase simple\n")
+
+    def tearDown(self) -> None:
+        self.dossier.cleanup()
+
+    def test_reutilisation(self):
+        cache = CacheCandidats()
+        analyzer = AnalyzerCompteur()
+        premieres = cache.obtenir(analyzer, self.dictionnaire)
+        secondes = cache.obtenir(analyzer, self.dictionnaire)
+        self.assertIs(premieres, secondes)
+        self.assertEqual(analyzer.appels, 1)
+        self.assertEqual((cache.succes, cache.echecs), (1, 1))
+
+    def test_invalidation_si_dictionnaire_modifie(self):
+        cache = CacheCandidats()
+        analyzer = AnalyzerCompteur()
+        self.assertEqual(len(cache.obtenir(analyzer, self.dictionnaire)), 2)
+        with open(self.dictionnaire, "a", encoding="utf-8") as f:
+            f.write("2024world\n")
+        os.utime(self.dictionnaire, ns=(0, os.stat(self.dictionnaire).st_mtime_ns + 1))
+        self.assertEqual(len(cache.obtenir(analyzer, self.dictionnaire)), 3)
+        self.assertEqual(analyzer.appels, 2)
+
+    def test_eviction_selon_budget(self):
+        # Deux entrées de 64 et 44 octets: un budget de 100 octets n'en garde qu'une
+        cache = CacheCandidats(budget_octets=100)
+        cache.obtenir(AnalyzerCompteur(), self.dictionnaire)
+        cache.obtenir(FernetAnalyzer(), self.dictionnaire)
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.octets_utilises, 100)
+
+    def test_partage_entre_fils(self):
+        cache = CacheCandidats()
+        analyzer = AnalyzerCompteur()
+        generer = analyzer.generer_cles_candidates
+        depart = threading.Barrier(4)
+
+        def generer_lentement(chemin_dictionnaire, compact=False):
+            time.sleep(0.05)
+            return generer(chemin_dictionnaire, compact)
+
+        analyzer.generer_cles_candidates = generer_lentement
+        resultats = []
+
+        def demander():
+            depart.wait()
+            resultats.append(cache.obtenir(analyzer, self.dictionnaire))
+
+        fils = [threading.Thread(target=demander) for _ in range(4)]
+        for f in fils:
+            f.start()
+        for f in fils:
+            f.join()
+
+        # Une seule dérivation, les autres fils reçoivent les mêmes clés
+        self.assertEqual(analyzer.appels, 1)
+        self.assertTrue(all(cles is resultats[0] for cles in resultats))
+        self.assertEqual((cache.succes, cache.echecs), (3, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.attaque_parallele import MoteurAttaque
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.cache_negatif import CacheNegatif
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.progression import SortieMuette
+from tests.chiffrement import chiffrer_chacha
+
+
+class CacheNegatifTests(unittest.TestCase):
+    """
+    Vérifie la persistance des clés échouées, leur saut par le moteur et la compaction des runs.
+    """
+
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+        cle = hashlib.sha256(b"2024secret").digest()
+        self.donnees = chiffrer_chacha(cle, b"Bonjour, le monde est grand. " * 8, nonce=b"\x01" * 12)
+        self.cles = [hashlib.sha256(f"leurre{i}".encode()).digest() for i in range(300)] + [cle]
+
+    def tearDown(self) -> None:
+        self.dossier.cleanup()
+
+    def test_persistance_entre_instances(self):
+        cache = CacheNegatif(self.dossier.name)
+        self.assertEqual(cache.masque("abc", "CHACHA20", self.cles), bytearray())
+        self.assertEqual(cache.enregistrer("abc", "CHACHA20", self.cles, 0, 100), 100)
+        # Clés déjà connues: aucun nouveau run
+        self.assertEqual(cache.enregistrer("abc", "CHACHA20", self.cles, 50, 100), 0)
+
+        relu = CacheNegatif(self.dossier.name)
+        masque = relu.masque("abc", "CHACHA20", self.cles)
+        self.assertEqual(sum(masque), 100)
+        self.assertTrue(all(masque[:100]))
+        self.assertTrue(relu.contient("abc", "CHACHA20", self.cles[0]))
+        self.assertFalse(relu.contient("abc", "CHACHA20", self.cles[-1]))
+        self.assertFalse(relu.contient("abc", "AES-256-CBC", self.cles[0]))
+
+    def test_compaction_des_runs(self):
+        cache = CacheNegatif(self.dossier.name, max_runs=3)
+        for debut in range(0, 200, 40):
+            cache.enregistrer("abc", "CHACHA20", self.cles, debut, debut + 50)
+        dossier_couple = os.path.join(self.dossier.name, "abc", "CHACHA20")
+        self.assertLessEqual(len([nom for nom in os.listdir(dossier_couple) if nom.endswith(".run")]), 3)
+        self.assertEqual(cache.taille("abc", "CHACHA20"), 210)
+
+        cache.compacter("abc", "CHACHA20")
+        self.assertEqual(len(os.listdir(dossier_couple)), 1)
+        self.assertEqual(CacheNegatif(self.dossier.name).taille("abc", "CHACHA20"), 210)
+
+    def test_moteur_saute_les_cles_echouees(self):
+        cache = CacheNegatif(self.dossier.name)
+        cache.enregistrer("abc", "CHACHA20", self.cles, 0, 300)
+        masque = cache.masque("abc", "CHACHA20", self.cles)
+
+        for moteur in (MoteurAttaque(1), MoteurAttaque(2, taille_lot=64, seuil_parallele=1)):
+            resultat = moteur.rechercher(ChaCha20_Analyzer(), self.donnees, self.cles, exclues=masque)
+            self.assertEqual(resultat.index, 300)
+            self.assertEqual(resultat.nb_testees, 1)
+
+    def test_mots_ecartes_avant_derivation(self):
+        chemin = os.path.join(self.dossier.name, "secret.enc")
+        with open(chemin, "wb") as f:
+            f.write(self.donnees)
+        dictionnaire = os.path.join(self.dossier.name, "mots.txt")
+        with open(dictionnaire, "w", encoding="utf-8") as f:
+            f.writelines(f"2024leurre{chr(97 + i // 26)}{chr(97 + i % 26)}\n" for i in range(40))
+        dossier_cache = os.path.join(self.dossier.name, "cache")
+
+        premier = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette(), dossier_cache_negatif=dossier_cache)
+        self.assertEqual(premier.attaque_dictionnaire_manuelle(chemin, "CHACHA20", dictionnaire).nb_tentatives, 40)
+
+        # Nouveau run avec le mot de passe ajouté: seuls les mots jamais essayés sont dérivés et testés
+        with open(dictionnaire, "a", encoding="utf-8") as f:
+            f.write("2024secret\n")
+        second = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette(), dossier_cache_negatif=dossier_cache)
+        analyzer = second.analyzers["CHACHA20"]
+        with mock.patch.object(analyzer, "deriver_cles", wraps=analyzer.deriver_cles) as deriver:
+            resultat = second.attaque_dictionnaire_manuelle(chemin, "CHACHA20", dictionnaire)
+        self.assertEqual(deriver.call_count, 1)
+        self.assertEqual(resultat.nb_tentatives, 41)
+        self.assertGreater(resultat.taux_succes, 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import src.mission_concurrente
+from src.cache_resultats import CacheResultats
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.points_reprise import PointsReprise
+
+
+class CacheResultatsTests(unittest.TestCase):
+    """
+    Vérifie le cache de résultats adressé par contenu: persistance, revérification de la clé et
+    déduplication des fichiers identiques dans un même run.
+    """
+
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "resultats.json")
+        self.wordlist = "keys/wordlist.txt"
+        self.mission = "data/mission2.enc"
+        if not os.path.exists(self.mission):
+            self.skipTest("Fichier de mission introuvable.")
+
+    def tearDown(self) -> None:
+        self.dossier.cleanup()
+
+    def test_persistance_et_oubli(self):
+        cache = CacheResultats(self.chemin)
+        cache.enregistrer("abc", "mission2.enc", "CHACHA20", b"\x01" * 32, {"CHACHA20": 0.85})
+        entree = CacheResultats(self.chemin).obtenir("abc")
+        self.assertEqual((entree["algo"], entree["cle"], entree["scores"]), ("CHACHA20", b"\x01" * 32, {"CHACHA20": 0.85}))
+        self.assertIsNone(cache.obtenir("autre"))
+
+        cache.oublier("abc")
+        self.assertEqual(len(CacheResultats(self.chemin)), 0)
+
+    def test_fichier_corrompu_ignore(self):
+        with open(self.chemin, "w", encoding="utf-8") as f:
+            f.write("{pas du json")
+        self.assertEqual(len(CacheResultats(self.chemin)), 0)
+
+    def test_resultat_reutilise_entre_runs(self):
+        attendu = DetecteurCryptoOrchestrateur(fichier_resultats=self.chemin).traiter_fichier(self.mission, self.wordlist)
+        self.assertGreater(attendu.nb_tentatives, 0)
+
+        # Même contenu sous un autre nom, nouveau run: aucune tentative
+        copie = os.path.join(self.dossier.name, "copie.enc")
+        shutil.copy(self.mission, copie)
+        resultat = DetecteurCryptoOrchestrateur(fichier_resultats=self.chemin).traiter_fichier(copie, self.wordlist)
+        self.assertEqual((resultat.algo, resultat.cle, resultat.texte_dechiffre), (attendu.algo, attendu.cle, attendu.texte_dechiffre))
+        self.assertEqual(resultat.nb_tentatives, 0)
+
+    def test_cle_invalide_reverifiee(self):
+        with open(self.mission, "rb") as f:
+            empreinte = PointsReprise.empreinte(f.read())
+        CacheResultats(self.chemin).enregistrer(empreinte, "mission2.enc", "CHACHA20", b"\x00" * 32, {"CHACHA20": 0.85})
+
+        resultat = DetecteurCryptoOrchestrateur(fichier_resultats=self.chemin).traiter_fichier(self.mission, self.wordlist)
+        self.assertGreater(resultat.nb_tentatives, 0)
+        self.assertNotEqual(CacheResultats(self.chemin).obtenir(empreinte)["cle"], b"\x00" * 32)
+
+    def test_fichiers_identiques_traites_une_fois(self):
+        for nom in ("a.enc", "b.enc"):
+            shutil.copy(self.mission, os.path.join(self.dossier.name, nom))
+        original = src.mission_concurrente.iterer_mission_concurrente
+        with mock.patch.object(src.mission_concurrente, "iterer_mission_concurrente", wraps=original) as espion, \
+                mock.patch("src.detecteur_crypto.rapport_mission"), mock.patch("src.detecteur_crypto.time.sleep"):
+            resultats = DetecteurCryptoOrchestrateur().mission_complete_automatique(self.dossier.name, self.wordlist, concurrente=True, nb_workers=1)
+
+        self.assertEqual(len(espion.call_args.args[0]), 1)
+        self.assertEqual(len(resultats), 2)
+        self.assertEqual((resultats[0].algo, resultats[0].cle), (resultats[1].algo, resultats[1].cle))
+        self.assertEqual(resultats[1].nb_tentatives, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
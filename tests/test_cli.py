@@ -0,0 +1,120 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.cli import CODE_ECHEC, CODE_ERREUR_LECTURE, CODE_SUCCES, CODE_USAGE, main
+
+
+class CliTests(unittest.TestCase):
+    """
+    Vérifie la ligne de commande non interactive: résultats JSON sur la sortie standard et codes de sortie.
+    """
+
+    def executer(self, *arguments, entree: bytes = b""):
+        sortie = io.StringIO()
+        code = main(list(arguments), sortie=sortie, entree=io.BytesIO(entree))
+        return code, sortie.getvalue()
+
+    def test_identify_dossier(self):
+        code, sortie = self.executer("identify", "data")
+        lignes = [json.loads(ligne) for ligne in sortie.splitlines()]
+
+        self.assertEqual(code, CODE_SUCCES)
+        self.assertEqual([ligne["fichier"] for ligne in lignes], [f"data/mission{i}.enc" for i in range(1, 6)])
+        self.assertEqual(lignes[4]["algo"], "FERNET")
+        self.assertEqual(len(lignes[0]["sha256"]), 64)
+
+    def test_identify_entree_standard(self):
+        code, sortie = self.executer("identify", "-", entree=Path("data/mission5.enc").read_bytes())
+
+        self.assertEqual(code, CODE_SUCCES)
+        self.assertEqual(json.loads(sortie)["algo"], "FERNET")
+
+    def test_attack_algo_impose(self):
+        code, sortie = self.executer("attack", "--algo", "CHACHA20", "data/mission2.enc")
+        resultat = json.loads(sortie)
+
+        self.assertEqual(code, CODE_SUCCES)
+        self.assertTrue(resultat["succes"])
+        self.assertEqual(resultat["algo"], "CHACHA20")
+
+    def test_attack_sortie(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin_sortie = os.path.join(dossier, "clair.txt")
+            code, sortie = self.executer("attack", "--algo", "CHACHA20", "--sortie", chemin_sortie, "data/mission2.enc")
+            resultat = json.loads(sortie)
+
+            self.assertEqual(code, CODE_SUCCES)
+            self.assertEqual(resultat["sortie"], chemin_sortie)
+            self.assertEqual(Path(chemin_sortie).read_text(encoding="utf-8").strip(), resultat["texte_dechiffre"].strip())
+
+            code, sortie = self.executer("attack", "--sortie", dossier, "data/mission2.enc", "data/mission5.enc")
+            self.assertEqual(code, CODE_SUCCES)
+            self.assertEqual(sorted(os.listdir(dossier)), ["clair.txt", "mission2.dec", "mission5.dec"])
+
+    def test_attack_echec(self):
+        code, sortie = self.executer("attack", "--algo", "AES-256-CBC", "data/mission3.enc")
+
+        self.assertEqual(code, CODE_ECHEC)
+        self.assertFalse(json.loads(sortie)["succes"])
+
+    def test_fichiers_introuvables(self):
+        code, sortie = self.executer("identify", "introuvable.enc")
+        self.assertEqual(code, CODE_USAGE)
+        self.assertEqual(json.loads(sortie)["erreur"], "fichier introuvable")
+
+        code, sortie = self.executer("identify", "introuvable.enc", "data/mission1.enc")
+        self.assertEqual(code, CODE_ERREUR_LECTURE)
+        self.assertEqual(len(sortie.splitlines()), 2)
+
+    def test_format_json(self):
+        code, sortie = self.executer("identify", "--format", "json", "data/mission1.enc", "data/mission2.enc")
+        resultats = json.loads(sortie)
+
+        self.assertEqual(code, CODE_SUCCES)
+        self.assertIsInstance(resultats, list)
+        self.assertEqual(len(resultats), 2)
+
+    def test_mission_concurrente_au_fil_de_l_eau(self):
+        code, sortie = self.executer("mission", "--workers", "2", "data")
+        lignes = [json.loads(ligne) for ligne in sortie.splitlines()]
+
+        self.assertEqual(code, CODE_SUCCES)
+        self.assertEqual(sorted(ligne["fichier"] for ligne in lignes), [os.path.join("data", f"mission{i}.enc") for i in range(1, 6)])
+        self.assertTrue(all(ligne["succes"] for ligne in lignes))
+
+    def test_sortie_standard_reservee_aux_resultats(self):
+        with redirect_stdout(io.StringIO()) as sortie_standard, redirect_stderr(io.StringIO()) as erreurs:
+            code, sortie = self.executer("mission", "data")
+
+        self.assertEqual(code, CODE_SUCCES)
+        self.assertEqual(len(sortie.splitlines()), 5)
+        # Messages et rapports de l'orchestrateur sur la sortie d'erreur, sans redirection de la sortie standard
+        self.assertEqual(sortie_standard.getvalue(), "")
+        self.assertIn("RAPPORT DE SYNTHESE", erreurs.getvalue())
+
+    def test_mission_options_incompatibles(self):
+        code, sortie = self.executer("mission", "--budget", "5", "--groupee", "data")
+        self.assertEqual(code, CODE_USAGE)
+        self.assertIn("erreur", json.loads(sortie))
+
+    def test_mission_groupee_sans_workers(self):
+        code, sortie = self.executer("mission", "--groupee", "--workers", "4", "data")
+        self.assertEqual(code, CODE_USAGE)
+        self.assertIn("--groupee", json.loads(sortie)["erreur"])
+
+    def test_usage_incorrect(self):
+        code, _ = self.executer("inconnue")
+        self.assertEqual(code, CODE_USAGE)
+
+
+if __name__ == "__main__":
+    unittest.main()
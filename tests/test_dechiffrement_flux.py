@@ -0,0 +1,108 @@
+import base64
+import io
+import os
+import sys
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers import algorithms
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.analyzers.aes_cbc_analyzer import Aes_Cbc_Analyzer
+from src.analyzers.aes_gcm_analyzer import Aes_Gcm_Analyzer
+from src.analyzers.blowfish_analyzer import Blowfish_Analyzer
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.analyzers.fernet_analyzer import FernetAnalyzer
+from tests.chiffrement import chiffrer_cbc, chiffrer_chacha
+
+TEXTE = b"Bonjour, le monde est grand et la nuit est calme. " * 40
+
+
+class DechiffrementFluxTests(unittest.TestCase):
+    """
+    Vérifie le déchiffrement en flux de chaque analyzer: identique au déchiffrement en mémoire,
+    authentification avant écriture du fichier final et mémoire constante.
+    """
+
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+        cle_aes = os.urandom(32)
+        cle_blowfish = os.urandom(16)
+        cle_chacha = os.urandom(32)
+        cle_fernet = base64.urlsafe_b64encode(os.urandom(32))
+        nonce = os.urandom(12)
+        self.cas = {
+            "AES-CBC": (Aes_Cbc_Analyzer(), cle_aes, chiffrer_cbc(algorithms.AES256(cle_aes), TEXTE)),
+            "BLOWFISH": (Blowfish_Analyzer(), cle_blowfish, chiffrer_cbc(algorithms.Blowfish(cle_blowfish), TEXTE)),
+            "CHACHA20": (ChaCha20_Analyzer(), cle_chacha, chiffrer_chacha(cle_chacha, TEXTE)),
+            "AES-GCM": (Aes_Gcm_Analyzer(), cle_aes, nonce + AESGCM(cle_aes).encrypt(nonce, TEXTE, None)),
+            "FERNET": (FernetAnalyzer(), cle_fernet, Fernet(cle_fernet).encrypt(TEXTE)),
+        }
+
+    def tearDown(self) -> None:
+        self.dossier.cleanup()
+
+    def _ecrire(self, nom: str, donnees: bytes) -> str:
+        chemin = os.path.join(self.dossier.name, nom)
+        with open(chemin, "wb") as f:
+            f.write(donnees)
+        return chemin
+
+    def test_flux_identique_au_dechiffrement_en_memoire(self):
+        for nom, (analyzer, cle, donnees) in self.cas.items():
+            with self.subTest(algo=nom):
+                sortie = io.BytesIO()
+                # Blocs de 7 octets: aucune frontière ne coïncide avec les blocs de chiffrement ni le Base64
+                self.assertTrue(analyzer.dechiffrer_flux(io.BytesIO(donnees), len(donnees), cle, sortie, taille_bloc=7))
+                self.assertEqual(sortie.getvalue(), analyzer.dechiffrer_donnees(donnees, cle))
+
+                chemin_sortie = os.path.join(self.dossier.name, f"{nom}.txt")
+                texte, taux = analyzer.dechiffrer_vers_fichier(self._ecrire(f"{nom}.enc", donnees), cle, chemin_sortie)
+                self.assertGreater(taux, 60)
+                with open(chemin_sortie, "rb") as f:
+                    self.assertEqual(f.read(), TEXTE)
+
+    def test_contenu_altere_jamais_ecrit(self):
+        for nom in ("AES-GCM", "FERNET"):
+            analyzer, cle, donnees = self.cas[nom]
+            with self.subTest(algo=nom):
+                # Dernier octet modifié: tag GCM ou HMAC Fernet (caractère Base64) invalide
+                altere = donnees[:-2] + (b"A" if donnees[-2:-1] != b"A" else b"B") + donnees[-1:]
+                chemin_sortie = os.path.join(self.dossier.name, f"{nom}.txt")
+                self.assertEqual(analyzer.dechiffrer_vers_fichier(self._ecrire(f"{nom}.enc", altere), cle, chemin_sortie), ("", 0.0))
+                self.assertEqual(sorted(os.listdir(self.dossier.name)), [f"{nom}.enc"])
+                os.remove(os.path.join(self.dossier.name, f"{nom}.enc"))
+
+    def test_mauvaise_cle_abandonnee_sur_le_prefixe(self):
+        analyzer, _, donnees = self.cas["CHACHA20"]
+        chemin_sortie = os.path.join(self.dossier.name, "sortie.txt")
+        texte, taux = analyzer.dechiffrer_vers_fichier(self._ecrire("c.enc", donnees), os.urandom(32), chemin_sortie)
+        self.assertLessEqual(taux, 60)
+        self.assertEqual(os.listdir(self.dossier.name), ["c.enc"])
+
+    def test_memoire_constante(self):
+        cle = os.urandom(32)
+        grand_texte = TEXTE * 600  # environ 12 Mo
+        chemin = self._ecrire("grand.enc", chiffrer_chacha(cle, grand_texte))
+        del grand_texte
+        chemin_sortie = os.path.join(self.dossier.name, "grand.txt")
+
+        tracemalloc.start()
+        try:
+            _, taux = ChaCha20_Analyzer().dechiffrer_vers_fichier(chemin, cle, chemin_sortie)
+            _, pic = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertGreater(taux, 60)
+        self.assertEqual(os.path.getsize(chemin_sortie), len(TEXTE) * 600)
+        self.assertLess(pic, 8 * 1024 * 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+RACINE = Path(__file__).resolve().parents[1]
+
+# Modules lourds réservés aux attaques et à l'affichage interactif
+MODULES_DIFFERES = [
+    "cryptography.fernet",
+    "cryptography.hazmat.primitives.kdf.pbkdf2",
+    "rich.progress",
+    "rich.markdown",
+    "rich.live",
+    "rich.traceback",
+    "multiprocessing",
+    "src.attaque_parallele",
+    "src.interface_console",
+]
+
+# Modules absents après le seul import du point d'entrée (préfixes: un paquet et ses sous-modules)
+MODULES_ABSENTS_A_L_IMPORT = [
+    "cryptography.hazmat.primitives.kdf",
+    "rich.console",
+    "src.analyzers",
+]
+
+# Chargement de la ligne de commande: import du module, ou exécution du point d'entrée comme par `python main.py`
+CHARGEMENTS = {
+    "src.cli": "import src.cli",
+    "main.py": "runpy.run_path('main.py', run_name='__main__')",
+}
+
+IMPORT = """
+import json, runpy, sys
+prefixes = sys.argv[2:]
+sys.argv = ["main.py", "--help"]
+try:
+    {chargement}
+except SystemExit:
+    pass
+print(json.dumps([nom for nom in sys.modules if any(nom == p or nom.startswith(p + ".") for p in prefixes)]))
+"""
+
+# Réimport du point d'entrée par un worker d'attaque (forkserver/spawn): ni ligne de commande ni menu
+REIMPORT_WORKER = """
+import json, runpy, sys
+sys.argv = ["main.py", "mission", "data"]
+runpy.run_path("main.py", run_name="__mp_main__")
+print(json.dumps([nom for nom in ("src.cli", "src.interface_console") if nom in sys.modules]))
+"""
+
+IDENTIFICATION = """
+import io, json, sys
+from src.cli import main
+code = main(["identify", "data"], sortie=io.StringIO())
+print(json.dumps({"code": code, "modules": [nom for nom in sys.argv[1:] if nom in sys.modules]}))
+"""
+
+
+class DemarrageTests(unittest.TestCase):
+    """
+    Vérifie que la ligne de commande démarre vite: les modules lourds ne sont chargés qu'à leur première utilisation.
+    """
+
+    def setUp(self):
+        self.dossier_pycache = tempfile.TemporaryDirectory()
+        self.env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+    def tearDown(self):
+        self.dossier_pycache.cleanup()
+
+    def lancer(self, *arguments: str) -> subprocess.CompletedProcess:
+        commande = [sys.executable, "-X", f"pycache_prefix={self.dossier_pycache.name}", *arguments]
+        return subprocess.run(commande, cwd=RACINE, env=self.env, capture_output=True, text=True, check=True)
+
+    def test_import_sans_modules_lourds(self):
+        # Assertion sur les modules chargés plutôt que sur une durée, qui dépend de la machine
+        for module, chargement in CHARGEMENTS.items():
+            with self.subTest(module=module):
+                sortie = self.lancer("-c", IMPORT.format(chargement=chargement), "--", *MODULES_ABSENTS_A_L_IMPORT).stdout
+                self.assertEqual(json.loads(sortie.splitlines()[-1]), [])
+
+    def test_point_d_entree_reimporte_par_un_worker(self):
+        sortie = self.lancer("-c", REIMPORT_WORKER).stdout
+        self.assertEqual(json.loads(sortie.splitlines()[-1]), [])
+
+    def test_identification_sans_modules_lourds(self):
+        resultat = json.loads(self.lancer("-c", IDENTIFICATION, *MODULES_DIFFERES).stdout)
+
+        self.assertEqual(resultat["code"], 0)
+        self.assertEqual(resultat["modules"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
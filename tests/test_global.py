@@ -3,7 +3,7 @@ from unittest import TestCase, main
 import sys
 sys.path.append('.')
 sys.path.append('..')
-from src.utils import verifier_texte_dechiffre, calculer_entropie
+from src.utils import verifier_texte_dechiffre, calculer_entropie, percentiles
 """ 
 Ici le TestCase pour le regroupement des Cas de figures de Tests et le main pour l'exécution automatique des tests définis dans la classe ci-dessous
 
@@ -48,6 +48,10 @@ class BetaTester(TestCase):
         self.assertEqual(entropie_chaine_vide, 0)
         self.assertGreater(entropie_chaine_aleatoire, entropie_chaine_repetitive)
 
+    def test_percentiles(self) -> None:
+        self.assertEqual(percentiles(list(range(1, 101))), {"p50": 50, "p90": 90, "p99": 99})
+        self.assertEqual(percentiles([]), {})
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.key_store import KeyStore
+from src.analyzers.aes_cbc_analyzer import Aes_Cbc_Analyzer
+from src.analyzers.blowfish_analyzer import Blowfish_Analyzer
+
+
+class KeyStoreTests(unittest.TestCase):
+    """
+    Tests du conteneur compact de clés candidates (pas fixe et pas variable).
+    """
+
+    def setUp(self) -> None:
+        self.cles_fixes = [bytes([i]) * 32 for i in range(10)]
+        self.cles_variables = [b"cle", b"x" * 16, b"y" * 20, b"motdepasse"]
+
+    def test_pas_fixe_sequence(self):
+        store = KeyStore.depuis_iterable(self.cles_fixes, 32)
+        self.assertEqual(len(store), 10)
+        self.assertEqual(store[3], self.cles_fixes[3])
+        self.assertEqual(store[-1], self.cles_fixes[-1])
+        self.assertEqual(list(store), self.cles_fixes)
+        self.assertEqual(store.nbytes, 320)
+        with self.assertRaises(ValueError):
+            store.append(b"trop court")
+
+    def test_pas_variable_sequence(self):
+        store = KeyStore.depuis_iterable(self.cles_variables)
+        self.assertEqual(list(store), self.cles_variables)
+        self.assertEqual(bytes(store.vue(2)), b"y" * 20)
+        with self.assertRaises(IndexError):
+            store[4]
+
+    def test_decoupage_conserve_ordre(self):
+        for cles, taille in ((self.cles_fixes, 32), (self.cles_variables, None)):
+            store = KeyStore.depuis_iterable(cles, taille)
+            morceaux = store.decouper(3)
+            self.assertEqual([cle for morceau in morceaux for cle in morceau], cles)
+            self.assertEqual(list(store[1:3]), cles[1:3])
+
+    def test_sauvegarde_et_chargement(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            for cles, taille in ((self.cles_fixes, 32), (self.cles_variables, None)):
+                store = KeyStore.depuis_iterable(cles, taille)
+                chemin = os.path.join(dossier, "cles.ks")
+                store.sauvegarder(chemin)
+                self.assertEqual(KeyStore.charger(chemin), store)
+
+    def test_generer_cles_candidates_compact(self):
+        """
+        Le mode compact doit produire exactement les mêmes clés que la liste classique.
+        """
+        for analyzer in (Aes_Cbc_Analyzer(), Blowfish_Analyzer()):
+            liste = analyzer.generer_cles_candidates("keys/wordlist.txt")
+            store = analyzer.generer_cles_candidates("keys/wordlist.txt", compact=True)
+            self.assertIsInstance(store, KeyStore)
+            self.assertEqual(list(store), liste)
+
+
+if __name__ == "__main__":
+    unittest.main()
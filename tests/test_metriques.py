@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.attaque_parallele import MoteurAttaque
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.metriques import ETAPES, Instrumentation, Metriques
+from src.progression import SortieMuette
+
+RACINE = Path(__file__).resolve().parents[1]
+
+
+class MetriquesTests(unittest.TestCase):
+    """
+    Vérifie les chronomètres par étape et les compteurs du chemin critique, et leurs exports JSON et Prometheus.
+    """
+
+    def test_attaque_mesuree(self):
+        metriques = Metriques()
+        orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette(), metriques=metriques)
+        resultat = orchestrateur.traiter_fichier(str(RACINE / "data" / "mission2.enc"), str(RACINE / "keys" / "wordlist.txt"))
+
+        self.assertEqual(resultat.algo, "CHACHA20")
+        self.assertEqual(metriques.compteurs["cles_testees"], resultat.nb_tentatives)
+        taille = (RACINE / "data" / "mission2.enc").stat().st_size
+        self.assertEqual(metriques.compteurs["octets_dechiffres"], resultat.nb_tentatives * taille)
+        for etape in ("lecture", "identification", "derivation", "dechiffrement", "validation"):
+            self.assertGreater(metriques.passages[etape], 0, etape)
+            self.assertGreater(metriques.durees_ns[etape], 0, etape)
+
+    def test_derivation_hors_cache(self):
+        metriques = Metriques()
+        orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette(), metriques=metriques)
+        analyzer = orchestrateur.analyzers["CHACHA20"]
+        wordlist = str(RACINE / "keys" / "wordlist.txt")
+        orchestrateur.cles_candidates(analyzer, wordlist)
+        passages = metriques.passages["derivation"]
+
+        # Les clés servies par le cache ne sont pas une dérivation
+        orchestrateur.cles_candidates(analyzer, wordlist)
+        self.assertEqual(passages, 1)
+        self.assertEqual(metriques.passages["derivation"], passages)
+
+    def test_cles_rejetees(self):
+        moteur = MoteurAttaque(1)
+        moteur.metriques = Metriques()
+        analyzer = DetecteurCryptoOrchestrateur().analyzers["CHACHA20"]
+        moteur.rechercher(analyzer, os.urandom(64), [os.urandom(32) for _ in range(6)], exclues=bytes([1, 0, 1, 0, 0, 0]))
+
+        self.assertEqual(moteur.metriques.compteurs["cles_rejetees"], 2)
+        self.assertEqual(moteur.metriques.compteurs["cles_testees"], 4)
+
+    def test_instrumentation_inactive(self):
+        orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette())
+        self.assertIs(type(orchestrateur.metriques), Instrumentation)
+        self.assertIs(orchestrateur.metriques.etape("lecture"), orchestrateur.metriques.etape("validation"))
+
+    def test_exports(self):
+        metriques = Metriques()
+        metriques.ajouter_duree("lecture", 1_500_000)
+        metriques.compter("cles_testees", 42)
+
+        with tempfile.TemporaryDirectory() as dossier:
+            metriques.exporter(os.path.join(dossier, "metriques.json"))
+            metriques.exporter(os.path.join(dossier, "metriques.prom"))
+            instantane = json.loads(Path(dossier, "metriques.json").read_text(encoding="utf-8"))
+            prometheus = Path(dossier, "metriques.prom").read_text(encoding="utf-8")
+
+        self.assertEqual(set(instantane["etapes"]), set(ETAPES))
+        self.assertEqual(instantane["etapes"]["lecture"], {"secondes": 0.0015, "passages": 1})
+        self.assertEqual(instantane["compteurs"]["cles_testees"], 42)
+        self.assertIn('cryptoforensic_etape_secondes_total{etape="lecture"} 0.001500000', prometheus)
+        self.assertIn("# TYPE cryptoforensic_cles_testees_total counter\ncryptoforensic_cles_testees_total 42\n", prometheus)
+
+    def test_export_manque_sans_fichier_temporaire(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            with mock.patch("src.metriques.os.replace", side_effect=OSError("disque plein")):
+                with self.assertRaises(OSError):
+                    Metriques().exporter(os.path.join(dossier, "metriques.json"))
+            self.assertEqual(os.listdir(dossier), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import sys
+import unittest
+from pathlib import Path
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur, ResultatAnalyse
+from src.mission_concurrente import executer_mission_concurrente
+
+
+class MissionConcurrenteTests(unittest.TestCase):
+    """
+    Vérifie que le mode concurrent donne les mêmes résultats que le traitement fichier par fichier,
+    dans un ordre déterministe.
+    """
+
+    def setUp(self) -> None:
+        self.dossier_data = Path("data")
+        self.wordlist = "keys/wordlist.txt"
+        if not self.dossier_data.exists():
+            self.skipTest("Dossier data/ introuvable.")
+        self.chemins = [str(p) for p in sorted(self.dossier_data.glob("*.enc"))]
+
+    def test_resultats_ordonnes_et_identiques(self):
+        recus: list[int] = []
+        resultats = executer_mission_concurrente(self.chemins, self.wordlist, 2, lambda i, r: recus.append(i))
+
+        self.assertEqual(sorted(recus), list(range(len(self.chemins))))
+        self.assertEqual(len(resultats), len(self.chemins))
+
+        orchestrateur = DetecteurCryptoOrchestrateur()
+        for chemin, resultat in zip(self.chemins, resultats):
+            self.assertIsInstance(resultat, ResultatAnalyse)
+            attendu = orchestrateur.traiter_fichier(chemin, self.wordlist)
+            self.assertEqual((resultat.algo, resultat.cle, resultat.texte_dechiffre), (attendu.algo, attendu.cle, attendu.texte_dechiffre))
+
+    def test_liste_vide(self):
+        self.assertEqual(executer_mission_concurrente([], self.wordlist), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.attaque_parallele import contexte_processus
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur, ResultatAnalyse
+from src.mission_concurrente import _RelaisPointsReprise, _relever_avancees
+from src.points_reprise import PointsReprise
+from src.progression import SortieMuette
+from tests.chiffrement import chiffrer_aes_cbc
+
+RACINE = Path(__file__).resolve().parents[1]
+
+
+class MissionFluxTests(unittest.TestCase):
+    """
+    Vérifie la mission au fil de l'eau: résultats produits fichier par fichier, rapports ajoutés
+    au fur et à mesure et statistiques seules conservées sur demande.
+    """
+
+    def setUp(self):
+        self.dossier = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dossier)
+        for nom in ("mission2.enc", "mission5.enc"):
+            shutil.copy(RACINE / "data" / nom, self.dossier)
+        # Contenu identique à mission5.enc: attaqué une seule fois
+        shutil.copy(RACINE / "data" / "mission5.enc", Path(self.dossier) / "mission6.enc")
+        self.orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette())
+        self.wordlist = str(RACINE / "keys" / "wordlist.txt")
+
+    def test_resultats_et_rapports_au_fil_de_l_eau(self):
+        with mock.patch("src.detecteur_crypto.rapport_mission") as rapport:
+            flux = self.orchestrateur.mission_flux(self.dossier, self.wordlist)
+            premier = next(flux)
+            # Le rapport du premier fichier est écrit avant le traitement du suivant
+            self.assertEqual(premier.algo, "CHACHA20")
+            self.assertEqual(rapport.return_value.generer_rapport_synthese.call_count, 1)
+            suivants = list(flux)
+
+        self.assertEqual([resultat.algo for resultat in suivants], ["FERNET", "FERNET"])
+        self.assertEqual(suivants[1].texte_dechiffre, suivants[0].texte_dechiffre)
+        self.assertEqual(suivants[1].nb_tentatives, 0)
+        self.assertEqual(rapport.return_value.generer_rapport_synthese.call_count, 3)
+        self.assertEqual(len(self.orchestrateur.missions_completees[0]["resultats"]), 3)
+
+    def test_statistiques_seules(self):
+        with mock.patch("src.detecteur_crypto.rapport_mission"):
+            nb_resultats = sum(1 for _ in self.orchestrateur.mission_flux(self.dossier, self.wordlist, statistiques_seules=True))
+
+        self.assertEqual(nb_resultats, 3)
+        self.assertEqual(self.orchestrateur.statistiques_globales["total_fichiers"], 3)
+        self.assertEqual(self.orchestrateur.statistiques_globales["fichiers_dechiffres"], 3)
+        self.assertGreater(self.orchestrateur.statistiques_globales["tentatives_total"], 0)
+        self.assertNotIn("resultats", self.orchestrateur.missions_completees[0])
+        self.assertEqual(self.orchestrateur.missions_completees[0]["nb_fichiers"], 3)
+
+    def test_arret_de_l_iteration(self):
+        with mock.patch("src.detecteur_crypto.rapport_mission"):
+            flux = self.orchestrateur.mission_flux(self.dossier, self.wordlist)
+            next(flux)
+            flux.close()
+
+        self.assertEqual(self.orchestrateur.statistiques_globales["total_fichiers"], 1)
+        self.assertEqual(self.orchestrateur.missions_completees[0]["nb_fichiers"], 1)
+
+    def test_mission_concurrente(self):
+        with mock.patch("src.detecteur_crypto.rapport_mission") as rapport:
+            resultats = list(self.orchestrateur.mission_flux(self.dossier, self.wordlist, concurrente=True, nb_workers=2))
+
+        par_fichier = {resultat.fichier: resultat for resultat in resultats}
+        self.assertEqual(sorted(par_fichier), ["mission2.enc", "mission5.enc", "mission6.enc"])
+        self.assertEqual([par_fichier[nom].algo for nom in sorted(par_fichier)], ["CHACHA20", "FERNET", "FERNET"])
+        # Contenu identique: une seule attaque, le second fichier reçoit une copie du résultat
+        self.assertEqual(par_fichier["mission6.enc"].nb_tentatives, 0)
+        self.assertEqual(par_fichier["mission6.enc"].texte_dechiffre, par_fichier["mission5.enc"].texte_dechiffre)
+        self.assertEqual(rapport.return_value.generer_rapport_synthese.call_count, 3)
+        self.assertEqual(self.orchestrateur.statistiques_globales["fichiers_dechiffres"], 3)
+
+    def test_rapports_concurrents_dans_l_ordre_des_fichiers(self):
+        def achevement_inverse(chemins, chemin_dictionnaire, nb_workers=0, *memoires):
+            # Le dernier fichier se termine le premier
+            for index in reversed(range(len(chemins))):
+                yield index, ResultatAnalyse("FERNET", b"cle", 1.0, "texte", 0.0, 1, os.path.basename(chemins[index]), 90.0)
+
+        with mock.patch("src.mission_concurrente.iterer_mission_concurrente", achevement_inverse), \
+             mock.patch("src.detecteur_crypto.rapport_mission") as rapport:
+            resultats = list(self.orchestrateur.mission_flux(self.dossier, self.wordlist, concurrente=True))
+
+        # Résultats produits dans l'ordre d'achèvement, rapports écrits dans l'ordre des fichiers
+        self.assertEqual([resultat.fichier for resultat in resultats], ["mission5.enc", "mission6.enc", "mission2.enc"])
+        rapports = [appel.args[0]["fichier"] for appel in rapport.return_value.generer_rapport_synthese.call_args_list]
+        self.assertEqual(rapports, ["mission2.enc", "mission5.enc", "mission6.enc"])
+
+    def test_mission_concurrente_reprise(self):
+        fichier_reprise = str(Path(self.dossier) / "reprise.json")
+        orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette(), fichier_reprise=fichier_reprise)
+        empreinte = PointsReprise.empreinte((RACINE / "data" / "mission2.enc").read_bytes())
+        source = orchestrateur.source_candidates(orchestrateur.analyzers["CHACHA20"], self.wordlist)
+        # La clé de mission2.enc est la quatrième du dictionnaire: une frontière à 4 la déclare déjà testée,
+        # un worker qui repart de ce point de reprise ne la retrouve donc pas
+        orchestrateur.points_reprise.avancer(empreinte, "CHACHA20", source, 4)
+
+        with mock.patch("src.detecteur_crypto.rapport_mission"):
+            resultats = list(orchestrateur.mission_flux(self.dossier, self.wordlist, concurrente=True, nb_workers=2))
+
+        par_fichier = {resultat.fichier: resultat for resultat in resultats}
+        self.assertEqual(par_fichier["mission2.enc"].cle, b"")
+        self.assertEqual(par_fichier["mission5.enc"].algo, "FERNET")
+        # Attaques achevées dans les workers: le processus principal a effacé leurs points de reprise
+        self.assertEqual(len(PointsReprise(fichier_reprise)), 0)
+
+    def test_workers_avec_trousseau_et_cache_negatif(self):
+        dossier_cache_negatif = str(Path(self.dossier) / "negatif")
+        orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette(), dossier_cache_negatif=dossier_cache_negatif)
+        # Clé FERNET retrouvée plus tôt dans la session
+        cle_fernet = orchestrateur.traiter_fichier(str(RACINE / "data" / "mission5.enc"), self.wordlist).cle
+        with open(Path(self.dossier) / "inconnu.enc", "wb") as f:
+            f.write(chiffrer_aes_cbc(os.urandom(32), b"Bonjour, le monde est grand et la nuit est calme. " * 4))
+
+        with mock.patch("src.detecteur_crypto.rapport_mission"):
+            premiers = list(orchestrateur.mission_flux(self.dossier, self.wordlist, concurrente=True, nb_workers=2))
+            seconds = list(orchestrateur.mission_flux(self.dossier, self.wordlist, concurrente=True, nb_workers=2))
+
+        premiers = {resultat.fichier: resultat for resultat in premiers}
+        seconds = {resultat.fichier: resultat for resultat in seconds}
+        # Clé du trousseau essayée en premier par le worker
+        self.assertEqual(premiers["mission5.enc"].cle, cle_fernet)
+        self.assertEqual(premiers["mission5.enc"].nb_tentatives, 1)
+        # Clé retrouvée par un worker, rendue au trousseau de la session
+        self.assertIn(("CHACHA20", premiers["mission2.enc"].cle), [(algo, cle) for algo, cle, _ in orchestrateur.trousseau.instantane()])
+        # Mots déjà essayés sans succès au premier run: au second, seules des clés du trousseau sont essayées
+        self.assertGreater(premiers["inconnu.enc"].nb_tentatives, len(orchestrateur.trousseau))
+        self.assertLessEqual(seconds["inconnu.enc"].nb_tentatives, len(orchestrateur.trousseau))
+
+    def test_relais_des_avancees(self):
+        points = PointsReprise(str(Path(self.dossier) / "reprise.json"), intervalle=3600)
+        points.avancer("abc", "FERNET", "src", 128)
+        file = contexte_processus().SimpleQueue()
+        relais = _RelaisPointsReprise(points.instantane(), file)
+        self.assertEqual(relais.position("abc", "FERNET", "src"), 128)
+
+        relais.avancer("def", "CHACHA20", "src", 64)
+        relais.terminer("abc", "FERNET", "src")
+        relais.sauvegarder()
+        # Le worker n'écrit jamais le fichier d'état
+        self.assertFalse(os.path.exists(points.chemin))
+
+        _relever_avancees(file, points)
+        self.assertEqual(points.position("def", "CHACHA20", "src"), 64)
+        self.assertEqual(points.position("abc", "FERNET", "src"), 0)
+
+    def test_modes_incompatibles(self):
+        with self.assertRaises(ValueError):
+            self.orchestrateur.mission_complete_automatique(self.dossier, self.wordlist, concurrente=True, groupee=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
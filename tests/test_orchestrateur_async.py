@@ -0,0 +1,102 @@
+import asyncio
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.orchestrateur_async import OrchestrateurAsync
+
+RACINE = Path(__file__).resolve().parents[1]
+
+
+class OrchestrateurAsyncTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Vérifie la façade asyncio: identification, attaque, mission au fil de l'eau et annulation.
+    """
+
+    async def asyncSetUp(self):
+        self.orchestrateur = OrchestrateurAsync(concurrence=2, chemin_dictionnaire=str(RACINE / "keys" / "wordlist.txt"))
+
+    async def asyncTearDown(self):
+        self.orchestrateur.fermer()
+
+    async def test_identifier_bytes(self):
+        scores = await self.orchestrateur.identifier((RACINE / "data" / "mission5.enc").read_bytes())
+        self.assertEqual(max(scores, key=scores.get), "FERNET")
+
+    async def test_attaquer(self):
+        resultat = await self.orchestrateur.attaquer(str(RACINE / "data" / "mission2.enc"))
+        self.assertEqual(resultat.algo, "CHACHA20")
+        self.assertTrue(resultat.texte_dechiffre)
+
+    async def test_mission_au_fil_de_l_eau(self):
+        resultats = {os.path.basename(chemin): resultat async for chemin, resultat in self.orchestrateur.mission(str(RACINE / "data"))}
+
+        self.assertEqual(sorted(resultats), [f"mission{i}.enc" for i in range(1, 6)])
+        self.assertEqual(resultats["mission5.enc"].algo, "FERNET")
+
+    def dictionnaire_chacha(self, generateur: random.Random) -> str:
+        # Dictionnaire au format des indices ChaCha20: sur un texte chiffré aléatoire, aucune clé ne convient
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write("\n".join("2024" + "".join(generateur.choices(string.ascii_lowercase, k=8)) for _ in range(20_000)))
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    async def test_annulation_arrete_la_recherche(self):
+        generateur = random.Random(0)
+        dictionnaire = self.dictionnaire_chacha(generateur)
+
+        dechiffrer = mock.patch.object(ChaCha20_Analyzer, "dechiffrer_donnees", autospec=True,
+                                       side_effect=ChaCha20_Analyzer.dechiffrer_donnees)
+        with dechiffrer as essais:
+            tache = asyncio.ensure_future(self.orchestrateur.attaquer(generateur.randbytes(512), "CHACHA20", dictionnaire))
+            # Annulation dès que la recherche a commencé
+            while essais.call_count == 0 and not tache.done():
+                await asyncio.sleep(0.01)
+            tache.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await tache
+            # La recherche s'est arrêtée avant d'épuiser le dictionnaire, et plus aucune clé n'est essayée
+            nb_essais = essais.call_count
+            self.assertLess(nb_essais, 20_000)
+            await asyncio.sleep(0.1)
+            self.assertEqual(essais.call_count, nb_essais)
+
+        # Le fil est libéré: une nouvelle opération est servie
+        scores = await self.orchestrateur.identifier(str(RACINE / "data" / "mission5.enc"))
+        self.assertEqual(max(scores, key=scores.get), "FERNET")
+
+    async def test_annulation_pendant_la_derivation(self):
+        generateur = random.Random(1)
+        dictionnaire = self.dictionnaire_chacha(generateur)
+
+        def deriver_lentement(analyzer, mot):
+            time.sleep(0.005)
+            return ChaCha20_Analyzer.deriver_cles(analyzer, mot)
+
+        # Dérivation complète: une centaine de secondes
+        with mock.patch.object(ChaCha20_Analyzer, "deriver_cles", autospec=True, side_effect=deriver_lentement) as deriver:
+            tache = asyncio.ensure_future(self.orchestrateur.attaquer(generateur.randbytes(512), "CHACHA20", dictionnaire))
+            while deriver.call_count == 0 and not tache.done():
+                await asyncio.sleep(0.01)
+            tache.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await tache
+            # Dérivation interrompue avec la recherche: aucun mot dérivé après l'annulation
+            nb_derivations = deriver.call_count
+            self.assertLess(nb_derivations, 20_000)
+            await asyncio.sleep(0.1)
+            self.assertEqual(deriver.call_count, nb_derivations)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+import os
+import string
+import sys
+import tempfile
+import time
+import unittest
+from functools import lru_cache
+from itertools import islice, product
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.ordonnanceur import OrdonnanceurAttaques
+from src.points_reprise import PointsReprise
+from src.utils import evaluer_dechiffrement, est_dechiffrement_reussi
+
+
+@lru_cache(maxsize=None)
+def leurres(chemin: str = "data/mission2.enc") -> tuple:
+    """
+        Leurres ChaCha20 parmi "2024aaaa", "2024aaab", ... sans les faux positifs: sur des octets aléatoires, quelques
+        mots donnent un texte jugé plausible et arrêteraient la recherche avant la clé de référence.
+    """
+    analyzer = DetecteurCryptoOrchestrateur().analyzers["CHACHA20"]
+    mots = ["2024" + "".join(lettres) for lettres in islice(product(string.ascii_lowercase, repeat=4), 20000)]
+    with open(chemin, "rb") as f:
+        donnees = f.read()
+    with tempfile.TemporaryDirectory() as dossier:
+        source = os.path.join(dossier, "leurres.txt")
+        with open(source, "w", encoding="utf-8") as f:
+            f.writelines(mot + "\n" for mot in mots)
+        cles = analyzer.generer_cles_candidates(source)
+    return tuple(mot for mot, cle in zip(mots, cles)
+                 if not est_dechiffrement_reussi(*evaluer_dechiffrement(analyzer.dechiffrer_donnees(donnees, cle))))
+
+
+def ecrire_dictionnaire(dossier: str, reference: str = "keys/wordlist.txt") -> str:
+    """
+        Dictionnaire des leurres ChaCha20, suivis du dictionnaire de référence s'il est donné.
+    """
+    dictionnaire = os.path.join(dossier, "wordlist.txt")
+    with open(dictionnaire, "w", encoding="utf-8") as f:
+        f.writelines(mot + "\n" for mot in leurres())
+        if reference is not None:
+            with open(reference, "r", encoding="utf-8") as source:
+                f.write(source.read())
+    return dictionnaire
+
+
+class OrdonnanceurAttaquesTests(unittest.TestCase):
+    """
+    Vérifie le comptage des candidates, l'ordre par gain attendu et le respect des budgets.
+    """
+
+    def setUp(self) -> None:
+        self.wordlist = "keys/wordlist.txt"
+        self.chemins = [str(p) for p in sorted(Path("data").glob("*.enc"))]
+        if not self.chemins:
+            self.skipTest("Dossier data/ introuvable.")
+        self.orchestrateur = DetecteurCryptoOrchestrateur()
+
+    def test_comptage_sans_derivation(self):
+        for nom_algo, analyzer in self.orchestrateur.analyzers.items():
+            self.assertEqual(analyzer.compter_cles_candidates(self.wordlist), len(analyzer.generer_cles_candidates(self.wordlist)), nom_algo)
+
+    def test_ordre_par_gain_attendu(self):
+        ordonnanceur = OrdonnanceurAttaques(self.orchestrateur, self.wordlist)
+        taches = ordonnanceur.planifier(self.chemins)
+        priorites = [tache.priorite(False) for tache in taches]
+        self.assertEqual(priorites, sorted(priorites, reverse=True))
+
+        resultats = ordonnanceur.executer(taches)
+        self.assertTrue(all(resultat.taux_succes > 60 for resultat in resultats.values()))
+        self.assertEqual(ordonnanceur.restes, {})
+
+    def test_budget_laisse_l_espace_restant(self):
+        chemin = "data/mission2.enc"
+        with tempfile.TemporaryDirectory() as dossier:
+            # Près de 20000 leurres ChaCha20 avant le dictionnaire de référence
+            dictionnaire = ecrire_dictionnaire(dossier, self.wordlist)
+
+            ordonnanceur = OrdonnanceurAttaques(self.orchestrateur, dictionnaire, budget_mission=0.05)
+            # Clés dérivées à l'avance: le budget ne porte que sur l'attaque
+            self.orchestrateur.cache_candidats.obtenir(self.orchestrateur.analyzers["CHACHA20"], dictionnaire)
+            taches = [tache for tache in ordonnanceur.planifier([chemin]) if tache.algo == "CHACHA20"]
+            ordonnanceur.executer(taches)
+            reste = ordonnanceur.restes.get((os.path.abspath(chemin), "CHACHA20"))
+            self.assertIsNotNone(reste)
+            self.assertGreater(reste, 0)
+
+            ordonnanceur.budget_mission = None
+            reprise = ordonnanceur.planifier([chemin], reprendre=True)
+            self.assertEqual([(tache.algo, tache.debut) for tache in reprise], [("CHACHA20", reste)])
+
+    def test_budget_couvre_la_derivation(self):
+        chemin = "data/mission2.enc"
+        with tempfile.TemporaryDirectory() as dossier:
+            dictionnaire = ecrire_dictionnaire(dossier, self.wordlist)
+            ordonnanceur = OrdonnanceurAttaques(self.orchestrateur, dictionnaire, budget_fichier=0.5)
+            taches = [tache for tache in ordonnanceur.planifier([chemin]) if tache.algo == "CHACHA20"]
+
+            def deriver_lentement(analyzer, mot):
+                time.sleep(0.005)
+                return ChaCha20_Analyzer.deriver_cles(analyzer, mot)
+
+            # Dérivation lente et clés absentes du cache: l'espace complet demanderait plus d'une minute
+            with mock.patch.object(ChaCha20_Analyzer, "deriver_cles", autospec=True, side_effect=deriver_lentement) as deriver:
+                debut = time.monotonic()
+                ordonnanceur.executer(taches)
+                duree = time.monotonic() - debut
+                reste = ordonnanceur.restes[(os.path.abspath(chemin), "CHACHA20")]
+                # Seuls les mots parcourus avant l'échéance ont été dérivés: la frontière de dérivation est la reprise
+                self.assertEqual(deriver.call_count, reste)
+                self.assertLess(reste, len(leurres()))
+                self.assertLess(duree, 5.0)
+
+                # Nouvelle session reprenant à la frontière: les mots antérieurs ne sont pas dérivés
+                suivant = OrdonnanceurAttaques(DetecteurCryptoOrchestrateur(), dictionnaire, budget_fichier=0.5)
+                suivant.restes = dict(ordonnanceur.restes)
+                reprise = suivant.planifier([chemin], reprendre=True)
+                deriver.reset_mock()
+                suivant.executer(reprise)
+                self.assertEqual(deriver.call_args_list[0].args[1], leurres()[reste])
+
+    def test_restes_persistes(self):
+        chemin = "data/mission2.enc"
+        with tempfile.TemporaryDirectory() as dossier:
+            dictionnaire = ecrire_dictionnaire(dossier, self.wordlist)
+            fichier_reprise = os.path.join(dossier, "reprise.json")
+
+            orchestrateur = DetecteurCryptoOrchestrateur(fichier_reprise=fichier_reprise)
+            ordonnanceur = OrdonnanceurAttaques(orchestrateur, dictionnaire, budget_mission=0.05)
+            orchestrateur.cache_candidats.obtenir(orchestrateur.analyzers["CHACHA20"], dictionnaire)
+            ordonnanceur.executer([tache for tache in ordonnanceur.planifier([chemin]) if tache.algo == "CHACHA20"])
+            reste = ordonnanceur.restes[(os.path.abspath(chemin), "CHACHA20")]
+
+            # Nouveau run: l'espace de clés restant est relu depuis le fichier de reprise
+            suivant = OrdonnanceurAttaques(DetecteurCryptoOrchestrateur(fichier_reprise=fichier_reprise), dictionnaire)
+            self.assertTrue(suivant.en_attente(chemin))
+            reprise = suivant.planifier([chemin], reprendre=True)
+            self.assertEqual([(tache.algo, tache.debut) for tache in reprise], [("CHACHA20", reste)])
+            suivant.executer(reprise)
+            self.assertFalse(suivant.en_attente(chemin))
+
+    def test_points_de_reprise_tenus_pendant_la_tache(self):
+        chemin = "data/mission2.enc"
+        with tempfile.TemporaryDirectory() as dossier:
+            dictionnaire = ecrire_dictionnaire(dossier, self.wordlist)
+            orchestrateur = DetecteurCryptoOrchestrateur(fichier_reprise=os.path.join(dossier, "reprise.json"))
+            ordonnanceur = OrdonnanceurAttaques(orchestrateur, dictionnaire)
+            taches = [tache for tache in ordonnanceur.planifier([chemin]) if tache.algo == "CHACHA20"]
+            with mock.patch.object(PointsReprise, "avancer", autospec=True, side_effect=PointsReprise.avancer) as avancer:
+                resultats = ordonnanceur.executer(taches)
+
+        self.assertGreater(resultats[chemin].taux_succes, 60)
+        # Frontières enregistrées au fil de la recherche, pas seulement à la fin de la tâche
+        frontieres = [appel.args[4] for appel in avancer.call_args_list]
+        self.assertGreater(len(frontieres), 10)
+        self.assertEqual(frontieres, sorted(frontieres))
+        self.assertEqual(len(orchestrateur.points_reprise), 0)
+
+    def test_cache_negatif_et_trousseau(self):
+        chemin = "data/mission2.enc"
+        with tempfile.TemporaryDirectory() as dossier:
+            # Leurres seuls: la clé n'est pas dans ce dictionnaire
+            dictionnaire = ecrire_dictionnaire(dossier, None)
+            orchestrateur = DetecteurCryptoOrchestrateur(dossier_cache_negatif=os.path.join(dossier, "negatif"))
+            tentatives = []
+            for _ in range(2):
+                ordonnanceur = OrdonnanceurAttaques(orchestrateur, dictionnaire)
+                taches = [tache for tache in ordonnanceur.planifier([chemin]) if tache.algo == "CHACHA20"]
+                tentatives.append(ordonnanceur.executer(taches)[chemin].nb_tentatives)
+
+            # Mots essayés sans succès au premier run: sautés au second
+            self.assertEqual(tentatives, [len(leurres()), 0])
+
+            # Clé retrouvée par une attaque planifiée: ajoutée au trousseau
+            ordonnanceur = OrdonnanceurAttaques(orchestrateur, self.wordlist)
+            resultat = ordonnanceur.executer([tache for tache in ordonnanceur.planifier([chemin]) if tache.algo == "CHACHA20"])[chemin]
+            self.assertIn(("CHACHA20", resultat.cle), [(algo, cle) for algo, cle, _ in orchestrateur.trousseau.instantane()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.attaque_parallele import MoteurAttaque
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.points_reprise import PointsReprise
+from tests.chiffrement import chiffrer_chacha
+
+
+class PointsRepriseTests(unittest.TestCase):
+    """
+    Vérifie l'enregistrement limité dans le temps des frontières et la reprise d'une attaque.
+    """
+
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "reprise.json")
+
+    def tearDown(self) -> None:
+        self.dossier.cleanup()
+
+    def test_ecritures_limitees_et_atomiques(self):
+        points = PointsReprise(self.chemin, intervalle=3600)
+        points.avancer("abc", "CHACHA20", "src", 256)
+        # Intervalle non écoulé: rien n'est encore écrit
+        self.assertFalse(os.path.exists(self.chemin))
+        points.sauvegarder()
+        self.assertEqual(PointsReprise(self.chemin).position("abc", "CHACHA20", "src"), 256)
+        self.assertEqual(PointsReprise(self.chemin).position("abc", "CHACHA20", "autre source"), 0)
+        self.assertFalse(os.path.exists(self.chemin + ".tmp"))
+
+        points.terminer("abc", "CHACHA20", "src")
+        self.assertEqual(len(PointsReprise(self.chemin)), 0)
+
+    def test_fichier_corrompu_ignore(self):
+        with open(self.chemin, "w", encoding="utf-8") as f:
+            f.write("{pas du json")
+        self.assertEqual(len(PointsReprise(self.chemin)), 0)
+
+    def test_reprise_depuis_la_frontiere(self):
+        cle = hashlib.sha256(b"2024secret").digest()
+        donnees = chiffrer_chacha(cle, b"Bonjour, le monde est grand. " * 8, nonce=b"\x01" * 12)
+        cles = [bytes(32)] * 600 + [cle]
+
+        points = PointsReprise(self.chemin, intervalle=0)
+        frontieres = []
+        MoteurAttaque(1, taille_lot=64).rechercher(ChaCha20_Analyzer(), donnees, cles[:600], progression=frontieres.append)
+        self.assertEqual(frontieres, sorted(frontieres))
+        points.avancer(points.empreinte(donnees), "CHACHA20", "src", frontieres[-1])
+
+        debut = PointsReprise(self.chemin).position(points.empreinte(donnees), "CHACHA20", "src")
+        self.assertEqual(debut, frontieres[-1])
+        resultat = MoteurAttaque(1).rechercher(ChaCha20_Analyzer(), donnees, cles, debut)
+        self.assertEqual(resultat.index, 600)
+        self.assertEqual(resultat.nb_testees, 600 - debut + 1)
+
+    def test_frontiere_contigue_en_parallele(self):
+        frontieres = []
+        cles = [bytes(32)] * 1000
+        donnees = b"\x01" * 12 + b"\x00" * 64
+        MoteurAttaque(2, taille_lot=64, seuil_parallele=1).rechercher(ChaCha20_Analyzer(), donnees, cles, progression=frontieres.append)
+        self.assertEqual(frontieres, sorted(frontieres))
+        self.assertEqual(frontieres[-1], len(cles))
+
+    def test_attaque_manuelle_efface_son_point_de_reprise(self):
+        if not os.path.exists("data/mission2.enc"):
+            self.skipTest("Fichier de mission introuvable.")
+        orchestrateur = DetecteurCryptoOrchestrateur(fichier_reprise=self.chemin)
+        resultat = orchestrateur.attaque_dictionnaire_manuelle("data/mission2.enc", "CHACHA20", "keys/wordlist.txt")
+        self.assertGreater(resultat.taux_succes, 60)
+        self.assertEqual(len(PointsReprise(self.chemin)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
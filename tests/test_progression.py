@@ -0,0 +1,81 @@
+import io
+import json
+import sys
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.progression import SortieJsonLignes, SortieMuette, SortieRich, SortieTexte
+
+
+class SortiesProgressionTests(unittest.TestCase):
+    """
+    Vérifie les sorties de progression et qu'une mission sans affichage ne dort jamais.
+    """
+
+    def test_json_lignes(self):
+        flux = io.StringIO()
+        sortie = SortieJsonLignes(flux)
+        tache = sortie.add_task("Analyse", total=10)
+        sortie.update(tache, description="Étape", advance=5)
+        sortie.remove_task(tache)
+
+        evenements = [json.loads(ligne) for ligne in flux.getvalue().splitlines()]
+        self.assertEqual([e["evenement"] for e in evenements], ["debut", "avance", "fin"])
+        self.assertEqual({e["tache"] for e in evenements}, {tache})
+        self.assertEqual(evenements[1]["avance"], 5)
+        self.assertEqual(evenements[1]["description"], "Étape")
+
+    def test_messages(self):
+        flux_json, flux_texte = io.StringIO(), io.StringIO()
+        SortieJsonLignes(flux_json).message("[bold green]mission2.enc: CHACHA20 ✅[/bold green]", style=True)
+        SortieTexte(flux_texte).message("[bold red]mission1.enc[/bold red]", style=True)
+        SortieTexte(flux_texte).message("Clé: b'[x]'")
+
+        evenement = json.loads(flux_json.getvalue())
+        self.assertEqual((evenement["evenement"], evenement["texte"]), ("message", "mission2.enc: CHACHA20 ✅"))
+        # Balises de style retirées, texte sans style laissé tel quel
+        self.assertEqual(flux_texte.getvalue(), "mission1.enc\nClé: b'[x]'\n")
+
+    def test_rich_rafraichissement_limite(self):
+        progress = mock.MagicMock()
+        with mock.patch("src.progression.time.monotonic", return_value=100.0):
+            sortie = SortieRich(intervalle=1.0, progress=progress)
+            tache = sortie.add_task("Analyse")
+            for _ in range(50):
+                sortie.update(tache, advance=1)
+        self.assertEqual(progress.update.call_count, 50)
+        # Un seul rafraîchissement: à la création de la tâche, les mises à jour suivantes tombent dans l'intervalle
+        self.assertEqual(progress.refresh.call_count, 1)
+
+    def test_mission_sans_affichage_ne_dort_pas(self):
+        if not Path("data").exists():
+            self.skipTest("Dossier data/ introuvable.")
+        flux = io.StringIO()
+        orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieJsonLignes(flux))
+        with mock.patch("time.sleep", side_effect=AssertionError("time.sleep appelé")), \
+                mock.patch("src.detecteur_crypto.rapport_mission"), redirect_stdout(io.StringIO()) as sortie_standard:
+            resultats = orchestrateur.mission_complete_automatique("data", "keys/wordlist.txt")
+
+        self.assertEqual(len(resultats), len(list(Path("data").glob("*.enc"))))
+        self.assertTrue(all(resultat.taux_succes > 60 for resultat in resultats))
+        evenements = [json.loads(ligne) for ligne in flux.getvalue().splitlines()]
+        self.assertTrue(any(e["evenement"] == "fin" for e in evenements))
+        # Les messages de l'orchestrateur passent par la sortie, pas par la sortie standard
+        self.assertTrue(any(e["evenement"] == "message" for e in evenements))
+        self.assertEqual(sortie_standard.getvalue(), "")
+
+    def test_sortie_muette_et_progress_absente(self):
+        orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette())
+        with mock.patch("time.sleep", side_effect=AssertionError("time.sleep appelé")):
+            resultats = orchestrateur.analyser_fichier_specifique("mission1.enc", None, None, False, 1)
+        self.assertEqual(resultats[0].algo, "AES-256-CBC")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.progression import SortieMuette
+from src.rapport_mission import rapport_mission
+from src.registre_analyzers import ANALYZERS_INTEGRES, DescriptionAnalyzer, RegistreAnalyzers
+
+RACINE = Path(__file__).resolve().parents[1]
+
+
+def entree_tierce(nom: str, resultat):
+    entree = mock.Mock()
+    entree.name = nom
+    if isinstance(resultat, Exception):
+        entree.load.side_effect = resultat
+    else:
+        entree.load.return_value = resultat
+    return entree
+
+
+class RegistreAnalyzersTests(unittest.TestCase):
+    """
+    Vérifie le registre: métadonnées lues sans import, analyzers chargés à la demande et entry points tiers.
+    """
+
+    def test_descriptions_integrees(self):
+        registre = RegistreAnalyzers(decouverte=False)
+
+        self.assertEqual(list(registre), ["AES-256-CBC", "CHACHA20", "BLOWFISH", "AES-GCM", "FERNET"])
+        # Le préfiltre de chaque analyzer est tiré de la signature du registre
+        for description in ANALYZERS_INTEGRES:
+            self.assertEqual(description.classes_alphabet, registre[description.nom]._CLASSES_ALPHABET, description.nom)
+
+    def test_chargement_a_la_demande(self):
+        orchestrateur = DetecteurCryptoOrchestrateur(registre=RegistreAnalyzers(decouverte=False))
+
+        scores = orchestrateur.scorer_fichier(str(RACINE / "data" / "mission5.enc"))
+
+        self.assertEqual(max(scores, key=scores.get), "FERNET")
+        self.assertEqual([nom for nom in orchestrateur.analyzers if orchestrateur.analyzers.est_charge(nom)], ["FERNET"])
+
+    def test_decouverte_entry_points(self):
+        tiers = DescriptionAnalyzer("CHACHA20-TIERS", "src.analyzers.chacha20_analyzer:ChaCha20_Analyzer")
+        remplacant = DescriptionAnalyzer("FERNET", "src.analyzers.chacha20_analyzer:ChaCha20_Analyzer")
+        entrees = [entree_tierce("tiers", tiers), entree_tierce("remplacant", remplacant), entree_tierce("casse", ImportError("absent"))]
+
+        with mock.patch("importlib.metadata.entry_points", return_value=entrees), redirect_stdout(io.StringIO()):
+            registre = RegistreAnalyzers()
+            noms = list(registre)
+
+        self.assertEqual(noms[-1], "CHACHA20-TIERS")
+        self.assertEqual(len(noms), 6)
+        self.assertIs(registre.description("FERNET"), ANALYZERS_INTEGRES[-1])
+        self.assertFalse(registre.est_charge("CHACHA20-TIERS"))
+        self.assertEqual(type(registre["CHACHA20-TIERS"]).__name__, "ChaCha20_Analyzer")
+
+    def test_rapport_numero_mission(self):
+        resultat = {"algorithme": "AES-256-CBC", "fichier": "mission1.enc", "cle": "00", "tentatives": 1, "temps_execution": 0.1,
+                    "taux_succes": 100.0, "statut_succes": "Succès", "texte_dechiffre": "texte"}
+        dossier_courant = os.getcwd()
+        with tempfile.TemporaryDirectory() as dossier:
+            os.chdir(dossier)
+            try:
+                with redirect_stdout(io.StringIO()) as sortie:
+                    rapport_mission().generer_rapport_synthese(resultat)
+            finally:
+                os.chdir(dossier_courant)
+
+        self.assertIn("Mission 1: AES-256-CBC", sortie.getvalue())
+
+    def test_rapports_sans_nouvelle_decouverte(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            shutil.copy(RACINE / "data" / "mission2.enc", dossier)
+            shutil.copy(RACINE / "data" / "mission5.enc", dossier)
+            with mock.patch("importlib.metadata.entry_points", return_value=[]) as entry_points, \
+                    mock.patch("src.detecteur_crypto.rapport_mission") as rapport:
+                orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette())
+                list(orchestrateur.mission_flux(dossier, str(RACINE / "keys" / "wordlist.txt")))
+
+        # Numérotation tirée du registre de l'orchestrateur: les entry points ne sont consultés qu'une fois
+        self.assertEqual(rapport.call_count, 2)
+        self.assertIs(rapport.call_args.args[0], orchestrateur.analyzers)
+        self.assertEqual(entry_points.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
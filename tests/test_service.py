@@ -0,0 +1,97 @@
+import base64
+import json
+import sys
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.service import ServiceAnalyse, creer_serveur
+
+RACINE = Path(__file__).resolve().parents[1]
+
+
+class ServiceTests(unittest.TestCase):
+    """
+    Vérifie l'API JSON du service: soumission, suivi des tâches, métriques et erreurs de requête.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ServiceAnalyse(nb_workers=2, chemin_dictionnaire=str(RACINE / "keys" / "wordlist.txt"),
+                                     racines=[str(RACINE / "data"), str(RACINE / "keys")])
+        cls.service.demarrer(prechauffer=False)
+        cls.serveur = creer_serveur(cls.service, port=0)
+        cls.url = f"http://127.0.0.1:{cls.serveur.server_address[1]}"
+        threading.Thread(target=cls.serveur.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.serveur.shutdown()
+        cls.serveur.server_close()
+        cls.service.arreter()
+
+    def requete(self, chemin: str, corps=None):
+        donnees = None if corps is None else json.dumps(corps).encode("utf-8")
+        try:
+            with urllib.request.urlopen(urllib.request.Request(self.url + chemin, data=donnees), timeout=30) as reponse:
+                return reponse.status, json.loads(reponse.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def executer(self, corps):
+        statut, tache = self.requete("/taches", corps)
+        self.assertEqual(statut, 202)
+        statut, tache = self.requete(f"/taches/{tache['id']}?attendre=30")
+        self.assertEqual(statut, 200)
+        return tache
+
+    def test_identification_donnees(self):
+        donnees = base64.b64encode((RACINE / "data" / "mission5.enc").read_bytes()).decode("ascii")
+        tache = self.executer({"type": "identify", "donnees": donnees})
+
+        self.assertEqual(tache["etat"], "terminee")
+        self.assertEqual(tache["resultat"]["algo"], "FERNET")
+        self.assertGreaterEqual(tache["metriques"]["total"], tache["metriques"]["execution"])
+
+    def test_attaque_chemin(self):
+        tache = self.executer({"type": "attack", "chemin": str(RACINE / "data" / "mission2.enc")})
+
+        self.assertEqual(tache["etat"], "terminee")
+        self.assertTrue(tache["resultat"]["succes"])
+        self.assertEqual(tache["resultat"]["algo"], "CHACHA20")
+
+    def test_tache_echouee(self):
+        tache = self.executer({"type": "identify", "chemin": str(RACINE / "data" / "introuvable.enc")})
+        self.assertEqual(tache["etat"], "echouee")
+        self.assertTrue(tache["erreur"])
+
+    def test_requetes_invalides(self):
+        self.assertEqual(self.requete("/taches", {"type": "inconnu", "chemin": "x"})[0], 400)
+        self.assertEqual(self.requete("/taches", {"type": "identify"})[0], 400)
+        self.assertEqual(self.requete("/taches", {"type": "identify", "donnees": "pas du base64!"})[0], 400)
+        self.assertEqual(self.requete("/taches/999999")[0], 404)
+
+    def test_chemins_hors_racines(self):
+        self.assertEqual(self.requete("/taches", {"type": "identify", "chemin": str(RACINE / "main.py")})[0], 400)
+        self.assertEqual(self.requete("/taches", {"type": "identify", "chemin": str(RACINE / "data" / ".." / "main.py")})[0], 400)
+        statut, reponse = self.requete("/taches", {"type": "attack", "chemin": str(RACINE / "data" / "mission1.enc"),
+                                                    "wordlist": "/etc/passwd"})
+        self.assertEqual(statut, 400)
+        self.assertIn("wordlist", reponse["erreur"])
+
+    def test_metriques(self):
+        self.executer({"type": "identify", "chemin": str(RACINE / "data" / "mission1.enc")})
+        statut, metriques = self.requete("/metriques")
+
+        self.assertEqual(statut, 200)
+        self.assertGreaterEqual(metriques["taches"]["terminee"], 1)
+        self.assertEqual(set(metriques["latence"]), {"p50", "p90", "p99"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.attaque_parallele import ResultatRecherche
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.progression import SortieMuette
+from src.suivi_attaque import SuiviAttaque
+
+
+class SuiviAttaqueTests(unittest.TestCase):
+    """
+    Vérifie l'attaque par dictionnaire interactive (moteur d'attaque, règle de succès de la mission)
+    et le calcul du débit et de l'ETA affichés.
+    """
+
+    def setUp(self) -> None:
+        if not Path("data").exists():
+            self.skipTest("Dossier data/ introuvable.")
+        self.orchestrateur = DetecteurCryptoOrchestrateur(sortie_progression=SortieMuette())
+
+    def test_attaque_reussie(self):
+        with mock.patch("time.sleep", side_effect=AssertionError("time.sleep appelé")):
+            texte = self.orchestrateur.attaque_dictionnaire("mission2.enc", "CHACHA20")
+        self.assertIn("Mission 2", texte)
+
+    def test_dechiffrement_non_valide_rejete(self):
+        # Les clés AES-CBC ne déchiffrent pas la mission 3: un texte non vide mais illisible n'est pas un succès
+        self.assertEqual(self.orchestrateur.attaque_dictionnaire("mission3.enc", "AES-256-CBC"), "Aucune clé trouvé")
+
+    def test_debit_et_eta(self):
+        suivi = SuiviAttaque("AES-GCM", 1000)
+        with mock.patch("src.suivi_attaque.time.monotonic", side_effect=[10.0, 12.0]):
+            suivi.avancer(0, 100)
+            suivi.avancer(0, 300)
+        self.assertEqual(suivi.debit(), 100.0)
+        self.assertEqual(suivi.restantes(), 700)
+        self.assertEqual(suivi.eta(), 7.0)
+
+        with mock.patch("src.suivi_attaque.time.monotonic", return_value=suivi._lancement + 4.0):
+            suivi.terminer(ResultatRecherche(index=399, nb_testees=400))
+        self.assertEqual(suivi.frontiere, 400)
+        self.assertEqual(suivi.debit(), 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.detecteur_crypto import ResultatAnalyse
+from src.table_resultats import TableResultats
+
+TEXTE = "Le message secret est arrivé à destination sans encombre."
+
+
+def resultats():
+    return [
+        ResultatAnalyse("CHACHA20", b"\x01" * 32, 0.85, TEXTE, 0.5, 10, "mission1.enc", 95.0),
+        ResultatAnalyse("CHACHA20", b"", 0.7, b"\x8f\x02", 1.5, 40, "mission2.enc", 3.0),
+        ResultatAnalyse("FERNET", b"cle", 1.0, TEXTE, 0.25, 2, "mission3.enc", 90.0),
+        ResultatAnalyse("", b"", 0.0, b"", 0.1, 0, "mission4.enc", 0.0),
+    ]
+
+
+class TableResultatsTests(unittest.TestCase):
+    """
+    Vérifie les enregistrements de résultats compacts et la table en colonnes: agrégats sur les colonnes,
+    textes gardés par référence ou déversés sur disque.
+    """
+
+    def test_resultat_sans_dict(self):
+        resultat = resultats()[0]
+        self.assertFalse(hasattr(resultat, "__dict__"))
+        self.assertEqual(resultat.fichier, "mission1.enc")
+
+    def test_agregats(self):
+        table = TableResultats()
+        table.etendre(resultats())
+
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table.taux_reussite_par_algo(), {"CHACHA20": 0.5, "FERNET": 1.0})
+        self.assertEqual(table.percentiles_temps(), {"p50": 0.25, "p90": 1.5, "p99": 1.5})
+        self.assertEqual(table.percentiles_temps((50,), algo="CHACHA20"), {"p50": 0.5})
+        self.assertEqual(table.percentiles_temps(algo="AES-GCM"), {})
+        self.assertEqual(table.resume(), {"total_fichiers": 4, "fichiers_dechiffres": 2, "temps_total": 2.35, "tentatives_total": 52})
+
+    def test_textes_deverses_sur_disque(self):
+        with tempfile.TemporaryDirectory() as dossier:
+            with TableResultats(os.path.join(dossier, "textes.bin")) as table:
+                table.etendre(resultats())
+                self.assertEqual(table.texte(0), TEXTE)
+                self.assertEqual(table.texte(1), b"\x8f\x02")
+
+                resultat = table[2]
+                self.assertEqual((resultat.algo, resultat.cle, resultat.fichier, resultat.nb_tentatives), ("FERNET", b"cle", "mission3.enc", 2))
+                self.assertEqual(resultat.texte_dechiffre, TEXTE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Autoriser les imports depuis src/
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.analyzers.aes_cbc_analyzer import Aes_Cbc_Analyzer
+from src.analyzers.chacha20_analyzer import ChaCha20_Analyzer
+from src.detecteur_crypto import DetecteurCryptoOrchestrateur
+from src.trousseau import TrousseauCles
+from tests.chiffrement import chiffrer_aes_cbc, chiffrer_chacha
+
+
+class TrousseauClesTests(unittest.TestCase):
+    """
+    Vérifie le trousseau de session: test rapide AES-CBC, dérivation des mots de passe retrouvés
+    et réutilisation d'une clé sur un autre fichier sans attaque par dictionnaire.
+    """
+
+    def setUp(self) -> None:
+        self.dossier = tempfile.TemporaryDirectory()
+        self.wordlist = "keys/wordlist.txt"
+
+    def tearDown(self) -> None:
+        self.dossier.cleanup()
+
+    def test_sonde_cbc(self):
+        analyzer = Aes_Cbc_Analyzer()
+        cle = os.urandom(32)
+        donnees = chiffrer_aes_cbc(cle, b"Bonjour, le monde est grand. " * 4)
+        self.assertTrue(analyzer.sonder(donnees, cle))
+        rejets = sum(not analyzer.sonder(donnees, os.urandom(32)) for _ in range(200))
+        # Un padding aléatoire n'est valide qu'environ une fois sur 256
+        self.assertGreater(rejets, 190)
+
+    def test_cles_derivees_des_autres_algorithmes(self):
+        trousseau = TrousseauCles()
+        trousseau.ajouter("CHACHA20", b"\x01" * 32, "paris2024")
+        trousseau.ajouter("CHACHA20", b"\x01" * 32, "paris2024")
+        self.assertEqual(len(trousseau), 1)
+
+        analyzer = Aes_Cbc_Analyzer()
+        attendues = analyzer.generer_cles_candidates(self._dictionnaire(["paris2024"]))
+        self.assertEqual(trousseau.cles("AES-256-CBC", analyzer), attendues)
+        self.assertEqual(trousseau.cles("CHACHA20", ChaCha20_Analyzer()), [b"\x01" * 32])
+        # Mot de passe retrouvé pour AES, hors du filtre des indices ChaCha20: dérivé quand même pour ChaCha20
+        trousseau.ajouter("AES-256-CBC", attendues[0], "paris2024")
+        chacha = ChaCha20_Analyzer()
+        self.assertFalse(chacha.mot_retenu("paris2024"))
+        self.assertEqual(trousseau.cles("CHACHA20", chacha), [b"\x01" * 32] + chacha.deriver_cles("paris2024"))
+
+    def test_derivation_mot_par_mot(self):
+        for nom_algo, analyzer in DetecteurCryptoOrchestrateur().analyzers.items():
+            mots = analyzer.mots_candidats(self.wordlist)
+            self.assertTrue(all(analyzer.mot_retenu(mot) for mot in mots), nom_algo)
+            derivees = [cle for mot in mots for cle in analyzer.deriver_cles(mot)]
+            self.assertEqual(derivees, analyzer.generer_cles_candidates(self.wordlist), nom_algo)
+
+    def test_cle_reutilisee_sur_un_autre_fichier(self):
+        if not os.path.exists("data/mission1.enc"):
+            self.skipTest("Fichier de mission introuvable.")
+        orchestrateur = DetecteurCryptoOrchestrateur()
+        premier = orchestrateur.traiter_fichier("data/mission1.enc", self.wordlist)
+        self.assertEqual(premier.algo, "AES-256-CBC")
+        self.assertEqual(len(orchestrateur.trousseau), 1)
+
+        autre = os.path.join(self.dossier.name, "autre.enc")
+        with open(autre, "wb") as f:
+            f.write(chiffrer_aes_cbc(premier.cle, b"The same password protects this other document, as usual. " * 3))
+        resultat = orchestrateur.traiter_fichier(autre, self.wordlist)
+        self.assertEqual((resultat.algo, resultat.cle, resultat.nb_tentatives), ("AES-256-CBC", premier.cle, 1))
+
+    def test_mot_aes_essaye_sur_chacha20(self):
+        if not os.path.exists("data/mission1.enc"):
+            self.skipTest("Fichier de mission introuvable.")
+        orchestrateur = DetecteurCryptoOrchestrateur()
+        premier = orchestrateur.traiter_fichier("data/mission1.enc", self.wordlist)
+        self.assertEqual(premier.algo, "AES-256-CBC")
+        (_, _, mot), = orchestrateur.trousseau.instantane()
+
+        # Même mot de passe, recette ChaCha20: la clé vient du trousseau malgré le filtre des indices
+        cle = ChaCha20_Analyzer().deriver_cles(mot)[0]
+        autre = os.path.join(self.dossier.name, "autre.enc")
+        with open(autre, "wb") as f:
+            f.write(chiffrer_chacha(cle, b"The same password protects this other document, as usual. " * 3))
+        resultat = orchestrateur.attaque_dictionnaire_manuelle(autre, "CHACHA20", self.wordlist)
+        self.assertEqual((resultat.cle, resultat.nb_tentatives), (cle, 1))
+
+    def _dictionnaire(self, mots: list[str]) -> str:
+        chemin = os.path.join(self.dossier.name, "mots.txt")
+        with open(chemin, "w", encoding="utf-8") as f:
+            f.write("\n".join(mots) + "\n")
+        return chemin
+
+
+if __name__ == "__main__":
+    unittest.main()